@@ -0,0 +1,30 @@
+"""Add config_version table for config cache invalidation.
+
+Revision ID: 20251220_0013
+Revises: 20251212_0012
+Create Date: 2025-12-20
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251220_0013"
+down_revision = "20251212_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    config_version = op.create_table(
+        "config_version",
+        sa.Column("namespace", sa.String(length=50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    )
+    op.bulk_insert(
+        config_version,
+        [{"namespace": ns, "version": 0} for ns in ("FEATURE", "ROULETTE", "LOTTERY", "DICE")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("config_version")
@@ -0,0 +1,36 @@
+"""Add user_daily_play_count for O(1) daily play counts.
+
+Revision ID: 20251220_0014
+Revises: 20251220_0013
+Create Date: 2025-12-20
+
+Existing rows can be rebuilt from the game logs with scripts/backfill_play_counters.py.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251220_0014"
+down_revision = "20251220_0013"
+branch_labels = None
+depends_on = None
+
+feature_type_enum = sa.Enum("ROULETTE", "DICE", "LOTTERY", "RANKING", "SEASON_PASS", "NONE", name="featuretype")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_daily_play_count",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("feature_type", feature_type_enum, nullable=False),
+        sa.Column("play_date", sa.Date(), nullable=False),
+        sa.Column("play_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.UniqueConstraint("user_id", "feature_type", "play_date", name="uq_user_daily_play_count"),
+    )
+    op.create_index("ix_user_daily_play_count_id", "user_daily_play_count", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_daily_play_count_id", table_name="user_daily_play_count")
+    op.drop_table("user_daily_play_count")
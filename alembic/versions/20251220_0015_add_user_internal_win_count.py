@@ -0,0 +1,29 @@
+"""Add user_internal_win_count for the INTERNAL_WIN_50 stamp check.
+
+Revision ID: 20251220_0015
+Revises: 20251220_0014
+Create Date: 2025-12-20
+
+Rows are created lazily from the game logs on a user's first lookup/win; run
+scripts/reconcile_internal_wins.py to seed or repair them in bulk.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251220_0015"
+down_revision = "20251220_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_internal_win_count",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("win_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_internal_win_count")
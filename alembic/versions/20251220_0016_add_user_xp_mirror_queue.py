@@ -0,0 +1,35 @@
+"""Add user_xp_mirror_queue for queued season pass -> core level XP mirroring.
+
+Revision ID: 20251220_0016
+Revises: 20251220_0015
+Create Date: 2025-12-20
+
+Only used with SEASON_XP_MIRROR_MODE=queue; scripts/apply_xp_mirror_queue.py drains it.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251220_0016"
+down_revision = "20251220_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_xp_mirror_queue",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+        sa.Column("source", sa.String(length=100), nullable=False),
+        sa.Column("meta", sa.JSON(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    )
+    op.create_index("ix_user_xp_mirror_queue_id", "user_xp_mirror_queue", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_xp_mirror_queue_id", table_name="user_xp_mirror_queue")
+    op.drop_table("user_xp_mirror_queue")
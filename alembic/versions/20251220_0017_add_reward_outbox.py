@@ -0,0 +1,42 @@
+"""Add reward_outbox for queued reward delivery.
+
+Revision ID: 20251220_0017
+Revises: 20251220_0016
+Create Date: 2025-12-20
+
+Only written with REWARD_DELIVERY_MODE=outbox; scripts/reward_outbox_worker.py drains it.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251220_0017"
+down_revision = "20251220_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reward_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("idempotency_key", sa.String(length=191), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("reward_type", sa.String(length=50), nullable=False),
+        sa.Column("reward_amount", sa.Integer(), nullable=False),
+        sa.Column("meta", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="PENDING"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("last_error", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("idempotency_key", name="uq_reward_outbox_idempotency_key"),
+    )
+    op.create_index("ix_reward_outbox_id", "reward_outbox", ["id"])
+    op.create_index("ix_reward_outbox_status_next_attempt", "reward_outbox", ["status", "next_attempt_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reward_outbox_status_next_attempt", table_name="reward_outbox")
+    op.drop_index("ix_reward_outbox_id", table_name="reward_outbox")
+    op.drop_table("reward_outbox")
@@ -0,0 +1,30 @@
+"""Add (created_at, id) indexes for keyset pagination of admin play logs and the wallet ledger.
+
+Revision ID: 20251220_0018
+Revises: 20251220_0017
+Create Date: 2025-12-20
+"""
+from alembic import op
+
+revision = "20251220_0018"
+down_revision = "20251220_0017"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_roulette_log_created_at_id", "roulette_log", ["created_at", "id"]),
+    ("ix_dice_log_created_at_id", "dice_log", ["created_at", "id"]),
+    ("ix_lottery_log_created_at_id", "lottery_log", ["created_at", "id"]),
+    ("ix_user_game_wallet_ledger_created_at_id", "user_game_wallet_ledger", ["created_at", "id"]),
+    ("ix_user_game_wallet_ledger_user_created_at_id", "user_game_wallet_ledger", ["user_id", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
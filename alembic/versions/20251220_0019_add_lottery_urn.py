@@ -0,0 +1,46 @@
+"""Add the pre-drawn lottery urn (lottery_config.use_urn, lottery_urn, lottery_urn_slot).
+
+Revision ID: 20251220_0019
+Revises: 20251220_0018
+Create Date: 2025-12-20
+
+Built by AdminLotteryService when a use_urn config is saved active; plays claim slots from it.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251220_0019"
+down_revision = "20251220_0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("lottery_config", sa.Column("use_urn", sa.Boolean(), nullable=False, server_default=sa.text("0")))
+    op.create_table(
+        "lottery_urn",
+        sa.Column("config_id", sa.Integer(), sa.ForeignKey("lottery_config.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("next_seq", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_seq", sa.Integer(), nullable=False, server_default="-1"),
+        sa.Column("built_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    )
+    op.create_table(
+        "lottery_urn_slot",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("config_id", sa.Integer(), sa.ForeignKey("lottery_config.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("prize_id", sa.Integer(), sa.ForeignKey("lottery_prize.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("config_id", "seq", name="uq_lottery_urn_slot_seq"),
+    )
+    op.create_index("ix_lottery_urn_slot_id", "lottery_urn_slot", ["id"])
+    op.create_index("ix_lottery_urn_slot_unclaimed", "lottery_urn_slot", ["config_id", "claimed_at", "seq"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lottery_urn_slot_unclaimed", table_name="lottery_urn_slot")
+    op.drop_index("ix_lottery_urn_slot_id", table_name="lottery_urn_slot")
+    op.drop_table("lottery_urn_slot")
+    op.drop_table("lottery_urn")
+    op.drop_column("lottery_config", "use_urn")
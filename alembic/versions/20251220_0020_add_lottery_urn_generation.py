@@ -0,0 +1,21 @@
+"""Add lottery_urn.generation so tickets reserved before a rebuild cannot claim the new urn's slots.
+
+Revision ID: 20251220_0020
+Revises: 20251220_0019
+Create Date: 2025-12-20
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251220_0020"
+down_revision = "20251220_0019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("lottery_urn", sa.Column("generation", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    op.drop_column("lottery_urn", "generation")
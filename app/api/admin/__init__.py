@@ -7,6 +7,7 @@ from app.api.admin.routes import (
     admin_game_tokens,
     admin_feature_schedule,
     admin_lottery,
+    admin_metrics,
     admin_ranking,
     admin_roulette,
     admin_seasons,
@@ -26,3 +27,4 @@ admin_router.include_router(admin_game_tokens.router)
 admin_router.include_router(admin_external_ranking.router)
 admin_router.include_router(admin_users.router)
 admin_router.include_router(admin_team_battle.router)
+admin_router.include_router(admin_metrics.router)
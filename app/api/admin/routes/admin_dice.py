@@ -1,10 +1,12 @@
 # /workspace/ch25/app/api/admin/routes/admin_dice.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.schemas.admin_dice import AdminDiceConfigCreate, AdminDiceConfigResponse, AdminDiceConfigUpdate
+from app.schemas.admin_simulation import SimulationResponse
 from app.services.admin_dice_service import AdminDiceService
+from app.services.game_simulator import DEFAULT_PLAYS, MAX_PLAYS, game_simulator
 
 router = APIRouter(prefix="/admin/api/dice-config", tags=["admin-dice"])
 
@@ -33,6 +35,17 @@ def update_config(config_id: int, payload: AdminDiceConfigUpdate, db: Session =
     return AdminDiceConfigResponse.from_orm(config)
 
 
+@router.post("/{config_id}/simulate", response_model=SimulationResponse)
+def simulate_config(
+    config_id: int,
+    plays: int = Query(DEFAULT_PLAYS, ge=1, le=MAX_PLAYS),
+    seed: int | None = Query(None),
+    db: Session = Depends(get_db),
+) -> SimulationResponse:
+    config = AdminDiceService.get_config(db, config_id)
+    return game_simulator.dice(config, plays=plays, seed=seed)
+
+
 @router.post("/{config_id}/activate", response_model=AdminDiceConfigResponse)
 def activate_config(config_id: int, db: Session = Depends(get_db)):
     config = AdminDiceService.toggle_active(db, config_id, True)
@@ -1,13 +1,16 @@
 """Admin endpoints for external ranking data."""
-from typing import List
+import io
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.schemas.external_ranking import (
     ExternalRankingCreate,
     ExternalRankingEntry,
+    ExternalRankingImportFailure,
+    ExternalRankingImportResponse,
     ExternalRankingListResponse,
     ExternalRankingUpdate,
 )
@@ -45,7 +48,8 @@ def upsert_external_ranking(
     payloads: List[ExternalRankingCreate],
     db: Session = Depends(get_db),
 ) -> ExternalRankingListResponse:
-    rows = AdminExternalRankingService.upsert_many(db, payloads)
+    timings: dict[str, float] = {}
+    rows = AdminExternalRankingService.upsert_many(db, payloads, timings=timings)
     user_map = {
         row.id: row.external_id
         for row in db.query(User.id, User.external_id).filter(User.id.in_([r.user_id for r in rows])).all()
@@ -63,7 +67,46 @@ def upsert_external_ranking(
         )
         for row in rows
     ]
-    return ExternalRankingListResponse(items=items)
+    return ExternalRankingListResponse(items=items, timings_ms=timings)
+
+
+def _import_format(file: UploadFile, requested: str | None) -> str:
+    if requested:
+        return requested
+    filename = (file.filename or "").lower()
+    if filename.endswith(".csv") or file.content_type == "text/csv":
+        return "csv"
+    if filename.endswith((".ndjson", ".jsonl")) or file.content_type in {"application/x-ndjson", "application/jsonl"}:
+        return "ndjson"
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="UNSUPPORTED_IMPORT_FORMAT")
+
+
+@router.post("/import", response_model=ExternalRankingImportResponse)
+def import_external_ranking(
+    file: UploadFile = File(...),
+    fmt: Literal["csv", "ndjson"] | None = Query(None, alias="format"),
+    chunk_size: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+) -> ExternalRankingImportResponse:
+    """Stream a CSV/NDJSON file into the upsert path chunk by chunk (format inferred from the file name if omitted)."""
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        result = AdminExternalRankingService.import_stream(db, stream, _import_format(file, fmt), chunk_size=chunk_size)
+    finally:
+        stream.detach()
+    return ExternalRankingImportResponse(
+        format=result.format,
+        chunk_size=result.chunk_size,
+        chunks=result.chunks,
+        rows_read=result.rows_read,
+        rows_upserted=result.rows_upserted,
+        failed_count=result.failed_count,
+        failed=[ExternalRankingImportFailure(line=f.line, error=f.error) for f in result.failures],
+        elapsed_ms=round(result.elapsed_seconds * 1000, 2),
+        rows_per_second=round(result.rows_per_second, 1),
+        timings_ms=result.timings_ms,
+        aborted=ExternalRankingImportFailure(line=result.aborted.line, error=result.aborted.error) if result.aborted else None,
+    )
 
 
 @router.put("/{user_id}", response_model=ExternalRankingEntry)
@@ -1,16 +1,14 @@
 """Admin endpoints for granting game tokens."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import desc, literal, literal_column
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
-from app.models.dice import DiceLog
-from app.models.lottery import LotteryLog, LotteryPrize
-from app.models.roulette import RouletteLog, RouletteSegment
+from app.api.deps import get_db, get_read_db
 from app.models.game_wallet import UserGameWallet
-from app.models.game_wallet_ledger import UserGameWalletLedger
 from app.models.user import User
 from app.schemas.game_tokens import (
+    BulkGameTokensFailure,
+    BulkGameTokensRequest,
+    BulkGameTokensResponse,
     GrantGameTokensRequest,
     GrantGameTokensResponse,
     LedgerEntry,
@@ -18,10 +16,15 @@ from app.schemas.game_tokens import (
     RevokeGameTokensRequest,
     TokenBalance,
 )
-from app.services.game_wallet_service import GameWalletService
+from app.services.admin_game_log_service import AdminGameLogService
+from app.services.game_wallet_service import BulkTokenResult, GameWalletService
 
 router = APIRouter(prefix="/admin/api/game-tokens", tags=["admin-game-tokens"])
 wallet_service = GameWalletService()
+log_service = AdminGameLogService()
+
+# Response header carrying the keyset cursor of the next page (absent on the last page).
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 def _resolve_user_id(db: Session, user_id: int | None, external_id: str | None) -> int:
@@ -51,13 +54,44 @@ def revoke_tokens(payload: RevokeGameTokensRequest, db: Session = Depends(get_db
     return GrantGameTokensResponse(user_id=user_id, token_type=payload.token_type, balance=balance, external_id=external)
 
 
+def _bulk_response(result: BulkTokenResult) -> BulkGameTokensResponse:
+    return BulkGameTokensResponse(
+        requested=result.requested,
+        applied=result.applied,
+        failed=[
+            BulkGameTokensFailure(index=f.index, user_id=f.user_id, external_id=f.external_id, error=f.error)
+            for f in result.failures
+        ],
+        balances=[
+            GrantGameTokensResponse(user_id=user_id, external_id=external_id, token_type=token_type, balance=balance)
+            for (user_id, token_type), (external_id, balance) in result.balances.items()
+        ],
+        elapsed_ms=round(result.elapsed_seconds * 1000, 2),
+        rows_per_second=round(result.rows_per_second, 1),
+    )
+
+
+@router.post("/grant-bulk", response_model=BulkGameTokensResponse)
+def grant_tokens_bulk(payload: BulkGameTokensRequest, db: Session = Depends(get_db)):
+    """Grant tokens to many users in one transaction; unknown users are reported, not fatal."""
+    result = wallet_service.grant_tokens_bulk(db, payload.items, reason=payload.reason, label=payload.label)
+    return _bulk_response(result)
+
+
+@router.post("/revoke-bulk", response_model=BulkGameTokensResponse)
+def revoke_tokens_bulk(payload: BulkGameTokensRequest, db: Session = Depends(get_db)):
+    """Revoke tokens from many users; rows exceeding the balance are reported, not fatal."""
+    result = wallet_service.revoke_tokens_bulk(db, payload.items, reason=payload.reason, label=payload.label)
+    return _bulk_response(result)
+
+
 @router.get("/wallets", response_model=list[TokenBalance])
 def list_wallets(
     user_id: int | None = None,
     external_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     limit = min(max(limit, 1), 200)
     offset = max(offset, 0)
@@ -86,143 +120,43 @@ def list_wallets(
 
 @router.get("/play-logs", response_model=list[PlayLogEntry])
 def list_recent_play_logs(
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     external_id: str | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    """Unified recent play logs from roulette/dice/lottery with pagination."""
+    """Recent play logs across roulette/dice/lottery, newest first.
+
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page; `offset` is
+    still honoured (relative to the cursor) for page-number clients.
+    """
     limit = min(max(limit, 1), 200)
     offset = max(offset, 0)
-
-    # Build optional user filter
-    user_filter_roulette = True
-    user_filter_dice = True
-    user_filter_lottery = True
-
-    if external_id:
-        user = db.query(User).filter(User.external_id == external_id).first()
-        if user:
-            user_filter_roulette = RouletteLog.user_id == user.id
-            user_filter_dice = DiceLog.user_id == user.id
-            user_filter_lottery = LotteryLog.user_id == user.id
-        else:
-            return []  # No user found with this external_id
-
-    # 1. Roulette Query
-    q_roulette = (
-        db.query(
-            RouletteLog.id.label("id"),
-            RouletteLog.user_id,
-            User.external_id,
-            RouletteLog.reward_type,
-            RouletteLog.reward_amount,
-            RouletteSegment.label.label("detail"),
-            RouletteLog.created_at.label("created_at"),
-            literal("ROULETTE").label("game_type"),
-        )
-        .join(User, User.id == RouletteLog.user_id)
-        .join(RouletteSegment, RouletteSegment.id == RouletteLog.segment_id)
-        .filter(user_filter_roulette)
-    )
-
-    # 2. Dice Query
-    q_dice = (
-        db.query(
-            DiceLog.id.label("id"),
-            DiceLog.user_id,
-            User.external_id,
-            DiceLog.reward_type,
-            DiceLog.reward_amount,
-            DiceLog.result.label("detail"),
-            DiceLog.created_at.label("created_at"),
-            literal("DICE").label("game_type"),
-        )
-        .join(User, User.id == DiceLog.user_id)
-        .filter(user_filter_dice)
-    )
-
-    # 3. Lottery Query
-    q_lottery = (
-        db.query(
-            LotteryLog.id.label("id"),
-            LotteryLog.user_id,
-            User.external_id,
-            LotteryLog.reward_type,
-            LotteryLog.reward_amount,
-            LotteryPrize.label.label("detail"),
-            LotteryLog.created_at.label("created_at"),
-            literal("LOTTERY").label("game_type"),
-        )
-        .join(User, User.id == LotteryLog.user_id)
-        .join(LotteryPrize, LotteryPrize.id == LotteryLog.prize_id)
-        .filter(user_filter_lottery)
-    )
-
-    # Union All + Sort + Pagination
-    union_q = q_roulette.union_all(q_dice, q_lottery).order_by(desc(literal_column("created_at")))
-
-    rows = union_q.offset(offset).limit(limit).all()
-
-    return [
-        PlayLogEntry(
-            id=row.id,
-            user_id=row.user_id,
-            external_id=row.external_id,
-            game=row.game_type,
-            reward_label=row.detail,
-            reward_type=row.reward_type,
-            reward_amount=row.reward_amount,
-            created_at=row.created_at.isoformat(),
-        )
-        for row in rows
-    ]
-
+    entries, next_cursor = log_service.list_play_logs(db, limit, cursor=cursor, offset=offset, external_id=external_id)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return entries
 
 
 @router.get("/ledger", response_model=list[LedgerEntry])
 def list_wallet_ledger(
+    response: Response,
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
     user_id: int | None = None,
     external_id: str | None = None,
     token_type: str | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
+    """Wallet ledger, newest first; paginated like /play-logs."""
     limit = min(max(limit, 1), 500)
     offset = max(offset, 0)
-    query = (
-        db.query(
-            UserGameWalletLedger,
-            User.external_id,
-        )
-        .join(User, User.id == UserGameWalletLedger.user_id)
-    )
-    if user_id:
-        query = query.filter(UserGameWalletLedger.user_id == user_id)
-    if external_id:
-        query = query.filter(User.external_id == external_id)
-    if token_type:
-        query = query.filter(UserGameWalletLedger.token_type == token_type)
-
-    rows = (
-        query.order_by(UserGameWalletLedger.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    entries, next_cursor = log_service.list_ledger(
+        db, limit, cursor=cursor, offset=offset, user_id=user_id, external_id=external_id, token_type=token_type
     )
-    return [
-        LedgerEntry(
-            id=row.UserGameWalletLedger.id,  # type: ignore[attr-defined]
-            user_id=row.UserGameWalletLedger.user_id,  # type: ignore[attr-defined]
-            external_id=row.external_id,  # type: ignore[attr-defined]
-            token_type=row.UserGameWalletLedger.token_type,  # type: ignore[attr-defined]
-            delta=row.UserGameWalletLedger.delta,  # type: ignore[attr-defined]
-            balance_after=row.UserGameWalletLedger.balance_after,  # type: ignore[attr-defined]
-            reason=row.UserGameWalletLedger.reason,  # type: ignore[attr-defined]
-            label=row.UserGameWalletLedger.label,  # type: ignore[attr-defined]
-            meta_json=row.UserGameWalletLedger.meta_json,  # type: ignore[attr-defined]
-            created_at=row.UserGameWalletLedger.created_at.isoformat(),  # type: ignore[attr-defined]
-        )
-        for row in rows
-    ]
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return entries
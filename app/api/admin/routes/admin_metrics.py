@@ -0,0 +1,20 @@
+"""Admin runtime metrics endpoint."""
+from fastapi import APIRouter
+
+from app.db.session import pool_metrics
+from app.services.event_writer import event_writer
+from app.services.season_resolver import season_resolver
+
+router = APIRouter(prefix="/admin/api/metrics", tags=["admin-metrics"])
+
+
+@router.get("")
+@router.get("/")
+def get_metrics() -> dict:
+    """In-process counters of this worker (each worker process reports its own)."""
+
+    return {
+        "event_writer": event_writer.metrics(),
+        "db_pool": pool_metrics(),
+        "season_resolver": season_resolver.metrics(),
+    }
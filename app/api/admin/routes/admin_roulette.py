@@ -1,10 +1,12 @@
 # /workspace/ch25/app/api/admin/routes/admin_roulette.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.schemas.admin_roulette import AdminRouletteConfigCreate, AdminRouletteConfigResponse, AdminRouletteConfigUpdate
+from app.schemas.admin_simulation import SimulationResponse
 from app.services.admin_roulette_service import AdminRouletteService
+from app.services.game_simulator import DEFAULT_PLAYS, MAX_PLAYS, game_simulator
 
 router = APIRouter(prefix="/admin/api/roulette-config", tags=["admin-roulette"])
 
@@ -33,6 +35,17 @@ def update_config(config_id: int, payload: AdminRouletteConfigUpdate, db: Sessio
     return AdminRouletteConfigResponse.from_orm(config)
 
 
+@router.post("/{config_id}/simulate", response_model=SimulationResponse)
+def simulate_config(
+    config_id: int,
+    plays: int = Query(DEFAULT_PLAYS, ge=1, le=MAX_PLAYS),
+    seed: int | None = Query(None),
+    db: Session = Depends(get_db),
+) -> SimulationResponse:
+    config = AdminRouletteService.get_config(db, config_id)
+    return game_simulator.roulette(config, plays=plays, seed=seed)
+
+
 @router.post("/{config_id}/activate", response_model=AdminRouletteConfigResponse)
 def activate_config(config_id: int, db: Session = Depends(get_db)):
     config = AdminRouletteService.toggle_active(db, config_id, True)
@@ -1,16 +1,26 @@
 """Shared API dependencies."""
-from collections.abc import Generator
+import math
+import time
+from collections.abc import AsyncGenerator, Generator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.core.security import decode_access_token
+from app.db import session as db_session
+from app.db.async_session import get_async_sessionmaker
 from app.db.session import SessionLocal
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Unix time until which this client's reads stay on the primary. Sent as a response header that
+# the SPA echoes back (bearer auth, no cross-origin cookies) and as a cookie for same-site clients.
+READ_PIN_HEADER = "X-Read-Pin"
+READ_PIN_COOKIE = "rw_pin"
+
 
 def get_db() -> Generator[Session, None, None]:
     """Provide a transactional database session for request handling."""
@@ -22,6 +32,61 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of get_db for the DB_STACK=async game routes."""
+
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+def get_read_db(request: Request, db: Session = Depends(get_db)) -> Generator[Session, None, None]:
+    """Session for read-only endpoints: the replica, unless this client wrote within the pin window.
+
+    Without DATABASE_READ_URL, or while the client's read-your-writes pin is live, this is the
+    primary session from get_db (which opens no connection unless used).
+    """
+
+    if not db_session.has_read_replica() or reads_pinned(request):
+        yield db
+        return
+    replica = db_session.ReadSessionLocal()
+    try:
+        yield replica
+    finally:
+        replica.close()
+
+
+def reads_pinned(request: Request) -> bool:
+    pin = request.headers.get(READ_PIN_HEADER) or request.cookies.get(READ_PIN_COOKIE) or 0
+    try:
+        return float(pin) > time.time()
+    except ValueError:
+        return False
+
+
+def pin_reads_to_primary(response: Response) -> None:
+    """Send the client's reads to the primary for READ_YOUR_WRITES_SECONDS (replica lag)."""
+
+    seconds = get_settings().read_your_writes_seconds
+    if seconds <= 0:
+        return
+    until = f"{time.time() + seconds:.3f}"
+    response.headers[READ_PIN_HEADER] = until
+    response.set_cookie(READ_PIN_COOKIE, until, max_age=math.ceil(seconds), httponly=True, samesite="lax")
+
+
+def pin_reads_after_user_write(request: Request, response: Response) -> None:
+    """Router dependency of the user-facing API: a successful write pins that client's reads.
+
+    Headers set on `response` are discarded when the endpoint raises (bad token, game error),
+    so only writes that went through pin; admin and auth routers do not use this dependency.
+    """
+
+    if request.method in ("GET", "HEAD", "OPTIONS") or not db_session.has_read_replica():
+        return
+    pin_reads_to_primary(response)
+
+
 def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> int:
     """Extract user id from Bearer token; raise 401 if missing or invalid."""
     settings = get_settings()
@@ -1,19 +1,27 @@
 # /workspace/ch25/app/api/routes/__init__.py
 """API route registrations."""
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from app.api import admin
-from app.api.routes import auth, dice, health, level_xp, lottery, ranking, roulette, season_pass, today_feature, team_battle
+from app.api.deps import pin_reads_after_user_write
+from app.api.routes import async_games, auth, dice, health, level_xp, lottery, ranking, roulette, season_pass, today_feature, team_battle
+from app.core.config import get_settings
 
 api_router = APIRouter()
+# User-facing write routes pin the caller's reads to the primary (read replica lag); admin and auth do not.
+user_writes = [Depends(pin_reads_after_user_write)]
 api_router.include_router(health.router, prefix="", tags=["health"])
 api_router.include_router(today_feature.router)
 api_router.include_router(auth.router)
-api_router.include_router(season_pass.router)
-api_router.include_router(roulette.router)
-api_router.include_router(dice.router)
-api_router.include_router(lottery.router)
+api_router.include_router(season_pass.router, dependencies=user_writes)
+if get_settings().db_stack == "async":
+    for router in async_games.routers:
+        api_router.include_router(router, dependencies=user_writes)
+else:
+    api_router.include_router(roulette.router, dependencies=user_writes)
+    api_router.include_router(dice.router, dependencies=user_writes)
+    api_router.include_router(lottery.router, dependencies=user_writes)
 api_router.include_router(ranking.router)
-api_router.include_router(team_battle.router)
-api_router.include_router(level_xp.router)
+api_router.include_router(team_battle.router, dependencies=user_writes)
+api_router.include_router(level_xp.router, dependencies=user_writes)
 api_router.include_router(admin.admin_router)
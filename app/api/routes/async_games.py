@@ -0,0 +1,71 @@
+"""Async (DB_STACK=async) roulette, dice and lottery routes.
+
+Same paths and responses as the sync routers in roulette.py, dice.py and lottery.py; only one
+set is registered, chosen by DB_STACK in app/api/routes/__init__.py.
+"""
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, get_current_user_id
+from app.schemas.dice import DicePlayResponse, DiceStatusResponse
+from app.schemas.lottery import LotteryPlayResponse, LotteryStatusResponse
+from app.schemas.roulette import RoulettePlayResponse, RouletteStatusResponse
+from app.services.async_game_services import AsyncDiceService, AsyncLotteryService, AsyncRouletteService
+from app.services.game_common import MAX_PLAYS_PER_REQUEST
+
+roulette_router = APIRouter(prefix="/api/roulette", tags=["roulette"])
+dice_router = APIRouter(prefix="/api/dice", tags=["dice"])
+lottery_router = APIRouter(prefix="/api/lottery", tags=["lottery"])
+routers = (roulette_router, dice_router, lottery_router)
+
+roulette_service = AsyncRouletteService()
+dice_service = AsyncDiceService()
+lottery_service = AsyncLotteryService()
+
+
+@roulette_router.get("/status", response_model=RouletteStatusResponse)
+async def roulette_status(
+    db: AsyncSession = Depends(get_async_db), user_id: int = Depends(get_current_user_id)
+) -> RouletteStatusResponse:
+    return await roulette_service.get_status(db, user_id=user_id, today=date.today())
+
+
+@roulette_router.post("/play", response_model=RoulettePlayResponse)
+async def roulette_play(
+    count: int = Query(1, ge=1, le=MAX_PLAYS_PER_REQUEST),
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int = Depends(get_current_user_id),
+) -> RoulettePlayResponse:
+    return await roulette_service.play(db, user_id=user_id, now=date.today(), count=count)
+
+
+@dice_router.get("/status", response_model=DiceStatusResponse)
+async def dice_status(db: AsyncSession = Depends(get_async_db), user_id: int = Depends(get_current_user_id)) -> DiceStatusResponse:
+    return await dice_service.get_status(db, user_id=user_id, today=date.today())
+
+
+@dice_router.post("/play", response_model=DicePlayResponse)
+async def dice_play(
+    count: int = Query(1, ge=1, le=MAX_PLAYS_PER_REQUEST),
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int = Depends(get_current_user_id),
+) -> DicePlayResponse:
+    return await dice_service.play(db, user_id=user_id, now=date.today(), count=count)
+
+
+@lottery_router.get("/status", response_model=LotteryStatusResponse)
+async def lottery_status(
+    db: AsyncSession = Depends(get_async_db), user_id: int = Depends(get_current_user_id)
+) -> LotteryStatusResponse:
+    return await lottery_service.get_status(db, user_id=user_id, today=date.today())
+
+
+@lottery_router.post("/play", response_model=LotteryPlayResponse)
+async def lottery_play(
+    count: int = Query(1, ge=1, le=MAX_PLAYS_PER_REQUEST),
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int = Depends(get_current_user_id),
+) -> LotteryPlayResponse:
+    return await lottery_service.play(db, user_id=user_id, now=date.today(), count=count)
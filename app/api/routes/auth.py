@@ -9,6 +9,7 @@ from app.api.deps import get_db
 from app.core.security import create_access_token, verify_password
 from app.models.user import User
 from app.models.feature import UserEventLog
+from app.services.event_writer import event_writer
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -74,20 +75,24 @@ def issue_token(payload: TokenRequest, request: Request, db: Session = Depends(g
         # Ensure PK is assigned for newly created users before referencing user.id
         db.flush()
 
-        # Insert login event log
-        db.add(
-            UserEventLog(
-                user_id=user.id,
-                feature_type="AUTH",
-                event_name="AUTH_LOGIN",
-                meta_json={"external_id": user.external_id, "ip": client_ip},
+        # Insert login event log (buffered mode: handed to the event writer after the commit)
+        login_meta = {"external_id": user.external_id, "ip": client_ip}
+        if not event_writer.enabled:
+            db.add(
+                UserEventLog(
+                    user_id=user.id,
+                    feature_type="AUTH",
+                    event_name="AUTH_LOGIN",
+                    meta_json=login_meta,
+                )
             )
-        )
 
         db.commit()
     except Exception:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="USER_CREATE_FAILED")
+    if event_writer.enabled:
+        event_writer.submit(user.id, "AUTH", "AUTH_LOGIN", login_meta)
 
     token = create_access_token(user_id=user.id)
     return TokenResponse(
@@ -1,13 +1,14 @@
 """Dice API routes."""
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.api.deps import get_current_user_id
 from app.schemas.dice import DicePlayResponse, DiceStatusResponse
 from app.services.dice_service import DiceService
+from app.services.game_common import MAX_PLAYS_PER_REQUEST
 
 router = APIRouter(prefix="/api/dice", tags=["dice"])
 service = DiceService()
@@ -20,6 +21,10 @@ def dice_status(db: Session = Depends(get_db), user_id: int = Depends(get_curren
 
 
 @router.post("/play", response_model=DicePlayResponse)
-def dice_play(db: Session = Depends(get_db), user_id: int = Depends(get_current_user_id)) -> DicePlayResponse:
+def dice_play(
+    count: int = Query(1, ge=1, le=MAX_PLAYS_PER_REQUEST),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> DicePlayResponse:
     today = date.today()
-    return service.play(db=db, user_id=user_id, now=today)
+    return service.play(db=db, user_id=user_id, now=today, count=count)
@@ -1,12 +1,13 @@
 """Lottery API routes."""
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from app.api.deps import get_current_user_id, get_db
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.schemas.lottery import LotteryPlayResponse, LotteryStatusResponse
+from app.services.game_common import MAX_PLAYS_PER_REQUEST
 from app.services.lottery_service import LotteryService
 
 router = APIRouter(prefix="/api/lottery", tags=["lottery"])
@@ -20,6 +21,10 @@ def lottery_status(db: Session = Depends(get_db), user_id: int = Depends(get_cur
 
 
 @router.post("/play", response_model=LotteryPlayResponse)
-def lottery_play(db: Session = Depends(get_db), user_id: int = Depends(get_current_user_id)) -> LotteryPlayResponse:
+def lottery_play(
+    count: int = Query(1, ge=1, le=MAX_PLAYS_PER_REQUEST),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> LotteryPlayResponse:
     today = date.today()
-    return service.play(db=db, user_id=user_id, now=today)
+    return service.play(db=db, user_id=user_id, now=today, count=count)
@@ -1,11 +1,12 @@
 """Roulette API routes."""
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user_id, get_db
+from app.api.deps import get_current_user_id, get_db, get_read_db
 from app.schemas.roulette import RoulettePlayResponse, RouletteStatusResponse
+from app.services.game_common import MAX_PLAYS_PER_REQUEST
 from app.services.roulette_service import RouletteService
 
 router = APIRouter(prefix="/api/roulette", tags=["roulette"])
@@ -13,12 +14,16 @@ service = RouletteService()
 
 
 @router.get("/status", response_model=RouletteStatusResponse)
-def roulette_status(db: Session = Depends(get_db), user_id: int = Depends(get_current_user_id)) -> RouletteStatusResponse:
+def roulette_status(db: Session = Depends(get_read_db), user_id: int = Depends(get_current_user_id)) -> RouletteStatusResponse:
     today = date.today()
     return service.get_status(db=db, user_id=user_id, today=today)
 
 
 @router.post("/play", response_model=RoulettePlayResponse)
-def roulette_play(db: Session = Depends(get_db), user_id: int = Depends(get_current_user_id)) -> RoulettePlayResponse:
+def roulette_play(
+    count: int = Query(1, ge=1, le=MAX_PLAYS_PER_REQUEST),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> RoulettePlayResponse:
     today = date.today()
-    return service.play(db=db, user_id=user_id, now=today)
+    return service.play(db=db, user_id=user_id, now=today, count=count)
@@ -7,7 +7,7 @@ from datetime import date
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user_id, get_db
+from app.api.deps import get_current_user_id, get_db, get_read_db
 from app.schemas.season_pass import (
     ClaimRequest,
     ClaimResponse,
@@ -24,7 +24,7 @@ service = SeasonPassService()
 
 @router.get("/status", response_model=SeasonPassStatusResponse, summary="Get season pass status")
 def get_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user_id: int = Depends(get_current_user_id),
 ) -> SeasonPassStatusResponse:
     """Return active season info, progress, level list, and today's stamp flag."""
@@ -34,6 +34,67 @@ class Settings(BaseSettings):
         False, validation_alias=AliasChoices("FEATURE_GATE_ENABLED", "feature_gate_enabled")
     )
 
+    # In-process cache for active game/feature configs (0 disables caching)
+    config_cache_ttl_seconds: float = Field(
+        10.0, validation_alias=AliasChoices("CONFIG_CACHE_TTL_SECONDS", "config_cache_ttl_seconds")
+    )
+
+    # Connection pool (ignored for SQLite). DATABASE_READ_URL, when set, gets its own engine/pool
+    # for read-only queries (replica); otherwise reads share the primary engine.
+    database_read_url: str | None = Field(None, validation_alias=AliasChoices("DATABASE_READ_URL", "database_read_url"))
+    db_pool_size: int = Field(10, validation_alias=AliasChoices("DB_POOL_SIZE", "db_pool_size"))
+    db_max_overflow: int = Field(20, validation_alias=AliasChoices("DB_MAX_OVERFLOW", "db_max_overflow"))
+    db_pool_timeout: float = Field(10.0, validation_alias=AliasChoices("DB_POOL_TIMEOUT", "db_pool_timeout"))
+    db_pool_recycle: int = Field(1800, validation_alias=AliasChoices("DB_POOL_RECYCLE", "db_pool_recycle"))
+    db_pool_pre_ping: bool = Field(True, validation_alias=AliasChoices("DB_POOL_PRE_PING", "db_pool_pre_ping"))
+    # Game route stack: "sync" (def handlers in the threadpool over pymysql) or "async" (async def
+    # handlers over AsyncSession). ASYNC_DATABASE_URL defaults to DATABASE_URL with the async driver
+    # (mysql+aiomysql, sqlite+aiosqlite, postgresql+asyncpg). Only measured on SQLite so far, where it
+    # is not faster; size it with scripts/bench_async_stack.py --url against MySQL before switching.
+    db_stack: str = Field("sync", validation_alias=AliasChoices("DB_STACK", "db_stack"))
+    async_database_url: str | None = Field(
+        None, validation_alias=AliasChoices("ASYNC_DATABASE_URL", "async_database_url")
+    )
+
+    # After a successful user-facing write, that client's read-only endpoints use the primary for this long
+    # (covers replica lag so a play is visible in the next status call)
+    read_your_writes_seconds: float = Field(
+        5.0, validation_alias=AliasChoices("READ_YOUR_WRITES_SECONDS", "read_your_writes_seconds")
+    )
+
+    # Season pass stamp -> core level XP mirror: "inline" (savepoint in the stamp's transaction),
+    # "queue" (user_xp_mirror_queue, applied in batches by scripts/apply_xp_mirror_queue.py) or
+    # "session" (own session/connection, committed separately; needs a second pooled connection per
+    # stamp and is only used for stamps that commit on their own)
+    season_xp_mirror_mode: str = Field(
+        "inline", validation_alias=AliasChoices("SEASON_XP_MIRROR_MODE", "season_xp_mirror_mode")
+    )
+
+    # Reward delivery: "inline" (in the producing request) or "outbox" (reward_outbox rows written
+    # in the producer's transaction, delivered by scripts/reward_outbox_worker.py)
+    reward_delivery_mode: str = Field(
+        "inline", validation_alias=AliasChoices("REWARD_DELIVERY_MODE", "reward_delivery_mode")
+    )
+
+    # user_event_log writes: "sync" (inserted with the request) or "buffered" (queued in-process and
+    # written by a background thread every EVENT_LOG_FLUSH_INTERVAL_MS or EVENT_LOG_BATCH_SIZE events)
+    event_log_mode: str = Field("sync", validation_alias=AliasChoices("EVENT_LOG_MODE", "event_log_mode"))
+    event_log_batch_size: int = Field(500, validation_alias=AliasChoices("EVENT_LOG_BATCH_SIZE", "event_log_batch_size"))
+    event_log_flush_interval_ms: float = Field(
+        200.0, validation_alias=AliasChoices("EVENT_LOG_FLUSH_INTERVAL_MS", "event_log_flush_interval_ms")
+    )
+    event_log_max_queue: int = Field(10_000, validation_alias=AliasChoices("EVENT_LOG_MAX_QUEUE", "event_log_max_queue"))
+
+    # Lottery configs with use_urn: play tickets each worker reserves from the urn counter per
+    # round trip (one UPDATE of the shared lottery_urn row per batch instead of per play)
+    lottery_urn_batch_size: int = Field(
+        50, validation_alias=AliasChoices("LOTTERY_URN_BATCH_SIZE", "lottery_urn_batch_size")
+    )
+
+    # External ranking leaderboard: "memory" (per worker) or "redis" (shared ZSET, needs REDIS_URL)
+    leaderboard_backend: str = Field("memory", validation_alias=AliasChoices("LEADERBOARD_BACKEND", "leaderboard_backend"))
+    redis_url: str = Field("redis://localhost:6379/0", validation_alias=AliasChoices("REDIS_URL", "redis_url"))
+
     # External ranking anti-abuse (deposit -> XP)
     external_ranking_deposit_step_amount: int = Field(
         100_000, validation_alias=AliasChoices("EXTERNAL_RANKING_DEPOSIT_STEP_AMOUNT", "external_ranking_deposit_step_amount")
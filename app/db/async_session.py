@@ -0,0 +1,43 @@
+"""Async SQLAlchemy engine and session factory (DB_STACK=async).
+
+Built lazily on first use, so the sync stack never imports aiomysql/aiosqlite.
+"""
+from functools import lru_cache
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import get_settings
+from app.db.pool_metrics import PoolUsage
+from app.db.session import engine_options
+
+ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+async_pool_usage = PoolUsage()
+
+
+def async_url(url: str) -> str:
+    """Swap the sync DBAPI driver in `url` for the async one (mysql+pymysql -> mysql+aiomysql)."""
+
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"no async driver configured for {backend!r}; set ASYNC_DATABASE_URL")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    settings = get_settings()
+    url = settings.async_database_url or async_url(settings.database_url)
+    options = engine_options(url, settings)
+    # The async engine needs its own queue pool class; wait times are not instrumented here.
+    options.pop("poolclass", None)
+    engine = create_async_engine(url, **options)
+    async_pool_usage.attach(engine.sync_engine)
+    return engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
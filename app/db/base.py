@@ -3,6 +3,7 @@ from app.db.base_class import Base
 
 # Import models here so Alembic can discover them.
 from app.models import (  # noqa: F401
+    ConfigVersion,
     DiceConfig,
     DiceLog,
     FeatureConfig,
@@ -13,7 +14,10 @@ from app.models import (  # noqa: F401
     LotteryConfig,
     LotteryLog,
     LotteryPrize,
+    LotteryUrn,
+    LotteryUrnSlot,
     RankingDaily,
+    RewardOutbox,
     UserEventLog,
     RouletteConfig,
     RouletteLog,
@@ -31,6 +35,9 @@ from app.models import (  # noqa: F401
     UserLevelProgress,
     UserLevelRewardLog,
     UserXpEventLog,
+    UserXpMirrorQueue,
     User,
     UserGameWallet,
+    UserDailyPlayCount,
+    UserInternalWinCount,
 )
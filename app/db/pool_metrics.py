@@ -0,0 +1,122 @@
+"""Connection-pool usage counters driven by SQLAlchemy pool events."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolUsage:
+    """Count checkouts and track how many pooled connections are in use at once.
+
+    Wait times (how long a checkout blocked for a free connection) are only recorded for
+    engines built with `poolclass=TimedQueuePool`; pool events fire after the wait.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+
+    def attach(self, engine: Engine) -> "PoolUsage":
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        if isinstance(engine.pool, TimedQueuePool):
+            engine.pool.usage = self
+        return self
+
+    def detach(self, engine: Engine) -> None:
+        event.remove(engine, "checkout", self._on_checkout)
+        event.remove(engine, "checkin", self._on_checkin)
+        if isinstance(engine.pool, TimedQueuePool) and engine.pool.usage is self:
+            engine.pool.usage = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.peak_in_use = self.in_use
+            self.waits = 0
+            self.wait_seconds = 0.0
+            self.wait_seconds_max = 0.0
+            self.timeouts = 0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {"checkouts": self.checkouts, "in_use": self.in_use, "peak_in_use": self.peak_in_use}
+
+    def describe(self, engine: Engine) -> dict[str, Any]:
+        """Pool sizing and counters for the admin metrics endpoint."""
+
+        pool = engine.pool
+        with self._lock:
+            stats: dict[str, Any] = {
+                "pool": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.wait_seconds * 1000 / self.waits, 3) if self.waits else 0.0,
+                "max_wait_ms": round(self.wait_seconds_max * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,  # pylint: disable=protected-access
+                timeout=pool.timeout(),
+            )
+        return stats
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:  # noqa: ANN001
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:  # noqa: ANN001
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited to its PoolUsage."""
+
+    usage: PoolUsage | None = None
+
+    def _do_get(self):  # noqa: ANN202
+        usage = self.usage
+        if usage is None:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            usage.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        usage.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        pool.usage = self.usage
+        return pool
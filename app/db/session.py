@@ -1,10 +1,54 @@
 """SQLAlchemy session and engine configuration."""
+from typing import Any
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.db.pool_metrics import PoolUsage, TimedQueuePool
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, future=True)
+
+def engine_options(url: str, settings: Settings) -> dict[str, Any]:
+    """Pool keyword arguments for create_engine; SQLite keeps SQLAlchemy's default pool."""
+
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+engine = create_engine(settings.database_url, future=True, **engine_options(settings.database_url, settings))
+pool_usage = PoolUsage().attach(engine)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+# Read replica: a separate engine/pool when DATABASE_READ_URL is set, the primary otherwise.
+if settings.database_read_url:
+    read_engine = create_engine(
+        settings.database_read_url, future=True, **engine_options(settings.database_read_url, settings)
+    )
+    read_pool_usage = PoolUsage().attach(read_engine)
+else:
+    read_engine = engine
+    read_pool_usage = pool_usage
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+def has_read_replica() -> bool:
+    return read_engine is not engine
+
+
+def pool_metrics() -> dict[str, Any]:
+    """Pool statistics of this worker's engines (primary, plus read when it is separate)."""
+
+    metrics = {"primary": pool_usage.describe(engine)}
+    if has_read_replica():
+        metrics["read"] = read_pool_usage.describe(read_engine)
+    return metrics
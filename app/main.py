@@ -2,9 +2,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.deps import READ_PIN_HEADER
 from app.api.routes import api_router
 from app.core.config import get_settings
 from app.core.error_handlers import register_exception_handlers
+from app.db.async_session import get_async_engine
+from app.services.event_writer import event_writer
 
 settings = get_settings()
 
@@ -40,12 +43,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", READ_PIN_HEADER],
 )
 
 @app.on_event("startup")
 async def startup_event():
     print(f"Startup: CORS origins loaded: {cors_origins}", flush=True)
 
+
+@app.on_event("shutdown")
+def shutdown_event():
+    # Write out buffered user_event_log rows before the worker exits.
+    event_writer.stop()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    # Only built when DB_STACK=async routes were used.
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
 register_exception_handlers(app)
 app.include_router(api_router)
 
@@ -1,10 +1,13 @@
 """Model package exports."""
+from app.models.config_version import ConfigVersion
 from app.models.dice import DiceConfig, DiceLog
 from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType, UserEventLog
 from app.models.game_wallet import GameTokenType, UserGameWallet
-from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize
+from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize, LotteryUrn, LotteryUrnSlot
+from app.models.play_counter import UserDailyPlayCount, UserInternalWinCount
 from app.models.external_ranking import ExternalRankingData, ExternalRankingRewardLog
 from app.models.ranking import RankingDaily
+from app.models.reward_outbox import RewardOutbox
 from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
 from app.models.season_pass import (
     SeasonPassConfig,
@@ -14,11 +17,12 @@ from app.models.season_pass import (
     SeasonPassStampLog,
 )
 from app.models.team_battle import TeamSeason, Team, TeamMember, TeamScore, TeamEventLog
-from app.models.level_xp import UserLevelProgress, UserLevelRewardLog, UserXpEventLog
+from app.models.level_xp import UserLevelProgress, UserLevelRewardLog, UserXpEventLog, UserXpMirrorQueue
 from app.models.game_wallet_ledger import UserGameWalletLedger
 from app.models.user import User
 
 __all__ = [
+    "ConfigVersion",
     "FeatureConfig",
     "FeatureSchedule",
     "FeatureType",
@@ -36,6 +40,7 @@ __all__ = [
     "UserLevelProgress",
     "UserLevelRewardLog",
     "UserXpEventLog",
+    "UserXpMirrorQueue",
     "User",
     "RouletteConfig",
     "RouletteLog",
@@ -45,10 +50,15 @@ __all__ = [
     "LotteryConfig",
     "LotteryLog",
     "LotteryPrize",
+    "LotteryUrn",
+    "LotteryUrnSlot",
     "ExternalRankingData",
     "ExternalRankingRewardLog",
     "RankingDaily",
+    "RewardOutbox",
     "UserGameWallet",
     "GameTokenType",
     "UserGameWalletLedger",
+    "UserDailyPlayCount",
+    "UserInternalWinCount",
 ]
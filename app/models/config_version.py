@@ -0,0 +1,16 @@
+"""Version counters used to invalidate per-worker config caches."""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.db.base_class import Base
+
+
+class ConfigVersion(Base):
+    """One row per cache namespace (ROULETTE, LOTTERY, DICE, FEATURE, ...); admins bump on write."""
+
+    __tablename__ = "config_version"
+
+    namespace = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,7 +1,7 @@
 """Ledger for game token balance changes with metadata/label."""
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum as SAEnum, ForeignKey, Integer, String, JSON
+from sqlalchemy import Column, DateTime, Enum as SAEnum, ForeignKey, Index, Integer, String, JSON
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -10,6 +10,11 @@ from app.models.game_wallet import GameTokenType
 
 class UserGameWalletLedger(Base):
     __tablename__ = "user_game_wallet_ledger"
+    __table_args__ = (
+        # Keyset pagination of the admin ledger listing (newest first, optionally per user).
+        Index("ix_user_game_wallet_ledger_created_at_id", "created_at", "id"),
+        Index("ix_user_game_wallet_ledger_user_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -79,3 +79,22 @@ class UserXpEventLog(Base):
         back_populates="xp_events",
         viewonly=True,
     )
+
+
+class UserXpMirrorQueue(Base):
+    """Pending core-level XP from season pass stamps (SEASON_XP_MIRROR_MODE=queue).
+
+    Rows are written in the stamp's transaction and applied in batches by
+    LevelXPService.apply_queued (scripts/apply_xp_mirror_queue.py); applied rows are deleted.
+    """
+
+    __tablename__ = "user_xp_mirror_queue"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    delta = Column(Integer, nullable=False)
+    source = Column(String(100), nullable=False)
+    meta = Column(JSON, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
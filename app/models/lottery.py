@@ -16,6 +16,8 @@ class LotteryConfig(Base):
     name = Column(String(100), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
     max_daily_tickets = Column(Integer, nullable=False, default=0)
+    # Draw finite-stock prizes from a pre-drawn urn (LotteryUrnSlot) instead of the prize rows.
+    use_urn = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -52,6 +54,7 @@ class LotteryLog(Base):
     __tablename__ = "lottery_log"
     __table_args__ = (
         Index("ix_lottery_log_user_created_at", "user_id", "created_at"),
+        Index("ix_lottery_log_created_at_id", "created_at", "id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -61,3 +64,33 @@ class LotteryLog(Base):
     reward_type = Column(String(50), nullable=False)
     reward_amount = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class LotteryUrn(Base):
+    """Play-ticket counter of a config's pre-drawn urn; workers reserve tickets from it in batches."""
+
+    __tablename__ = "lottery_urn"
+
+    config_id = Column(Integer, ForeignKey("lottery_config.id", ondelete="CASCADE"), primary_key=True)
+    next_seq = Column(Integer, nullable=False, default=0)
+    last_seq = Column(Integer, nullable=False, default=-1)
+    # Bumped by every settle/rebuild; tickets reserved under an older generation claim nothing.
+    generation = Column(Integer, nullable=False, default=1)
+    built_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class LotteryUrnSlot(Base):
+    """Play ticket `seq` of an urn that wins one unit of a finite-stock prize."""
+
+    __tablename__ = "lottery_urn_slot"
+    __table_args__ = (
+        UniqueConstraint("config_id", "seq", name="uq_lottery_urn_slot_seq"),
+        Index("ix_lottery_urn_slot_unclaimed", "config_id", "claimed_at", "seq"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    config_id = Column(Integer, ForeignKey("lottery_config.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)
+    prize_id = Column(Integer, ForeignKey("lottery_prize.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
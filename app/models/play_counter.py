@@ -0,0 +1,31 @@
+"""Materialized per-user play and win counters."""
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Enum as SqlEnum, ForeignKey, Integer, UniqueConstraint
+
+from app.db.base_class import Base
+from app.models.feature import FeatureType
+
+
+class UserDailyPlayCount(Base):
+    """Number of plays per user, game and day; bumped by every play, read by status endpoints."""
+
+    __tablename__ = "user_daily_play_count"
+    __table_args__ = (UniqueConstraint("user_id", "feature_type", "play_date", name="uq_user_daily_play_count"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    feature_type = Column(SqlEnum(FeatureType), nullable=False)
+    play_date = Column(Date, nullable=False)
+    play_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class UserInternalWinCount(Base):
+    """Running total of internal game wins per user (dice WIN, roulette/lottery reward > 0)."""
+
+    __tablename__ = "user_internal_win_count"
+
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    win_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
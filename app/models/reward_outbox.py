@@ -0,0 +1,32 @@
+"""Transactional outbox for reward delivery (REWARD_DELIVERY_MODE=outbox)."""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String
+
+from app.db.base_class import Base
+
+
+class RewardOutbox(Base):
+    """A reward written in the producer's transaction and delivered later by the outbox worker.
+
+    `idempotency_key` is unique, so a producer that runs twice for the same business event
+    (level reached, team rank settled, ...) queues one delivery. The worker marks a row
+    DONE in the same transaction as the wallet write; failures are retried with exponential
+    backoff via `next_attempt_at` until they are parked as FAILED.
+    """
+
+    __tablename__ = "reward_outbox"
+    __table_args__ = (Index("ix_reward_outbox_status_next_attempt", "status", "next_attempt_at"),)
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    idempotency_key = Column(String(191), nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    reward_type = Column(String(50), nullable=False)
+    reward_amount = Column(Integer, nullable=False)
+    meta = Column(JSON, nullable=True)
+    status = Column(String(20), nullable=False, default="PENDING")  # PENDING / DONE / FAILED
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    delivered_at = Column(DateTime, nullable=True)
@@ -20,6 +20,8 @@ class AdminLotteryConfigBase(BaseModel):
     name: str
     is_active: bool = True
     max_daily_plays: int = 1
+    # Finite-stock prizes are drawn from a pre-drawn urn built on activation (see lottery_urn).
+    use_urn: bool = False
     prizes: List[AdminLotteryPrizeBase]
 
     model_config = ConfigDict(from_attributes=True, validate_by_name=True)
@@ -33,6 +35,7 @@ class AdminLotteryConfigUpdate(BaseModel):
     name: Optional[str] = None
     is_active: Optional[bool] = None
     max_daily_plays: Optional[int] = None
+    use_urn: Optional[bool] = None
     prizes: Optional[List[AdminLotteryPrizeBase]] = None
 
     model_config = ConfigDict(from_attributes=True)
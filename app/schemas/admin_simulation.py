@@ -0,0 +1,31 @@
+"""Schemas for the admin game-config payout simulator."""
+from pydantic import BaseModel
+
+
+class SimulationOutcome(BaseModel):
+    label: str
+    reward_type: str
+    reward_amount: int
+    count: int
+    probability: float
+
+
+class SimulationResponse(BaseModel):
+    game: str
+    config_id: int
+    # Plays actually simulated; less than requested when every lottery prize sold out.
+    plays: int
+    requested_plays: int
+    seed: int | None = None
+    # Expected reward_amount per token spent (all reward types, as in the play event's xp_from_reward).
+    rtp: float
+    variance: float
+    std_dev: float
+    payout_by_reward_type: dict[str, float]
+    distribution: list[SimulationOutcome]
+    token_type: str
+    # Tokens spent per play minus the same token won back (TICKET_* rewards).
+    net_token_burn_per_play: float
+    # Lottery: plays until the last finite-stock prize sold out (None if it did not within the run).
+    plays_to_sell_out: int | None = None
+    elapsed_ms: float
@@ -28,4 +28,6 @@ class DiceResult(BaseModel):
 class DicePlayResponse(BaseModel):
     result: str
     game: DiceResult
+    # Every roll of a multi-play in order; `game` is the last one.
+    games: list[DiceResult] = []
     season_pass: dict | None = None
@@ -38,3 +38,24 @@ class ExternalRankingEntry(BaseModel):
 
 class ExternalRankingListResponse(BaseModel):
     items: list[ExternalRankingEntry]
+    timings_ms: dict[str, float] | None = None
+
+
+class ExternalRankingImportFailure(BaseModel):
+    line: int
+    error: str
+
+
+class ExternalRankingImportResponse(BaseModel):
+    format: str
+    chunk_size: int
+    chunks: int
+    rows_read: int
+    rows_upserted: int
+    failed_count: int
+    failed: list[ExternalRankingImportFailure]
+    elapsed_ms: float
+    rows_per_second: float
+    timings_ms: dict[str, float]
+    # First line not imported when the file became unreadable mid-import (earlier chunks are committed).
+    aborted: ExternalRankingImportFailure | None = None
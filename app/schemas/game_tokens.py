@@ -25,6 +25,28 @@ class RevokeGameTokensRequest(BaseModel):
     amount: int = Field(gt=0)
 
 
+class BulkGameTokensRequest(BaseModel):
+    items: list[GrantGameTokensRequest] = Field(min_length=1, max_length=20000)
+    reason: str | None = None
+    label: str | None = None
+
+
+class BulkGameTokensFailure(BaseModel):
+    index: int
+    user_id: int | None = None
+    external_id: str | None = None
+    error: str
+
+
+class BulkGameTokensResponse(BaseModel):
+    requested: int
+    applied: int
+    failed: list[BulkGameTokensFailure]
+    balances: list[GrantGameTokensResponse]
+    elapsed_ms: float
+    rows_per_second: float
+
+
 class TokenBalance(BaseModel):
     user_id: int
     external_id: str | None = None
@@ -28,4 +28,6 @@ class LotteryStatusResponse(BaseModel):
 class LotteryPlayResponse(BaseModel):
     result: str
     prize: LotteryPrizeSchema
+    # Every draw of a multi-play in order; `prize` is the last one.
+    prizes: list[LotteryPrizeSchema] = []
     season_pass: dict | None = None
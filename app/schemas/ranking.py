@@ -32,4 +32,5 @@ class RankingTodayResponse(BaseModel):
     my_entry: RankingEntry | None = None
     external_entries: list[ExternalRankingEntry] = []
     my_external_entry: ExternalRankingEntry | None = None
+    external_total: int = 0
     feature_type: FeatureType
@@ -29,4 +29,6 @@ class RouletteStatusResponse(BaseModel):
 class RoulettePlayResponse(BaseModel):
     result: str
     segment: RouletteSegmentSchema
+    # Every spin of a multi-play in order; `segment` is the last one.
+    segments: list[RouletteSegmentSchema] = []
     season_pass: dict | None = None
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.models.dice import DiceConfig
 from app.schemas.admin_dice import AdminDiceConfigCreate, AdminDiceConfigUpdate
+from app.services.config_cache import config_cache
 
 
 class AdminDiceService:
@@ -40,6 +41,7 @@ class AdminDiceService:
             lose_reward_amount=data.lose_reward_value,
         )
         db.add(config)
+        config_cache.bump(db, "DICE")
         db.commit()
         db.refresh(config)
         return config
@@ -60,6 +62,7 @@ class AdminDiceService:
             else:
                 setattr(config, field, value)
         db.add(config)
+        config_cache.bump(db, "DICE")
         db.commit()
         db.refresh(config)
         return config
@@ -69,6 +72,7 @@ class AdminDiceService:
         config = AdminDiceService.get_config(db, config_id)
         config.is_active = active
         db.add(config)
+        config_cache.bump(db, "DICE")
         db.commit()
         db.refresh(config)
         return config
@@ -1,19 +1,82 @@
 """Admin CRUD for external ranking data and season-pass hooks."""
+import csv
+import json
+import time
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Iterable
+from itertools import islice
+from typing import IO, Iterable, Iterator
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, select, func
+from pydantic import ValidationError
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from app.models.external_ranking import ExternalRankingData
 from app.models.season_pass import SeasonPassStampLog
 from app.schemas.external_ranking import ExternalRankingCreate, ExternalRankingUpdate
 from app.models.user import User
+from app.services.config_cache import config_cache
+from app.services.leaderboard import NAMESPACE as LEADERBOARD_NAMESPACE, external_leaderboard
 from app.services.season_pass_service import SeasonPassService
 from app.core import config
 
 
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_FAILURE_SAMPLE = 100
+
+
+@dataclass
+class ExternalRankingImportFailure:
+    line: int
+    error: str
+
+
+@dataclass
+class ExternalRankingImportResult:
+    format: str
+    chunk_size: int
+    chunks: int = 0
+    rows_read: int = 0
+    rows_upserted: int = 0
+    failed_count: int = 0
+    # First IMPORT_FAILURE_SAMPLE failures only, so a bad 1M-row file cannot blow up the response.
+    failures: list[ExternalRankingImportFailure] = field(default_factory=list)
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    # Set when the file turned unreadable after chunks were committed: `line` is the first
+    # line not imported (every row before it was processed), so the upload can resume there.
+    aborted: ExternalRankingImportFailure | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def add_failure(self, line: int, error: str) -> None:
+        self.failed_count += 1
+        if len(self.failures) < IMPORT_FAILURE_SAMPLE:
+            self.failures.append(ExternalRankingImportFailure(line=line, error=error))
+
+
+def _iter_import_records(stream: IO[str], fmt: str) -> Iterator[tuple[int, dict | None]]:
+    """Yield (line number, raw record) lazily; unparsable lines yield None as the record."""
+
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            # Blank cells mean "not given" (e.g. external_id when user_id is set).
+            yield reader.line_num, {key: value for key, value in record.items() if key and value not in ("", None)}
+        return
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield line_no, record if isinstance(record, dict) else None
+
+
 class AdminExternalRankingService:
     """Manage external ranking data rows (deposit amount, play count)."""
 
@@ -44,7 +107,63 @@ class AdminExternalRankingService:
         return row
 
     @staticmethod
-    def upsert_many(db: Session, data: Iterable[ExternalRankingCreate]) -> list[ExternalRankingData]:
+    def _resolve_user_ids(
+        db: Session,
+        payloads: list[ExternalRankingCreate],
+        batch_size: int,
+        failures: list[tuple[int, str]] | None = None,
+    ) -> list[int | None]:
+        """Resolve every payload to a user id with one IN query per `batch_size` external ids.
+
+        Unresolvable payloads raise, or with `failures` are recorded as (index, error) and
+        resolve to None.
+        """
+
+        externals = list(dict.fromkeys(p.external_id for p in payloads if not p.user_id and p.external_id))
+        id_by_external: dict[str, int] = {}
+        for start in range(0, len(externals), batch_size):
+            chunk = externals[start : start + batch_size]
+            id_by_external.update(db.execute(select(User.external_id, User.id).where(User.external_id.in_(chunk))).all())
+
+        user_ids: list[int | None] = []
+        for index, payload in enumerate(payloads):
+            if payload.user_id:
+                user_ids.append(payload.user_id)
+                continue
+            if payload.external_id and payload.external_id in id_by_external:
+                user_ids.append(id_by_external[payload.external_id])
+                continue
+            code, detail = (
+                (status.HTTP_404_NOT_FOUND, "USER_NOT_FOUND") if payload.external_id else (status.HTTP_400_BAD_REQUEST, "USER_REQUIRED")
+            )
+            if failures is None:
+                raise HTTPException(status_code=code, detail=detail)
+            failures.append((index, detail))
+            user_ids.append(None)
+        return user_ids
+
+    @staticmethod
+    def upsert_many(
+        db: Session,
+        data: Iterable[ExternalRankingCreate],
+        batch_size: int = 1000,
+        timings: dict[str, float] | None = None,
+        failures: list[tuple[int, str]] | None = None,
+        weekly_top10: bool = True,
+    ) -> list[ExternalRankingData]:
+        """Upsert ranking rows and grant the season-pass XP earned since the previous upload.
+
+        Work is done in phases whose wall time (ms) is written into `timings` when given:
+        resolve (external ids, one IN query per batch), load (existing rows, likewise),
+        deltas (deposit/play XP and remainders for every row in one pass), write (single
+        commit + leaderboard update), xp (batched season-pass grants) and top10.
+
+        With `failures`, rows whose user cannot be resolved are skipped and reported as
+        (index, error) instead of failing the whole upload. `weekly_top10=False` leaves the
+        TOP10 stamp to the caller (see `award_weekly_top10`).
+        """
+
+        payloads = list(data)
         season_pass = SeasonPassService()
         settings = config.get_settings()
         today = date.today()
@@ -53,15 +172,36 @@ class AdminExternalRankingService:
         xp_per_step = max(settings.external_ranking_deposit_xp_per_step, 0)
         max_steps_per_day = max(settings.external_ranking_deposit_max_steps_per_day, 0)
         cooldown_minutes = max(settings.external_ranking_deposit_cooldown_minutes, 0)
+        phase_ms: dict[str, float] = {} if timings is None else timings
+        clock = time.perf_counter()
 
-        existing_by_user = {row.user_id: row for row in db.execute(select(ExternalRankingData)).scalars().all()}
-        results: list[ExternalRankingData] = []
+        def _lap(phase: str) -> None:
+            nonlocal clock
+            current = time.perf_counter()
+            phase_ms[phase] = round((current - clock) * 1000, 3)
+            clock = current
 
-        for payload in data:
-            user_id = AdminExternalRankingService._resolve_user_id(db, payload.user_id, payload.external_id)
+        resolved = AdminExternalRankingService._resolve_user_ids(db, payloads, batch_size, failures)
+        pairs = [(user_id, payload) for user_id, payload in zip(resolved, payloads) if user_id is not None]
+        _lap("resolve")
+
+        unique_user_ids = list(dict.fromkeys(user_id for user_id, _ in pairs))
+        existing_by_user: dict[int, ExternalRankingData] = {}
+        for start in range(0, len(unique_user_ids), batch_size):
+            chunk = unique_user_ids[start : start + batch_size]
+            existing_by_user.update(
+                (row.user_id, row)
+                for row in db.execute(select(ExternalRankingData).where(ExternalRankingData.user_id.in_(chunk))).scalars()
+            )
+        _lap("load")
+
+        # Values as of the previous upload, captured before this one overwrites them.
+        previous: dict[int, tuple[int, datetime | None]] = {}
+        results: list[ExternalRankingData] = []
+        for user_id, payload in pairs:
             row = existing_by_user.get(user_id)
-            prev_deposit = row.deposit_amount if row else 0
-            prev_play = row.play_count if row else 0
+            if user_id not in previous:
+                previous[user_id] = (row.deposit_amount, row.updated_at) if row else (0, None)
 
             # Daily baseline reset happens before overwriting with today's totals
             if row and row.last_daily_reset != today:
@@ -71,7 +211,6 @@ class AdminExternalRankingService:
                 row.last_daily_reset = today
 
             if row:
-                row.user_id = user_id
                 row.deposit_amount = payload.deposit_amount
                 row.play_count = payload.play_count
                 row.memo = payload.memo
@@ -81,6 +220,7 @@ class AdminExternalRankingService:
                     deposit_amount=payload.deposit_amount,
                     play_count=payload.play_count,
                     memo=payload.memo,
+                    deposit_remainder=0,
                     daily_base_deposit=0,
                     daily_base_play=0,
                     last_daily_reset=today,
@@ -89,84 +229,162 @@ class AdminExternalRankingService:
                 existing_by_user[user_id] = row
             results.append(row)
 
+        # Season pass XP hooks (daily deltas), computed for every user before anything is written
+        current_season = season_pass.get_current_season(db, today)
+        xp_by_user: dict[int, int] = {}
+        if current_season:
+            cooldown = timedelta(minutes=cooldown_minutes)
+            for user_id, (prev_deposit, prev_updated_at) in previous.items():
+                row = existing_by_user[user_id]
+                # 예치: step_amount 단위당 XP 지급 + remainder 누적
+                deposit_delta = max(row.deposit_amount - max(prev_deposit, row.daily_base_deposit or 0), 0)
+                deposit_steps, row.deposit_remainder = divmod((row.deposit_remainder or 0) + deposit_delta, step_amount)
+
+                # 상한 적용 (0이면 무제한)
+                if max_steps_per_day > 0:
+                    deposit_steps = min(deposit_steps, max_steps_per_day)
+
+                # 쿨다운: 직전 업데이트가 cooldown_minutes 이내면 지급만 보류하고 remainder만 저장
+                if deposit_steps > 0 and cooldown_minutes > 0 and prev_updated_at and now - prev_updated_at < cooldown:
+                    continue
+
+                # 이용 횟수: 1회당 xp_per_step 지급 (일일 누적 대비 증분 계산)
+                play_delta = max(row.play_count - (row.daily_base_play or 0), 0)
+                xp = (deposit_steps + play_delta) * xp_per_step
+                if xp > 0:
+                    xp_by_user[user_id] = xp
+        _lap("deltas")
+
+        config_cache.bump(db, LEADERBOARD_NAMESPACE)
         db.commit()
-        for row in results:
-            db.refresh(row)
+        external_leaderboard.apply_changes(db, upserted_user_ids=unique_user_ids)
+        _lap("write")
 
-        # Season pass XP hooks (daily deltas) + weekly TOP10 stamp
-        current_season = season_pass.get_current_season(db, today)
         if not current_season:
             return results
 
-        season_id = current_season.id
+        season_pass.add_bonus_xp_bulk(db, xp_by_user, now=today, batch_size=batch_size)
+        _lap("xp")
 
-        for row in results:
-            # 예치: step_amount 단위당 XP 지급 + remainder 누적
-            deposit_delta = max(row.deposit_amount - max(prev_deposit, row.daily_base_deposit or 0), 0)
-            total_for_step = (row.deposit_remainder or 0) + deposit_delta
-            deposit_steps = total_for_step // step_amount
-            remainder = total_for_step % step_amount
+        # Weekly TOP10 (once per ISO week)
+        # NOTE: Disabled in TEST_MODE to keep external ranking step tests deterministic.
+        if weekly_top10 and not settings.test_mode:
+            AdminExternalRankingService.award_weekly_top10(db, current_season.id, today, season_pass)
+        _lap("top10")
+        return results
 
-            # 상한 적용 (0이면 무제한)
-            if max_steps_per_day > 0:
-                deposit_steps = min(deposit_steps, max_steps_per_day)
+    @staticmethod
+    def import_stream(db: Session, stream: IO[str], fmt: str, chunk_size: int = 1000) -> ExternalRankingImportResult:
+        """Import CSV (with a header row) or NDJSON ranking rows without materializing the file.
 
-            # 쿨다운: 최근 업데이트가 cooldown_minutes 이내면 지급만 보류하고 remainder만 저장
-            if deposit_steps > 0 and cooldown_minutes > 0 and row.updated_at:
-                if now - row.updated_at < timedelta(minutes=cooldown_minutes):
-                    row.deposit_remainder = remainder
-                    continue
+        Rows are parsed and validated `chunk_size` at a time and each chunk goes through
+        upsert_many (its own commit); the session is expunged after every chunk so memory
+        does not grow with the file. Invalid rows and unknown users are reported by line and
+        skipped. The weekly TOP10 stamp runs once, after the last chunk.
 
-            if deposit_steps > 0 and xp_per_step > 0:
-                xp_to_add = deposit_steps * xp_per_step
-                season_pass.add_bonus_xp(db, user_id=row.user_id, xp_amount=xp_to_add, now=today)
+        A file that cannot be decoded or parsed is rejected with INVALID_IMPORT_FILE while
+        nothing is committed yet; after that the result is returned with `aborted` set
+        (and without the TOP10 stamp) so the caller sees what was imported and where to resume.
+        """
 
-            row.deposit_remainder = remainder
+        if fmt not in IMPORT_FORMATS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="UNSUPPORTED_IMPORT_FORMAT")
+        started = time.perf_counter()
+        result = ExternalRankingImportResult(format=fmt, chunk_size=chunk_size)
+        records = _iter_import_records(stream, fmt)
+        resume_line = 1
+        try:
+            while chunk := list(islice(records, chunk_size)):
+                result.rows_read += len(chunk)
+                lines: list[int] = []
+                payloads: list[ExternalRankingCreate] = []
+                chunk_failures: list[tuple[int, str]] = []
+                for line_no, record in chunk:
+                    payload = None
+                    if record is not None:
+                        try:
+                            payload = ExternalRankingCreate.model_validate(record)
+                        except ValidationError:
+                            pass
+                    if payload is None:
+                        chunk_failures.append((line_no, "INVALID_ROW"))
+                        continue
+                    payloads.append(payload)
+                    lines.append(line_no)
 
-            # 이용 횟수: 1회당 20 XP 지급 (일일 누적 대비 증분 계산)
-            play_delta = max(row.play_count - (row.daily_base_play or 0), 0)
-            if play_delta > 0 and xp_per_step > 0:
-                xp_to_add = play_delta * xp_per_step
-                season_pass.add_bonus_xp(db, user_id=row.user_id, xp_amount=xp_to_add, now=today)
+                failures: list[tuple[int, str]] = []
+                timings: dict[str, float] = {}
+                if payloads:
+                    AdminExternalRankingService.upsert_many(
+                        db, payloads, batch_size=chunk_size, timings=timings, failures=failures, weekly_top10=False
+                    )
+                chunk_failures.extend((lines[index], error) for index, error in failures)
+                for line_no, error in sorted(chunk_failures):
+                    result.add_failure(line_no, error)
+                result.rows_upserted += len(payloads) - len(failures)
+                for phase, ms in timings.items():
+                    result.timings_ms[phase] = round(result.timings_ms.get(phase, 0.0) + ms, 3)
+                result.chunks += 1
+                resume_line = chunk[-1][0] + 1
+                db.expunge_all()
+        except (csv.Error, UnicodeDecodeError) as exc:
+            if result.chunks == 0:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="INVALID_IMPORT_FILE") from exc
+            result.aborted = ExternalRankingImportFailure(line=resume_line, error="INVALID_IMPORT_FILE")
 
-        # Weekly TOP10 (once per ISO week)
-        # NOTE: Disabled in TEST_MODE to keep external ranking step tests deterministic.
-        if not settings.test_mode:
-            top10 = (
-                db.execute(
-                    select(ExternalRankingData)
-                    .order_by(ExternalRankingData.deposit_amount.desc(), ExternalRankingData.play_count.desc())
-                    .limit(10)
-                )
-                .scalars()
-                .all()
+        top10_started = time.perf_counter()
+        settings = config.get_settings()
+        season = (
+            SeasonPassService().get_current_season(db, date.today())
+            if result.rows_upserted and result.aborted is None
+            else None
+        )
+        if season and not settings.test_mode:
+            AdminExternalRankingService.award_weekly_top10(db, season.id, date.today())
+        result.timings_ms["top10"] = round((time.perf_counter() - top10_started) * 1000, 3)
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    @staticmethod
+    def award_weekly_top10(db: Session, season_id: int, today: date, season_pass: SeasonPassService | None = None) -> None:
+        """Stamp the current TOP10 once per ISO week (one IN query for existing stamps)."""
+
+        season_pass = season_pass or SeasonPassService()
+        top10_user_ids = (
+            db.execute(
+                select(ExternalRankingData.user_id)
+                .order_by(ExternalRankingData.deposit_amount.desc(), ExternalRankingData.play_count.desc())
+                .limit(10)
             )
-            iso_year, iso_week, _ = today.isocalendar()
-            week_key = f"W{iso_year}-{iso_week:02d}"
-            for entry in top10:
-                existing_top = (
-                    db.query(SeasonPassStampLog)
-                    .filter(
-                        SeasonPassStampLog.user_id == entry.user_id,
-                        SeasonPassStampLog.season_id == season_id,
-                        SeasonPassStampLog.source_feature_type == "EXTERNAL_RANKING_TOP10",
-                        SeasonPassStampLog.period_key == f"TOP10_{week_key}",
-                    )
-                    .one_or_none()
+            .scalars()
+            .all()
+        )
+        iso_year, iso_week, _ = today.isocalendar()
+        period_key = f"TOP10_W{iso_year}-{iso_week:02d}"
+        stamped = set(
+            db.execute(
+                select(SeasonPassStampLog.user_id).where(
+                    SeasonPassStampLog.user_id.in_(top10_user_ids),
+                    SeasonPassStampLog.season_id == season_id,
+                    SeasonPassStampLog.source_feature_type == "EXTERNAL_RANKING_TOP10",
+                    SeasonPassStampLog.period_key == period_key,
+                )
+            ).scalars()
+        )
+        for user_id in top10_user_ids:
+            if user_id not in stamped:
+                season_pass.maybe_add_stamp(
+                    db,
+                    user_id=user_id,
+                    source_feature_type="EXTERNAL_RANKING_TOP10",
+                    now=today,
+                    period_key=period_key,
                 )
-                if not existing_top:
-                    season_pass.maybe_add_stamp(
-                        db,
-                        user_id=entry.user_id,
-                        source_feature_type="EXTERNAL_RANKING_TOP10",
-                        now=today,
-                        period_key=f"TOP10_{week_key}",
-                    )
-        return results
 
     @staticmethod
     def update(db: Session, user_id: int, payload: ExternalRankingUpdate) -> ExternalRankingData:
         row = AdminExternalRankingService.get_by_user(db, user_id)
+        previous_user_id = row.user_id
         data = payload.model_dump(exclude_unset=True)
         if "external_id" in data:
             row.user_id = AdminExternalRankingService._resolve_user_id(db, None, data["external_id"])
@@ -175,8 +393,11 @@ class AdminExternalRankingService:
                 continue
             setattr(row, key, value)
         db.add(row)
+        config_cache.bump(db, LEADERBOARD_NAMESPACE)
         db.commit()
         db.refresh(row)
+        removed = [previous_user_id] if previous_user_id != row.user_id else []
+        external_leaderboard.apply_changes(db, upserted_user_ids=[row.user_id], removed_user_ids=removed)
         return row
 
     @staticmethod
@@ -184,4 +405,6 @@ class AdminExternalRankingService:
         result = db.execute(delete(ExternalRankingData).where(ExternalRankingData.user_id == user_id))
         if result.rowcount == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="EXTERNAL_RANKING_NOT_FOUND")
+        config_cache.bump(db, LEADERBOARD_NAMESPACE)
         db.commit()
+        external_leaderboard.apply_changes(db, removed_user_ids=[user_id])
@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.feature import FeatureSchedule
+from app.services.config_cache import config_cache
 from app.schemas.admin_feature_schedule import (
     AdminFeatureScheduleBase,
     AdminFeatureScheduleResponse,
@@ -41,6 +42,7 @@ class AdminFeatureScheduleService:
 
         db.add(schedule)
         try:
+            config_cache.bump(db, "FEATURE")
             db.commit()
         except Exception:
             db.rollback()
@@ -54,4 +56,5 @@ class AdminFeatureScheduleService:
         if not schedule:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SCHEDULE_NOT_FOUND")
         db.delete(schedule)
+        config_cache.bump(db, "FEATURE")
         db.commit()
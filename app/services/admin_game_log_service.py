@@ -0,0 +1,195 @@
+"""Keyset-paginated admin listings of game play logs and the token wallet ledger.
+
+Both listings are newest first. A page is addressed by an opaque cursor naming the last row
+of the previous page. The cursor holds (created_at, game, id) for play logs and
+(created_at, id) for the ledger, so every query is an index range scan of `limit` rows on
+(created_at, id) no matter how deep the page is.
+
+Play logs live in three tables. Each game is read as its own index-ordered stream of at most
+limit + 1 rows after the cursor. The streams are k-way merged with heapq.merge. This replaces
+a UNION ALL that sorted every log row and then skipped OFFSET rows.
+"""
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, select, true
+from sqlalchemy.orm import Session
+
+from app.models.dice import DiceLog
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.lottery import LotteryLog, LotteryPrize
+from app.models.roulette import RouletteLog, RouletteSegment
+from app.models.user import User
+from app.schemas.game_tokens import LedgerEntry, PlayLogEntry
+
+# Tie-break between games whose rows share a created_at (higher rank sorts first).
+GAME_RANK = {"DICE": 0, "LOTTERY": 1, "ROULETTE": 2}
+
+
+def encode_cursor(created_at: datetime, row_id: int, game: str | None = None) -> str:
+    payload = {"t": created_at.isoformat(), "id": row_id}
+    if game is not None:
+        payload["g"] = game
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, with_game: bool = False) -> tuple[datetime, int, str | None]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        game = payload["g"] if with_game else None
+        if with_game and game not in GAME_RANK:
+            raise ValueError(game)
+        return datetime.fromisoformat(payload["t"]), int(payload["id"]), game
+    except (ValueError, KeyError, TypeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="INVALID_CURSOR") from exc
+
+
+def _after(created_at_col, id_col, cursor_at: datetime, cursor_id: int, same_rank: bool = True, earlier_rank: bool = False):
+    """Rows strictly after the cursor in (created_at DESC, rank DESC, id DESC) order."""
+
+    if not same_rank:
+        # A lower-ranked game's rows at the cursor's created_at come after it; a higher rank's do not.
+        return created_at_col <= cursor_at if earlier_rank else created_at_col < cursor_at
+    return or_(created_at_col < cursor_at, and_(created_at_col == cursor_at, id_col < cursor_id))
+
+
+class AdminGameLogService:
+    def list_play_logs(
+        self,
+        db: Session,
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        external_id: str | None = None,
+    ) -> tuple[list[PlayLogEntry], str | None]:
+        """Return one page of play logs across games and the cursor of the next page (None at the end).
+
+        `offset` (legacy page numbers) skips rows past the cursor; it costs O(offset + limit) per stream.
+        """
+
+        user_id = None
+        if external_id:
+            user_id = db.execute(select(User.id).where(User.external_id == external_id)).scalar_one_or_none()
+            if user_id is None:
+                return [], None
+        after = decode_cursor(cursor, with_game=True) if cursor else None
+        want = offset + limit + 1
+
+        streams = [self._stream(db, game, after, user_id, want) for game in GAME_RANK]
+        merged = heapq.merge(*streams, key=lambda row: (row["created_at"], GAME_RANK[row["game"]], row["id"]), reverse=True)
+        rows = list(islice(merged, offset, want))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["created_at"], last["id"], last["game"])
+        return [
+            PlayLogEntry(**{**row, "created_at": row["created_at"].isoformat()}) for row in rows
+        ], next_cursor
+
+    def list_ledger(
+        self,
+        db: Session,
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        user_id: int | None = None,
+        external_id: str | None = None,
+        token_type: str | None = None,
+    ) -> tuple[list[LedgerEntry], str | None]:
+        query = select(UserGameWalletLedger, User.external_id).join(User, User.id == UserGameWalletLedger.user_id)
+        if user_id:
+            query = query.where(UserGameWalletLedger.user_id == user_id)
+        if external_id:
+            query = query.where(User.external_id == external_id)
+        if token_type:
+            query = query.where(UserGameWalletLedger.token_type == token_type)
+        if cursor:
+            cursor_at, cursor_id, _ = decode_cursor(cursor)
+            query = query.where(_after(UserGameWalletLedger.created_at, UserGameWalletLedger.id, cursor_at, cursor_id))
+        rows = db.execute(
+            query.order_by(UserGameWalletLedger.created_at.desc(), UserGameWalletLedger.id.desc())
+            .offset(offset)
+            .limit(limit + 1)
+        ).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1].UserGameWalletLedger
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return [
+            LedgerEntry(
+                id=entry.id,
+                user_id=entry.user_id,
+                external_id=external,
+                token_type=entry.token_type,
+                delta=entry.delta,
+                balance_after=entry.balance_after,
+                reason=entry.reason,
+                label=entry.label,
+                meta_json=entry.meta_json,
+                created_at=entry.created_at.isoformat(),
+            )
+            for entry, external in rows
+        ], next_cursor
+
+    @staticmethod
+    def _play_log_query(game: str):
+        if game == "ROULETTE":
+            return RouletteLog, select(
+                RouletteLog.id, RouletteLog.user_id, User.external_id, RouletteLog.reward_type,
+                RouletteLog.reward_amount, RouletteSegment.label.label("detail"), RouletteLog.created_at,
+            ).join(User, User.id == RouletteLog.user_id).join(RouletteSegment, RouletteSegment.id == RouletteLog.segment_id)
+        if game == "DICE":
+            return DiceLog, select(
+                DiceLog.id, DiceLog.user_id, User.external_id, DiceLog.reward_type,
+                DiceLog.reward_amount, DiceLog.result.label("detail"), DiceLog.created_at,
+            ).join(User, User.id == DiceLog.user_id)
+        return LotteryLog, select(
+            LotteryLog.id, LotteryLog.user_id, User.external_id, LotteryLog.reward_type,
+            LotteryLog.reward_amount, LotteryPrize.label.label("detail"), LotteryLog.created_at,
+        ).join(User, User.id == LotteryLog.user_id).join(LotteryPrize, LotteryPrize.id == LotteryLog.prize_id)
+
+    def _stream(
+        self,
+        db: Session,
+        game: str,
+        after: tuple[datetime, int, str | None] | None,
+        user_id: int | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Up to `limit` rows of one game after the cursor, newest first, straight off (created_at, id)."""
+
+        model, query = self._play_log_query(game)
+        condition = true()
+        if after is not None:
+            cursor_at, cursor_id, cursor_game = after
+            rank, cursor_rank = GAME_RANK[game], GAME_RANK[cursor_game]
+            condition = _after(
+                model.created_at, model.id, cursor_at, cursor_id,
+                same_rank=rank == cursor_rank, earlier_rank=rank < cursor_rank,
+            )
+        if user_id is not None:
+            condition = and_(condition, model.user_id == user_id)
+        rows = db.execute(query.where(condition).order_by(model.created_at.desc(), model.id.desc()).limit(limit)).all()
+        return [
+            {
+                "id": row.id,
+                "user_id": row.user_id,
+                "external_id": row.external_id,
+                "game": game,
+                "reward_label": row.detail,
+                "reward_type": row.reward_type,
+                "reward_amount": row.reward_amount,
+                "created_at": row.created_at,
+            }
+            for row in rows
+        ]
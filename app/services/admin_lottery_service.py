@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import InvalidConfigError
 from app.models.lottery import LotteryConfig, LotteryPrize
 from app.schemas.admin_lottery import AdminLotteryConfigCreate, AdminLotteryConfigUpdate
+from app.services.config_cache import config_cache
+from app.services.lottery_urn import lottery_urn
 
 
 class AdminLotteryService:
@@ -62,6 +64,16 @@ class AdminLotteryService:
         if total_weight <= 0:
             raise InvalidConfigError("ZERO_TOTAL_WEIGHT")
 
+    @staticmethod
+    def _rebuild_urn(db: Session, config: LotteryConfig) -> None:
+        """Redraw the urn of an active use_urn config, or settle and drop it otherwise."""
+
+        db.flush()
+        if config.use_urn and config.is_active:
+            lottery_urn.build(db, config)
+        else:
+            lottery_urn.settle(db, config)
+
     @staticmethod
     def create_config(db: Session, data: AdminLotteryConfigCreate) -> LotteryConfig:
         try:
@@ -69,9 +81,13 @@ class AdminLotteryService:
                 name=data.name,
                 is_active=data.is_active,
                 max_daily_tickets=data.max_daily_plays,
+                use_urn=data.use_urn,
             )
             AdminLotteryService._apply_prizes(config, data.prizes)
             db.add(config)
+            if config.use_urn:
+                AdminLotteryService._rebuild_urn(db, config)
+            config_cache.bump(db, "LOTTERY")
             db.commit()
             db.refresh(config)
             return config
@@ -87,15 +103,24 @@ class AdminLotteryService:
         config = AdminLotteryService.get_config(db, config_id)
         try:
             update_data = data.dict(exclude_unset=True)
+            # Claimed urn slots are written back to the old prizes before they can be replaced.
+            rebuild_urn = data.prizes is not None or "is_active" in update_data or "use_urn" in update_data
+            if rebuild_urn:
+                lottery_urn.settle(db, config)
             if "name" in update_data:
                 config.name = update_data["name"]
             if "is_active" in update_data:
                 config.is_active = update_data["is_active"]
             if "max_daily_plays" in update_data:
                 config.max_daily_tickets = update_data["max_daily_plays"]
+            if "use_urn" in update_data:
+                config.use_urn = update_data["use_urn"]
             if data.prizes is not None:
                 AdminLotteryService._apply_prizes(config, data.prizes)
             db.add(config)
+            if rebuild_urn:
+                AdminLotteryService._rebuild_urn(db, config)
+            config_cache.bump(db, "LOTTERY")
             db.commit()
             db.refresh(config)
             return config
@@ -111,6 +136,8 @@ class AdminLotteryService:
         config = AdminLotteryService.get_config(db, config_id)
         config.is_active = active
         db.add(config)
+        AdminLotteryService._rebuild_urn(db, config)
+        config_cache.bump(db, "LOTTERY")
         db.commit()
         db.refresh(config)
         return config
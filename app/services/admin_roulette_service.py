@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import InvalidConfigError
 from app.models.roulette import RouletteConfig, RouletteSegment
 from app.schemas.admin_roulette import AdminRouletteConfigCreate, AdminRouletteConfigUpdate
+from app.services.config_cache import config_cache
 
 
 class AdminRouletteService:
@@ -73,6 +74,7 @@ class AdminRouletteService:
             )
             AdminRouletteService._apply_segments(db, config, data.segments)
             db.add(config)
+            config_cache.bump(db, "ROULETTE")
             db.commit()
             db.refresh(config)
             return config
@@ -97,6 +99,7 @@ class AdminRouletteService:
             if data.segments is not None:
                 AdminRouletteService._apply_segments(db, config, data.segments)
             db.add(config)
+            config_cache.bump(db, "ROULETTE")
             db.commit()
             db.refresh(config)
             return config
@@ -112,6 +115,7 @@ class AdminRouletteService:
         config = AdminRouletteService.get_config(db, config_id)
         config.is_active = active
         db.add(config)
+        config_cache.bump(db, "ROULETTE")
         db.commit()
         db.refresh(config)
         return config
@@ -120,4 +124,5 @@ class AdminRouletteService:
     def delete_config(db: Session, config_id: int) -> None:
         config = AdminRouletteService.get_config(db, config_id)
         db.delete(config)
+        config_cache.bump(db, "ROULETTE")
         db.commit()
@@ -13,6 +13,7 @@ from app.schemas.admin_season import (
     AdminSeasonResponse,
     AdminSeasonUpdate,
 )
+from app.services.config_cache import config_cache
 
 
 class AdminSeasonService:
@@ -65,6 +66,7 @@ class AdminSeasonService:
         payload = data.dict(by_alias=True)
         season = SeasonPassConfig(**payload)
         db.add(season)
+        config_cache.bump(db, "SEASON_PASS")
         db.commit()
         db.refresh(season)
         return season
@@ -96,6 +98,7 @@ class AdminSeasonService:
                 raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="ACTIVE_SEASON_CONFLICT")
 
             db.add(season)
+            config_cache.bump(db, "SEASON_PASS")
             db.commit()
             db.refresh(season)
         return season
@@ -105,6 +108,7 @@ class AdminSeasonService:
         season = AdminSeasonService.get_season(db, season_id)
         season.is_active = False
         db.add(season)
+        config_cache.bump(db, "SEASON_PASS")
         db.commit()
         db.refresh(season)
         return season
@@ -5,21 +5,43 @@ from sqlalchemy import select, and_
 from sqlalchemy.orm import Session
 
 from app.core.security import hash_password
+from app.models.external_ranking import ExternalRankingData
 from app.models.user import User
-from app.models.season_pass import SeasonPassConfig, SeasonPassLevel, SeasonPassProgress
+from app.models.season_pass import SeasonPassConfig, SeasonPassProgress
 from app.schemas.admin_user import AdminUserCreate, AdminUserUpdate
+from app.services.config_cache import config_cache
+from app.services.leaderboard import NAMESPACE as LEADERBOARD_NAMESPACE, external_leaderboard
+from app.services.season_pass_service import NAMESPACE as SEASON_PASS_NAMESPACE, SeasonPassService
+from app.services.season_resolver import season_resolver
 
 
 class AdminUserService:
     """Provide create/read/update/delete operations for users."""
 
+    @staticmethod
+    def _bump_ranked_user(db: Session, user_id: int) -> bool:
+        """Bump the leaderboard version when `user_id` is ranked (its cached display name changes).
+
+        Returns whether it did; the caller then applies the change after committing.
+        """
+
+        ranked = db.execute(
+            select(ExternalRankingData.id).where(ExternalRankingData.user_id == user_id).limit(1)
+        ).first() is not None
+        if ranked:
+            config_cache.bump(db, LEADERBOARD_NAMESPACE)
+        return ranked
+
     @staticmethod
     def _get_active_season(db: Session, today: date) -> SeasonPassConfig | None:
-        return db.execute(
-            select(SeasonPassConfig).where(
-                and_(SeasonPassConfig.start_date <= today, SeasonPassConfig.end_date >= today, SeasonPassConfig.is_active == True)
-            )
-        ).scalar_one_or_none()
+        return season_resolver.get(
+            db,
+            SeasonPassConfig,
+            SEASON_PASS_NAMESPACE,
+            "active_flag",
+            today,
+            lambda session, at: SeasonPassService.load_season_window(session, at, active_only=True),
+        )
 
     @staticmethod
     def _get_or_create_progress(db: Session, user_id: int, season: SeasonPassConfig) -> SeasonPassProgress:
@@ -41,20 +63,7 @@ class AdminUserService:
 
     @staticmethod
     def _compute_level_from_xp(db: Session, season: SeasonPassConfig, xp: int) -> int:
-        levels = (
-            db.execute(
-                select(SeasonPassLevel.level, SeasonPassLevel.required_xp)
-                .where(SeasonPassLevel.season_id == season.id)
-                .order_by(SeasonPassLevel.level.asc())
-            )
-            .all()
-        )
-        target = 1
-        for lvl, req_xp in levels:
-            if xp >= req_xp:
-                target = lvl
-            else:
-                break
+        target = SeasonPassService.get_level_ladder(db, season.id).level_for_xp(xp)
         # Clamp to season.max_level in case table is incomplete
         return min(target, season.max_level)
 
@@ -167,8 +176,12 @@ class AdminUserService:
                 db.add(progress)
 
         db.add(user)
+        name_changed = "nickname" in update_data or "external_id" in update_data
+        ranked = name_changed and AdminUserService._bump_ranked_user(db, user.id)
         db.commit()
         db.refresh(user)
+        if ranked:
+            external_leaderboard.apply_changes(db, upserted_user_ids=[user.id])
         return AdminUserService._enrich_user_with_xp(db, user)
 
     @staticmethod
@@ -177,4 +190,8 @@ class AdminUserService:
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="USER_NOT_FOUND")
         db.delete(user)
+        # The ranking row outlives the user and falls back to the placeholder name.
+        ranked = AdminUserService._bump_ranked_user(db, user_id)
         db.commit()
+        if ranked:
+            external_leaderboard.apply_changes(db, upserted_user_ids=[user_id])
@@ -0,0 +1,88 @@
+"""AsyncSession front-ends for the hot game services (DB_STACK=async).
+
+Each method runs the existing sync service on the AsyncSession's connection via
+`AsyncSession.run_sync`: the service code, its transactions and its error codes stay the
+single implementation, while every statement goes through the async driver, so the event
+loop keeps serving other requests during DB round trips instead of parking a threadpool
+thread on a blocking pymysql call.
+
+The sync code runs on the event loop thread itself, so nothing inside it may wait on
+anything but the driver: the session is flagged so buffered analytics events are dropped
+(and counted) rather than waiting for room in a full event-writer queue.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.game_wallet import GameTokenType
+from app.schemas.dice import DicePlayResponse, DiceStatusResponse
+from app.schemas.lottery import LotteryPlayResponse, LotteryStatusResponse
+from app.schemas.roulette import RoulettePlayResponse, RouletteStatusResponse
+from app.services.dice_service import DiceService
+from app.services.event_writer import NONBLOCKING_SUBMIT
+from app.services.game_wallet_service import GameWalletService
+from app.services.lottery_service import LotteryService
+from app.services.roulette_service import RouletteService
+
+T = TypeVar("T")
+
+
+async def _run(db: AsyncSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    db.sync_session.info[NONBLOCKING_SUBMIT] = True
+    return await db.run_sync(lambda session: fn(session, *args, **kwargs))
+
+
+class AsyncRouletteService:
+    def __init__(self, service: RouletteService | None = None) -> None:
+        self.service = service or RouletteService()
+
+    async def get_status(self, db: AsyncSession, user_id: int, today: date) -> RouletteStatusResponse:
+        return await _run(db, self.service.get_status, user_id=user_id, today=today)
+
+    async def play(self, db: AsyncSession, user_id: int, now: date | datetime, count: int = 1) -> RoulettePlayResponse:
+        return await _run(db, self.service.play, user_id=user_id, now=now, count=count)
+
+
+class AsyncDiceService:
+    def __init__(self, service: DiceService | None = None) -> None:
+        self.service = service or DiceService()
+
+    async def get_status(self, db: AsyncSession, user_id: int, today: date) -> DiceStatusResponse:
+        return await _run(db, self.service.get_status, user_id=user_id, today=today)
+
+    async def play(self, db: AsyncSession, user_id: int, now: date | datetime, count: int = 1) -> DicePlayResponse:
+        return await _run(db, self.service.play, user_id=user_id, now=now, count=count)
+
+
+class AsyncLotteryService:
+    def __init__(self, service: LotteryService | None = None) -> None:
+        self.service = service or LotteryService()
+
+    async def get_status(self, db: AsyncSession, user_id: int, today: date) -> LotteryStatusResponse:
+        return await _run(db, self.service.get_status, user_id=user_id, today=today)
+
+    async def play(self, db: AsyncSession, user_id: int, now: date | datetime, count: int = 1) -> LotteryPlayResponse:
+        return await _run(db, self.service.play, user_id=user_id, now=now, count=count)
+
+
+class AsyncGameWalletService:
+    def __init__(self, service: GameWalletService | None = None) -> None:
+        self.service = service or GameWalletService()
+
+    async def get_balance(self, db: AsyncSession, user_id: int, token_type: GameTokenType) -> int:
+        return await _run(db, self.service.get_balance, user_id, token_type)
+
+    async def grant_tokens(self, db: AsyncSession, user_id: int, token_type: GameTokenType, amount: int, **kwargs: Any) -> int:
+        return await _run(db, self.service.grant_tokens, user_id, token_type, amount, **kwargs)
+
+    async def revoke_tokens(self, db: AsyncSession, user_id: int, token_type: GameTokenType, amount: int, **kwargs: Any) -> int:
+        return await _run(db, self.service.revoke_tokens, user_id, token_type, amount, **kwargs)
+
+    async def require_and_consume_token(
+        self, db: AsyncSession, user_id: int, token_type: GameTokenType, amount: int = 1, **kwargs: Any
+    ) -> int:
+        return await _run(db, self.service.require_and_consume_token, user_id, token_type, amount, **kwargs)
+
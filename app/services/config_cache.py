@@ -0,0 +1,364 @@
+"""In-process cache for active game/feature configs with cross-worker version invalidation.
+
+Configs change only through admin endpoints, yet every play/status call used to re-query
+them. Each worker keeps immutable snapshots per namespace:
+
+- Within `CONFIG_CACHE_TTL_SECONDS` a snapshot is served without touching the DB.
+- After the TTL one cheap `config_version` lookup decides whether the snapshot is still
+  current; only a changed version triggers a reload.
+- Admin writes call `config_cache.bump(db, namespace)` inside their transaction, which
+  increments the shared version (seen by every worker after at most one TTL) and drops
+  the local copy immediately.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import accumulate
+from typing import Any, Callable, Hashable
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.config_version import ConfigVersion
+from app.services.weighted_sampler import WeightedSampler, build_sampler
+
+
+@dataclass(frozen=True)
+class FeatureConfigSnapshot:
+    id: int
+    feature_type: Any
+    title: str
+    page_path: str
+    is_enabled: bool
+
+    @classmethod
+    def from_model(cls, row: Any) -> "FeatureConfigSnapshot":
+        return cls(id=row.id, feature_type=row.feature_type, title=row.title, page_path=row.page_path, is_enabled=row.is_enabled)
+
+
+@dataclass(frozen=True)
+class RouletteSegmentSnapshot:
+    id: int
+    slot_index: int
+    label: str
+    reward_type: str
+    reward_amount: int
+    weight: int
+    is_jackpot: bool
+
+    @classmethod
+    def from_model(cls, row: Any) -> "RouletteSegmentSnapshot":
+        return cls(
+            id=row.id,
+            slot_index=row.slot_index,
+            label=row.label,
+            reward_type=row.reward_type,
+            reward_amount=row.reward_amount,
+            weight=row.weight,
+            is_jackpot=bool(row.is_jackpot),
+        )
+
+
+@dataclass(frozen=True)
+class RouletteConfigSnapshot:
+    id: int
+    name: str
+    max_daily_spins: int
+    segments: tuple[RouletteSegmentSnapshot, ...]
+    # Alias table over `segments`, built once per snapshot.
+    sampler: WeightedSampler | None = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_model(cls, config: Any, segments: list[Any]) -> "RouletteConfigSnapshot":
+        snapshots = tuple(RouletteSegmentSnapshot.from_model(seg) for seg in segments)
+        return cls(
+            id=config.id,
+            name=config.name,
+            max_daily_spins=config.max_daily_spins,
+            segments=snapshots,
+            sampler=build_sampler(snapshots),
+        )
+
+    def pick(self) -> RouletteSegmentSnapshot:
+        return self.segments[self.sampler.sample_index()]
+
+
+@dataclass(frozen=True)
+class LotteryPrizeSnapshot:
+    id: int
+    label: str
+    reward_type: str
+    reward_amount: int
+    weight: int
+    stock: int | None
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, row: Any) -> "LotteryPrizeSnapshot":
+        return cls(
+            id=row.id,
+            label=row.label,
+            reward_type=row.reward_type,
+            reward_amount=row.reward_amount,
+            weight=row.weight,
+            stock=row.stock,
+            is_active=bool(row.is_active),
+        )
+
+
+@dataclass(frozen=True)
+class LotteryConfigSnapshot:
+    id: int
+    name: str
+    max_daily_tickets: int
+    prizes: tuple[LotteryPrizeSnapshot, ...]
+    use_urn: bool = False
+    urn_generation: int = 0
+    # Alias tables over `prizes` and over the unlimited-stock `unlimited` (urn plays), built
+    # once per snapshot; None when no prize in the pool has weight.
+    sampler: WeightedSampler | None = field(default=None, compare=False, repr=False)
+    unlimited: tuple[LotteryPrizeSnapshot, ...] = ()
+    unlimited_sampler: WeightedSampler | None = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_model(cls, config: Any, prizes: list[Any], urn_generation: int = 0) -> "LotteryConfigSnapshot":
+        snapshots = tuple(LotteryPrizeSnapshot.from_model(prize) for prize in prizes)
+        unlimited = tuple(prize for prize in snapshots if prize.stock is None and prize.weight > 0)
+        return cls(
+            id=config.id,
+            name=config.name,
+            max_daily_tickets=config.max_daily_tickets,
+            prizes=snapshots,
+            use_urn=bool(getattr(config, "use_urn", False)),
+            urn_generation=urn_generation,
+            sampler=build_sampler(snapshots),
+            unlimited=unlimited,
+            unlimited_sampler=build_sampler(unlimited),
+        )
+
+
+@dataclass(frozen=True)
+class DiceConfigSnapshot:
+    id: int
+    name: str
+    max_daily_plays: int
+    win_reward_type: str
+    win_reward_amount: int
+    draw_reward_type: str
+    draw_reward_amount: int
+    lose_reward_type: str
+    lose_reward_amount: int
+
+    @classmethod
+    def from_model(cls, config: Any) -> "DiceConfigSnapshot":
+        return cls(
+            id=config.id,
+            name=config.name,
+            max_daily_plays=config.max_daily_plays,
+            win_reward_type=config.win_reward_type,
+            win_reward_amount=config.win_reward_amount,
+            draw_reward_type=config.draw_reward_type,
+            draw_reward_amount=config.draw_reward_amount,
+            lose_reward_type=config.lose_reward_type,
+            lose_reward_amount=config.lose_reward_amount,
+        )
+
+
+@dataclass(frozen=True)
+class SeasonLevelSnapshot:
+    level: int
+    required_xp: int
+    reward_type: str
+    reward_amount: int
+    auto_claim: bool
+    reward_label: str
+
+
+@dataclass(frozen=True)
+class SeasonLevelLadder:
+    """Immutable level table of one season, resolved with bisect instead of DB queries.
+
+    `levels` is ordered by level number. `thresholds` is the running maximum of
+    required_xp along that order, so a level counts as reached once its own and every lower
+    level's requirement is met (the same prefix rule as walking the table in order).
+    """
+
+    season_id: int
+    levels: tuple[SeasonLevelSnapshot, ...]
+    thresholds: tuple[int, ...]
+    level_numbers: tuple[int, ...]
+
+    @classmethod
+    def from_models(cls, season_id: int, levels: list[Any], labels: dict[int, str] | None = None) -> "SeasonLevelLadder":
+        labels = labels or {}
+        by_level: dict[int, Any] = {}
+        for lvl in sorted(levels, key=lambda row: row.level):
+            by_level.setdefault(lvl.level, lvl)
+        snapshots = tuple(
+            SeasonLevelSnapshot(
+                level=lvl.level,
+                required_xp=lvl.required_xp,
+                reward_type=lvl.reward_type,
+                reward_amount=lvl.reward_amount,
+                auto_claim=lvl.auto_claim,
+                reward_label=labels.get(lvl.level, f"{lvl.reward_type} {lvl.reward_amount}"),
+            )
+            for lvl in by_level.values()
+        )
+        thresholds = tuple(accumulate((lvl.required_xp for lvl in snapshots), max))
+        return cls(season_id=season_id, levels=snapshots, thresholds=thresholds, level_numbers=tuple(by_level))
+
+    def reached(self, xp: int) -> tuple[SeasonLevelSnapshot, ...]:
+        """Levels reached with `xp`, in level order."""
+
+        return self.levels[: bisect_right(self.thresholds, xp)]
+
+    def crossed(self, previous_level: int, xp: int) -> tuple[SeasonLevelSnapshot, ...]:
+        """Levels above `previous_level` that are reached with `xp`."""
+
+        return self.levels[bisect_right(self.level_numbers, previous_level) : bisect_right(self.thresholds, xp)]
+
+    def get(self, level: int) -> SeasonLevelSnapshot | None:
+        index = bisect_left(self.level_numbers, level)
+        if index < len(self.level_numbers) and self.level_numbers[index] == level:
+            return self.levels[index]
+        return None
+
+    def level_for_xp(self, xp: int, default: int = 1) -> int:
+        count = bisect_right(self.thresholds, xp)
+        return self.levels[count - 1].level if count else default
+
+    def next_level_xp(self, xp: int) -> int:
+        """required_xp of the first level not reached yet (the top requirement once all are)."""
+
+        count = bisect_right(self.thresholds, xp)
+        if count < len(self.levels):
+            return self.levels[count].required_xp
+        return max((lvl.required_xp for lvl in self.levels), default=0)
+
+
+@dataclass(frozen=True)
+class SeasonPassSnapshot:
+    id: int
+    season_name: str
+    start_date: date
+    end_date: date
+    max_level: int
+    base_xp_per_stamp: int
+    ladder: SeasonLevelLadder
+
+    @property
+    def levels(self) -> tuple[SeasonLevelSnapshot, ...]:
+        return self.ladder.levels
+
+    @classmethod
+    def from_model(cls, season: Any, ladder: SeasonLevelLadder) -> "SeasonPassSnapshot":
+        return cls(
+            id=season.id,
+            season_name=season.season_name,
+            start_date=season.start_date,
+            end_date=season.end_date,
+            max_level=season.max_level,
+            base_xp_per_stamp=season.base_xp_per_stamp,
+            ladder=ladder,
+        )
+
+
+@dataclass
+class _Entry:
+    value: Any
+    version: int
+    expires_at: float
+
+
+class ConfigCache:
+    """TTL + version-checked cache of config snapshots, shared by all requests of a worker."""
+
+    def __init__(self, ttl_seconds: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[tuple[str, Hashable], _Entry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return get_settings().config_cache_ttl_seconds
+
+    @staticmethod
+    def current_version(db: Session, namespace: str) -> int:
+        version = db.execute(select(ConfigVersion.version).where(ConfigVersion.namespace == namespace)).scalar_one_or_none()
+        return version or 0
+
+    def get(self, db: Session, namespace: str, key: Hashable, loader: Callable[[Session], Any]) -> Any:
+        """Return the cached snapshot for (namespace, key), loading it with `loader(db)` when stale.
+
+        Loader exceptions propagate and are not cached.
+        """
+
+        ttl = self.ttl_seconds
+        if ttl <= 0:
+            return loader(db)
+
+        cache_key = (namespace, key)
+        now = self._clock()
+        entry = self._entries.get(cache_key)
+        if entry is not None and now < entry.expires_at:
+            self.hits += 1
+            return entry.value
+
+        version = self.current_version(db, namespace)
+        if entry is not None and entry.version == version:
+            entry.expires_at = now + ttl
+            self.hits += 1
+            return entry.value
+
+        self.misses += 1
+        value = loader(db)
+        with self._lock:
+            self._entries[cache_key] = _Entry(value=value, version=version, expires_at=now + ttl)
+        return value
+
+    def bump(self, db: Session, namespace: str) -> None:
+        """Increment the shared version for `namespace` (caller commits) and drop local copies."""
+
+        result = db.execute(
+            update(ConfigVersion)
+            .where(ConfigVersion.namespace == namespace)
+            .values(version=ConfigVersion.version + 1, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.add(ConfigVersion(namespace=namespace, version=1))
+            db.flush()
+        self.invalidate(namespace)
+
+    def discard(self, namespace: str, key: Hashable) -> None:
+        """Drop one local entry so the next `get` reloads it (the shared version is untouched)."""
+
+        with self._lock:
+            self._entries.pop((namespace, key), None)
+
+    def invalidate(self, namespace: str | None = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                self._entries.pop(cache_key, None)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+        self.hits = 0
+        self.misses = 0
+
+
+config_cache = ConfigCache()
@@ -2,7 +2,7 @@
 from datetime import date, datetime
 import random
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import InvalidConfigError
@@ -10,9 +10,11 @@ from app.models.dice import DiceConfig, DiceLog
 from app.models.feature import FeatureType
 from app.models.game_wallet import GameTokenType
 from app.schemas.dice import DicePlayResponse, DiceResult, DiceStatusResponse
+from app.services.config_cache import DiceConfigSnapshot, config_cache
 from app.services.feature_service import FeatureService
-from app.services.game_common import GamePlayContext, log_game_play
+from app.services.game_common import GamePlayContext, GamePlayUnitOfWork
 from app.services.game_wallet_service import GameWalletService
+from app.services.play_counter_service import PlayCounterService
 from app.services.reward_service import RewardService
 from app.services.season_pass_service import SeasonPassService
 
@@ -25,12 +27,18 @@ class DiceService:
         self.reward_service = RewardService()
         self.wallet_service = GameWalletService()
         self.season_pass_service = SeasonPassService()
+        self.play_counter_service = PlayCounterService()
 
-    def _get_today_config(self, db: Session) -> DiceConfig:
+    def _load_snapshot(self, db: Session) -> DiceConfigSnapshot:
         config = db.execute(select(DiceConfig).where(DiceConfig.is_active.is_(True))).scalar_one_or_none()
         if config is None:
             raise InvalidConfigError("DICE_CONFIG_MISSING")
-        return config
+        return DiceConfigSnapshot.from_model(config)
+
+    def _get_today_config(self, db: Session) -> DiceConfigSnapshot:
+        """Active dice config, served from the per-worker config cache."""
+
+        return config_cache.get(db, "DICE", "active", self._load_snapshot)
 
     @staticmethod
     def _validate_dice_values(values: list[int]) -> None:
@@ -43,13 +51,7 @@ class DiceService:
         token_type = GameTokenType.DICE_TOKEN
         token_balance = self.wallet_service.get_balance(db, user_id, token_type)
 
-        today_plays = db.execute(
-            select(func.count()).select_from(DiceLog).where(
-                DiceLog.user_id == user_id,
-                DiceLog.config_id == config.id,
-                func.date(DiceLog.created_at) == today,
-            )
-        ).scalar_one()
+        today_plays = self.play_counter_service.get_count(db, user_id, FeatureType.DICE, today)
         # Daily cap removed: use 0 to denote unlimited.
         unlimited = 0
         remaining = 0
@@ -65,20 +67,7 @@ class DiceService:
             feature_type=FeatureType.DICE,
         )
 
-    def play(self, db: Session, user_id: int, now: date | datetime) -> DicePlayResponse:
-        today = now.date() if isinstance(now, datetime) else now
-        self.feature_service.validate_feature_active(db, today, FeatureType.DICE)
-        config = self._get_today_config(db)
-        token_type = GameTokenType.DICE_TOKEN
-
-        today_plays = db.execute(
-            select(func.count()).select_from(DiceLog).where(
-                DiceLog.user_id == user_id,
-                DiceLog.config_id == config.id,
-                func.date(DiceLog.created_at) == today,
-            )
-        ).scalar_one()
-
+    def _roll(self, config: DiceConfigSnapshot) -> DiceResult:
         user_dice = [random.randint(1, 6), random.randint(1, 6)]
         dealer_dice = [random.randint(1, 6), random.randint(1, 6)]
         user_sum = sum(user_dice)
@@ -101,68 +90,80 @@ class DiceService:
             reward_type = config.lose_reward_type
             reward_amount = config.lose_reward_amount
 
-        self.wallet_service.require_and_consume_token(
-            db,
-            user_id,
-            token_type,
-            amount=1,
-            reason="DICE_PLAY",
-            label=f"{config.name} - {outcome}",
-            meta={"result": outcome},
-        )
-
-        log_entry = DiceLog(
-            user_id=user_id,
-            config_id=config.id,
-            user_dice_1=user_dice[0],
-            user_dice_2=user_dice[1],
+        return DiceResult(
+            user_dice=user_dice,
+            dealer_dice=dealer_dice,
             user_sum=user_sum,
-            dealer_dice_1=dealer_dice[0],
-            dealer_dice_2=dealer_dice[1],
             dealer_sum=dealer_sum,
-            result=outcome,
+            outcome=outcome,
             reward_type=reward_type,
             reward_amount=reward_amount,
         )
-        db.add(log_entry)
-        db.commit()
-        db.refresh(log_entry)
 
-        ctx = GamePlayContext(user_id=user_id, feature_type=FeatureType.DICE.value, today=today)
-        log_game_play(
-            ctx,
-            db,
-            {
-                "result": outcome,
-                "reward_type": reward_type,
-                "reward_amount": reward_amount,
-                "reward_label": f"{config.name} - {outcome}",
-                "xp_from_reward": reward_amount if reward_amount > 0 else 0,
-            },
-        )
+    def play(self, db: Session, user_id: int, now: date | datetime, count: int = 1) -> DicePlayResponse:
+        """Roll `count` times in one transaction (one debit, batched log inserts, one commit)."""
+
+        today = now.date() if isinstance(now, datetime) else now
+        self.feature_service.validate_feature_active(db, today, FeatureType.DICE)
+        config = self._get_today_config(db)
+        token_type = GameTokenType.DICE_TOKEN
+        rolls = [self._roll(config) for _ in range(count)]
 
-        self.reward_service.deliver(
+        ctx = GamePlayContext(user_id=user_id, feature_type=FeatureType.DICE.value, today=today)
+        with GamePlayUnitOfWork(
             db,
-            user_id=user_id,
-            reward_type=reward_type,
-            reward_amount=reward_amount,
-            meta={"reason": "dice_play", "outcome": outcome},
-        )
-        if outcome == "WIN":
-            self.season_pass_service.maybe_add_internal_win_stamp(db, user_id=user_id, now=today)
+            ctx,
+            wallet_service=self.wallet_service,
+            reward_service=self.reward_service,
+            season_pass_service=self.season_pass_service,
+        ) as uow:
+            uow.consume_tokens(
+                token_type,
+                [(f"{config.name} - {roll.outcome}", {"result": roll.outcome}) for roll in rolls],
+                reason="DICE_PLAY",
+            )
+            logs = [
+                DiceLog(
+                    user_id=user_id,
+                    config_id=config.id,
+                    user_dice_1=roll.user_dice[0],
+                    user_dice_2=roll.user_dice[1],
+                    user_sum=roll.user_sum,
+                    dealer_dice_1=roll.dealer_dice[0],
+                    dealer_dice_2=roll.dealer_dice[1],
+                    dealer_sum=roll.dealer_sum,
+                    result=roll.outcome,
+                    reward_type=roll.reward_type,
+                    reward_amount=roll.reward_amount,
+                )
+                for roll in rolls
+            ]
+            uow.add_logs(logs)
+            for roll, log in zip(rolls, logs):
+                uow.log_event(
+                    {
+                        "result": roll.outcome,
+                        "reward_type": roll.reward_type,
+                        "reward_amount": roll.reward_amount,
+                        "reward_label": f"{config.name} - {roll.outcome}",
+                        "xp_from_reward": roll.reward_amount if roll.reward_amount > 0 else 0,
+                    }
+                )
+                uow.deliver_reward(
+                    roll.reward_type,
+                    roll.reward_amount,
+                    meta={"reason": "dice_play", "outcome": roll.outcome},
+                    log=log,
+                )
+            wins = sum(1 for roll in rolls if roll.outcome == "WIN")
+            if wins:
+                uow.add_internal_win_stamp(wins)
         # 게임 설정 포인트를 시즌패스 XP 보너스로 반영
         season_pass = None  # 게임 1회당 자동 스탬프 발급을 중단하고, 조건 달성 시 별도 로직으로 처리
 
         return DicePlayResponse(
             result="OK",
-            game=DiceResult(
-                user_dice=user_dice,
-                dealer_dice=dealer_dice,
-                user_sum=user_sum,
-                dealer_sum=dealer_sum,
-                outcome=outcome,
-                reward_type=reward_type,
-                reward_amount=reward_amount,
-            ),
+            game=rolls[-1],
+            games=rolls,
             season_pass=season_pass,
         )
@@ -0,0 +1,210 @@
+"""Buffered, batched writer for user_event_log analytics rows (EVENT_LOG_MODE=buffered)."""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.feature import UserEventLog
+
+_STOP = object()
+
+# Session.info flag set by the async game stack: submits from that session never wait.
+NONBLOCKING_SUBMIT = "event_writer_nonblocking"
+
+
+class BufferedEventWriter:
+    """Queue UserEventLog rows in-process and write them from a background thread.
+
+    A flush happens once `batch_size` events are waiting or `flush_interval_ms` after the
+    first one arrived, as one multi-row INSERT and one commit. The queue is bounded: when it
+    is full, `submit` waits up to `put_timeout_ms` (backpressure on the producer) and then
+    drops the event and counts it. With `block=False` it drops at once instead, for callers
+    on the event loop thread (DB_STACK=async), where any wait would stall every request.
+    `stop()` flushes what is left (registered on app shutdown).
+    Events are analytics only, so a failed batch is counted, not retried.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] | None = None,
+        batch_size: int | None = None,
+        flush_interval_ms: float | None = None,
+        max_queue: int | None = None,
+        put_timeout_ms: float = 50.0,
+    ) -> None:
+        settings = get_settings()
+        self._session_factory = session_factory
+        self.batch_size = batch_size or settings.event_log_batch_size
+        self.flush_interval = (flush_interval_ms if flush_interval_ms is not None else settings.event_log_flush_interval_ms) / 1000
+        self.put_timeout = put_timeout_ms / 1000
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue or settings.event_log_max_queue)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._reset_counters()
+
+    @property
+    def enabled(self) -> bool:
+        return get_settings().event_log_mode == "buffered"
+
+    def _reset_counters(self) -> None:
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._flush_seconds = 0.0
+        self._flush_seconds_max = 0.0
+        self._latency_seconds = 0.0
+        self._latency_seconds_max = 0.0
+
+    def submit(
+        self, user_id: int, feature_type: str, event_name: str, meta: dict[str, Any] | None = None, block: bool = True
+    ) -> bool:
+        """Queue one event; returns False when it was dropped because the queue stayed full."""
+
+        self._ensure_started()
+        row = {
+            "user_id": user_id,
+            "feature_type": feature_type,
+            "event_name": event_name,
+            "meta_json": meta,
+            "created_at": datetime.utcnow(),
+        }
+        try:
+            if block:
+                self._queue.put((row, time.perf_counter()), timeout=self.put_timeout)
+            else:
+                self._queue.put_nowait((row, time.perf_counter()))
+        except queue.Full:
+            with self._metrics_lock:
+                self._dropped += 1
+            return False
+        with self._metrics_lock:
+            self._submitted += 1
+        return True
+
+    def flush(self) -> int:
+        """Write everything queued right now from the calling thread; returns rows written."""
+
+        written = 0
+        batch: list[tuple[dict, float]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                continue
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                written += self._write(batch)
+                batch = []
+        if batch:
+            written += self._write(batch)
+        return written
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and flush the remaining events."""
+
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        self.flush()
+
+    def metrics(self) -> dict[str, Any]:
+        with self._metrics_lock:
+            batches, written = self._batches, self._written
+            return {
+                "mode": get_settings().event_log_mode,
+                "submitted": self._submitted,
+                "written": written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "batches": batches,
+                "avg_batch": round(written / batches, 1) if batches else 0.0,
+                "avg_flush_ms": round(self._flush_seconds * 1000 / batches, 3) if batches else 0.0,
+                "max_flush_ms": round(self._flush_seconds_max * 1000, 3),
+                "avg_latency_ms": round(self._latency_seconds * 1000 / written, 3) if written else 0.0,
+                "max_latency_ms": round(self._latency_seconds_max * 1000, 3),
+            }
+
+    def reset_metrics(self) -> None:
+        with self._metrics_lock:
+            self._reset_counters()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+
+    def _write(self, batch: list[tuple[dict, float]]) -> int:
+        started = time.perf_counter()
+        try:
+            with self._get_session() as db:
+                db.execute(insert(UserEventLog), [row for row, _ in batch])
+                db.commit()
+        except Exception:
+            # Analytics only: count the lost rows (see metrics()["failed"]) instead of retrying.
+            with self._metrics_lock:
+                self._failed += len(batch)
+            return 0
+        done = time.perf_counter()
+        with self._metrics_lock:
+            self._written += len(batch)
+            self._batches += 1
+            self._flush_seconds += done - started
+            self._flush_seconds_max = max(self._flush_seconds_max, done - started)
+            for _, submitted in batch:
+                self._latency_seconds += done - submitted
+            self._latency_seconds_max = max(self._latency_seconds_max, done - min(submitted for _, submitted in batch))
+        return len(batch)
+
+    def _get_session(self) -> Session:
+        if self._session_factory is None:
+            from app.db.session import SessionLocal  # pylint: disable=import-outside-toplevel
+
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+
+event_writer = BufferedEventWriter()
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.core.config import get_settings
 from app.core.exceptions import FeatureNotActiveError, InvalidConfigError, NoFeatureTodayError
 from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.services.config_cache import FeatureConfigSnapshot, config_cache
 
 
 class FeatureService:
@@ -36,19 +37,28 @@ class FeatureService:
             raise FeatureNotActiveError("FEATURE_NOT_ACTIVE")
         return schedule.feature_type
 
-    def validate_feature_active(self, db: Session, now: date | datetime, expected_type: FeatureType) -> FeatureConfig:
+    def _get_feature_config(self, db: Session, feature_type: FeatureType) -> FeatureConfigSnapshot | None:
+        def load(session: Session) -> FeatureConfigSnapshot | None:
+            row = session.execute(select(FeatureConfig).where(FeatureConfig.feature_type == feature_type)).scalar_one_or_none()
+            return FeatureConfigSnapshot.from_model(row) if row else None
+
+        return config_cache.get(db, "FEATURE", ("config", feature_type), load)
+
+    def validate_feature_active(self, db: Session, now: date | datetime, expected_type: FeatureType) -> FeatureConfigSnapshot:
         """Validate that the requested feature is enabled.
 
         Today-feature 게이트는 기본 OFF이며, FEATURE_GATE_ENABLED=true일 때만 일정 검증을 수행한다.
+        The feature_config row (and the schedule lookup when the gate is on) is served from the config cache.
         """
         settings = get_settings()
 
         if settings.feature_gate_enabled and not settings.test_mode:
-            today_feature = self.get_today_feature(db, now)
+            today = now.astimezone(ZoneInfo("Asia/Seoul")).date() if isinstance(now, datetime) else now
+            today_feature = config_cache.get(db, "FEATURE", ("schedule", today), lambda session: self.get_today_feature(session, today))
             if today_feature != expected_type:
                 raise FeatureNotActiveError()
 
-        config = db.execute(select(FeatureConfig).where(FeatureConfig.feature_type == expected_type)).scalar_one_or_none()
+        config = self._get_feature_config(db, expected_type)
         if config is None:
             raise NoFeatureTodayError()
         if not config.is_enabled:
@@ -1,4 +1,4 @@
-"""Common helpers for game services (logging, season-pass hooks)."""
+"""Common helpers for game services (logging, season-pass hooks, play unit of work)."""
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, Optional
@@ -6,8 +6,18 @@ from typing import Any, Optional
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import DailyLimitReachedError
-from app.models.feature import UserEventLog
+from app.models.feature import FeatureType, UserEventLog
+from app.models.game_wallet import GameTokenType
+from app.services.event_writer import NONBLOCKING_SUBMIT, event_writer
+from app.services.game_wallet_service import GameWalletService
+from app.services.play_counter_service import PlayCounterService
+from app.services.reward_service import RewardService
 from app.services.season_pass_service import SeasonPassService
+
+# Upper bound of `count` on the play endpoints (x10 spins, bulk rolls).
+MAX_PLAYS_PER_REQUEST = 50
+
+
 @dataclass
 class GamePlayContext:
     """Context container for a single game play action."""
@@ -19,9 +29,18 @@ class GamePlayContext:
     metadata: Optional[dict[str, Any]] = None
 
 
-def log_game_play(ctx: GamePlayContext, db: Session, result_payload: dict[str, Any]) -> None:
-    """Persist shared event logging across games into user_event_log."""
+def log_game_play(ctx: GamePlayContext, db: Session, result_payload: dict[str, Any], commit: bool = True) -> None:
+    """Persist shared event logging across games into user_event_log.
 
+    With EVENT_LOG_MODE=buffered the row is handed to the background event writer instead
+    of being written (and committed) with `db`; sessions of the async stack never wait for
+    room in its queue (see `NONBLOCKING_SUBMIT`).
+    """
+
+    if event_writer.enabled:
+        block = not db.info.get(NONBLOCKING_SUBMIT, False)
+        event_writer.submit(ctx.user_id, ctx.feature_type, "PLAY", result_payload, block=block)
+        return
     entry = UserEventLog(
         user_id=ctx.user_id,
         feature_type=ctx.feature_type,
@@ -29,7 +48,138 @@ def log_game_play(ctx: GamePlayContext, db: Session, result_payload: dict[str, A
         meta_json=result_payload,
     )
     db.add(entry)
-    db.commit()
+    if commit:
+        db.commit()
+
+
+class GamePlayUnitOfWork:
+    """Stage every write of a single play and commit them in one transaction.
+
+    Wallet debit + ledger, the game log, the user_event_log row, the reward and the
+    internal-win stamp are flushed as they happen and committed once on exit (a buffered
+    user_event_log row is handed to the event writer after that commit).
+    Any exception rolls the whole play back, so a spin is never half-applied.
+    A multi-play (`count` > 1) is one unit of work: N tokens debited at once, N logs staged
+    together and a single commit.
+
+    Usage:
+        with GamePlayUnitOfWork(db, ctx) as uow:
+            uow.consume_token(GameTokenType.ROULETTE_COIN, reason="ROULETTE_PLAY")
+            uow.add_log(RouletteLog(...))
+            uow.log_event({...})
+            uow.deliver_reward("POINT", 100, meta={...})
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        ctx: GamePlayContext,
+        wallet_service: GameWalletService | None = None,
+        reward_service: RewardService | None = None,
+        season_pass_service: SeasonPassService | None = None,
+    ) -> None:
+        self.db = db
+        self.ctx = ctx
+        self.wallet_service = wallet_service or GameWalletService()
+        self.reward_service = reward_service or RewardService()
+        self.season_pass_service = season_pass_service or SeasonPassService()
+        self._log: Any = None
+        self._buffered_events: list[dict[str, Any]] = []
+
+    def __enter__(self) -> "GamePlayUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        if exc_type is not None:
+            self.db.rollback()
+            return
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        # Buffered analytics events only leave once the play is committed.
+        for payload in self._buffered_events:
+            log_game_play(self.ctx, self.db, payload)
+
+    def consume_token(
+        self,
+        token_type: GameTokenType,
+        amount: int = 1,
+        reason: str | None = None,
+        label: str | None = None,
+        meta: dict | None = None,
+    ) -> int:
+        return self.wallet_service.require_and_consume_token(
+            self.db,
+            self.ctx.user_id,
+            token_type,
+            amount=amount,
+            reason=reason,
+            label=label,
+            meta=meta,
+            commit=False,
+        )
+
+    def consume_tokens(
+        self,
+        token_type: GameTokenType,
+        plays: list[tuple[str | None, dict | None]],
+        reason: str | None = None,
+    ) -> int:
+        """Pay one token per play of a multi-play; `plays` holds each play's ledger (label, meta)."""
+        return self.wallet_service.consume_for_plays(
+            self.db, self.ctx.user_id, token_type, plays, reason=reason, commit=False
+        )
+
+    def add_logs(self, entries: list[Any]) -> None:
+        """Stage every log row of a multi-play (inserted together on flush); bump the play counter once."""
+        self.db.add_all(entries)
+        self._log = entries[-1]
+        PlayCounterService.increment(
+            self.db, self.ctx.user_id, FeatureType(self.ctx.feature_type), self.ctx.today, amount=len(entries)
+        )
+
+    def add_log(self, entry: Any) -> None:
+        """Stage the game log row and bump the user's daily play counter for this feature."""
+        self.db.add(entry)
+        self._log = entry
+        PlayCounterService.increment(self.db, self.ctx.user_id, FeatureType(self.ctx.feature_type), self.ctx.today)
+
+    def log_event(self, result_payload: dict[str, Any]) -> None:
+        if event_writer.enabled:
+            self._buffered_events.append(result_payload)
+            return
+        log_game_play(self.ctx, self.db, result_payload, commit=False)
+
+    def deliver_reward(
+        self, reward_type: str, reward_amount: int, meta: dict[str, Any] | None = None, log: Any = None
+    ) -> None:
+        """`log` names the play of a multi-play the reward belongs to (default: the last staged log)."""
+        log = log if log is not None else self._log
+        idempotency_key = None
+        if self.reward_service.outbox_enabled and log is not None:
+            # The play's log row identifies the reward when it is queued in the outbox.
+            self.db.flush()
+            idempotency_key = f"{self.ctx.feature_type}:{log.id}"
+        self.reward_service.deliver(
+            self.db,
+            user_id=self.ctx.user_id,
+            reward_type=reward_type,
+            reward_amount=reward_amount,
+            meta=meta,
+            commit=False,
+            idempotency_key=idempotency_key,
+        )
+
+    def add_internal_win_stamp(self, wins: int = 1) -> dict | None:
+        """Count this play's win(s) and award the INTERNAL_WIN_50 stamp once the threshold is hit."""
+        # Flush first so a counter seeded from the logs already includes this play's log rows.
+        self.db.flush()
+        total_wins = PlayCounterService.record_win(self.db, self.ctx.user_id, wins=wins)
+        return self.season_pass_service.maybe_add_internal_win_stamp(
+            self.db, user_id=self.ctx.user_id, now=self.ctx.today, commit=False, total_wins=total_wins
+        )
 
 
 def enforce_daily_limit(limit: int, played: int) -> None:
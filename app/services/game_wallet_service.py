@@ -1,14 +1,76 @@
 """Game wallet service for per-feature tokens."""
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Protocol, Sequence
+
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core import config
 from app.core.exceptions import InvalidConfigError, NotEnoughTokensError
 from app.models.game_wallet import GameTokenType, UserGameWallet
 from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+
+_wallet_table = UserGameWallet.__table__
+# executemany-friendly relative update; the guard keeps revokes from going negative even if
+# another transaction debited the wallet after it was read.
+_BULK_DELTA_UPDATE = (
+    _wallet_table.update()
+    .where(
+        _wallet_table.c.user_id == bindparam("b_user_id"),
+        _wallet_table.c.token_type == bindparam("b_token_type"),
+        _wallet_table.c.balance + bindparam("b_delta") >= 0,
+    )
+    .values(balance=_wallet_table.c.balance + bindparam("b_delta"))
+)
+
+
+class BulkTokenItem(Protocol):
+    user_id: int | None
+    external_id: str | None
+    token_type: GameTokenType
+    amount: int
+
+
+@dataclass
+class BulkTokenFailure:
+    index: int
+    user_id: int | None
+    external_id: str | None
+    error: str
+
+
+@dataclass
+class BulkTokenResult:
+    requested: int = 0
+    applied: int = 0
+    failures: list[BulkTokenFailure] = field(default_factory=list)
+    # Final balance per touched wallet: (user_id, token_type) -> (external_id, balance)
+    balances: dict[tuple[int, GameTokenType], tuple[str | None, int]] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.requested / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
 
 
 class GameWalletService:
-    def _get_or_create_wallet(self, db: Session, user_id: int, token_type: GameTokenType) -> UserGameWallet:
+    @staticmethod
+    def _persist(db: Session, commit: bool, instance=None) -> None:
+        """Commit (and refresh) immediately, or only flush when the caller owns the transaction."""
+
+        if not commit:
+            db.flush()
+            return
+        db.commit()
+        if instance is not None:
+            db.refresh(instance)
+
+    def _get_or_create_wallet(self, db: Session, user_id: int, token_type: GameTokenType, commit: bool = True) -> UserGameWallet:
         wallet = (
             db.query(UserGameWallet)
             .filter(UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type)
@@ -17,11 +79,10 @@ class GameWalletService:
         if wallet is None:
             wallet = UserGameWallet(user_id=user_id, token_type=token_type, balance=0)
             db.add(wallet)
-            db.commit()
-            db.refresh(wallet)
+            self._persist(db, commit, wallet)
         return wallet
 
-    def _log_ledger(self, db: Session, user_id: int, token_type: GameTokenType, delta: int, balance_after: int, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> None:
+    def _log_ledger(self, db: Session, user_id: int, token_type: GameTokenType, delta: int, balance_after: int, reason: str | None = None, label: str | None = None, meta: dict | None = None, commit: bool = True) -> None:
         entry = UserGameWalletLedger(
             user_id=user_id,
             token_type=token_type,
@@ -32,57 +93,271 @@ class GameWalletService:
             meta_json=meta or {},
         )
         db.add(entry)
-        db.commit()
+        if commit:
+            db.commit()
 
     def get_balance(self, db: Session, user_id: int, token_type: GameTokenType) -> int:
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
-        return wallet.balance
+        """Read-only (safe on a replica session): a missing wallet reads as 0 and is not created."""
 
-    def require_and_consume_token(self, db: Session, user_id: int, token_type: GameTokenType, amount: int = 1, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> int:
-        if amount <= 0:
-            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+        balance = db.execute(
+            select(UserGameWallet.balance).where(UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type)
+        ).scalar_one_or_none()
+        return balance or 0
 
-        settings = config.get_settings()
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
+    def _debit(self, db: Session, user_id: int, token_type: GameTokenType, amount: int) -> int | None:
+        """Atomically subtract `amount` if the balance covers it; return the new balance or None.
 
-        # In test mode, auto-top-up to avoid blocking tests/demos.
-        if settings.test_mode and wallet.balance < amount:
-            wallet.balance = max(wallet.balance, amount)
-            db.add(wallet)
-            db.commit()
-            db.refresh(wallet)
+        A single `UPDATE ... SET balance = balance - :amount WHERE balance >= :amount` replaces
+        the read-check-write sequence, so concurrent debits can never overdraw the wallet.
+        The new balance comes back via RETURNING where the dialect supports it; otherwise it is
+        re-read inside the same transaction, which now holds the row lock.
+        """
+
+        stmt = (
+            update(UserGameWallet)
+            .where(
+                UserGameWallet.user_id == user_id,
+                UserGameWallet.token_type == token_type,
+                UserGameWallet.balance >= amount,
+            )
+            .values(balance=UserGameWallet.balance - amount, updated_at=datetime.utcnow())
+        )
+        if db.get_bind().dialect.update_returning:
+            return db.execute(stmt.returning(UserGameWallet.balance)).scalar_one_or_none()
+
+        if db.execute(stmt).rowcount == 0:
+            return None
+        return db.execute(
+            select(UserGameWallet.balance).where(UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type)
+        ).scalar_one()
 
+    def _require_debit(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, commit: bool) -> int:
+        balance = self._debit(db, user_id, token_type, amount)
+        if balance is not None:
+            return balance
+        settings = config.get_settings()
+        if not settings.test_mode:
+            raise NotEnoughTokensError("NOT_ENOUGH_TOKENS")
+        # In test mode, auto-top-up to avoid blocking tests/demos.
+        wallet = self._get_or_create_wallet(db, user_id, token_type, commit=commit)
         if wallet.balance < amount:
+            wallet.balance = amount
+            db.add(wallet)
+            self._persist(db, commit, wallet)
+        balance = self._debit(db, user_id, token_type, amount)
+        if balance is None:
             raise NotEnoughTokensError("NOT_ENOUGH_TOKENS")
+        return balance
 
-        wallet.balance -= amount
-        db.add(wallet)
-        db.commit()
-        db.refresh(wallet)
-        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=wallet.balance, reason=reason or "CONSUME", label=label, meta=meta)
-        return wallet.balance
+    def require_and_consume_token(self, db: Session, user_id: int, token_type: GameTokenType, amount: int = 1, reason: str | None = None, label: str | None = None, meta: dict | None = None, commit: bool = True) -> int:
+        """Debit tokens and write the ledger row; with commit=False both are only flushed."""
+        if amount <= 0:
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+
+        balance = self._require_debit(db, user_id, token_type, amount, commit=commit)
+        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=balance, reason=reason or "CONSUME", label=label, meta=meta, commit=commit)
+        if not commit:
+            db.flush()
+        return balance
+
+    def consume_for_plays(self, db: Session, user_id: int, token_type: GameTokenType, plays: Sequence[tuple[str | None, dict | None]], reason: str | None = None, commit: bool = True) -> int:
+        """Debit one token per play in a single conditional UPDATE; bulk-insert one ledger row per play.
 
-    def grant_tokens(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> int:
+        `plays` holds each play's (label, meta). Either every play is paid for or nothing is
+        debited. Returns the balance after the last play.
+        """
+        if not plays:
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+
+        balance = self._require_debit(db, user_id, token_type, len(plays), commit=commit)
+        last = len(plays) - 1
+        db.execute(
+            insert(UserGameWalletLedger),
+            [
+                {
+                    "user_id": user_id,
+                    "token_type": token_type,
+                    "delta": -1,
+                    "balance_after": balance + last - index,
+                    "reason": reason or "CONSUME",
+                    "label": label,
+                    "meta_json": meta or {},
+                }
+                for index, (label, meta) in enumerate(plays)
+            ],
+        )
+        if commit:
+            db.commit()
+        return balance
+
+    def grant_tokens(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, reason: str | None = None, label: str | None = None, meta: dict | None = None, commit: bool = True) -> int:
         if amount <= 0:
             raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
+        wallet = self._get_or_create_wallet(db, user_id, token_type, commit=commit)
         wallet.balance += amount
         db.add(wallet)
-        db.commit()
-        db.refresh(wallet)
-        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=amount, balance_after=wallet.balance, reason=reason or "GRANT", label=label, meta=meta)
+        if commit:
+            db.commit()
+            db.refresh(wallet)
+        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=amount, balance_after=wallet.balance, reason=reason or "GRANT", label=label, meta=meta, commit=commit)
         return wallet.balance
 
     def revoke_tokens(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> int:
         """Admin-only token revocation; prevents negative balance."""
         if amount <= 0:
             raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
-        if wallet.balance < amount:
+        balance = self._debit(db, user_id, token_type, amount)
+        if balance is None:
             raise NotEnoughTokensError("NOT_ENOUGH_TOKENS")
-        wallet.balance -= amount
-        db.add(wallet)
-        db.commit()
-        db.refresh(wallet)
-        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=wallet.balance, reason=reason or "REVOKE", label=label, meta=meta)
-        return wallet.balance
+        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=balance, reason=reason or "REVOKE", label=label, meta=meta)
+        return balance
+
+    def grant_tokens_bulk(self, db: Session, items: Sequence[BulkTokenItem], reason: str | None = None, label: str | None = None, meta: dict | None = None, batch_size: int = 1000, commit: bool = True) -> BulkTokenResult:
+        """Grant tokens to many users at once; see `_apply_bulk`."""
+        return self._apply_bulk(db, items, sign=1, reason=reason or "GRANT", label=label, meta=meta, batch_size=batch_size, commit=commit)
+
+    def revoke_tokens_bulk(self, db: Session, items: Sequence[BulkTokenItem], reason: str | None = None, label: str | None = None, meta: dict | None = None, batch_size: int = 1000, commit: bool = True) -> BulkTokenResult:
+        """Admin-only bulk revocation; rows that would make a balance negative are reported as failures."""
+        return self._apply_bulk(db, items, sign=-1, reason=reason or "REVOKE", label=label, meta=meta, batch_size=batch_size, commit=commit)
+
+    @staticmethod
+    def _resolve_users(db: Session, items: Sequence[BulkTokenItem], batch_size: int) -> tuple[dict[int, str | None], dict[str, int]]:
+        """Look up every referenced user id / external_id with one IN query per `batch_size` keys."""
+
+        lookups = [("id", uid) for uid in {item.user_id for item in items if item.user_id}]
+        lookups += [("ext", ext) for ext in {item.external_id for item in items if not item.user_id and item.external_id}]
+        external_by_id: dict[int, str | None] = {}
+        id_by_external: dict[str, int] = {}
+        for start in range(0, len(lookups), batch_size):
+            chunk = lookups[start : start + batch_size]
+            ids = [value for kind, value in chunk if kind == "id"]
+            externals = [value for kind, value in chunk if kind == "ext"]
+            conditions = []
+            if ids:
+                conditions.append(User.id.in_(ids))
+            if externals:
+                conditions.append(User.external_id.in_(externals))
+            for user_id, external_id in db.execute(select(User.id, User.external_id).where(or_(*conditions))):
+                external_by_id[user_id] = external_id
+                if external_id is not None:
+                    id_by_external[external_id] = user_id
+        return external_by_id, id_by_external
+
+    @staticmethod
+    def _insert_missing_wallets(db: Session, keys: list[tuple[int, GameTokenType]]) -> list[tuple[int, GameTokenType]]:
+        """Insert zero-balance wallets for `keys`; returns the keys a concurrent request created first.
+
+        FOR UPDATE cannot lock rows that do not exist yet, so a first play or another bulk run
+        may insert the same wallet meanwhile. Like PlayCounterService.increment, a savepoint
+        catches the duplicate: the batch insert falls back to one savepoint per wallet.
+        """
+
+        rows = [{"user_id": user_id, "token_type": token_type, "balance": 0} for user_id, token_type in keys]
+        try:
+            with db.begin_nested():
+                db.execute(insert(UserGameWallet), rows)
+            return []
+        except IntegrityError:
+            pass
+        raced = []
+        for key, row in zip(keys, rows):
+            try:
+                with db.begin_nested():
+                    db.execute(insert(UserGameWallet), row)
+            except IntegrityError:
+                raced.append(key)
+        return raced
+
+    def _apply_bulk(self, db: Session, items: Sequence[BulkTokenItem], sign: int, reason: str, label: str | None, meta: dict | None, batch_size: int, commit: bool) -> BulkTokenResult:
+        """Apply many token deltas with a handful of statements per `batch_size` wallets.
+
+        Per batch: one SELECT (FOR UPDATE where supported) of the existing wallets, one
+        executemany INSERT for missing wallets, one executemany relative UPDATE and one
+        executemany INSERT into the ledger. Every input row gets its own ledger entry, with
+        `balance_after` computed in input order. Everything is committed once at the end.
+        """
+
+        started = time.perf_counter()
+        result = BulkTokenResult(requested=len(items))
+        external_by_id, id_by_external = self._resolve_users(db, items, batch_size)
+
+        valid: list[tuple[int, int, GameTokenType, int]] = []
+        for index, item in enumerate(items):
+            if item.amount <= 0:
+                error = "INVALID_TOKEN_AMOUNT"
+            elif item.user_id:
+                error = None if item.user_id in external_by_id else "USER_NOT_FOUND"
+                user_id = item.user_id
+            elif item.external_id:
+                user_id = id_by_external.get(item.external_id)
+                error = None if user_id is not None else "USER_NOT_FOUND"
+            else:
+                error = "USER_REQUIRED"
+            if error is not None:
+                result.failures.append(BulkTokenFailure(index=index, user_id=item.user_id, external_id=item.external_id, error=error))
+                continue
+            valid.append((index, user_id, item.token_type, item.amount))
+
+        keys = list(dict.fromkeys((user_id, token_type) for _, user_id, token_type, _ in valid))
+        batch_of = {key: position // batch_size for position, key in enumerate(keys)}
+        rows_by_batch: dict[int, list[tuple[int, int, GameTokenType, int]]] = defaultdict(list)
+        for row in valid:
+            rows_by_batch[batch_of[(row[1], row[2])]].append(row)
+
+        for batch_no, start in enumerate(range(0, len(keys), batch_size)):
+            batch_keys = keys[start : start + batch_size]
+            wanted = set(batch_keys)
+            existing = db.execute(
+                select(UserGameWallet.user_id, UserGameWallet.token_type, UserGameWallet.balance)
+                .where(UserGameWallet.user_id.in_({user_id for user_id, _ in batch_keys}))
+                .with_for_update()
+            )
+            balances = {(user_id, token_type): balance for user_id, token_type, balance in existing if (user_id, token_type) in wanted}
+            missing = [key for key in batch_keys if key not in balances]
+            if missing:
+                raced = set(self._insert_missing_wallets(db, missing))
+                balances.update({key: 0 for key in missing})
+                if raced:
+                    # Created concurrently: lock and read their real balances.
+                    existing = db.execute(
+                        select(UserGameWallet.user_id, UserGameWallet.token_type, UserGameWallet.balance)
+                        .where(UserGameWallet.user_id.in_({user_id for user_id, _ in raced}))
+                        .with_for_update()
+                    )
+                    balances.update(
+                        {(user_id, token_type): balance for user_id, token_type, balance in existing if (user_id, token_type) in raced}
+                    )
+
+            deltas: dict[tuple[int, GameTokenType], int] = defaultdict(int)
+            ledger_rows = []
+            for index, user_id, token_type, amount in rows_by_batch[batch_no]:
+                key = (user_id, token_type)
+                delta = sign * amount
+                if balances[key] + delta < 0:
+                    result.failures.append(BulkTokenFailure(index=index, user_id=user_id, external_id=external_by_id.get(user_id), error="NOT_ENOUGH_TOKENS"))
+                    continue
+                balances[key] += delta
+                deltas[key] += delta
+                ledger_rows.append(
+                    {
+                        "user_id": user_id,
+                        "token_type": token_type,
+                        "delta": delta,
+                        "balance_after": balances[key],
+                        "reason": reason,
+                        "label": label,
+                        "meta_json": meta or {},
+                    }
+                )
+                result.balances[key] = (external_by_id.get(user_id), balances[key])
+
+            if deltas:
+                db.execute(_BULK_DELTA_UPDATE, [{"b_user_id": user_id, "b_token_type": token_type, "b_delta": delta} for (user_id, token_type), delta in deltas.items()])
+            if ledger_rows:
+                db.execute(insert(UserGameWalletLedger), ledger_rows)
+            result.applied += len(ledger_rows)
+
+        result.failures.sort(key=lambda failure: failure.index)
+        self._persist(db, commit)
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
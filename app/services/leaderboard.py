@@ -0,0 +1,294 @@
+"""Sorted leaderboard for the external ranking (deposit desc, play_count desc, user_id asc).
+
+`/api/ranking/today` used to load and serialize every external_ranking_data row and find
+the caller with a linear scan. The leaderboard keeps the ordering materialized:
+
+- `InMemoryLeaderboard` (default): a bisect-sorted key list per worker. Rank lookups are
+  O(log n); admin writes update it in place on the worker that made them and bump the
+  EXTERNAL_RANKING config version so other workers rebuild on their next version check.
+- `RedisLeaderboard` (`LEADERBOARD_BACKEND=redis`): one ZSET shared by every worker,
+  updated directly by admin writes. Requires the optional `redis` package and REDIS_URL.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from bisect import bisect_left, insort
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Protocol
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.external_ranking import ExternalRankingData
+from app.models.user import User
+from app.services.config_cache import ConfigCache
+
+NAMESPACE = "EXTERNAL_RANKING"
+NO_NICKNAME = "닉네임 없음"
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    user_id: int
+    deposit_amount: int
+    play_count: int
+    user_name: str
+    memo: str | None = None
+
+    @property
+    def sort_key(self) -> tuple[int, int, int]:
+        return (-self.deposit_amount, -self.play_count, self.user_id)
+
+
+class LeaderboardBackend(Protocol):
+    def replace_all(self, entries: Iterable[LeaderboardEntry]) -> None: ...
+
+    def upsert(self, entries: Iterable[LeaderboardEntry]) -> None: ...
+
+    def remove(self, user_ids: Iterable[int]) -> None: ...
+
+    def get(self, user_id: int) -> tuple[int, LeaderboardEntry] | None: ...
+
+    def page(self, offset: int, limit: int) -> list[tuple[int, LeaderboardEntry]]: ...
+
+    def __len__(self) -> int: ...
+
+
+class InMemoryLeaderboard:
+    """Sorted list of sort keys plus a user_id -> entry map, guarded by one lock."""
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[int, int, int]] = []
+        self._entries: dict[int, LeaderboardEntry] = {}
+        self._lock = threading.RLock()
+
+    def replace_all(self, entries: Iterable[LeaderboardEntry]) -> None:
+        entries_by_user = {entry.user_id: entry for entry in entries}
+        keys = sorted(entry.sort_key for entry in entries_by_user.values())
+        with self._lock:
+            self._entries = entries_by_user
+            self._keys = keys
+
+    def upsert(self, entries: Iterable[LeaderboardEntry]) -> None:
+        with self._lock:
+            for entry in entries:
+                self._discard(entry.user_id)
+                self._entries[entry.user_id] = entry
+                insort(self._keys, entry.sort_key)
+
+    def remove(self, user_ids: Iterable[int]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._discard(user_id)
+
+    def _discard(self, user_id: int) -> None:
+        old = self._entries.pop(user_id, None)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, old.sort_key)]
+
+    def get(self, user_id: int) -> tuple[int, LeaderboardEntry] | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            return bisect_left(self._keys, entry.sort_key) + 1, entry
+
+    def page(self, offset: int, limit: int) -> list[tuple[int, LeaderboardEntry]]:
+        with self._lock:
+            keys = self._keys[offset : offset + limit]
+            return [(offset + idx + 1, self._entries[key[2]]) for idx, key in enumerate(keys)]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class RedisLeaderboard:
+    """ZSET-backed leaderboard shared across workers.
+
+    Score is deposit_amount (exact as a double up to 2**53). Redis orders equal scores by
+    member, so the member encodes play_count and an inverted user_id; ZREVRANGE then yields
+    play_count desc, user_id asc for ties. Entry details live in a hash keyed by user_id.
+    """
+
+    _MAX_ID = 10**12 - 1
+
+    def __init__(self, client, key: str = "leaderboard:external_ranking") -> None:  # noqa: ANN001
+        self.client = client
+        self.key = key
+        self.details_key = f"{key}:entries"
+
+    @classmethod
+    def _member(cls, entry: LeaderboardEntry) -> str:
+        return f"{entry.play_count:012d}:{cls._MAX_ID - entry.user_id:012d}"
+
+    def exists(self) -> bool:
+        return bool(self.client.exists(self.details_key))
+
+    def replace_all(self, entries: Iterable[LeaderboardEntry]) -> None:
+        entries = list(entries)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(self.key, self.details_key)
+        if entries:
+            pipe.zadd(self.key, {self._member(entry): entry.deposit_amount for entry in entries})
+            pipe.hset(self.details_key, mapping={entry.user_id: json.dumps(asdict(entry)) for entry in entries})
+        pipe.execute()
+
+    def upsert(self, entries: Iterable[LeaderboardEntry]) -> None:
+        entries = list(entries)
+        if not entries:
+            return
+        old = self._load([entry.user_id for entry in entries])
+        pipe = self.client.pipeline(transaction=True)
+        stale = [self._member(entry) for entry in old.values()]
+        if stale:
+            pipe.zrem(self.key, *stale)
+        pipe.zadd(self.key, {self._member(entry): entry.deposit_amount for entry in entries})
+        pipe.hset(self.details_key, mapping={entry.user_id: json.dumps(asdict(entry)) for entry in entries})
+        pipe.execute()
+
+    def remove(self, user_ids: Iterable[int]) -> None:
+        old = self._load(list(user_ids))
+        if not old:
+            return
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zrem(self.key, *[self._member(entry) for entry in old.values()])
+        pipe.hdel(self.details_key, *old.keys())
+        pipe.execute()
+
+    def _load(self, user_ids: list[int]) -> dict[int, LeaderboardEntry]:
+        if not user_ids:
+            return {}
+        raw = self.client.hmget(self.details_key, user_ids)
+        return {user_id: LeaderboardEntry(**json.loads(value)) for user_id, value in zip(user_ids, raw) if value}
+
+    def get(self, user_id: int) -> tuple[int, LeaderboardEntry] | None:
+        entry = self._load([user_id]).get(user_id)
+        if entry is None:
+            return None
+        rank = self.client.zrevrank(self.key, self._member(entry))
+        return (rank + 1, entry) if rank is not None else None
+
+    def page(self, offset: int, limit: int) -> list[tuple[int, LeaderboardEntry]]:
+        members = self.client.zrevrange(self.key, offset, offset + limit - 1)
+        user_ids = [self._MAX_ID - int((m.decode() if isinstance(m, bytes) else m).split(":")[1]) for m in members]
+        entries = self._load(user_ids)
+        return [(offset + idx + 1, entries[user_id]) for idx, user_id in enumerate(user_ids) if user_id in entries]
+
+    def __len__(self) -> int:
+        return int(self.client.zcard(self.key))
+
+
+def _display_name(nickname: str | None, external_id: str | None) -> str:
+    return nickname or external_id or NO_NICKNAME
+
+
+class ExternalRankingLeaderboard:
+    """Keeps a leaderboard backend in sync with external_ranking_data."""
+
+    def __init__(self, backend: LeaderboardBackend | None = None, ttl_seconds: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._version: int | None = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> LeaderboardBackend:
+        if self._backend is None:
+            settings = get_settings()
+            if settings.leaderboard_backend == "redis":
+                import redis  # optional dependency
+
+                self._backend = RedisLeaderboard(redis.Redis.from_url(settings.redis_url))
+            else:
+                self._backend = InMemoryLeaderboard()
+        return self._backend
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else get_settings().config_cache_ttl_seconds
+
+    @staticmethod
+    def load_entries(db: Session, user_ids: Iterable[int] | None = None) -> list[LeaderboardEntry]:
+        stmt = select(ExternalRankingData, User.nickname, User.external_id).join(
+            User, User.id == ExternalRankingData.user_id, isouter=True
+        )
+        if user_ids is not None:
+            stmt = stmt.where(ExternalRankingData.user_id.in_(list(user_ids)))
+        return [
+            LeaderboardEntry(
+                user_id=row.ExternalRankingData.user_id,
+                deposit_amount=row.ExternalRankingData.deposit_amount,
+                play_count=row.ExternalRankingData.play_count,
+                user_name=_display_name(row.nickname, row.external_id),
+                memo=row.ExternalRankingData.memo,
+            )
+            for row in db.execute(stmt).all()
+        ]
+
+    def ensure_fresh(self, db: Session) -> LeaderboardBackend:
+        """Return the backend, rebuilding it from the DB when another worker changed the data."""
+
+        backend = self.backend
+        if isinstance(backend, RedisLeaderboard):
+            if not backend.exists():
+                backend.replace_all(self.load_entries(db))
+            return backend
+
+        now = self._clock()
+        if self._version is not None and now < self._checked_at + self.ttl_seconds:
+            return backend
+        version = ConfigCache.current_version(db, NAMESPACE)
+        with self._lock:
+            if version != self._version:
+                backend.replace_all(self.load_entries(db))
+                self._version = version
+            self._checked_at = now
+        return backend
+
+    def page(self, db: Session, offset: int, limit: int) -> list[tuple[int, LeaderboardEntry]]:
+        return self.ensure_fresh(db).page(offset, limit)
+
+    def lookup(self, db: Session, user_id: int) -> tuple[int, LeaderboardEntry] | None:
+        return self.ensure_fresh(db).get(user_id)
+
+    def total(self, db: Session) -> int:
+        return len(self.ensure_fresh(db))
+
+    def apply_changes(self, db: Session, upserted_user_ids: Iterable[int] = (), removed_user_ids: Iterable[int] = ()) -> None:
+        """Apply committed admin changes in place.
+
+        Call after the commit that bumped the EXTERNAL_RANKING version. If another writer
+        bumped it too, the local board is dropped and rebuilt on the next read instead.
+        """
+
+        upserted_user_ids = list(upserted_user_ids)
+        removed_user_ids = list(removed_user_ids)
+        backend = self.backend
+        if not isinstance(backend, RedisLeaderboard):
+            version = ConfigCache.current_version(db, NAMESPACE)
+            with self._lock:
+                if self._version is None or version != self._version + 1:
+                    self._version = None
+                    return
+                self._version = version
+        if removed_user_ids:
+            backend.remove(removed_user_ids)
+        if upserted_user_ids:
+            backend.upsert(self.load_entries(db, upserted_user_ids))
+
+    def reset(self) -> None:
+        """Forget local state (tests, or after restoring the DB)."""
+
+        with self._lock:
+            self._version = None
+            self._checked_at = float("-inf")
+            if not isinstance(self._backend, RedisLeaderboard):
+                self._backend = None
+
+
+external_leaderboard = ExternalRankingLeaderboard()
@@ -1,17 +1,27 @@
 """Core level/XP service for global rewards (non-seasonal)."""
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 
 from app.models.game_wallet import GameTokenType
-from app.models.level_xp import UserLevelProgress, UserLevelRewardLog, UserXpEventLog
+from app.models.level_xp import UserLevelProgress, UserLevelRewardLog, UserXpEventLog, UserXpMirrorQueue
 from app.services.reward_service import RewardService
 
 
+class _TicketGrant(NamedTuple):
+    """BulkTokenItem for level-reward tickets."""
+
+    user_id: int
+    token_type: GameTokenType
+    amount: int
+    external_id: str | None = None
+
+
 class LevelXPService:
     """Maintain user-level XP and issue rewards idempotently."""
 
@@ -26,6 +36,15 @@ class LevelXPService:
         {"level": 7, "required_xp": 1000, "reward_type": "COUPON_BAEMIN", "reward_payload": {"amount": 20000, "currency": "KRW"}, "auto_grant": False},
     ]
 
+    # Thresholds of LEVELS for bisect; a level is reached once xp >= its required_xp.
+    REQUIRED_XP: tuple[int, ...] = tuple(row["required_xp"] for row in LEVELS)
+
+    TICKET_TOKENS: Dict[str, GameTokenType] = {
+        "TICKET_ROULETTE": GameTokenType.ROULETTE_COIN,
+        "TICKET_DICE": GameTokenType.DICE_TOKEN,
+        "TICKET_LOTTERY": GameTokenType.LOTTERY_TICKET,
+    }
+
     def __init__(self) -> None:
         self.reward_service = RewardService()
 
@@ -42,10 +61,11 @@ class LevelXPService:
         event = UserXpEventLog(user_id=user_id, source=source, delta=delta, meta=meta or {})
         db.add(event)
 
-    def add_xp(self, db: Session, user_id: int, delta: int, source: str, meta: dict | None = None) -> dict:
+    def add_xp(self, db: Session, user_id: int, delta: int, source: str, meta: dict | None = None, commit: bool = True) -> dict:
         """Increment XP, log event, and emit reward logs for newly reached levels.
 
-        Returns a payload summarizing added XP and any new reward logs (does not commit).
+        Returns a payload summarizing added XP and any new reward logs. XP itself is not
+        committed; auto-granted tickets are, unless commit=False.
         """
 
         if delta <= 0:
@@ -54,33 +74,40 @@ class LevelXPService:
         progress = self._get_or_create_progress(db, user_id)
         self._log_event(db, user_id=user_id, source=source, delta=delta, meta=meta)
 
+        previous_reached = bisect_right(self.REQUIRED_XP, progress.xp)
         progress.xp += delta
         progress.updated_at = datetime.utcnow()
+        reached_rows = self.LEVELS[: bisect_right(self.REQUIRED_XP, progress.xp)]
+        if reached_rows:
+            progress.level = max(progress.level, reached_rows[-1]["level"])
+        if len(reached_rows) == previous_reached:
+            # No threshold crossed: rewards for reached levels were settled when they were crossed.
+            return {"added_xp": delta, "new_rewards": [], "level": progress.level, "xp": progress.xp}
 
-        # Determine newly achieved levels
-        achieved = []
-        current_level = progress.level
-        for row in self.LEVELS:
-            if progress.xp < row["required_xp"]:
-                break
-            current_level = max(current_level, row["level"])
-            # Check duplicate reward
-            existing = db.execute(
-                select(UserLevelRewardLog).where(
+        # Determine newly achieved levels (one lookup for the claimed ones, one batch of logs)
+        rewarded = set(
+            db.execute(
+                select(UserLevelRewardLog.level).where(
                     UserLevelRewardLog.user_id == user_id,
-                    UserLevelRewardLog.level == row["level"],
+                    UserLevelRewardLog.level.in_([row["level"] for row in reached_rows]),
                 )
-            ).scalar_one_or_none()
-            if existing:
-                continue
-            reward_log = UserLevelRewardLog(
-                user_id=user_id,
-                level=row["level"],
-                reward_type=row["reward_type"],
-                reward_payload=row["reward_payload"],
-                auto_granted=row["auto_grant"],
-            )
-            db.add(reward_log)
+            ).scalars()
+        )
+        new_rows = [row for row in reached_rows if row["level"] not in rewarded]
+        db.add_all(
+            [
+                UserLevelRewardLog(
+                    user_id=user_id,
+                    level=row["level"],
+                    reward_type=row["reward_type"],
+                    reward_payload=row["reward_payload"],
+                    auto_granted=row["auto_grant"],
+                )
+                for row in new_rows
+            ]
+        )
+        achieved = []
+        for row in new_rows:
             achieved.append(
                 {
                     "level": row["level"],
@@ -89,29 +116,187 @@ class LevelXPService:
                     "auto_granted": row["auto_grant"],
                 }
             )
+            if row["auto_grant"] and self.reward_service.outbox_enabled:
+                self.reward_service.enqueue(db, **self._outbox_row(user_id, row, source))
             # Auto grant only for supported reward types; non-blocking
-            if row["auto_grant"]:
+            elif row["auto_grant"]:
                 reward_meta = {"source": source, "level": row["level"], **(row["reward_payload"] or {})}
                 try:
                     if row["reward_type"].startswith("COUPON"):
                         self.reward_service.grant_coupon(db, user_id=user_id, coupon_type=row["reward_type"], meta=reward_meta)
                     elif row["reward_type"].startswith("TICKET"):
-                        ticket_map = {
-                            "TICKET_ROULETTE": GameTokenType.ROULETTE_COIN,
-                            "TICKET_DICE": GameTokenType.DICE_TOKEN,
-                            "TICKET_LOTTERY": GameTokenType.LOTTERY_TICKET,
-                        }
-                        token_type = ticket_map.get(row["reward_type"])
+                        token_type = self.TICKET_TOKENS.get(row["reward_type"])
                         payload = row.get("reward_payload") or {}
                         amount = payload.get("tickets") or payload.get("amount") or 0
                         if token_type and amount > 0:
-                            self.reward_service.grant_ticket(db, user_id=user_id, token_type=token_type, amount=amount, meta=reward_meta)
+                            self.reward_service.grant_ticket(db, user_id=user_id, token_type=token_type, amount=amount, meta=reward_meta, commit=commit)
                 except Exception:
                     # Delivery errors should not break XP accrual; rely on logs for retries.
                     pass
-        progress.level = current_level
         return {"added_xp": delta, "new_rewards": achieved, "level": progress.level, "xp": progress.xp}
 
+    def add_xp_bulk(self, db: Session, xp_by_user: dict[int, int], source: str, meta: dict | None = None, batch_size: int = 1000) -> dict[int, dict]:
+        """add_xp for many users with a fixed number of statements per `batch_size` users (does not commit).
+
+        Progress rows and reward logs are read with IN queries, event and reward logs are
+        inserted with executemany, and auto-granted tickets go through one
+        GameWalletService.grant_tokens_bulk call per level.
+        """
+
+        xp_by_user = {user_id: delta for user_id, delta in xp_by_user.items() if delta > 0}
+        user_ids = list(xp_by_user)
+        progress_by_user: dict[int, UserLevelProgress] = {}
+        rewarded: set[tuple[int, int]] = set()
+        for start in range(0, len(user_ids), batch_size):
+            chunk = user_ids[start : start + batch_size]
+            progress_by_user.update(
+                (progress.user_id, progress)
+                for progress in db.execute(select(UserLevelProgress).where(UserLevelProgress.user_id.in_(chunk))).scalars()
+            )
+            rewarded.update(
+                db.execute(
+                    select(UserLevelRewardLog.user_id, UserLevelRewardLog.level).where(UserLevelRewardLog.user_id.in_(chunk))
+                ).all()
+            )
+        missing = [UserLevelProgress(user_id=user_id, level=1, xp=0) for user_id in user_ids if user_id not in progress_by_user]
+        if missing:
+            db.add_all(missing)
+            db.flush()
+            progress_by_user.update((progress.user_id, progress) for progress in missing)
+
+        now = datetime.utcnow()
+        event_rows: list[dict] = []
+        reward_rows: list[dict] = []
+        tickets_by_level: dict[int, list[_TicketGrant]] = {}
+        outbox = self.reward_service.outbox_enabled
+        outbox_rows: list[dict] = []
+        results: dict[int, dict] = {}
+        for user_id, delta in xp_by_user.items():
+            progress = progress_by_user[user_id]
+            event_rows.append({"user_id": user_id, "source": source, "delta": delta, "meta": meta or {}, "created_at": now})
+            previous_reached = bisect_right(self.REQUIRED_XP, progress.xp)
+            progress.xp += delta
+            progress.updated_at = now
+            reached_rows = self.LEVELS[: bisect_right(self.REQUIRED_XP, progress.xp)]
+            if reached_rows:
+                progress.level = max(progress.level, reached_rows[-1]["level"])
+            achieved = []
+            # Same rule as add_xp: only an event that crosses a threshold settles rewards.
+            for row in reached_rows if len(reached_rows) > previous_reached else ():
+                if (user_id, row["level"]) in rewarded:
+                    continue
+                reward_rows.append(
+                    {
+                        "user_id": user_id,
+                        "level": row["level"],
+                        "reward_type": row["reward_type"],
+                        "reward_payload": row["reward_payload"],
+                        "auto_granted": row["auto_grant"],
+                        "created_at": now,
+                    }
+                )
+                achieved.append(
+                    {
+                        "level": row["level"],
+                        "reward_type": row["reward_type"],
+                        "reward_payload": row["reward_payload"],
+                        "auto_granted": row["auto_grant"],
+                    }
+                )
+                if row["auto_grant"] and outbox:
+                    outbox_rows.append(self._outbox_row(user_id, row, source))
+                elif row["auto_grant"]:
+                    payload = row.get("reward_payload") or {}
+                    token_type = self.TICKET_TOKENS.get(row["reward_type"])
+                    amount = payload.get("tickets") or payload.get("amount") or 0
+                    if row["reward_type"].startswith("COUPON"):
+                        reward_meta = {"source": source, "level": row["level"], **payload}
+                        self.reward_service.grant_coupon(db, user_id=user_id, coupon_type=row["reward_type"], meta=reward_meta)
+                    elif token_type and amount > 0:
+                        tickets_by_level.setdefault(row["level"], []).append(_TicketGrant(user_id, token_type, amount))
+            results[user_id] = {"added_xp": delta, "new_rewards": achieved, "level": progress.level, "xp": progress.xp}
+
+        if event_rows:
+            db.execute(insert(UserXpEventLog), event_rows)
+        if reward_rows:
+            db.execute(insert(UserLevelRewardLog), reward_rows)
+        levels = {row["level"]: row for row in self.LEVELS}
+        for level, items in tickets_by_level.items():
+            self.reward_service.wallet_service.grant_tokens_bulk(
+                db,
+                items,
+                reason="LEVEL_REWARD",
+                label="AUTO_GRANT",
+                meta={"source": source, "level": level, **(levels[level]["reward_payload"] or {})},
+                batch_size=batch_size,
+                commit=False,
+            )
+        if outbox_rows:
+            self.reward_service.enqueue_many(db, outbox_rows, batch_size=batch_size)
+        db.flush()
+        return results
+
+    @staticmethod
+    def _outbox_row(user_id: int, row: Dict[str, Any], source: str) -> dict:
+        """reward_outbox row (RewardService.deliver arguments) for an auto-granted level reward."""
+
+        payload = row.get("reward_payload") or {}
+        meta = {"source": source, "level": row["level"], **payload}
+        if row["reward_type"].startswith("COUPON"):
+            reward_type, amount = "COUPON", payload.get("amount") or 1
+            meta["coupon_type"] = row["reward_type"]
+        else:
+            reward_type, amount = row["reward_type"], payload.get("tickets") or payload.get("amount") or 0
+        return {
+            "idempotency_key": f"LEVEL:{user_id}:{row['level']}",
+            "user_id": user_id,
+            "reward_type": reward_type,
+            "reward_amount": amount,
+            "meta": meta,
+        }
+
+    @staticmethod
+    def enqueue_xp(db: Session, user_id: int, delta: int, source: str, meta: dict | None = None) -> None:
+        """Queue an add_xp call in the caller's transaction (does not commit)."""
+
+        if delta > 0:
+            db.add(UserXpMirrorQueue(user_id=user_id, delta=delta, source=source, meta=meta or {}))
+
+    def apply_queued(self, db: Session, limit: int = 1000, max_attempts: int = 5) -> dict:
+        """Apply up to `limit` queued XP rows oldest first in one transaction and commit.
+
+        Each row runs add_xp in its own savepoint; applied rows are deleted, failed rows keep
+        their place with attempts/last_error and are skipped once they reach `max_attempts`.
+        Rows are locked with SKIP LOCKED where supported so several workers can drain together.
+        """
+
+        rows = (
+            db.execute(
+                select(UserXpMirrorQueue)
+                .where(UserXpMirrorQueue.attempts < max_attempts)
+                .order_by(UserXpMirrorQueue.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            .scalars()
+            .all()
+        )
+        applied: list[int] = []
+        failed = 0
+        for row in rows:
+            try:
+                with db.begin_nested():
+                    self.add_xp(db, user_id=row.user_id, delta=row.delta, source=row.source, meta=row.meta, commit=False)
+                applied.append(row.id)
+            except Exception as exc:
+                row.attempts += 1
+                row.last_error = f"{type(exc).__name__}: {exc}"[:255]
+                failed += 1
+        if applied:
+            db.execute(delete(UserXpMirrorQueue).where(UserXpMirrorQueue.id.in_(applied)))
+        db.commit()
+        return {"applied": len(applied), "failed": failed}
+
     def get_status(self, db: Session, user_id: int) -> dict:
         """Return current level/XP snapshot and reward history."""
 
@@ -1,22 +1,24 @@
 """Lottery service implementing status and play flows."""
+from dataclasses import replace
 from datetime import date, datetime
-import random
-import time
 
-from sqlalchemy import func, select
-from sqlalchemy.exc import DBAPIError
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
-from app.core.exceptions import InvalidConfigError, LockAcquisitionError
+from app.core.exceptions import InvalidConfigError
 from app.models.feature import FeatureType
 from app.models.game_wallet import GameTokenType
-from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize
+from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize, LotteryUrn
 from app.schemas.lottery import LotteryPlayResponse, LotteryPrizeSchema, LotteryStatusResponse
+from app.services.config_cache import LotteryConfigSnapshot, LotteryPrizeSnapshot, config_cache
 from app.services.feature_service import FeatureService
-from app.services.game_common import GamePlayContext, log_game_play
+from app.services.game_common import GamePlayContext, GamePlayUnitOfWork
 from app.services.game_wallet_service import GameWalletService
+from app.services.lottery_urn import NO_SLOT, UrnExhausted, lottery_urn
+from app.services.play_counter_service import PlayCounterService
 from app.services.reward_service import RewardService
 from app.services.season_pass_service import SeasonPassService
+from app.services.weighted_sampler import build_sampler
 
 
 class LotteryService:
@@ -27,6 +29,8 @@ class LotteryService:
         self.reward_service = RewardService()
         self.wallet_service = GameWalletService()
         self.season_pass_service = SeasonPassService()
+        self.play_counter_service = PlayCounterService()
+        self.urn_service = lottery_urn
 
     def _get_today_config(self, db: Session) -> LotteryConfig:
         config = db.execute(select(LotteryConfig).where(LotteryConfig.is_active.is_(True))).scalar_one_or_none()
@@ -34,14 +38,9 @@ class LotteryService:
             raise InvalidConfigError("LOTTERY_CONFIG_MISSING")
         return config
 
-    def _eligible_prizes(self, db: Session, config_id: int, lock: bool = False) -> list[LotteryPrize]:
+    def _eligible_prizes(self, db: Session, config_id: int) -> list[LotteryPrize]:
         prizes_stmt = select(LotteryPrize).where(LotteryPrize.config_id == config_id, LotteryPrize.is_active.is_(True))
-        if lock and db.bind and db.bind.dialect.name != "sqlite":
-            prizes_stmt = prizes_stmt.with_for_update()
-        try:
-            prizes = db.execute(prizes_stmt).scalars().all()
-        except DBAPIError as exc:
-            raise LockAcquisitionError("LOTTERY_LOCK_FAILED") from exc
+        prizes = db.execute(prizes_stmt).scalars().all()
         eligible = [p for p in prizes if (p.stock is None or p.stock > 0)]
         for prize in eligible:
             if prize.weight < 0:
@@ -51,20 +50,91 @@ class LotteryService:
             raise InvalidConfigError("INVALID_LOTTERY_CONFIG")
         return eligible
 
+    def _load_snapshot(self, db: Session) -> LotteryConfigSnapshot:
+        config = self._get_today_config(db)
+        urn_generation = None
+        if config.use_urn:
+            urn_generation = db.execute(select(LotteryUrn.generation).where(LotteryUrn.config_id == config.id)).scalar_one_or_none()
+        return LotteryConfigSnapshot.from_model(config, self._eligible_prizes(db, config.id), urn_generation or 0)
+
+    def _get_snapshot(self, db: Session) -> LotteryConfigSnapshot:
+        """Active config + eligible prizes, served from the per-worker config cache.
+
+        Plays draw from this immutable snapshot without reading prize rows. Its stock is
+        informational: a draw of a finite-stock prize is settled against the row by
+        `_take_stock`, and the LOTTERY version is bumped whenever a prize runs out so every
+        worker drops it from the snapshot.
+        """
+
+        return config_cache.get(db, "LOTTERY", "active", self._load_snapshot)
+
+    @staticmethod
+    def _take_stock(db: Session, prize_id: int) -> int | None:
+        """Decrement one unit of stock if any is left; return the remaining stock or None if sold out.
+
+        A conditional `UPDATE ... WHERE stock > 0` locks only this prize's row and only for the
+        rest of the play's transaction, so unlimited prizes and other prizes never contend.
+        """
+
+        stmt = update(LotteryPrize).where(LotteryPrize.id == prize_id, LotteryPrize.stock > 0).values(stock=LotteryPrize.stock - 1)
+        if db.get_bind().dialect.update_returning:
+            return db.execute(stmt.returning(LotteryPrize.stock)).scalar_one_or_none()
+        if db.execute(stmt).rowcount == 0:
+            return None
+        return db.execute(select(LotteryPrize.stock).where(LotteryPrize.id == prize_id)).scalar_one()
+
+    def _draw(self, db: Session, config: LotteryConfigSnapshot) -> LotteryPrizeSnapshot:
+        """Draw a prize from the snapshot, settling stock for finite-stock prizes.
+
+        A prize that sold out after the snapshot was built is dropped from this play's pool
+        and the draw is repeated among the rest (same relative weights).
+        """
+
+        prizes, sampler = config.prizes, config.sampler
+        while sampler is not None:
+            chosen = prizes[sampler.sample_index()]
+            if chosen.stock is None:
+                return chosen
+            remaining = self._take_stock(db, chosen.id)
+            if remaining is not None:
+                if remaining == 0:
+                    config_cache.bump(db, "LOTTERY")
+                return replace(chosen, stock=remaining)
+            # Our snapshot is stale (the play that emptied it already bumped the version).
+            config_cache.invalidate("LOTTERY")
+            prizes = tuple(prize for prize in prizes if prize.id != chosen.id)
+            sampler = build_sampler(prizes)
+        raise InvalidConfigError("INVALID_LOTTERY_CONFIG")
+
+    def _draw_from_urn(self, db: Session, config: LotteryConfigSnapshot, user_id: int) -> LotteryPrizeSnapshot:
+        """Claim this play's urn ticket (use_urn configs); a ticket without a slot wins an unlimited prize.
+
+        Finite-stock prizes are only ever won through urn slots, so their rows are not touched.
+        """
+
+        prizes = {prize.id: prize for prize in config.prizes}
+        unlimited = config.unlimited
+        while True:
+            try:
+                prize_id = self.urn_service.claim(db, config.id, user_id, config.urn_generation)
+            except UrnExhausted:
+                prize_id = NO_SLOT
+                if not unlimited:
+                    raise InvalidConfigError("INVALID_LOTTERY_CONFIG")
+            if prize_id in prizes:
+                return prizes[prize_id]
+            if unlimited:
+                return unlimited[config.unlimited_sampler.sample_index()]
+            # Only finite prizes: every ticket has a slot, this one was claimed by a duplicate ticket.
+
     def get_status(self, db: Session, user_id: int, today: date) -> LotteryStatusResponse:
         self.feature_service.validate_feature_active(db, today, FeatureType.LOTTERY)
-        config = self._get_today_config(db)
+        config = self._get_snapshot(db)
         token_type = GameTokenType.LOTTERY_TICKET
         token_balance = self.wallet_service.get_balance(db, user_id, token_type)
-        prizes = self._eligible_prizes(db, config.id)
+        prizes = config.prizes
 
-        today_tickets = db.execute(
-            select(func.count()).select_from(LotteryLog).where(
-                LotteryLog.user_id == user_id,
-                LotteryLog.config_id == config.id,
-                func.date(LotteryLog.created_at) == today,
-            )
-        ).scalar_one()
+        today_tickets = self.play_counter_service.get_count(db, user_id, FeatureType.LOTTERY, today)
         # Daily cap removed: use 0 to denote unlimited.
         unlimited = 0
         remaining = 0
@@ -81,86 +151,80 @@ class LotteryService:
             feature_type=FeatureType.LOTTERY,
         )
 
-    def play(self, db: Session, user_id: int, now: date | datetime) -> LotteryPlayResponse:
+    def play(self, db: Session, user_id: int, now: date | datetime, count: int = 1) -> LotteryPlayResponse:
+        """Draw `count` tickets in one transaction (one debit, batched log inserts, one commit)."""
+
         today = now.date() if isinstance(now, datetime) else now
         self.feature_service.validate_feature_active(db, today, FeatureType.LOTTERY)
-        config = self._get_today_config(db)
-        token_type = GameTokenType.LOTTERY_TICKET
-        prizes = None
-        for attempt in range(3):
-            try:
-                prizes = self._eligible_prizes(db, config.id, lock=True)
-                break
-            except LockAcquisitionError:
-                if attempt == 2:
-                    raise
-                time.sleep(0.05)
-        assert prizes is not None
-
-        today_tickets = db.execute(
-            select(func.count()).select_from(LotteryLog).where(
-                LotteryLog.user_id == user_id,
-                LotteryLog.config_id == config.id,
-                func.date(LotteryLog.created_at) == today,
-            )
-        ).scalar_one()
-
-        weighted_pool: list[LotteryPrize] = []
-        for prize in prizes:
-            weighted_pool.extend([prize] * max(prize.weight, 0))
-        chosen = random.choice(weighted_pool)
-
-        self.wallet_service.require_and_consume_token(
-            db,
-            user_id,
-            token_type,
-            amount=1,
-            reason="LOTTERY_PLAY",
-            label=chosen.label,
-            meta={"prize_id": chosen.id},
-        )
-
-        if chosen.stock is not None:
-            chosen.stock -= 1
-            db.add(chosen)
-
-        log_entry = LotteryLog(
-            user_id=user_id,
-            config_id=config.id,
-            prize_id=chosen.id,
-            reward_type=chosen.reward_type,
-            reward_amount=chosen.reward_amount,
-        )
-        db.add(log_entry)
-        db.commit()
-        db.refresh(log_entry)
+        config = self._get_snapshot(db)
 
         ctx = GamePlayContext(user_id=user_id, feature_type=FeatureType.LOTTERY.value, today=today)
-        log_game_play(
-            ctx,
-            db,
-            {
-                "prize_id": chosen.id,
-                "reward_type": chosen.reward_type,
-                "reward_amount": chosen.reward_amount,
-                "label": chosen.label,
-                "xp_from_reward": chosen.reward_amount if chosen.reward_amount > 0 else 0,
-            },
-        )
-
-        self.reward_service.deliver(
-            db,
-            user_id=user_id,
-            reward_type=chosen.reward_type,
-            reward_amount=chosen.reward_amount,
-            meta={"reason": "lottery_play", "prize_id": chosen.id},
-        )
-        if chosen.reward_amount > 0:
-            self.season_pass_service.maybe_add_internal_win_stamp(db, user_id=user_id, now=today)
+        try:
+            draws = self._play(db, ctx, config, count)
+        except Exception:
+            if config.use_urn:
+                # The rolled-back play may have reserved a batch; its tickets are re-offered by the sweep.
+                self.urn_service.release(config.id)
+            raise
         season_pass = None  # 게임 1회당 자동 스탬프 발급 제거
 
+        prizes = [LotteryPrizeSchema.from_orm(chosen) for chosen in draws]
         return LotteryPlayResponse(
             result="OK",
-            prize=LotteryPrizeSchema.from_orm(chosen),
+            prize=prizes[-1],
+            prizes=prizes,
             season_pass=season_pass,
         )
+
+    def _play(
+        self, db: Session, ctx: GamePlayContext, config: LotteryConfigSnapshot, count: int
+    ) -> list[LotteryPrizeSnapshot]:
+        user_id = ctx.user_id
+        token_type = GameTokenType.LOTTERY_TICKET
+        with GamePlayUnitOfWork(
+            db,
+            ctx,
+            wallet_service=self.wallet_service,
+            reward_service=self.reward_service,
+            season_pass_service=self.season_pass_service,
+        ) as uow:
+            draws = [
+                self._draw_from_urn(db, config, user_id) if config.use_urn else self._draw(db, config)
+                for _ in range(count)
+            ]
+            uow.consume_tokens(
+                token_type,
+                [(chosen.label, {"prize_id": chosen.id}) for chosen in draws],
+                reason="LOTTERY_PLAY",
+            )
+            logs = [
+                LotteryLog(
+                    user_id=user_id,
+                    config_id=config.id,
+                    prize_id=chosen.id,
+                    reward_type=chosen.reward_type,
+                    reward_amount=chosen.reward_amount,
+                )
+                for chosen in draws
+            ]
+            uow.add_logs(logs)
+            for chosen, log in zip(draws, logs):
+                uow.log_event(
+                    {
+                        "prize_id": chosen.id,
+                        "reward_type": chosen.reward_type,
+                        "reward_amount": chosen.reward_amount,
+                        "label": chosen.label,
+                        "xp_from_reward": chosen.reward_amount if chosen.reward_amount > 0 else 0,
+                    }
+                )
+                uow.deliver_reward(
+                    chosen.reward_type,
+                    chosen.reward_amount,
+                    meta={"reason": "lottery_play", "prize_id": chosen.id},
+                    log=log,
+                )
+            wins = sum(1 for chosen in draws if chosen.reward_amount > 0)
+            if wins:
+                uow.add_internal_win_stamp(wins)
+        return draws
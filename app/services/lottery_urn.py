@@ -0,0 +1,210 @@
+"""Pre-drawn prize urn for lottery configs with finite-stock prizes (LotteryConfig.use_urn).
+
+When such a config is saved active, the whole sequence of finite-stock wins is drawn up front:
+play ticket `seq` wins the prize in LotteryUrnSlot(seq), and every ticket without a slot wins
+an unlimited prize drawn from the config snapshot. The sequence is sampled from the same
+process as live draws (weights renormalised as prizes sell out), so odds are unchanged, and
+each finite prize gets exactly `stock` slots.
+
+A play takes the next ticket from this worker's reserved batch and claims its slot with one
+`UPDATE ... WHERE config_id = ? AND seq = ? AND claimed_at IS NULL` on the unique
+(config_id, seq) index. Tickets are reserved `LOTTERY_URN_BATCH_SIZE` at a time from the
+lottery_urn counter, so that row is written once per batch, and prize rows are never written
+by plays. The claim's `claimed_at IS NULL` guard makes over-issue impossible even if two
+workers ever hold the same ticket.
+
+Tickets of rolled-back plays or dead workers are not lost: once the counter passes the last
+slot, batches are refilled from the slots that are still unclaimed.
+
+Every settle/rebuild bumps lottery_urn.generation. A batch remembers the generation it was
+reserved under and its claims only match while that generation is current, so tickets other
+workers still hold from the old urn can never take the new urn's slots. A worker drops such a
+batch as soon as its LOTTERY snapshot carries the newer generation (`urn_generation`).
+
+Plays never write prize rows, so LotteryPrize.stock is the stock left when the urn was built;
+`settle` (run by every rebuild and by deactivation) subtracts the claimed slots from it.
+"""
+from __future__ import annotations
+
+import math
+import random
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.lottery import LotteryConfig, LotteryUrn, LotteryUrnSlot
+
+# claim() result for a ticket without a slot: the play wins an unlimited prize.
+NO_SLOT = 0
+
+
+class UrnExhausted(Exception):
+    """Every slot of the urn has been claimed; only unlimited prizes remain."""
+
+
+class LotteryUrnService:
+    def __init__(self, batch_size: int | None = None, rng: random.Random | None = None) -> None:
+        self._batch_size = batch_size
+        self._rng = rng or random.SystemRandom()
+        self._lock = threading.Lock()
+        self._batches: dict[int, tuple[int, deque[int]]] = {}
+
+    @property
+    def batch_size(self) -> int:
+        return max(1, self._batch_size or get_settings().lottery_urn_batch_size)
+
+    def draw_sequence(self, prizes: Iterable) -> list[tuple[int, int]]:
+        """Sample (seq, prize_id) of every finite-stock win, in play order.
+
+        The gap to the next finite win is geometric with p = finite weight / total weight, and
+        the winner is picked by weight among prizes with stock left; O(total stock) draws.
+        """
+
+        active = [p for p in prizes if p.is_active and p.weight > 0]
+        finite = {p.id: [p.weight, p.stock] for p in active if p.stock is not None and p.stock > 0}
+        unlimited_weight = sum(p.weight for p in active if p.stock is None)
+        slots: list[tuple[int, int]] = []
+        seq = -1
+        while finite:
+            finite_weight = sum(weight for weight, _ in finite.values())
+            p = finite_weight / (finite_weight + unlimited_weight)
+            seq += 1 if p >= 1 else 1 + int(math.log(1.0 - self._rng.random()) / math.log1p(-p))
+            prize_id = self._rng.choices(list(finite), weights=[weight for weight, _ in finite.values()])[0]
+            slots.append((seq, prize_id))
+            finite[prize_id][1] -= 1
+            if finite[prize_id][1] == 0:
+                del finite[prize_id]
+        return slots
+
+    def settle(self, db: Session, config: LotteryConfig) -> None:
+        """Subtract claimed slots from the prizes' stock and empty the urn (caller's transaction).
+
+        The counter row is kept, exhausted and with the next generation, so tickets reserved
+        from the old urn stay invalid across later rebuilds.
+        """
+
+        # Unclaimed slots go first so in-flight claims finish (row locks) before claims are counted.
+        db.execute(delete(LotteryUrnSlot).where(LotteryUrnSlot.config_id == config.id, LotteryUrnSlot.claimed_at.is_(None)))
+        claimed: dict[int, int] = {}
+        for prize_id in db.execute(
+            select(LotteryUrnSlot.prize_id).where(LotteryUrnSlot.config_id == config.id).with_for_update()
+        ).scalars():
+            claimed[prize_id] = claimed.get(prize_id, 0) + 1
+        for prize in config.prizes:
+            if prize.stock is not None and prize.id in claimed:
+                prize.stock = max(prize.stock - claimed[prize.id], 0)
+        db.execute(delete(LotteryUrnSlot).where(LotteryUrnSlot.config_id == config.id))
+        db.execute(
+            update(LotteryUrn)
+            .where(LotteryUrn.config_id == config.id)
+            .values(next_seq=0, last_seq=-1, generation=LotteryUrn.generation + 1)
+        )
+        self.release(config.id)
+
+    def build(self, db: Session, config: LotteryConfig) -> int:
+        """Settle and redraw the urn of a config in the caller's transaction; returns the slot count.
+
+        The config and its prizes must be flushed (ids assigned).
+        """
+
+        self.settle(db, config)
+        config_id = config.id
+        slots = self.draw_sequence(config.prizes)
+        if slots:
+            db.execute(
+                LotteryUrnSlot.__table__.insert(),
+                [{"config_id": config_id, "seq": seq, "prize_id": prize_id} for seq, prize_id in slots],
+            )
+        counter = {"next_seq": 0, "last_seq": slots[-1][0] if slots else -1, "built_at": datetime.utcnow()}
+        if not db.execute(update(LotteryUrn).where(LotteryUrn.config_id == config_id).values(**counter)).rowcount:
+            db.execute(LotteryUrn.__table__.insert(), {"config_id": config_id, "generation": 1, **counter})
+        return len(slots)
+
+    def release(self, config_id: int) -> None:
+        """Drop this worker's reserved tickets (after a rollback or a rebuild)."""
+
+        with self._lock:
+            self._batches.pop(config_id, None)
+
+    def claim(self, db: Session, config_id: int, user_id: int, generation: int = 0) -> int:
+        """Claim the next ticket in the caller's transaction.
+
+        `generation` is the urn generation of the caller's LOTTERY snapshot; a reserved batch
+        from an older generation is dropped first. Returns the won finite-stock prize id, or
+        NO_SLOT when the ticket has no slot (draw an unlimited prize). Raises UrnExhausted once
+        every slot is claimed.
+        """
+
+        ticket_generation, seq = self._next_ticket(db, config_id, generation)
+        current = select(LotteryUrn.config_id).where(
+            LotteryUrn.config_id == config_id, LotteryUrn.generation == ticket_generation
+        )
+        stmt = (
+            update(LotteryUrnSlot)
+            .where(
+                LotteryUrnSlot.config_id == config_id,
+                LotteryUrnSlot.seq == seq,
+                LotteryUrnSlot.claimed_at.is_(None),
+                current.exists(),
+            )
+            .values(user_id=user_id, claimed_at=datetime.utcnow())
+        )
+        if db.get_bind().dialect.update_returning:
+            prize_id = db.execute(stmt.returning(LotteryUrnSlot.prize_id)).scalar_one_or_none()
+        elif db.execute(stmt).rowcount == 1:
+            prize_id = db.execute(
+                select(LotteryUrnSlot.prize_id).where(LotteryUrnSlot.config_id == config_id, LotteryUrnSlot.seq == seq)
+            ).scalar_one()
+        else:
+            prize_id = None
+        return prize_id or NO_SLOT
+
+    def _next_ticket(self, db: Session, config_id: int, generation: int) -> tuple[int, int]:
+        with self._lock:
+            entry = self._batches.get(config_id)
+            if entry is not None and entry[0] >= generation and entry[1]:
+                return entry[0], entry[1].popleft()
+        ticket_generation, tickets = self._reserve(db, config_id)
+        if not tickets:
+            raise UrnExhausted(config_id)
+        seq = tickets.popleft()
+        with self._lock:
+            self._batches[config_id] = (ticket_generation, tickets)
+        return ticket_generation, seq
+
+    def _reserve(self, db: Session, config_id: int) -> tuple[int, deque[int]]:
+        """Reserve the next batch of tickets; returns (urn generation, tickets)."""
+
+        size = self.batch_size
+        stmt = (
+            update(LotteryUrn)
+            .where(LotteryUrn.config_id == config_id, LotteryUrn.next_seq <= LotteryUrn.last_seq)
+            .values(next_seq=LotteryUrn.next_seq + size)
+        )
+        columns = (LotteryUrn.next_seq, LotteryUrn.last_seq, LotteryUrn.generation)
+        if db.get_bind().dialect.update_returning:
+            row = db.execute(stmt.returning(*columns)).one_or_none()
+        elif db.execute(stmt).rowcount == 1:
+            row = db.execute(select(*columns).where(LotteryUrn.config_id == config_id)).one()
+        else:
+            row = None
+        if row is not None:
+            next_seq, last_seq, generation = row
+            return generation, deque(range(next_seq - size, min(next_seq, last_seq + 1)))
+        # Counter is past the last slot: re-offer slots whose tickets were never claimed.
+        generation = db.execute(select(LotteryUrn.generation).where(LotteryUrn.config_id == config_id)).scalar_one_or_none()
+        seqs = db.execute(
+            select(LotteryUrnSlot.seq)
+            .where(LotteryUrnSlot.config_id == config_id, LotteryUrnSlot.claimed_at.is_(None))
+            .order_by(LotteryUrnSlot.seq)
+            .limit(size)
+        ).scalars()
+        return generation or 0, deque(seqs)
+
+
+lottery_urn = LotteryUrnService()
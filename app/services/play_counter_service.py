@@ -0,0 +1,196 @@
+"""Per-user play and win counters maintained by the play path."""
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.dice import DiceLog
+from app.models.feature import FeatureType
+from app.models.lottery import LotteryLog
+from app.models.play_counter import UserDailyPlayCount, UserInternalWinCount
+from app.models.roulette import RouletteLog
+
+GAME_LOG_MODELS = {
+    FeatureType.ROULETTE: RouletteLog,
+    FeatureType.DICE: DiceLog,
+    FeatureType.LOTTERY: LotteryLog,
+}
+
+# What counts as an internal win for the season-pass INTERNAL_WIN_50 stamp, per log table.
+WIN_CONDITIONS = (
+    (DiceLog, DiceLog.result == "WIN"),
+    (RouletteLog, RouletteLog.reward_amount > 0),
+    (LotteryLog, LotteryLog.reward_amount > 0),
+)
+
+
+class PlayCounterService:
+    """Reads and bumps `user_daily_play_count` rows.
+
+    Status endpoints used to run `COUNT(*) ... WHERE date(created_at) = :today` over the game
+    logs, which cannot use the (user_id, created_at) index and grows with history. The
+    counter row is a unique-key lookup and is incremented in the play transaction.
+    """
+
+    @staticmethod
+    def get_count(db: Session, user_id: int, feature_type: FeatureType, play_date: date) -> int:
+        count = db.execute(
+            select(UserDailyPlayCount.play_count).where(
+                UserDailyPlayCount.user_id == user_id,
+                UserDailyPlayCount.feature_type == feature_type,
+                UserDailyPlayCount.play_date == play_date,
+            )
+        ).scalar_one_or_none()
+        return count or 0
+
+    @staticmethod
+    def increment(db: Session, user_id: int, feature_type: FeatureType, play_date: date, amount: int = 1) -> None:
+        """Add `amount` plays; the caller owns the transaction."""
+
+        stmt = (
+            update(UserDailyPlayCount)
+            .where(
+                UserDailyPlayCount.user_id == user_id,
+                UserDailyPlayCount.feature_type == feature_type,
+                UserDailyPlayCount.play_date == play_date,
+            )
+            .values(play_count=UserDailyPlayCount.play_count + amount, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if db.execute(stmt).rowcount:
+            return
+        # First play of the day: insert, falling back to the update if a concurrent play won the race.
+        try:
+            with db.begin_nested():
+                db.add(UserDailyPlayCount(user_id=user_id, feature_type=feature_type, play_date=play_date, play_count=amount))
+        except IntegrityError:
+            db.execute(stmt)
+
+    @staticmethod
+    def rebuild(db: Session, start: date | None = None, end: date | None = None) -> int:
+        """Recompute counters from the game logs for [start, end] (inclusive); returns rows written.
+
+        Existing counters in the range are replaced. Meant for backfills and repairs, not the
+        request path; the caller commits.
+        """
+
+        range_filters = []
+        if start is not None:
+            range_filters.append(UserDailyPlayCount.play_date >= start)
+        if end is not None:
+            range_filters.append(UserDailyPlayCount.play_date <= end)
+        db.execute(delete(UserDailyPlayCount).where(*range_filters))
+
+        rows: list[dict] = []
+        for feature_type, log_model in GAME_LOG_MODELS.items():
+            play_day = func.date(log_model.created_at)
+            stmt = select(log_model.user_id, play_day, func.count()).group_by(log_model.user_id, play_day)
+            if start is not None:
+                stmt = stmt.where(log_model.created_at >= datetime.combine(start, time.min))
+            if end is not None:
+                stmt = stmt.where(log_model.created_at < datetime.combine(end + timedelta(days=1), time.min))
+            for user_id, day, count in db.execute(stmt):
+                if isinstance(day, str):
+                    day = date.fromisoformat(day)
+                rows.append({"user_id": user_id, "feature_type": feature_type, "play_date": day, "play_count": count})
+
+        if rows:
+            db.execute(insert(UserDailyPlayCount), rows)
+        return len(rows)
+
+    @staticmethod
+    def count_wins_from_logs(db: Session, user_id: int) -> int:
+        """Full recount over the three game logs; only used to seed or reconcile the counter."""
+
+        return sum(
+            db.execute(select(func.count()).select_from(log_model).where(log_model.user_id == user_id, condition)).scalar_one()
+            for log_model, condition in WIN_CONDITIONS
+        )
+
+    @staticmethod
+    def _add_wins(db: Session, user_id: int, wins: int) -> int:
+        """`win_count += wins` on an existing row (rowcount); a current read that locks the row."""
+
+        return db.execute(
+            update(UserInternalWinCount)
+            .where(UserInternalWinCount.user_id == user_id)
+            .values(win_count=UserInternalWinCount.win_count + wins, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    @staticmethod
+    def _read_win_count(db: Session, user_id: int) -> int:
+        # Read after our own UPDATE, so REPEATABLE READ returns the row as this transaction wrote it.
+        return db.execute(select(UserInternalWinCount.win_count).where(UserInternalWinCount.user_id == user_id)).scalar_one()
+
+    @classmethod
+    def ensure_win_count(cls, db: Session, user_id: int, wins: int = 0) -> tuple[int, bool]:
+        """Return (win_count, created); a missing row is seeded from the logs (flushed, not committed).
+
+        `wins` are the caller's flushed but uncommitted wins, which the seed already includes.
+        When another request seeds the row first, its count cannot include them, so they are
+        added with an UPDATE. That UPDATE is a current read and also locks the row, where a
+        plain re-SELECT could still miss the committed row under a REPEATABLE READ snapshot.
+        """
+
+        count = db.execute(
+            select(UserInternalWinCount.win_count).where(UserInternalWinCount.user_id == user_id)
+        ).scalar_one_or_none()
+        if count is not None:
+            return count, False
+        count = cls.count_wins_from_logs(db, user_id)
+        try:
+            with db.begin_nested():
+                db.add(UserInternalWinCount(user_id=user_id, win_count=count))
+        except IntegrityError:
+            # Seeded concurrently by another request; add our uncommitted wins on top of theirs.
+            cls._add_wins(db, user_id, wins)
+            return cls._read_win_count(db, user_id), False
+        return count, True
+
+    @classmethod
+    def record_win(cls, db: Session, user_id: int, wins: int = 1) -> int:
+        """Count the current play's win(s) and return the new total; the caller owns the transaction.
+
+        The play's log rows must already be flushed: when the counter does not exist yet it is
+        seeded from the logs, which then already include these wins.
+        """
+
+        if not cls._add_wins(db, user_id, wins):
+            return cls.ensure_win_count(db, user_id, wins=wins)[0]
+        return cls._read_win_count(db, user_id)
+
+    @staticmethod
+    def reconcile_win_counts(db: Session, user_ids: list[int] | None = None, apply: bool = True) -> list[tuple[int, int | None, int]]:
+        """Compare stored win counters with the logs; returns (user_id, stored, actual) for every drift.
+
+        With `apply` the counters are corrected (missing rows inserted); the caller commits.
+        """
+
+        actual: dict[int, int] = {}
+        for log_model, condition in WIN_CONDITIONS:
+            stmt = select(log_model.user_id, func.count()).where(condition).group_by(log_model.user_id)
+            if user_ids is not None:
+                stmt = stmt.where(log_model.user_id.in_(user_ids))
+            for user_id, count in db.execute(stmt):
+                actual[user_id] = actual.get(user_id, 0) + count
+
+        stored_stmt = select(UserInternalWinCount.user_id, UserInternalWinCount.win_count)
+        if user_ids is not None:
+            stored_stmt = stored_stmt.where(UserInternalWinCount.user_id.in_(user_ids))
+        stored = dict(db.execute(stored_stmt).all())
+
+        drift = [
+            (user_id, stored.get(user_id), actual.get(user_id, 0))
+            for user_id in sorted(set(actual) | set(stored))
+            if stored.get(user_id) != actual.get(user_id, 0)
+        ]
+        if apply and drift:
+            existing = [{"user_id": user_id, "win_count": count} for user_id, old, count in drift if old is not None]
+            missing = [{"user_id": user_id, "win_count": count} for user_id, old, count in drift if old is None]
+            if existing:
+                db.execute(update(UserInternalWinCount), existing)
+            if missing:
+                db.execute(insert(UserInternalWinCount), missing)
+        return drift
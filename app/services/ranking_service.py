@@ -1,14 +1,12 @@
 """Ranking service for daily leaderboard lookup."""
 from datetime import date, datetime
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.external_ranking import ExternalRankingData
-from app.models.user import User
 from app.models.feature import FeatureType
 from app.schemas.ranking import ExternalRankingEntry, RankingTodayResponse
 from app.services.feature_service import FeatureService
+from app.services.leaderboard import LeaderboardEntry, external_leaderboard
 
 
 class RankingService:
@@ -16,36 +14,28 @@ class RankingService:
 
     def __init__(self) -> None:
         self.feature_service = FeatureService()
+        self.leaderboard = external_leaderboard
+
+    @staticmethod
+    def _to_schema(rank: int, entry: LeaderboardEntry) -> ExternalRankingEntry:
+        return ExternalRankingEntry(
+            rank=rank,
+            user_id=entry.user_id,
+            user_name=entry.user_name,
+            deposit_amount=entry.deposit_amount,
+            play_count=entry.play_count,
+            memo=entry.memo,
+        )
 
-    def get_today_ranking(self, db: Session, user_id: int, now: date | datetime, top_n: int = 10) -> RankingTodayResponse:
+    def get_today_ranking(
+        self, db: Session, user_id: int, now: date | datetime, top_n: int = 10, offset: int = 0
+    ) -> RankingTodayResponse:
         today = now.date() if isinstance(now, datetime) else now
         self.feature_service.validate_feature_active(db, today, FeatureType.RANKING)
 
-        external_rows = db.execute(
-            select(ExternalRankingData, User.nickname, User.external_id)
-            .join(User, User.id == ExternalRankingData.user_id, isouter=True)
-            .order_by(
-                ExternalRankingData.deposit_amount.desc(),
-                ExternalRankingData.play_count.desc(),
-                ExternalRankingData.user_id.asc(),
-            )
-        ).all()
-        external_entries = []
-        for idx, row in enumerate(external_rows):
-            display_name = row.nickname or row.external_id or ""
-            if not display_name:
-                display_name = "닉네임 없음"
-            external_entries.append(
-                ExternalRankingEntry(
-                    rank=idx + 1,
-                    user_id=row.ExternalRankingData.user_id,
-                    user_name=display_name,
-                    deposit_amount=row.ExternalRankingData.deposit_amount,
-                    play_count=row.ExternalRankingData.play_count,
-                    memo=row.ExternalRankingData.memo,
-                )
-            )
-        my_external_entry = next((entry for entry in external_entries if entry.user_id == user_id), None)
+        external_entries = [self._to_schema(rank, entry) for rank, entry in self.leaderboard.page(db, offset, top_n)]
+        mine = self.leaderboard.lookup(db, user_id)
+        my_external_entry = self._to_schema(*mine) if mine else None
 
         return RankingTodayResponse(
             date=today,
@@ -53,5 +43,6 @@ class RankingService:
             my_entry=None,
             external_entries=external_entries,
             my_external_entry=my_external_entry,
+            external_total=self.leaderboard.total(db),
             feature_type=FeatureType.RANKING,
         )
@@ -1,12 +1,20 @@
 """Reward service for coupons, points, and game tickets."""
+from datetime import datetime, timedelta
 from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.core import config
 from app.models.game_wallet import GameTokenType
+from app.models.reward_outbox import RewardOutbox
 from app.services.game_wallet_service import GameWalletService
 
+# Outbox retry backoff: 30s, 1m, 2m, ... capped at one hour.
+OUTBOX_RETRY_BASE_SECONDS = 30
+OUTBOX_RETRY_MAX_SECONDS = 3600
+
 
 class RewardService:
     """Centralize reward delivery (points, coupons, game tickets)."""
@@ -26,7 +34,7 @@ class RewardService:
         # TODO: Integrate with coupon provider.
         _ = (db, user_id, coupon_type, meta)
 
-    def grant_ticket(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, meta: dict[str, Any] | None = None) -> None:
+    def grant_ticket(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, meta: dict[str, Any] | None = None, commit: bool = True) -> None:
         """Grant game tickets (roulette/dice/lottery) to the user wallet."""
 
         self.wallet_service.grant_tokens(
@@ -37,13 +45,53 @@ class RewardService:
             reason=(meta or {}).get("reason") or "LEVEL_REWARD",
             label=(meta or {}).get("label") or "AUTO_GRANT",
             meta=meta,
+            commit=commit,
         )
 
-    def deliver(self, db: Session, user_id: int, reward_type: str, reward_amount: int, meta: dict[str, Any] | None = None) -> None:
-        """Dispatch reward based on reward_type; no-op for NONE/zero."""
+    @property
+    def outbox_enabled(self) -> bool:
+        return config.get_settings().reward_delivery_mode == "outbox"
+
+    def deliver(
+        self,
+        db: Session,
+        user_id: int,
+        reward_type: str,
+        reward_amount: int,
+        meta: dict[str, Any] | None = None,
+        commit: bool = True,
+        idempotency_key: str | None = None,
+    ) -> None:
+        """Deliver a reward now, or queue it in reward_outbox when REWARD_DELIVERY_MODE=outbox.
+
+        With commit=False nothing is committed, so the delivery (or the outbox row) lands in the
+        caller's transaction. `idempotency_key` names the business event behind the reward; an
+        outbox row with the same key is never queued twice.
+        """
+
+        if self.outbox_enabled:
+            self.enqueue(db, user_id=user_id, reward_type=reward_type, reward_amount=reward_amount, meta=meta, idempotency_key=idempotency_key)
+            if commit:
+                db.commit()
+            return
+        self.deliver_now(db, user_id=user_id, reward_type=reward_type, reward_amount=reward_amount, meta=meta, commit=commit)
+
+    def deliver_now(self, db: Session, user_id: int, reward_type: str, reward_amount: int, meta: dict[str, Any] | None = None, commit: bool = True) -> None:
+        """Dispatch reward based on reward_type; no-op for NONE/zero.
+
+        With commit=False, wallet writes are only flushed so the caller can commit them together
+        with the rest of its unit of work, including the XP_FROM_GAME_REWARD season-pass hook.
+        """
 
         if reward_amount == 0 or reward_type in {"NONE", "", None}:
             return
+        if reward_type == "LEVEL_XP":
+            # Lazy import to avoid circular dependency with LevelXPService
+            from app.services.level_xp_service import LevelXPService  # pylint: disable=import-outside-toplevel
+
+            source = (meta or {}).get("source") or "REWARD"
+            LevelXPService().add_xp(db, user_id=user_id, delta=reward_amount, source=source, meta=meta, commit=commit)
+            return
         settings = config.get_settings()
         xp_from_game_reward = settings.xp_from_game_reward
         season_pass = None
@@ -56,7 +104,7 @@ class RewardService:
         if reward_type == "POINT":
             self.grant_point(db, user_id=user_id, amount=reward_amount, reason=meta.get("reason") if meta else None)
             if xp_from_game_reward and season_pass:
-                season_pass.add_bonus_xp(db, user_id=user_id, xp_amount=reward_amount)
+                season_pass.add_bonus_xp(db, user_id=user_id, xp_amount=reward_amount, commit=commit)
             return
         if reward_type == "COUPON":
             coupon_code = meta.get("coupon_type") if meta else "GENERIC"
@@ -70,8 +118,116 @@ class RewardService:
         }
         if reward_type in ticket_map:
             token_type = ticket_map[reward_type]
-            self.grant_ticket(db, user_id=user_id, token_type=token_type, amount=reward_amount, meta=meta)
+            self.grant_ticket(db, user_id=user_id, token_type=token_type, amount=reward_amount, meta=meta, commit=commit)
             return
 
         # Unknown reward types are ignored but should be monitored.
         _ = (db, user_id, reward_type, reward_amount, meta)
+
+    def enqueue(
+        self,
+        db: Session,
+        user_id: int,
+        reward_type: str,
+        reward_amount: int,
+        meta: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> RewardOutbox | None:
+        """Write a reward to reward_outbox in the caller's transaction (flushed, not committed).
+
+        Returns None for NONE/zero rewards and when `idempotency_key` is already queued.
+        Without a key the row gets a random one, i.e. it is only deduplicated by the
+        producer's own transaction.
+        """
+
+        if reward_amount == 0 or reward_type in {"NONE", "", None}:
+            return None
+        if idempotency_key is None:
+            idempotency_key = f"AUTO:{uuid4().hex}"
+        elif db.execute(select(RewardOutbox.id).where(RewardOutbox.idempotency_key == idempotency_key)).first():
+            return None
+        row = RewardOutbox(
+            idempotency_key=idempotency_key,
+            user_id=user_id,
+            reward_type=reward_type,
+            reward_amount=reward_amount,
+            meta=meta or {},
+        )
+        db.add(row)
+        db.flush()
+        return row
+
+    def enqueue_many(self, db: Session, rows: list[dict[str, Any]], batch_size: int = 1000) -> int:
+        """Bulk form of enqueue for rows with idempotency keys; returns how many were queued.
+
+        Each row needs idempotency_key, user_id, reward_type and reward_amount (meta optional).
+        Existing keys are looked up with one IN query per `batch_size` rows.
+        """
+
+        queued = 0
+        for start in range(0, len(rows), batch_size):
+            chunk = [row for row in rows[start : start + batch_size] if row["reward_amount"] and row["reward_type"] not in {"NONE", "", None}]
+            existing = set(
+                db.execute(
+                    select(RewardOutbox.idempotency_key).where(RewardOutbox.idempotency_key.in_([row["idempotency_key"] for row in chunk]))
+                ).scalars()
+            )
+            fresh: dict[str, dict[str, Any]] = {}
+            for row in chunk:
+                if row["idempotency_key"] not in existing:
+                    fresh.setdefault(row["idempotency_key"], {"meta": {}, **row})
+            if fresh:
+                db.execute(insert(RewardOutbox), list(fresh.values()))
+                queued += len(fresh)
+        return queued
+
+    def drain_outbox(self, db: Session, limit: int = 100, max_attempts: int = 8, now: datetime | None = None) -> dict[str, int]:
+        """Deliver up to `limit` due outbox rows oldest first and commit once.
+
+        Each row is delivered in its own savepoint and marked DONE in the same transaction as
+        its wallet writes, so a crash never delivers a row twice. A failed row is retried after
+        OUTBOX_RETRY_BASE_SECONDS * 2**(attempts-1) (capped) and parked as FAILED after
+        `max_attempts`. Rows are locked with SKIP LOCKED where supported so several workers can
+        drain together.
+        """
+
+        now = now or datetime.utcnow()
+        rows = (
+            db.execute(
+                select(RewardOutbox)
+                .where(RewardOutbox.status == "PENDING", RewardOutbox.next_attempt_at <= now)
+                .order_by(RewardOutbox.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            .scalars()
+            .all()
+        )
+        result = {"delivered": 0, "retried": 0, "failed": 0}
+        for row in rows:
+            row.attempts += 1
+            try:
+                with db.begin_nested():
+                    self.deliver_now(
+                        db,
+                        user_id=row.user_id,
+                        reward_type=row.reward_type,
+                        reward_amount=row.reward_amount,
+                        meta={**(row.meta or {}), "idempotency_key": row.idempotency_key},
+                        commit=False,
+                    )
+            except Exception as exc:
+                row.last_error = f"{type(exc).__name__}: {exc}"[:255]
+                if row.attempts >= max_attempts:
+                    row.status = "FAILED"
+                    result["failed"] += 1
+                else:
+                    delay = min(OUTBOX_RETRY_BASE_SECONDS * 2 ** (row.attempts - 1), OUTBOX_RETRY_MAX_SECONDS)
+                    row.next_attempt_at = now + timedelta(seconds=delay)
+                    result["retried"] += 1
+                continue
+            row.status = "DONE"
+            row.delivered_at = now
+            result["delivered"] += 1
+        db.commit()
+        return result
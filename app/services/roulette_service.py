@@ -1,21 +1,20 @@
 """Roulette service implementing status and play flows."""
 from datetime import date, datetime
-import random
-import time
 
-from sqlalchemy import func, select
-from sqlalchemy.exc import DBAPIError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.exceptions import InvalidConfigError, LockAcquisitionError
+from app.core.exceptions import InvalidConfigError
 from app.models.feature import FeatureType
 from app.models.game_wallet import GameTokenType
 from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
 from app.schemas.roulette import RoulettePlayResponse, RouletteStatusResponse
+from app.services.config_cache import RouletteConfigSnapshot, config_cache
 from app.services.feature_service import FeatureService
-from app.services.game_common import GamePlayContext, log_game_play
+from app.services.game_common import GamePlayContext, GamePlayUnitOfWork
 from app.services.game_wallet_service import GameWalletService
+from app.services.play_counter_service import PlayCounterService
 from app.services.reward_service import RewardService
 from app.services.season_pass_service import SeasonPassService
 
@@ -28,6 +27,7 @@ class RouletteService:
         self.reward_service = RewardService()
         self.wallet_service = GameWalletService()
         self.season_pass_service = SeasonPassService()
+        self.play_counter_service = PlayCounterService()
 
     def _seed_default_segments(self, db: Session, config_id: int) -> list[RouletteSegment]:
         """Ensure six default segments exist for the given config (TEST_MODE bootstrap)."""
@@ -65,15 +65,10 @@ class RouletteService:
             raise InvalidConfigError("ROULETTE_CONFIG_MISSING")
         return config
 
-    def _get_segments(self, db: Session, config_id: int, lock: bool = False) -> list[RouletteSegment]:
+    def _get_segments(self, db: Session, config_id: int) -> list[RouletteSegment]:
         settings = get_settings()
         stmt = select(RouletteSegment).where(RouletteSegment.config_id == config_id).order_by(RouletteSegment.slot_index)
-        if lock and db.bind and db.bind.dialect.name != "sqlite":
-            stmt = stmt.with_for_update()
-        try:
-            segments = db.execute(stmt).scalars().all()
-        except DBAPIError as exc:
-            raise LockAcquisitionError("ROULETTE_LOCK_FAILED") from exc
+        segments = db.execute(stmt).scalars().all()
         if len(segments) == 0 and settings.test_mode:
             return self._seed_default_segments(db, config_id)
         if len(segments) != 6:
@@ -86,20 +81,28 @@ class RouletteService:
             raise InvalidConfigError("INVALID_ROULETTE_CONFIG")
         return segments
 
+    def _load_snapshot(self, db: Session) -> RouletteConfigSnapshot:
+        config = self._get_today_config(db)
+        return RouletteConfigSnapshot.from_model(config, self._get_segments(db, config.id))
+
+    def _get_snapshot(self, db: Session) -> RouletteConfigSnapshot:
+        """Active config + validated segments, served from the per-worker config cache.
+
+        Plays draw from this immutable snapshot and never read or lock segment rows; admin
+        edits bump the ROULETTE version, so workers switch to the new segments on their next
+        version check.
+        """
+
+        return config_cache.get(db, "ROULETTE", "active", self._load_snapshot)
+
     def get_status(self, db: Session, user_id: int, today: date) -> RouletteStatusResponse:
         self.feature_service.validate_feature_active(db, today, FeatureType.ROULETTE)
-        config = self._get_today_config(db)
+        config = self._get_snapshot(db)
         token_type = GameTokenType.ROULETTE_COIN
         token_balance = self.wallet_service.get_balance(db, user_id, token_type)
-        segments = self._get_segments(db, config.id)
+        segments = list(config.segments)
 
-        today_spins = db.execute(
-            select(func.count()).select_from(RouletteLog).where(
-                RouletteLog.user_id == user_id,
-                RouletteLog.config_id == config.id,
-                func.date(RouletteLog.created_at) == today,
-            )
-        ).scalar_one()
+        today_spins = self.play_counter_service.get_count(db, user_id, FeatureType.ROULETTE, today)
         # Daily cap removed: use 0 to denote unlimited.
         unlimited = 0
         remaining = 0
@@ -116,83 +119,65 @@ class RouletteService:
             feature_type=FeatureType.ROULETTE,
         )
 
-    def play(self, db: Session, user_id: int, now: date | datetime) -> RoulettePlayResponse:
+    def play(self, db: Session, user_id: int, now: date | datetime, count: int = 1) -> RoulettePlayResponse:
+        """Spin `count` times in one transaction (one debit, batched log inserts, one commit)."""
+
         today = now.date() if isinstance(now, datetime) else now
         self.feature_service.validate_feature_active(db, today, FeatureType.ROULETTE)
-        config = self._get_today_config(db)
+        config = self._get_snapshot(db)
         token_type = GameTokenType.ROULETTE_COIN
-        segments = None
-        for attempt in range(3):
-            try:
-                segments = self._get_segments(db, config.id, lock=True)
-                break
-            except LockAcquisitionError:
-                if attempt == 2:
-                    raise
-                time.sleep(0.05)
-        assert segments is not None
-
-        today_spins = db.execute(
-            select(func.count()).select_from(RouletteLog).where(
-                RouletteLog.user_id == user_id,
-                RouletteLog.config_id == config.id,
-                func.date(RouletteLog.created_at) == today,
-            )
-        ).scalar_one()
-
-        weighted_segments = []
-        for seg in segments:
-            weighted_segments.extend([seg] * max(seg.weight, 0))
-        chosen = random.choice(weighted_segments)
-
-        self.wallet_service.require_and_consume_token(
-            db,
-            user_id,
-            token_type,
-            amount=1,
-            reason="ROULETTE_PLAY",
-            label=chosen.label,
-            meta={"segment_id": getattr(chosen, "id", None)},
-        )
-
-        log_entry = RouletteLog(
-            user_id=user_id,
-            config_id=config.id,
-            segment_id=chosen.id,
-            reward_type=chosen.reward_type,
-            reward_amount=chosen.reward_amount,
-        )
-        db.add(log_entry)
-        db.commit()
-        db.refresh(log_entry)
+        # Segments have no stock, so a spin touches no shared config rows at all.
+        spins = [config.pick() for _ in range(count)]
 
         ctx = GamePlayContext(user_id=user_id, feature_type=FeatureType.ROULETTE.value, today=today)
-        log_game_play(
-            ctx,
+        with GamePlayUnitOfWork(
             db,
-            {
-                "segment_id": chosen.id,
-                "reward_type": chosen.reward_type,
-                "reward_amount": chosen.reward_amount,
-                "label": chosen.label,
-                "xp_from_reward": chosen.reward_amount if chosen.reward_amount > 0 else 0,
-            },
-        )
-
-        # Deliver reward according to segment definition.
-        self.reward_service.deliver(
-            db,
-            user_id=user_id,
-            reward_type=chosen.reward_type,
-            reward_amount=chosen.reward_amount,
-            meta={"reason": "roulette_spin", "segment_id": chosen.id},
-        )
-        if chosen.reward_amount > 0:
-            self.season_pass_service.maybe_add_internal_win_stamp(db, user_id=user_id, now=today)
+            ctx,
+            wallet_service=self.wallet_service,
+            reward_service=self.reward_service,
+            season_pass_service=self.season_pass_service,
+        ) as uow:
+            uow.consume_tokens(
+                token_type,
+                [(chosen.label, {"segment_id": chosen.id}) for chosen in spins],
+                reason="ROULETTE_PLAY",
+            )
+            logs = [
+                RouletteLog(
+                    user_id=user_id,
+                    config_id=config.id,
+                    segment_id=chosen.id,
+                    reward_type=chosen.reward_type,
+                    reward_amount=chosen.reward_amount,
+                )
+                for chosen in spins
+            ]
+            uow.add_logs(logs)
+            for chosen, log in zip(spins, logs):
+                uow.log_event(
+                    {
+                        "segment_id": chosen.id,
+                        "reward_type": chosen.reward_type,
+                        "reward_amount": chosen.reward_amount,
+                        "label": chosen.label,
+                        "xp_from_reward": chosen.reward_amount if chosen.reward_amount > 0 else 0,
+                    }
+                )
+                # Deliver reward according to segment definition.
+                uow.deliver_reward(
+                    chosen.reward_type,
+                    chosen.reward_amount,
+                    meta={"reason": "roulette_spin", "segment_id": chosen.id},
+                    log=log,
+                )
+            wins = sum(1 for chosen in spins if chosen.reward_amount > 0)
+            if wins:
+                uow.add_internal_win_stamp(wins)
         season_pass = None  # 게임 1회당 자동 스탬프 발급을 중단하고, 조건 달성 시 별도 로직으로 처리
 
         return RoulettePlayResponse(
             result="OK",
-            segment=chosen,
+            segment=spins[-1],
+            segments=spins,
             season_pass=season_pass,
         )
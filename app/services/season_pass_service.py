@@ -1,11 +1,11 @@
 """Season pass domain service implementation aligned with design docs."""
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Iterable
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, literal, null, select, union_all
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.models.season_pass import (
@@ -16,8 +16,23 @@ from app.models.season_pass import (
     SeasonPassStampLog,
 )
 from app.schemas.season_pass import SeasonPassStatusResponse
+from app.services.config_cache import SeasonLevelLadder, SeasonLevelSnapshot, SeasonPassSnapshot, config_cache
 from app.services.level_xp_service import LevelXPService
+from app.services.play_counter_service import PlayCounterService
 from app.services.reward_service import RewardService
+from app.services.season_resolver import SeasonWindow, bounded_window, season_resolver
+
+NAMESPACE = "SEASON_PASS"
+
+REWARD_LABELS = {
+    1: "복권 티켓 1장",
+    2: "주사위 티켓 2장",
+    3: "룰렛 티켓 2장",
+    4: "복권 티켓 2장 + 주사위 티켓 1장",
+    5: "주사위 티켓 3장 + 룰렛 티켓 2장",
+    6: "복권 티켓 3장 + 룰렛 티켓 3장",
+    7: "복권/주사위/룰렛 티켓 각 5장",
+}
 
 
 class SeasonPassService:
@@ -26,26 +41,46 @@ class SeasonPassService:
     def __init__(self) -> None:
         self.reward_service = RewardService()
 
-    def _mirror_xp_to_core_level(self, db: Session, user_id: int, delta: int, source: str, meta: dict) -> None:
-        """Best-effort mirror XP to global level system without breaking the caller session."""
+    def _mirror_xp_to_core_level(
+        self, db: Session, user_id: int, delta: int, source: str, meta: dict, commit: bool = True
+    ) -> None:
+        """Best-effort mirror XP to the global level system; failures are swallowed.
+
+        SEASON_XP_MIRROR_MODE picks how: "inline" (default) applies it in a savepoint of `db`
+        and "queue" as a user_xp_mirror_queue row, both committed with the caller; "session" in
+        a separate session (a second pooled connection, committed on its own). With
+        commit=False the caller's transaction stays open (e.g. a play holding its wallet and
+        counter row locks), so "session" falls back to "inline": a second connection would wait
+        on those locks until the lock timeout.
+        """
+
+        from app.core.config import get_settings
 
+        mode = get_settings().season_xp_mirror_mode
+        if mode == "session" and not commit:
+            mode = "inline"
         try:
-            session_factory = sessionmaker(bind=db.get_bind(), expire_on_commit=False)
-            with session_factory() as mirror_db:
-                LevelXPService().add_xp(
-                    mirror_db,
-                    user_id=user_id,
-                    delta=delta,
-                    source=source,
-                    meta=meta,
-                )
-                mirror_db.commit()
+            if mode == "queue":
+                LevelXPService.enqueue_xp(db, user_id=user_id, delta=delta, source=source, meta=meta)
+            elif mode == "inline":
+                with db.begin_nested():
+                    LevelXPService().add_xp(db, user_id=user_id, delta=delta, source=source, meta=meta, commit=False)
+            else:
+                session_factory = sessionmaker(bind=db.get_bind(), expire_on_commit=False)
+                with session_factory() as mirror_db:
+                    LevelXPService().add_xp(
+                        mirror_db,
+                        user_id=user_id,
+                        delta=delta,
+                        source=source,
+                        meta=meta,
+                    )
+                    mirror_db.commit()
         except Exception:
             return
 
     def _ensure_default_season(self, db: Session, today: date) -> SeasonPassConfig | None:
         """When TEST_MODE is on and no season exists, create a simple default season."""
-        from datetime import timedelta
         from app.core.config import get_settings
 
         settings = get_settings()
@@ -74,33 +109,51 @@ class SeasonPassService:
         ]
         season.levels = levels
         db.add(season)
+        config_cache.bump(db, NAMESPACE)
         db.commit()
         db.refresh(season)
         return season
 
-    def get_current_season(self, db: Session, now: date | datetime) -> SeasonPassConfig | None:
-        """Return the active season for the given date or None if not found."""
+    @staticmethod
+    def load_season_window(db: Session, today: date, active_only: bool = False) -> SeasonWindow:
+        """Season covering `today` and the dates over which it stays the only one covering them."""
 
-        today = now.date() if isinstance(now, datetime) else now
-        stmt = select(SeasonPassConfig).where(
-            and_(SeasonPassConfig.start_date <= today, SeasonPassConfig.end_date >= today)
-        )
-        seasons = db.execute(stmt).scalars().all()
-        if not seasons:
-            # In TEST_MODE allow auto-creation so FE can proceed locally.
-            auto_season = self._ensure_default_season(db, today)
-            if auto_season:
-                return auto_season
-            return None
+        criteria = [SeasonPassConfig.is_active == True] if active_only else []  # noqa: E712
+        seasons = db.execute(
+            select(SeasonPassConfig).where(
+                and_(SeasonPassConfig.start_date <= today, SeasonPassConfig.end_date >= today, *criteria)
+            )
+        ).scalars().all()
         if len(seasons) > 1:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="NO_ACTIVE_SEASON_CONFLICT",
             )
-        return seasons[0]
+        season = seasons[0] if seasons else None
+        return bounded_window(
+            db,
+            season.id if season else None,
+            SeasonPassConfig.start_date,
+            SeasonPassConfig.end_date,
+            today,
+            timedelta(days=1),
+            *criteria,
+            valid_from=season.start_date if season else date.min,
+            valid_until=season.end_date if season else date.max,
+        )
+
+    def get_current_season(self, db: Session, now: date | datetime) -> SeasonPassConfig | None:
+        """Return the active season for the given date or None if not found (window-cached)."""
+
+        today = now.date() if isinstance(now, datetime) else now
+        season = season_resolver.get(db, SeasonPassConfig, NAMESPACE, "current", today, self.load_season_window)
+        if season is None:
+            # In TEST_MODE allow auto-creation so FE can proceed locally.
+            return self._ensure_default_season(db, today)
+        return season
 
-    def get_or_create_progress(self, db: Session, user_id: int, season_id: int) -> SeasonPassProgress:
-        """Fetch existing progress or create an initial record."""
+    def get_or_create_progress(self, db: Session, user_id: int, season_id: int, commit: bool = True) -> SeasonPassProgress:
+        """Fetch existing progress or create an initial record (flushed only when commit=False)."""
 
         stmt = select(SeasonPassProgress).where(
             SeasonPassProgress.user_id == user_id, SeasonPassProgress.season_id == season_id
@@ -117,75 +170,94 @@ class SeasonPassService:
             total_stamps=0,
         )
         db.add(progress)
+        if not commit:
+            db.flush()
+            return progress
         db.commit()
         db.refresh(progress)
         return progress
 
-    def get_status(self, db: Session, user_id: int, now: date | datetime) -> dict:
-        """Return active season info, progress, levels, and today's stamp flag."""
+    @staticmethod
+    def _load_level_ladder(db: Session, season_id: int) -> SeasonLevelLadder:
+        levels = db.execute(select(SeasonPassLevel).where(SeasonPassLevel.season_id == season_id)).scalars().all()
+        return SeasonLevelLadder.from_models(season_id, levels, REWARD_LABELS)
 
-        season = self.get_current_season(db, now)
-        if season is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NO_ACTIVE_SEASON")
+    @classmethod
+    def get_level_ladder(cls, db: Session, season_id: int) -> SeasonLevelLadder:
+        """Cached level table of a season; invalidated with the SEASON_PASS namespace."""
 
-        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id)
-        levels = (
-            db.execute(
-                select(SeasonPassLevel).where(SeasonPassLevel.season_id == season.id).order_by(SeasonPassLevel.level)
-            )
-            .scalars()
-            .all()
-        )
-        reward_logs = db.execute(
-            select(SeasonPassRewardLog).where(
-                SeasonPassRewardLog.season_id == season.id, SeasonPassRewardLog.user_id == user_id
-            )
-        ).scalars().all()
-        claimed_levels = {log.level for log in reward_logs}
+        return config_cache.get(db, NAMESPACE, ("ladder", season_id), lambda s: cls._load_level_ladder(s, season_id))
 
-        today = now.date() if isinstance(now, datetime) else now
-        stamped_today = (
-            db.execute(
-                select(SeasonPassStampLog).where(
-                    SeasonPassStampLog.user_id == user_id,
-                    SeasonPassStampLog.season_id == season.id,
-                    SeasonPassStampLog.date == today,
-                )
-            )
-            .scalars()
-            .first()
+    def _load_status_snapshot(self, db: Session, today: date) -> SeasonPassSnapshot | None:
+        season = self.get_current_season(db, today)
+        if season is None:
+            return None
+        return SeasonPassSnapshot.from_model(season, self.get_level_ladder(db, season.id))
+
+    @staticmethod
+    def _load_user_status(db: Session, user_id: int, season_id: int, today: date) -> tuple[Any, set[int], bool]:
+        """Progress row, claimed levels and today's stamp flag in one round trip (UNION ALL)."""
+
+        progress_q = select(
+            literal("P").label("kind"),
+            SeasonPassProgress.current_level.label("a"),
+            SeasonPassProgress.current_xp.label("b"),
+            SeasonPassProgress.total_stamps.label("c"),
+            SeasonPassProgress.last_stamp_date.label("d"),
+        ).where(SeasonPassProgress.user_id == user_id, SeasonPassProgress.season_id == season_id)
+        claimed_q = select(literal("C"), SeasonPassRewardLog.level, null(), null(), null()).where(
+            SeasonPassRewardLog.user_id == user_id, SeasonPassRewardLog.season_id == season_id
+        )
+        stamped_q = select(literal("S"), func.count(SeasonPassStampLog.id), null(), null(), null()).where(
+            SeasonPassStampLog.user_id == user_id,
+            SeasonPassStampLog.season_id == season_id,
+            SeasonPassStampLog.date == today,
         )
 
-        max_required = max((lvl.required_xp for lvl in levels), default=0)
-        next_level_req = next((lvl.required_xp for lvl in levels if lvl.required_xp > progress.current_xp), max_required)
-
-        reward_labels = {
-            1: "복권 티켓 1장",
-            2: "주사위 티켓 2장",
-            3: "룰렛 티켓 2장",
-            4: "복권 티켓 2장 + 주사위 티켓 1장",
-            5: "주사위 티켓 3장 + 룰렛 티켓 2장",
-            6: "복권 티켓 3장 + 룰렛 티켓 3장",
-            7: "복권/주사위/룰렛 티켓 각 5장",
-        }
+        progress = None
+        claimed_levels: set[int] = set()
+        stamped_today = False
+        for row in db.execute(union_all(progress_q, claimed_q, stamped_q)):
+            if row.kind == "P":
+                progress = row
+            elif row.kind == "C":
+                claimed_levels.add(row.a)
+            else:
+                stamped_today = row.a > 0
+        return progress, claimed_levels, stamped_today
 
-        level_payload = []
-        for level in levels:
-            is_unlocked = progress.current_xp >= level.required_xp
-            is_claimed = level.level in claimed_levels
-            reward_label = reward_labels.get(level.level, f"{level.reward_type} {level.reward_amount}")
-            level_payload.append(
-                {
-                    "level": level.level,
-                    "required_xp": level.required_xp,
-                    "reward_type": level.reward_type,
-                    "reward_amount": level.reward_amount,
-                    "auto_claim": level.auto_claim,
-                    "is_unlocked": is_unlocked,
-                    "is_claimed": is_claimed,
-                    "reward_label": reward_label,
-                }
-            )
+    def get_status(self, db: Session, user_id: int, now: date | datetime) -> dict:
+        """Return active season info, progress, levels, and today's stamp flag.
+
+        The season and its level table come from the config cache (SEASON_PASS namespace);
+        the per-user part is a single query. A user without progress yet is reported at
+        level 1 / 0 XP without writing a row; the first stamp or claim creates it.
+        """
+
+        today = now.date() if isinstance(now, datetime) else now
+        season = config_cache.get(db, NAMESPACE, ("status", today), lambda s: self._load_status_snapshot(s, today))
+        if season is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NO_ACTIVE_SEASON")
+
+        progress, claimed_levels, stamped_today = self._load_user_status(db, user_id, season.id, today)
+        current_xp = progress.b if progress else 0
+
+        levels = season.levels
+        next_level_req = season.ladder.next_level_xp(current_xp)
+
+        level_payload = [
+            {
+                "level": level.level,
+                "required_xp": level.required_xp,
+                "reward_type": level.reward_type,
+                "reward_amount": level.reward_amount,
+                "auto_claim": level.auto_claim,
+                "is_unlocked": current_xp >= level.required_xp,
+                "is_claimed": level.level in claimed_levels,
+                "reward_label": level.reward_label,
+            }
+            for level in levels
+        ]
 
         return {
             "season": {
@@ -197,14 +269,14 @@ class SeasonPassService:
                 "base_xp_per_stamp": season.base_xp_per_stamp,
             },
             "progress": {
-                "current_level": progress.current_level,
-                "current_xp": progress.current_xp,
-                "total_stamps": progress.total_stamps,
-                "last_stamp_date": progress.last_stamp_date,
+                "current_level": progress.a if progress else 1,
+                "current_xp": current_xp,
+                "total_stamps": progress.c if progress else 0,
+                "last_stamp_date": progress.d if progress else None,
                 "next_level_xp": next_level_req,
             },
             "levels": level_payload,
-            "today": {"date": today, "stamped": stamped_today is not None},
+            "today": {"date": today, "stamped": stamped_today},
         }
 
     def add_stamp(
@@ -216,8 +288,12 @@ class SeasonPassService:
         now: date | datetime | None = None,
         stamp_count: int = 1,
         period_key: str | None = None,
+        commit: bool = True,
     ) -> dict:
-        """Apply stamp(s): prevent duplicates, update XP, level-up, and log rewards."""
+        """Apply stamp(s): prevent duplicates, update XP, level-up, and log rewards.
+
+        With commit=False the writes are flushed into the caller's transaction instead of committed.
+        """
 
         today = (now or date.today())
         if isinstance(today, datetime):
@@ -230,7 +306,7 @@ class SeasonPassService:
         if season is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NO_ACTIVE_SEASON")
 
-        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id)
+        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id, commit=commit)
 
         xp_to_add = season.base_xp_per_stamp * stamp_count + xp_bonus
         key = period_key or today.isoformat()
@@ -246,67 +322,46 @@ class SeasonPassService:
             delta=xp_to_add,
             source=f"SEASON_STAMP:{source_feature_type}",
             meta={"season_id": season.id, "period_key": key, "stamp_count": stamp_count, "xp_bonus": xp_bonus},
+            commit=commit,
         )
 
-        achieved_levels = self._eligible_levels(db, season.id, progress.current_xp)
-        new_levels = [level for level in achieved_levels if level.level > previous_level]
+        ladder = self.get_level_ladder(db, season.id)
         rewards: list[dict] = []
 
-        for level in new_levels:
-            reward_logged = db.execute(
-                select(SeasonPassRewardLog).where(
-                    SeasonPassRewardLog.user_id == user_id,
-                    SeasonPassRewardLog.season_id == season.id,
-                    SeasonPassRewardLog.level == level.level,
-                )
-            ).scalar_one_or_none()
-            if reward_logged:
-                continue
-
-            if level.auto_claim:
-                reward_log = SeasonPassRewardLog(
+        for level, reward_log in self._add_auto_claim_logs(db, progress, ladder.crossed(previous_level, progress.current_xp)):
+            reward_meta = {
+                "season_id": season.id,
+                "level": level.level,
+                "source": "SEASON_PASS_AUTO_CLAIM",
+                "trigger": "STAMP",
+                "stamp_count": stamp_count,
+                "xp_added": xp_to_add,
+                "feature": source_feature_type,
+            }
+            try:
+                self.reward_service.deliver(
+                    db,
                     user_id=user_id,
-                    season_id=season.id,
-                    progress_id=progress.id,
-                    level=level.level,
                     reward_type=level.reward_type,
                     reward_amount=level.reward_amount,
-                    claimed_at=datetime.utcnow(),
+                    meta=reward_meta,
+                    commit=commit,
+                    idempotency_key=self.reward_key(season.id, user_id, level.level),
                 )
-                db.add(reward_log)
-                reward_meta = {
-                    "season_id": season.id,
+            except Exception:
+                # Reward delivery failure should not block stamp flow; rely on logs for retry.
+                pass
+            rewards.append(
+                {
                     "level": level.level,
-                    "source": "SEASON_PASS_AUTO_CLAIM",
-                    "trigger": "STAMP",
-                    "stamp_count": stamp_count,
-                    "xp_added": xp_to_add,
-                    "feature": source_feature_type,
+                    "reward_type": level.reward_type,
+                    "reward_amount": level.reward_amount,
+                    "auto_claim": level.auto_claim,
+                    "claimed_at": reward_log.claimed_at,
                 }
-                try:
-                    self.reward_service.deliver(
-                        db,
-                        user_id=user_id,
-                        reward_type=level.reward_type,
-                        reward_amount=level.reward_amount,
-                        meta=reward_meta,
-                    )
-                except Exception:
-                    # Reward delivery failure should not block stamp flow; rely on logs for retry.
-                    pass
-                rewards.append(
-                    {
-                        "level": level.level,
-                        "reward_type": level.reward_type,
-                        "reward_amount": level.reward_amount,
-                        "auto_claim": level.auto_claim,
-                        "claimed_at": reward_log.claimed_at,
-                    }
-                )
+            )
 
-        progress.current_level = max(progress.current_level, previous_level)
-        if achieved_levels:
-            progress.current_level = max(progress.current_level, max(level.level for level in achieved_levels))
+        progress.current_level = max(progress.current_level, previous_level, ladder.level_for_xp(progress.current_xp))
 
         existing_stamp = db.execute(
             select(SeasonPassStampLog).where(
@@ -337,8 +392,11 @@ class SeasonPassService:
             )
             db.add(stamp_log)
 
-        db.commit()
-        db.refresh(progress)
+        if commit:
+            db.commit()
+            db.refresh(progress)
+        else:
+            db.flush()
 
         leveled_up = progress.current_level > previous_level
         return {
@@ -358,6 +416,7 @@ class SeasonPassService:
         now: date | datetime | None = None,
         stamp_count: int = 1,
         period_key: str | None = None,
+        commit: bool = True,
     ) -> dict | None:
         """Best-effort stamp: ignore no-season or already-stamped errors."""
 
@@ -370,6 +429,7 @@ class SeasonPassService:
                 now=now,
                 stamp_count=stamp_count,
                 period_key=period_key,
+                commit=commit,
             )
         except HTTPException as exc:
             if exc.detail in {"ALREADY_STAMPED_TODAY", "NO_ACTIVE_SEASON"}:
@@ -382,15 +442,21 @@ class SeasonPassService:
         user_id: int,
         threshold: int = 50,
         now: date | datetime | None = None,
+        commit: bool = True,
+        total_wins: int | None = None,
     ) -> dict | None:
-        """Award one stamp when total internal 게임 승리 횟수 >= threshold (once per season)."""
+        """Award one stamp when total internal 게임 승리 횟수 >= threshold (once per season).
+
+        Callers that just recorded a win pass the counter value as `total_wins`.
+        """
 
         today = (now or date.today())
         if isinstance(today, datetime):
             today = today.date()
 
-        progress = self.get_internal_win_progress(db, user_id=user_id, threshold=threshold, now=today)
-        if progress["total_wins"] < threshold:
+        if total_wins is None:
+            total_wins, _ = PlayCounterService.ensure_win_count(db, user_id)
+        if total_wins < threshold:
             return None
 
         existing = db.execute(
@@ -411,36 +477,17 @@ class SeasonPassService:
             now=today,
             stamp_count=1,
             period_key="INTERNAL_WIN_50",
+            commit=commit,
         )
 
     def get_internal_win_progress(
         self, db: Session, user_id: int, threshold: int = 50, now: date | datetime | None = None
     ) -> dict:
-        """Return current internal win count and remaining to threshold."""
-
-        from sqlalchemy import func
-        from app.models.dice import DiceLog
-        from app.models.roulette import RouletteLog
-        from app.models.lottery import LotteryLog
-
-        today = (now or date.today())
-        if isinstance(today, datetime):
-            today = today.date()
+        """Return current internal win count and remaining to threshold (one primary-key lookup)."""
 
-        dice_wins = db.execute(
-            select(func.count()).select_from(DiceLog).where(DiceLog.user_id == user_id, DiceLog.result == "WIN")
-        ).scalar_one()
-        roulette_wins = db.execute(
-            select(func.count()).select_from(RouletteLog).where(
-                RouletteLog.user_id == user_id, RouletteLog.reward_amount > 0
-            )
-        ).scalar_one()
-        lottery_wins = db.execute(
-            select(func.count()).select_from(LotteryLog).where(
-                LotteryLog.user_id == user_id, LotteryLog.reward_amount > 0
-            )
-        ).scalar_one()
-        total_wins = dice_wins + roulette_wins + lottery_wins
+        total_wins, created = PlayCounterService.ensure_win_count(db, user_id)
+        if created:
+            db.commit()
         remaining = max(threshold - total_wins, 0)
         return {"total_wins": total_wins, "threshold": threshold, "remaining": remaining}
 
@@ -456,11 +503,7 @@ class SeasonPassService:
         if progress.current_level < level:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="LEVEL_NOT_REACHED")
 
-        level_row = db.execute(
-            select(SeasonPassLevel).where(
-                SeasonPassLevel.season_id == season.id, SeasonPassLevel.level == level
-            )
-        ).scalar_one_or_none()
+        level_row = self.get_level_ladder(db, season.id).get(level)
         if level_row is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="LEVEL_NOT_FOUND")
         if level_row.auto_claim:
@@ -491,20 +534,33 @@ class SeasonPassService:
             "level": level,
             "source": "SEASON_PASS_MANUAL_CLAIM",
         }
-        db.commit()
-        db.refresh(reward_log)
-        try:
+        outbox = self.reward_service.outbox_enabled
+        if outbox:
+            # Queue the delivery in the claim's own transaction.
             self.reward_service.deliver(
                 db,
                 user_id=user_id,
                 reward_type=level_row.reward_type,
                 reward_amount=level_row.reward_amount,
                 meta=reward_meta,
+                commit=False,
+                idempotency_key=self.reward_key(season.id, user_id, level),
             )
-            db.commit()
-        except Exception:
-            # Manual claim should still record the claim even if delivery fails; retry externally.
-            db.rollback()
+        db.commit()
+        db.refresh(reward_log)
+        if not outbox:
+            try:
+                self.reward_service.deliver(
+                    db,
+                    user_id=user_id,
+                    reward_type=level_row.reward_type,
+                    reward_amount=level_row.reward_amount,
+                    meta=reward_meta,
+                )
+                db.commit()
+            except Exception:
+                # Manual claim should still record the claim even if delivery fails; retry externally.
+                db.rollback()
 
         return {
             "level": reward_log.level,
@@ -513,14 +569,53 @@ class SeasonPassService:
             "claimed_at": reward_log.claimed_at,
         }
 
-    def _eligible_levels(self, db: Session, season_id: int, current_xp: int) -> Iterable[SeasonPassLevel]:
-        """Return levels whose required XP is met."""
+    @staticmethod
+    def reward_key(season_id: int, user_id: int, level: int) -> str:
+        """Outbox idempotency key of a season pass level reward."""
 
-        return db.execute(
-            select(SeasonPassLevel)
-            .where(SeasonPassLevel.season_id == season_id, SeasonPassLevel.required_xp <= current_xp)
-            .order_by(SeasonPassLevel.level)
-        ).scalars().all()
+        return f"SEASON_PASS:{season_id}:{user_id}:{level}"
+
+    @staticmethod
+    def _add_auto_claim_logs(
+        db: Session, progress: SeasonPassProgress, levels: Iterable[SeasonLevelSnapshot]
+    ) -> list[tuple[SeasonLevelSnapshot, SeasonPassRewardLog]]:
+        """Add reward logs for the auto-claim `levels` the user has not claimed yet.
+
+        Claimed levels are looked up with one IN query (none when nothing auto-claimable was
+        crossed) and the new logs are added together, so they flush as one batch.
+        """
+
+        auto_levels = [level for level in levels if level.auto_claim]
+        if not auto_levels:
+            return []
+        claimed = set(
+            db.execute(
+                select(SeasonPassRewardLog.level).where(
+                    SeasonPassRewardLog.user_id == progress.user_id,
+                    SeasonPassRewardLog.season_id == progress.season_id,
+                    SeasonPassRewardLog.level.in_([level.level for level in auto_levels]),
+                )
+            ).scalars()
+        )
+        claimed_at = datetime.utcnow()
+        pending = [
+            (
+                level,
+                SeasonPassRewardLog(
+                    user_id=progress.user_id,
+                    season_id=progress.season_id,
+                    progress_id=progress.id,
+                    level=level.level,
+                    reward_type=level.reward_type,
+                    reward_amount=level.reward_amount,
+                    claimed_at=claimed_at,
+                ),
+            )
+            for level in auto_levels
+            if level.level not in claimed
+        ]
+        db.add_all([reward_log for _, reward_log in pending])
+        return pending
 
     def add_bonus_xp(
         self,
@@ -528,8 +623,13 @@ class SeasonPassService:
         user_id: int,
         xp_amount: int,
         now: date | datetime | None = None,
+        commit: bool = True,
     ) -> dict:
-        """Add raw XP without stamping (used for game 보상 포인트 → XP)."""
+        """Add raw XP without stamping (used for game 보상 포인트 → XP).
+
+        With commit=False everything, including the core level mirror, lands in the caller's
+        transaction (flushed only), so it commits or rolls back with the caller.
+        """
 
         if xp_amount <= 0:
             return {"added_xp": 0, "leveled_up": False, "rewards": []}
@@ -542,36 +642,188 @@ class SeasonPassService:
         if season is None:
             return {"added_xp": 0, "leveled_up": False, "rewards": []}
 
-        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id)
+        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id, commit=commit)
         previous_level = progress.current_level
         progress.current_xp += xp_amount
         db.add(progress)
 
-        achieved_levels = self._eligible_levels(db, season.id, progress.current_xp)
-        # Defensive: avoid processing duplicate level rows
-        seen_levels: set[int] = set()
-        new_levels: list[SeasonPassLevel] = []
-        for lvl in achieved_levels:
-            if lvl.level in seen_levels:
-                continue
-            seen_levels.add(lvl.level)
-            if lvl.level > previous_level:
-                new_levels.append(lvl)
+        # The ladder keeps one row per level number, so duplicate level rows are not re-processed.
+        ladder = self.get_level_ladder(db, season.id)
         rewards: list[dict] = []
         delivery_queue: list[dict] = []
 
-        for level in new_levels:
-            reward_logged = db.execute(
-                select(SeasonPassRewardLog).where(
-                    SeasonPassRewardLog.user_id == user_id,
-                    SeasonPassRewardLog.season_id == season.id,
-                    SeasonPassRewardLog.level == level.level,
+        for level, reward_log in self._add_auto_claim_logs(db, progress, ladder.crossed(previous_level, progress.current_xp)):
+            delivery_queue.append(
+                {
+                    "reward_type": level.reward_type,
+                    "reward_amount": level.reward_amount,
+                    "level": level.level,
+                }
+            )
+            rewards.append(
+                {
+                    "level": level.level,
+                    "reward_type": level.reward_type,
+                    "reward_amount": level.reward_amount,
+                    "auto_claim": level.auto_claim,
+                    "claimed_at": reward_log.claimed_at,
+                }
+            )
+
+        progress.current_level = max(progress.current_level, previous_level, ladder.level_for_xp(progress.current_xp))
+
+        def reward_meta(item: dict) -> dict:
+            return {
+                "season_id": season.id,
+                "level": item["level"],
+                "source": "SEASON_PASS_AUTO_CLAIM",
+                "trigger": "BONUS_XP",
+                "xp_added": xp_amount,
+            }
+
+        # With the reward outbox the deliveries are queued together with the reward logs.
+        if self.reward_service.outbox_enabled:
+            for item in delivery_queue:
+                self.reward_service.deliver(
+                    db,
+                    user_id=user_id,
+                    reward_type=item["reward_type"],
+                    reward_amount=item["reward_amount"],
+                    meta=reward_meta(item),
+                    commit=False,
+                    idempotency_key=self.reward_key(season.id, user_id, item["level"]),
                 )
-            ).scalar_one_or_none()
-            if reward_logged:
-                continue
+            delivery_queue = []
+
+        if not commit:
+            # Caller's unit of work: mirror and inline deliveries stay best-effort via savepoints.
+            db.flush()
+            try:
+                with db.begin_nested():
+                    LevelXPService().add_xp(
+                        db, user_id=user_id, delta=xp_amount, source="SEASON_BONUS_XP", meta={"season_id": season.id}, commit=False
+                    )
+            except Exception:
+                pass
+            for item in delivery_queue:
+                try:
+                    with db.begin_nested():
+                        self.reward_service.deliver(
+                            db,
+                            user_id=user_id,
+                            reward_type=item["reward_type"],
+                            reward_amount=item["reward_amount"],
+                            meta=reward_meta(item),
+                            commit=False,
+                        )
+                except Exception:
+                    continue
+        else:
+            # 1) Commit XP/progress + reward logs first (must not be affected by reward delivery failures)
+            db.commit()
+            db.refresh(progress)
+
+            # 2) Mirror to core level system (best-effort, separate transaction)
+            try:
+                LevelXPService().add_xp(
+                    db,
+                    user_id=user_id,
+                    delta=xp_amount,
+                    source="SEASON_BONUS_XP",
+                    meta={"season_id": season.id},
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+
+            # 3) Deliver rewards (best-effort, separate transaction per reward)
+            for item in delivery_queue:
+                try:
+                    self.reward_service.deliver(
+                        db,
+                        user_id=user_id,
+                        reward_type=item["reward_type"],
+                        reward_amount=item["reward_amount"],
+                        meta=reward_meta(item),
+                    )
+                    db.commit()
+                except Exception:
+                    db.rollback()
+
+        leveled_up = progress.current_level > previous_level
+        return {
+            "added_xp": xp_amount,
+            "leveled_up": leveled_up,
+            "current_level": progress.current_level,
+            "rewards": rewards,
+        }
+
+    def add_bonus_xp_bulk(
+        self,
+        db: Session,
+        xp_by_user: dict[int, int],
+        now: date | datetime | None = None,
+        batch_size: int = 1000,
+    ) -> dict[int, dict]:
+        """Batch form of add_bonus_xp for many users; returns add_bonus_xp's payload per user.
+
+        The season and its levels are read once, progress rows and claimed reward logs with
+        one IN query per `batch_size` users, and all XP/progress + reward logs are committed
+        together. Core-level mirroring and reward delivery stay best-effort per user.
+        """
 
-            if level.auto_claim:
+        xp_by_user = {user_id: xp for user_id, xp in xp_by_user.items() if xp > 0}
+        if not xp_by_user:
+            return {}
+
+        today = (now or date.today())
+        if isinstance(today, datetime):
+            today = today.date()
+
+        season = self.get_current_season(db, today)
+        if season is None:
+            return {}
+
+        ladder = self.get_level_ladder(db, season.id)
+
+        user_ids = list(xp_by_user)
+        progress_by_user: dict[int, SeasonPassProgress] = {}
+        claimed: set[tuple[int, int]] = set()
+        for start in range(0, len(user_ids), batch_size):
+            chunk = user_ids[start : start + batch_size]
+            progress_by_user.update(
+                (progress.user_id, progress)
+                for progress in db.execute(
+                    select(SeasonPassProgress).where(
+                        SeasonPassProgress.season_id == season.id, SeasonPassProgress.user_id.in_(chunk)
+                    )
+                ).scalars()
+            )
+            claimed.update(
+                db.execute(
+                    select(SeasonPassRewardLog.user_id, SeasonPassRewardLog.level).where(
+                        SeasonPassRewardLog.season_id == season.id, SeasonPassRewardLog.user_id.in_(chunk)
+                    )
+                ).all()
+            )
+        for user_id in user_ids:
+            if user_id not in progress_by_user:
+                progress_by_user[user_id] = SeasonPassProgress(
+                    user_id=user_id, season_id=season.id, current_level=1, current_xp=0, total_stamps=0
+                )
+                db.add(progress_by_user[user_id])
+        db.flush()
+
+        results: dict[int, dict] = {}
+        delivery_queue: list[tuple[int, SeasonLevelSnapshot]] = []
+        for user_id, xp_amount in xp_by_user.items():
+            progress = progress_by_user[user_id]
+            previous_level = progress.current_level
+            progress.current_xp += xp_amount
+            rewards: list[dict] = []
+            for level in ladder.crossed(previous_level, progress.current_xp):
+                if (user_id, level.level) in claimed or not level.auto_claim:
+                    continue
                 reward_log = SeasonPassRewardLog(
                     user_id=user_id,
                     season_id=season.id,
@@ -582,13 +834,7 @@ class SeasonPassService:
                     claimed_at=datetime.utcnow(),
                 )
                 db.add(reward_log)
-                delivery_queue.append(
-                    {
-                        "reward_type": level.reward_type,
-                        "reward_amount": level.reward_amount,
-                        "level": level.level,
-                    }
-                )
+                delivery_queue.append((user_id, level))
                 rewards.append(
                     {
                         "level": level.level,
@@ -598,53 +844,85 @@ class SeasonPassService:
                         "claimed_at": reward_log.claimed_at,
                     }
                 )
+            progress.current_level = max(progress.current_level, ladder.level_for_xp(progress.current_xp))
+            results[user_id] = {
+                "added_xp": xp_amount,
+                "leveled_up": progress.current_level > previous_level,
+                "current_level": progress.current_level,
+                "rewards": rewards,
+            }
 
-        progress.current_level = max(progress.current_level, previous_level)
-        if achieved_levels:
-            progress.current_level = max(progress.current_level, max(level.level for level in achieved_levels))
+        # With the reward outbox the deliveries are queued together with the reward logs.
+        if self.reward_service.outbox_enabled:
+            self.reward_service.enqueue_many(
+                db,
+                [
+                    {
+                        "idempotency_key": self.reward_key(season.id, user_id, level.level),
+                        "user_id": user_id,
+                        "reward_type": level.reward_type,
+                        "reward_amount": level.reward_amount,
+                        "meta": {
+                            "season_id": season.id,
+                            "level": level.level,
+                            "source": "SEASON_PASS_AUTO_CLAIM",
+                            "trigger": "BONUS_XP",
+                            "xp_added": xp_by_user[user_id],
+                        },
+                    }
+                    for user_id, level in delivery_queue
+                ],
+                batch_size=batch_size,
+            )
+            delivery_queue = []
 
-        # 1) Commit XP/progress + reward logs first (must not be affected by reward delivery failures)
+        # 1) Commit XP/progress + reward logs for every user at once
         db.commit()
-        db.refresh(progress)
 
-        # 2) Mirror to core level system (best-effort, separate transaction)
+        # 2) Mirror to core level system in one batch; if that fails, retry user by user so a
+        #    bad row only loses its own mirror
+        level_xp = LevelXPService()
+        mirror_meta = {"season_id": season.id}
         try:
-            LevelXPService().add_xp(
-                db,
-                user_id=user_id,
-                delta=xp_amount,
-                source="SEASON_BONUS_XP",
-                meta={"season_id": season.id},
-            )
-            db.commit()
+            with db.begin_nested():
+                level_xp.add_xp_bulk(db, xp_by_user, source="SEASON_BONUS_XP", meta=mirror_meta, batch_size=batch_size)
         except Exception:
-            db.rollback()
+            for user_id, xp_amount in xp_by_user.items():
+                try:
+                    with db.begin_nested():
+                        level_xp.add_xp(
+                            db,
+                            user_id=user_id,
+                            delta=xp_amount,
+                            source="SEASON_BONUS_XP",
+                            meta=mirror_meta,
+                            commit=False,
+                        )
+                except Exception:
+                    continue
+        db.commit()
 
-        # 3) Deliver rewards (best-effort, separate transaction per reward)
-        for item in delivery_queue:
+        # 3) Deliver rewards (best-effort, one savepoint per reward, committed together)
+        for user_id, level in delivery_queue:
             reward_meta = {
                 "season_id": season.id,
-                "level": item["level"],
+                "level": level.level,
                 "source": "SEASON_PASS_AUTO_CLAIM",
                 "trigger": "BONUS_XP",
-                "xp_added": xp_amount,
+                "xp_added": xp_by_user[user_id],
             }
             try:
-                self.reward_service.deliver(
-                    db,
-                    user_id=user_id,
-                    reward_type=item["reward_type"],
-                    reward_amount=item["reward_amount"],
-                    meta=reward_meta,
-                )
-                db.commit()
+                with db.begin_nested():
+                    self.reward_service.deliver(
+                        db,
+                        user_id=user_id,
+                        reward_type=level.reward_type,
+                        reward_amount=level.reward_amount,
+                        meta=reward_meta,
+                        commit=False,
+                    )
             except Exception:
-                db.rollback()
+                continue
+        db.commit()
 
-        leveled_up = progress.current_level > previous_level
-        return {
-            "added_xp": xp_amount,
-            "leveled_up": leveled_up,
-            "current_level": progress.current_level,
-            "rewards": rewards,
-        }
+        return results
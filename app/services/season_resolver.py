@@ -0,0 +1,124 @@
+"""Active-season resolution cached for the span in which the answer cannot change.
+
+A single play asks for the current season pass several times (status, internal win stamp,
+stamp, bonus XP), and admin/team-battle paths do the same for their own season tables. The
+answer only changes when the clock crosses a season boundary or an admin edits seasons, so
+each lookup is resolved once into a `SeasonWindow`: the season id (or None) together with
+the inclusive span [valid_from, valid_until] over which that id stays the answer.
+
+Windows live in `config_cache` under the season's namespace, so admin writes that call
+`config_cache.bump(db, namespace)` re-resolve them (immediately in the writing worker, after
+at most one TTL elsewhere). A lookup outside the cached window drops it and resolves again.
+Hits cost a `db.get` on the id, which the session's identity map serves after the first call.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.services.config_cache import ConfigCache, config_cache
+
+
+@dataclass(frozen=True)
+class SeasonWindow:
+    season_id: int | None
+    valid_from: Any
+    valid_until: Any
+
+    def covers(self, at: Any) -> bool:
+        return self.valid_from <= at <= self.valid_until
+
+
+def bounded_window(
+    db: Session,
+    season_id: int | None,
+    start_col: Any,
+    end_col: Any,
+    at: Any,
+    step: Any,
+    *criteria: Any,
+    valid_from: Any,
+    valid_until: Any,
+) -> SeasonWindow:
+    """Clip [valid_from, valid_until] to the gap between the neighbouring seasons of `at`.
+
+    Every season matching `criteria` either covers `at` or ends before / starts after it,
+    so the set covering `at` is unchanged until the previous season's end or the next
+    season's start (one round trip for both).
+    """
+
+    prev_end, next_start = db.execute(
+        select(
+            select(func.max(end_col)).where(end_col < at, *criteria).scalar_subquery(),
+            select(func.min(start_col)).where(start_col > at, *criteria).scalar_subquery(),
+        )
+    ).one()
+    if prev_end is not None:
+        valid_from = max(valid_from, prev_end + step)
+    if next_start is not None:
+        valid_until = min(valid_until, next_start - step)
+    return SeasonWindow(season_id=season_id, valid_from=valid_from, valid_until=valid_until)
+
+
+class SeasonResolver:
+    """Window cache of active-season lookups with hit/miss counters."""
+
+    def __init__(self, cache: ConfigCache = config_cache) -> None:
+        self._cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(
+        self, db: Session, namespace: str, key: str, at: Any, loader: Callable[[Session, Any], SeasonWindow]
+    ) -> int | None:
+        """Season id in effect at `at`; `loader(db, at)` builds the window on a miss.
+
+        Loader exceptions (e.g. overlapping seasons) propagate and are not cached.
+        """
+
+        cache_key = ("season_window", key)
+        loaded = False
+
+        def load(session: Session) -> SeasonWindow:
+            nonlocal loaded
+            loaded = True
+            return loader(session, at)
+
+        window = self._cache.get(db, namespace, cache_key, load)
+        if not window.covers(at):
+            self._cache.discard(namespace, cache_key)
+            window = self._cache.get(db, namespace, cache_key, load)
+        if loaded:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return window.season_id
+
+    def get(
+        self, db: Session, model: Any, namespace: str, key: str, at: Any, loader: Callable[[Session, Any], SeasonWindow]
+    ) -> Any | None:
+        """Like `resolve`, returning the `model` row (re-resolved once if it vanished without a bump)."""
+
+        season_id = self.resolve(db, namespace, key, at, loader)
+        if season_id is None:
+            return None
+        season = db.get(model, season_id)
+        if season is None:
+            self._cache.discard(namespace, ("season_window", key))
+            season_id = self.resolve(db, namespace, key, at, loader)
+            season = db.get(model, season_id) if season_id is not None else None
+        return season
+
+    def metrics(self) -> dict:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hits / total, 4) if total else 0.0}
+
+    def reset_metrics(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+season_resolver = SeasonResolver()
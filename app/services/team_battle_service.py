@@ -13,8 +13,13 @@ from app.models.external_ranking import ExternalRankingData
 from app.models.game_wallet import GameTokenType
 from app.services.game_wallet_service import GameWalletService
 from app.services.level_xp_service import LevelXPService
+from app.services.reward_service import RewardService
+from app.services.config_cache import config_cache
+from app.services.season_resolver import SeasonWindow, bounded_window, season_resolver
 from app.core.config import get_settings
 
+NAMESPACE = "TEAM_SEASON"
+
 
 class TeamBattleService:
     POINTS_PER_PLAY = 10
@@ -86,11 +91,7 @@ class TeamBattleService:
         start = start_local.astimezone(utc).replace(tzinfo=None)
         end = end_local.astimezone(utc).replace(tzinfo=None)
 
-        existing = db.execute(
-            select(TeamSeason).where(
-                and_(TeamSeason.starts_at <= today, TeamSeason.ends_at >= today)
-            )
-        ).scalar_one_or_none()
+        existing = season_resolver.get(db, TeamSeason, NAMESPACE, "covering", today, self._load_covering_window)
         if existing:
             return existing
 
@@ -104,26 +105,53 @@ class TeamBattleService:
         db.add(season)
         db.flush()
         db.query(TeamSeason).filter(TeamSeason.id != season.id, TeamSeason.is_active == True).update({"is_active": False})  # noqa: E712
+        config_cache.bump(db, NAMESPACE)
         db.commit()
         db.refresh(season)
         return season
 
-    def get_active_season(self, db: Session, now: datetime | None = None) -> TeamSeason | None:
-        reference = now or self._now_utc()
+    @staticmethod
+    def _load_covering_window(db: Session, at: datetime) -> SeasonWindow:
+        """Season (active or not) whose stored bounds cover `at`, as used by ensure_current_season."""
 
+        season = db.execute(
+            select(TeamSeason).where(and_(TeamSeason.starts_at <= at, TeamSeason.ends_at >= at))
+        ).scalar_one_or_none()
+        return bounded_window(
+            db,
+            season.id if season else None,
+            TeamSeason.starts_at,
+            TeamSeason.ends_at,
+            at,
+            timedelta(microseconds=1),
+            valid_from=season.starts_at if season else datetime.min,
+            valid_until=season.ends_at if season else datetime.max,
+        )
+
+    def _load_active_window(self, db: Session, reference: datetime) -> SeasonWindow:
         season = db.execute(select(TeamSeason).where(TeamSeason.is_active == True)).scalar_one_or_none()  # noqa: E712
         if not season:
-            return None
+            return SeasonWindow(season_id=None, valid_from=datetime.min, valid_until=datetime.max)
 
         start_utc = self._normalize_to_utc(season.starts_at, reference)
         end_utc = self._normalize_to_utc(season.ends_at, reference)
+        step = timedelta(microseconds=1)
+        if reference < start_utc:
+            return SeasonWindow(season_id=None, valid_from=datetime.min, valid_until=start_utc - step)
+        if reference > end_utc:
+            return SeasonWindow(season_id=None, valid_from=end_utc + step, valid_until=datetime.max)
+        return SeasonWindow(season_id=season.id, valid_from=start_utc, valid_until=end_utc)
 
-        if start_utc <= reference <= end_utc:
-            season.starts_at = start_utc
-            season.ends_at = end_utc
-            return season
+    def get_active_season(self, db: Session, now: datetime | None = None) -> TeamSeason | None:
+        reference = now or self._now_utc()
 
-        return None
+        season = season_resolver.get(db, TeamSeason, NAMESPACE, "active", reference, self._load_active_window)
+        if not season:
+            return None
+
+        season.starts_at = self._normalize_to_utc(season.starts_at, reference)
+        season.ends_at = self._normalize_to_utc(season.ends_at, reference)
+        return season
 
     def _get_active_or_current(self, db: Session, now: datetime | None = None) -> TeamSeason:
         season = self.get_active_season(db, now)
@@ -170,6 +198,7 @@ class TeamBattleService:
             if conflict:
                 raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="ACTIVE_SEASON_CONFLICT")
         db.add(season)
+        config_cache.bump(db, NAMESPACE)
         db.commit()
         db.refresh(season)
         return season
@@ -194,6 +223,7 @@ class TeamBattleService:
             db.query(TeamSeason).filter(TeamSeason.id != season.id, TeamSeason.is_active == True).update({"is_active": False})  # noqa: E712
 
         db.add(season)
+        config_cache.bump(db, NAMESPACE)
         db.commit()
         db.refresh(season)
         return season
@@ -203,6 +233,7 @@ class TeamBattleService:
         if not season:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SEASON_NOT_FOUND")
         db.delete(season)
+        config_cache.bump(db, NAMESPACE)
         db.commit()
 
     def set_active(self, db: Session, season_id: int, is_active: bool) -> TeamSeason:
@@ -211,6 +242,7 @@ class TeamBattleService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SEASON_NOT_FOUND")
         season.is_active = is_active
         db.add(season)
+        config_cache.bump(db, NAMESPACE)
         db.commit()
         db.refresh(season)
         return season
@@ -427,16 +459,32 @@ class TeamBattleService:
         rank2 = standings[1] if len(standings) > 1 else None
 
         auto_rewards: list[int] = []
+        reward_service = RewardService()
         if rank2:
             for entry in eligible_users_for_team(rank2.team_id):
-                LevelXPService().add_xp(
-                    db,
-                    user_id=entry["user_id"],
-                    delta=100,
-                    source="TEAM_BATTLE_RANK2",
-                    meta={"season_id": season_id, "team_id": rank2.team_id, "rank": 2},
-                )
+                meta = {"season_id": season_id, "team_id": rank2.team_id, "rank": 2}
+                if reward_service.outbox_enabled:
+                    # Keyed per season and user, so settling twice queues the XP once.
+                    reward_service.deliver(
+                        db,
+                        user_id=entry["user_id"],
+                        reward_type="LEVEL_XP",
+                        reward_amount=100,
+                        meta={**meta, "source": "TEAM_BATTLE_RANK2"},
+                        commit=False,
+                        idempotency_key=f"TEAM_BATTLE_RANK2:{season_id}:{entry['user_id']}",
+                    )
+                else:
+                    LevelXPService().add_xp(
+                        db,
+                        user_id=entry["user_id"],
+                        delta=100,
+                        source="TEAM_BATTLE_RANK2",
+                        meta=meta,
+                    )
                 auto_rewards.append(entry["user_id"])
+            if reward_service.outbox_enabled:
+                db.commit()
 
         all_eligible = [
             {"team_id": t_id, "user_id": u_id, "points": pts}
@@ -0,0 +1,80 @@
+"""Weighted random selection with a precomputed alias table (Vose's method).
+
+Roulette segments and lottery prizes are drawn by integer weight. Building a list with
+`weight` copies of every item costs O(total weight) per spin; the alias table is built in
+O(n) together with each immutable config snapshot (see config_cache) and each draw is O(1)
+with no allocation, key building or locking.
+"""
+from __future__ import annotations
+
+import random
+from fractions import Fraction
+from typing import Sequence
+
+
+class WeightedSampler:
+    """Alias table over integer weights; `sample_index` returns the chosen position.
+
+    Integer arithmetic is used throughout so the sampled distribution equals
+    weight / total_weight exactly (no float rounding).
+    """
+
+    __slots__ = ("size", "total", "_prob", "_alias")
+
+    def __init__(self, weights: Sequence[int]) -> None:
+        if not weights or any(w < 0 for w in weights):
+            raise ValueError("weights must be a non-empty sequence of non-negative integers")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("total weight must be positive")
+
+        n = len(weights)
+        # Scale by n so the average column holds exactly `total`.
+        scaled = [w * n for w in weights]
+        prob = [0] * n
+        alias = list(range(n))
+        small = [i for i, w in enumerate(scaled) if w < total]
+        large = [i for i, w in enumerate(scaled) if w >= total]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - total
+            (small if scaled[l] < total else large).append(l)
+        for i in large + small:
+            prob[i] = total
+
+        self.size = n
+        self.total = total
+        self._prob = tuple(prob)
+        self._alias = tuple(alias)
+
+    def sample_index(self, rng: random.Random | None = None) -> int:
+        """Draw one index in O(1)."""
+
+        r = rng or random
+        i = r.randrange(self.size)
+        if r.randrange(self.total) < self._prob[i]:
+            return i
+        return self._alias[i]
+
+    def probabilities(self) -> list[Fraction]:
+        """Exact per-index probability implied by the alias table (used for verification)."""
+
+        result = [Fraction(0)] * self.size
+        denom = self.size * self.total
+        for i in range(self.size):
+            result[i] += Fraction(self._prob[i], denom)
+            result[self._alias[i]] += Fraction(self.total - self._prob[i], denom)
+        return result
+
+
+def build_sampler(items: Sequence, weight_attr: str = "weight") -> WeightedSampler | None:
+    """Alias table over the items' weights (negatives count as 0); None when no item has weight."""
+
+    weights = [max(getattr(item, weight_attr), 0) for item in items]
+    if not any(weights):
+        return None
+    return WeightedSampler(weights)
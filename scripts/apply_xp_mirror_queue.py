@@ -0,0 +1,47 @@
+"""
+Apply queued season pass -> core level XP (SEASON_XP_MIRROR_MODE=queue).
+
+Usage:
+    python scripts/apply_xp_mirror_queue.py [--batch 1000] [--interval 5] [--once]
+
+Drains user_xp_mirror_queue in batches of `--batch` rows, one transaction per batch. With
+--once it exits when the queue is empty; otherwise it keeps polling every `--interval`
+seconds. Rows that keep failing stay queued after `--max-attempts` tries for inspection
+(attempts / last_error columns).
+
+Requires: DATABASE_URL environment variable
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.services.level_xp_service import LevelXPService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=1000, help="rows per transaction")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds to sleep when the queue is empty")
+    parser.add_argument("--max-attempts", type=int, default=5)
+    parser.add_argument("--once", action="store_true", help="exit once the queue is drained")
+    args = parser.parse_args()
+
+    service = LevelXPService()
+    while True:
+        with SessionLocal() as db:
+            result = service.apply_queued(db, limit=args.batch, max_attempts=args.max_attempts)
+        if result["applied"] or result["failed"]:
+            print(f"applied={result['applied']} failed={result['failed']}", flush=True)
+        if result["applied"] + result["failed"] < args.batch:
+            if args.once:
+                return
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Rebuild user_daily_play_count from roulette_log, dice_log and lottery_log.
+
+Usage:
+    python scripts/backfill_play_counters.py [--start 2025-12-01] [--end 2025-12-31]
+
+Without a range every counter is recomputed. Existing counters inside the range are
+replaced, so the script is safe to re-run (e.g. after the 20251220_0014 migration, or to
+repair counters after manual log edits). Run it outside peak hours: plays made while it
+runs for today's date may be counted twice or not at all until the next run.
+
+Requires: DATABASE_URL environment variable
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.services.play_counter_service import PlayCounterService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="first play date (inclusive)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="last play date (inclusive)")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        written = PlayCounterService.rebuild(db, start=args.start, end=args.end)
+        db.commit()
+    print(f"rebuilt {written} user_daily_play_count rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Requests/second of one worker for the sync and async (DB_STACK) game route stacks.
+
+Usage:
+    python scripts/bench_async_stack.py [--concurrency 64] [--requests 2000] [--users 50] [--threads 40] [--stacks sync,async]
+
+For each stack a fresh database is seeded (same data as bench_play_pipeline.py) and an app
+with only that stack's roulette/dice/lottery routers is driven in-process through
+httpx.AsyncClient + ASGITransport by `--concurrency` concurrent clients, alternating
+status and play calls across the three games. The sync stack runs its `def` handlers on
+the AnyIO threadpool (`--threads` tokens, Starlette's default is 40) over pysqlite; the
+async stack runs `async def` handlers over aiosqlite. Prints requests/s, p50/p99 latency
+and non-2xx responses.
+
+Without --url a throw-away file-based SQLite database is used per stack; with --url pass
+the sync URL (mysql+pymysql://...), the async one is derived (mysql+aiomysql://...).
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import AsyncGenerator, Generator
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+import anyio.to_thread
+import httpx
+from fastapi import FastAPI, Request
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.deps import get_async_db, get_current_user_id, get_db
+from app.api.routes import async_games, dice, lottery, roulette
+from app.core.error_handlers import register_exception_handlers
+from app.db.async_session import async_url
+from app.db.base import Base
+from bench_play_pipeline import percentile, seed
+
+CALLS = [("GET", "/api/roulette/status"), ("POST", "/api/roulette/play"), ("GET", "/api/dice/status"),
+         ("POST", "/api/dice/play"), ("GET", "/api/lottery/status"), ("POST", "/api/lottery/play")]
+
+
+def bench_user(request: Request) -> int:
+    return int(request.headers["x-bench-user"])
+
+
+def build_app(stack: str, url: str, concurrency: int) -> tuple[FastAPI, list]:
+    sqlite = url.startswith("sqlite")
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.dependency_overrides[get_current_user_id] = bench_user
+    if stack == "sync":
+        engine = create_engine(
+            url, connect_args={"check_same_thread": False, "timeout": 60} if sqlite else {},
+            pool_size=concurrency, max_overflow=0,
+        )
+        SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+        def bench_db() -> Generator[Session, None, None]:
+            with SessionLocal() as db:
+                yield db
+
+        for router in (roulette.router, dice.router, lottery.router):
+            app.include_router(router)
+        app.dependency_overrides[get_db] = bench_db
+        return app, [engine.dispose]
+
+    engine = create_async_engine(
+        async_url(url), connect_args={"timeout": 60} if sqlite else {}, pool_size=concurrency, max_overflow=0
+    )
+    factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def bench_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with factory() as db:
+            yield db
+
+    for router in async_games.routers:
+        app.include_router(router)
+    app.dependency_overrides[get_async_db] = bench_async_db
+    return app, [engine.dispose]
+
+
+async def drive(app: FastAPI, concurrency: int, requests: int, users: int) -> tuple[float, list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        for n in counter:
+            method, path = CALLS[n % len(CALLS)]
+            started = time.perf_counter()
+            response = await client.request(method, path, headers={"x-bench-user": str(n % users + 1)})
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 300:
+                errors += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, errors
+
+
+def run(url: str, stack: str, concurrency: int, requests: int, users: int, threads: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine, expire_on_commit=False)() as db:
+        seed(db, users, requests)
+    engine.dispose()
+
+    app, cleanups = build_app(stack, url, concurrency)
+
+    async def main() -> tuple[float, list[float], int]:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+        try:
+            return await drive(app, concurrency, requests, users)
+        finally:
+            for cleanup in cleanups:
+                result = cleanup()
+                if asyncio.iscoroutine(result):
+                    await result
+
+    elapsed, latencies, errors = asyncio.run(main())
+    print(
+        f"{stack:>5}: {requests / elapsed:,.0f} req/s, p50 {statistics.median(latencies):.1f} ms, "
+        f"p99 {percentile(latencies, 99):.1f} ms, {errors} non-2xx"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=40, help="AnyIO threadpool size for the sync stack")
+    parser.add_argument("--stacks", default="sync,async")
+    parser.add_argument("--url", help="sync SQLAlchemy URL (default: temporary SQLite file per stack)")
+    args = parser.parse_args()
+
+    for stack in args.stacks.split(","):
+        if args.url:
+            run(args.url, stack, args.concurrency, args.requests, args.users, args.threads)
+            continue
+        with tempfile.TemporaryDirectory() as tmp:
+            run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", stack, args.concurrency, args.requests, args.users, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark for AdminExternalRankingService.upsert_many on large uploads.
+
+Usage:
+    python scripts/bench_external_ranking_upload.py [--users 5000] [--rounds 2] [--import] [--url sqlite:///bench.db]
+
+Seeds `--users` users and a season, then uploads one ranking row per user (by external_id)
+`--rounds` times with growing deposits, so the first round inserts rows and later rounds
+update them and grant step XP. Prints rows/s, the per-phase timings and the Python heap
+peak of each round.
+
+With --import each round is written to an NDJSON file and fed through the streaming
+import (AdminExternalRankingService.import_stream) instead of one in-memory list.
+
+Without --url a throw-away file-based SQLite database is used.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel
+from app.models.user import User
+from app.schemas.external_ranking import ExternalRankingCreate
+from app.services.admin_external_ranking_service import AdminExternalRankingService
+
+
+def upload_list(SessionLocal, users: int, round_no: int) -> dict[str, float]:  # noqa: ANN001
+    payloads = [
+        ExternalRankingCreate(external_id=f"bench-{i}", deposit_amount=100_000 * round_no + i, play_count=round_no)
+        for i in range(1, users + 1)
+    ]
+    timings: dict[str, float] = {}
+    with SessionLocal() as db:
+        AdminExternalRankingService.upsert_many(db, payloads, timings=timings)
+    return timings
+
+
+def upload_import(SessionLocal, users: int, round_no: int, tmp: str) -> dict[str, float]:  # noqa: ANN001
+    path = os.path.join(tmp, f"round-{round_no}.ndjson")
+    with open(path, "w", encoding="utf-8") as fh:
+        for i in range(1, users + 1):
+            fh.write(json.dumps({"external_id": f"bench-{i}", "deposit_amount": 100_000 * round_no + i, "play_count": round_no}) + "\n")
+    tracemalloc.reset_peak()
+    with SessionLocal() as db, open(path, encoding="utf-8") as fh:
+        return AdminExternalRankingService.import_stream(db, fh, "ndjson").timings_ms
+
+
+def run(url: str, users: int, rounds: int, via_import: bool) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    with SessionLocal() as db:
+        today = date.today()
+        season = SeasonPassConfig(
+            season_name="BENCH",
+            start_date=today - timedelta(days=1),
+            end_date=today + timedelta(days=30),
+            max_level=10,
+            base_xp_per_stamp=10,
+            is_active=True,
+        )
+        season.levels = [
+            SeasonPassLevel(level=i, required_xp=100 * i, reward_type="POINT", reward_amount=100, auto_claim=True)
+            for i in range(1, 11)
+        ]
+        db.add(season)
+        db.execute(insert(User), [{"id": i, "external_id": f"bench-{i}", "status": "ACTIVE"} for i in range(1, users + 1)])
+        db.commit()
+
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        for round_no in range(1, rounds + 1):
+            tracemalloc.reset_peak()
+            started = time.perf_counter()
+            if via_import:
+                timings = upload_import(SessionLocal, users, round_no, tmp)
+            else:
+                timings = upload_list(SessionLocal, users, round_no)
+            elapsed = time.perf_counter() - started
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            phases = ", ".join(f"{phase}={ms:.1f}ms" for phase, ms in timings.items())
+            print(f"round {round_no}: {users} rows in {elapsed:.2f}s ({users / elapsed:,.0f} rows/s, peak {peak_mb:.1f} MiB) [{phases}]")
+    tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--import", dest="via_import", action="store_true", help="stream rounds through the NDJSON import")
+    parser.add_argument("--url", help="SQLAlchemy URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url, args.users, args.rounds, args.via_import)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.users, args.rounds, args.via_import)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark for SQL statements per XP event while users level up.
+
+Usage:
+    python scripts/bench_level_up_queries.py [--users 50] [--events 60] [--xp 10] [--url sqlite:///bench.db]
+
+Seeds a season with 20 levels (every other one auto-claimed) and `--users` users, then
+grants `--xp` bonus XP per event `--events` times to every user through
+SeasonPassService.add_bonus_xp (which mirrors into LevelXPService.add_xp). For each band
+of ten events it prints the average number of SQL statements and reward-log lookups per
+event together with the season level reached, so it shows whether the per-event cost grows
+with the number of levels a user has already passed.
+
+Without --url a throw-away file-based SQLite database is used.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel
+from app.models.user import User
+from app.services.season_pass_service import SeasonPassService
+
+BAND = 10
+
+
+def run(url: str, users: int, events: int, xp: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    with SessionLocal() as db:
+        today = date.today()
+        season = SeasonPassConfig(
+            season_name="BENCH",
+            start_date=today - timedelta(days=1),
+            end_date=today + timedelta(days=30),
+            max_level=20,
+            base_xp_per_stamp=10,
+            is_active=True,
+        )
+        season.levels = [
+            SeasonPassLevel(level=i, required_xp=30 * (i - 1), reward_type="POINT", reward_amount=10, auto_claim=i % 2 == 0)
+            for i in range(1, 21)
+        ]
+        db.add(season)
+        db.execute(insert(User), [{"id": i, "external_id": f"bench-{i}", "status": "ACTIVE"} for i in range(1, users + 1)])
+        db.commit()
+
+    counts = {"statements": 0, "lookups": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        counts["statements"] += 1
+        if statement.startswith("SELECT") and ("FROM season_pass_reward_log" in statement or "FROM user_level_reward_log" in statement):
+            counts["lookups"] += 1
+
+    service = SeasonPassService()
+    print(f"{'events':>9} {'level':>5} {'stmts/event':>11} {'lookups/event':>13} {'ms/event':>8}")
+    with SessionLocal() as db:
+        for band_start in range(0, events, BAND):
+            band = min(BAND, events - band_start)
+            counts.update(statements=0, lookups=0)
+            started = time.perf_counter()
+            for _ in range(band):
+                for user_id in range(1, users + 1):
+                    result = service.add_bonus_xp(db, user_id=user_id, xp_amount=xp)
+            elapsed = time.perf_counter() - started
+            per_event = band * users
+            print(
+                f"{band_start + 1:>4}-{band_start + band:<4} {result['current_level']:>5} "
+                f"{counts['statements'] / per_event:>11.2f} {counts['lookups'] / per_event:>13.2f} "
+                f"{elapsed * 1000 / per_event:>8.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--events", type=int, default=60)
+    parser.add_argument("--xp", type=int, default=10, help="bonus XP per event")
+    parser.add_argument("--url", help="SQLAlchemy URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url, args.users, args.events, args.xp)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.users, args.events, args.xp)
+
+
+if __name__ == "__main__":
+    main()
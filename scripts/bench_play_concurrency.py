@@ -0,0 +1,120 @@
+"""
+Multi-threaded play throughput for roulette and lottery (lock-free snapshot draw).
+
+Usage:
+    python scripts/bench_play_concurrency.py [--workers 1,2,4,8] [--plays 200] [--games roulette,lottery] [--url mysql+pymysql://...]
+
+For every worker count a fresh database is seeded (same data as bench_play_pipeline.py; the
+lottery has one finite-stock prize), then each worker thread plays `--plays` times as its
+own user with its own session. Prints plays/s and the speed-up over one worker.
+
+Plays draw from the cached config snapshot and touch no shared config rows except a
+finite-stock prize when it is actually drawn, so throughput should scale with workers on
+MySQL. Without --url a throw-away SQLite file (WAL) is used; SQLite allows one writer at a
+time, so expect flat numbers there.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.services.config_cache import config_cache
+from app.services.lottery_service import LotteryService
+from app.services.roulette_service import RouletteService
+from bench_play_pipeline import seed
+
+SERVICES = {"roulette": RouletteService, "lottery": LotteryService}
+
+
+def run(url: str, game: str, workers: int, plays: int) -> tuple[float, int]:
+    sqlite = url.startswith("sqlite")
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False, "timeout": 60} if sqlite else {},
+        pool_size=workers,
+        max_overflow=0,
+    )
+    if sqlite:
+        # WAL + BEGIN IMMEDIATE: writers queue on the busy timeout instead of failing on a
+        # read-to-write lock upgrade.
+        @event.listens_for(engine, "connect")
+        def _connect(dbapi_connection, _record):  # noqa: ANN001
+            dbapi_connection.isolation_level = None
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+        @event.listens_for(engine, "begin")
+        def _begin(conn):  # noqa: ANN001
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    with SessionLocal() as db:
+        seed(db, workers, plays)
+    config_cache.clear()
+
+    service = SERVICES[game]()
+    barrier = threading.Barrier(workers + 1)
+    failures = 0
+    lock = threading.Lock()
+
+    def worker(user_id: int) -> None:
+        nonlocal failures
+        barrier.wait()
+        for _ in range(plays):
+            try:
+                with SessionLocal() as db:
+                    service.play(db, user_id=user_id, now=date.today())
+            except OperationalError:
+                with lock:
+                    failures += 1
+
+    threads = [threading.Thread(target=worker, args=(user_id,)) for user_id in range(1, workers + 1)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+    return (workers * plays - failures) / elapsed, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--plays", type=int, default=200, help="plays per worker")
+    parser.add_argument("--games", default="roulette,lottery")
+    parser.add_argument("--url", help="SQLAlchemy URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    # Keep the season pass -> core XP mirror in the play's own transaction (no second connection).
+    get_settings().season_xp_mirror_mode = "inline"
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        print(f"{'game':<10}{'workers':>8}{'plays/s':>10}{'speed-up':>10}{'failed':>8}", flush=True)
+        for game in args.games.split(","):
+            baseline = None
+            for workers in (int(w) for w in args.workers.split(",")):
+                rate, failures = run(url, game, workers, args.plays)
+                baseline = baseline or rate
+                print(f"{game:<10}{workers:>8}{rate:>10,.0f}{rate / baseline:>9.2f}x{failures:>8}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
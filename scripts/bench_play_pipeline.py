@@ -0,0 +1,141 @@
+"""
+Benchmark for the roulette/dice/lottery play pipeline.
+
+Usage:
+    python scripts/bench_play_pipeline.py [--plays 300] [--users 20] [--url sqlite:///bench.db]
+
+Reports, per game:
+- commits issued per play (counted with a SQLAlchemy `commit` engine event)
+- p50 / p99 / max latency of `<Game>Service.play`
+
+Without --url a throw-away file-based SQLite database is used so every commit
+pays a real journal write, which is closer to MySQL than an in-memory DB.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.dice import DiceConfig
+from app.models.feature import FeatureConfig, FeatureType
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.lottery import LotteryConfig, LotteryPrize
+from app.models.roulette import RouletteConfig, RouletteSegment
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel
+from app.models.user import User
+from app.services.dice_service import DiceService
+from app.services.lottery_service import LotteryService
+from app.services.roulette_service import RouletteService
+
+
+def seed(db, users: int, plays: int) -> None:
+    today = date.today()
+    for user_id in range(1, users + 1):
+        db.add(User(id=user_id, external_id=f"bench-{user_id}", status="ACTIVE"))
+        for token in GameTokenType:
+            db.add(UserGameWallet(user_id=user_id, token_type=token, balance=plays * 10))
+    for feature_type in (FeatureType.ROULETTE, FeatureType.DICE, FeatureType.LOTTERY):
+        db.add(FeatureConfig(feature_type=feature_type, title=feature_type.value, page_path=f"/{feature_type.value.lower()}"))
+
+    roulette = RouletteConfig(name="BENCH_ROULETTE", is_active=True)
+    roulette.segments = [
+        RouletteSegment(slot_index=i, label=f"S{i}", reward_type="POINT" if i % 2 else "NONE", reward_amount=10 * (i % 2), weight=10)
+        for i in range(6)
+    ]
+    lottery = LotteryConfig(name="BENCH_LOTTERY", is_active=True)
+    lottery.prizes = [
+        LotteryPrize(label="MISS", reward_type="NONE", reward_amount=0, weight=70, stock=None),
+        LotteryPrize(label="SMALL", reward_type="POINT", reward_amount=10, weight=25, stock=None),
+        LotteryPrize(label="BIG", reward_type="POINT", reward_amount=100, weight=5, stock=plays * users),
+    ]
+    dice = DiceConfig(
+        name="BENCH_DICE",
+        is_active=True,
+        win_reward_type="POINT",
+        win_reward_amount=10,
+        draw_reward_type="NONE",
+        draw_reward_amount=0,
+        lose_reward_type="NONE",
+        lose_reward_amount=0,
+    )
+    season = SeasonPassConfig(
+        season_name="BENCH_SEASON",
+        start_date=today - timedelta(days=1),
+        end_date=today + timedelta(days=7),
+        max_level=5,
+        base_xp_per_stamp=10,
+        is_active=True,
+    )
+    season.levels = [
+        SeasonPassLevel(level=i, required_xp=20 * i, reward_type="POINT", reward_amount=100, auto_claim=True) for i in range(1, 6)
+    ]
+    db.add_all([roulette, lottery, dice, season])
+    db.commit()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+def run(url: str, plays: int, users: int) -> None:
+    engine = create_engine(url, connect_args={"check_same_thread": False} if url.startswith("sqlite") else {})
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+    with SessionLocal() as db:
+        seed(db, users, plays)
+
+    commits = {"count": 0}
+
+    @event.listens_for(engine, "commit")
+    def _count_commit(conn):  # noqa: ANN001
+        commits["count"] += 1
+
+    games = [("roulette", RouletteService()), ("dice", DiceService()), ("lottery", LotteryService())]
+    print(f"{'game':<10}{'plays':>7}{'commits/play':>14}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, service in games:
+        latencies: list[float] = []
+        commits["count"] = 0
+        for i in range(plays):
+            user_id = (i % users) + 1
+            with SessionLocal() as db:
+                started = time.perf_counter()
+                service.play(db, user_id=user_id, now=date.today())
+                latencies.append((time.perf_counter() - started) * 1000)
+        print(
+            f"{name:<10}{plays:>7}{commits['count'] / plays:>14.2f}"
+            f"{statistics.median(latencies):>10.2f}{percentile(latencies, 99):>10.2f}{max(latencies):>10.2f}"
+        )
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plays", type=int, default=300)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--url", default=None, help="SQLAlchemy URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url, args.plays, args.users)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.plays, args.users)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Pool-usage benchmark for the season pass -> core level XP mirror modes.
+
+Usage:
+    python scripts/bench_season_xp_mirror.py [--threads 8] [--stamps 50] [--pool-size 8] [--modes session,inline,queue] [--url sqlite:///bench.db]
+
+For each SEASON_XP_MIRROR_MODE a fresh database is seeded with one user per thread, then
+every thread stamps `--stamps` times through SeasonPassService.add_stamp with its own
+session, on an engine whose pool holds `--pool-size` connections (no overflow, 2s timeout).
+Prints stamps/s, pool checkouts per stamp, peak connections in use, stamps that timed out
+waiting for the pool and how much of the stamped XP reached the core level table (mirror
+failures, e.g. pool timeouts in "session" mode, are swallowed by design). In queue mode
+the queue is drained afterwards and timed separately.
+
+Without --url a throw-away file-based SQLite database is used per mode.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.db.pool_metrics import PoolUsage
+from app.models.level_xp import UserLevelProgress
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel, SeasonPassProgress
+from app.models.user import User
+from app.services.config_cache import config_cache
+from app.services.level_xp_service import LevelXPService
+from app.services.season_pass_service import SeasonPassService
+
+
+def run(url: str, mode: str, threads: int, stamps: int, pool_size: int) -> None:
+    connect_args = {"check_same_thread": False, "timeout": 60} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args, pool_size=pool_size, max_overflow=0, pool_timeout=2)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    today = date.today()
+    with SessionLocal() as db:
+        season = SeasonPassConfig(
+            season_name="BENCH",
+            start_date=today - timedelta(days=1),
+            end_date=today + timedelta(days=30),
+            max_level=10,
+            base_xp_per_stamp=10,
+            is_active=True,
+        )
+        season.levels = [
+            SeasonPassLevel(level=i, required_xp=100 * i, reward_type="POINT", reward_amount=10, auto_claim=False)
+            for i in range(1, 11)
+        ]
+        db.add(season)
+        db.flush()
+        for user_id in range(1, threads + 1):
+            db.add(User(id=user_id, external_id=f"bench-{user_id}", status="ACTIVE"))
+            db.add(SeasonPassProgress(user_id=user_id, season_id=season.id, current_level=1, current_xp=0, total_stamps=0))
+        db.commit()
+
+    get_settings().season_xp_mirror_mode = mode
+    config_cache.clear()
+    usage = PoolUsage().attach(engine)
+    usage.reset()
+    service = SeasonPassService()
+    barrier = threading.Barrier(threads)
+
+    timeouts = 0
+    lock = threading.Lock()
+
+    def worker(user_id: int) -> None:
+        nonlocal timeouts
+        barrier.wait()
+        for n in range(stamps):
+            try:
+                with SessionLocal() as db:
+                    service.add_stamp(db, user_id=user_id, source_feature_type="BENCH", period_key=f"bench-{n}", now=today)
+            except TimeoutError:
+                with lock:
+                    timeouts += 1
+
+    pool = [threading.Thread(target=worker, args=(user_id,)) for user_id in range(1, threads + 1)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    metrics = usage.snapshot()
+
+    drained = ""
+    if mode == "queue":
+        drain_started = time.perf_counter()
+        level_xp = LevelXPService()
+        while True:
+            with SessionLocal() as db:
+                if level_xp.apply_queued(db, limit=1000)["applied"] == 0:
+                    break
+        drained = f", drained in {(time.perf_counter() - drain_started) * 1000:.0f} ms"
+    usage.detach(engine)
+
+    total = threads * stamps
+    with SessionLocal() as db:
+        mirrored = db.execute(select(func.coalesce(func.sum(UserLevelProgress.xp), 0))).scalar_one()
+    print(
+        f"{mode:>7}: {total / elapsed:,.0f} stamps/s, {metrics['checkouts'] / total:.2f} checkouts/stamp, "
+        f"peak {metrics['peak_in_use']}/{pool_size} connections, {timeouts} stamp pool timeouts, "
+        f"core XP {mirrored}/{(total - timeouts) * 10}{drained}"
+    )
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--stamps", type=int, default=50, help="stamps per thread")
+    parser.add_argument("--pool-size", type=int, default=8)
+    parser.add_argument("--modes", default="session,inline,queue")
+    parser.add_argument("--url", help="SQLAlchemy URL (default: temporary SQLite file per mode)")
+    args = parser.parse_args()
+
+    for mode in args.modes.split(","):
+        if args.url:
+            run(args.url, mode, args.threads, args.stamps, args.pool_size)
+            continue
+        with tempfile.TemporaryDirectory() as tmp:
+            run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", mode, args.threads, args.stamps, args.pool_size)
+
+
+if __name__ == "__main__":
+    main()
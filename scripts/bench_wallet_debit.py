@@ -0,0 +1,101 @@
+"""
+Concurrency benchmark for GameWalletService.require_and_consume_token.
+
+Usage:
+    python scripts/bench_wallet_debit.py [--threads 16] [--attempts 200] [--balance 1000] [--url sqlite:///bench.db]
+
+Many threads debit one user's wallet at the same time (one session and one commit per
+debit). Reports successful/rejected debits, throughput, and whether the final balance and
+ledger agree, i.e. whether any token was spent twice.
+
+Without --url a throw-away file-based SQLite database is used.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.exceptions import NotEnoughTokensError
+from app.db.base import Base
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.services.game_wallet_service import GameWalletService
+
+
+def run(url: str, threads: int, attempts: int, balance: int) -> None:
+    connect_args = {"check_same_thread": False, "timeout": 60} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args, pool_size=threads, max_overflow=0)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    with SessionLocal() as db:
+        db.add(User(id=1, external_id="bench-wallet", status="ACTIVE"))
+        db.add(UserGameWallet(user_id=1, token_type=GameTokenType.ROULETTE_COIN, balance=balance))
+        db.commit()
+
+    service = GameWalletService()
+    barrier = threading.Barrier(threads)
+    counts = {"ok": 0, "empty": 0}
+    lock = threading.Lock()
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(attempts):
+            with SessionLocal() as db:
+                try:
+                    service.require_and_consume_token(db, 1, GameTokenType.ROULETTE_COIN, reason="BENCH")
+                    key = "ok"
+                except NotEnoughTokensError:
+                    db.rollback()
+                    key = "empty"
+            with lock:
+                counts[key] += 1
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    with SessionLocal() as db:
+        final = db.execute(select(UserGameWallet.balance)).scalar_one()
+        ledger = db.execute(select(func.count()).select_from(UserGameWalletLedger)).scalar_one()
+    engine.dispose()
+
+    total = threads * attempts
+    print(f"threads={threads} attempts={total} start_balance={balance}")
+    print(f"debited={counts['ok']} rejected={counts['empty']} final_balance={final} ledger_rows={ledger}")
+    print(f"throughput={total / elapsed:.0f} attempts/s ({counts['ok'] / elapsed:.0f} debits/s) in {elapsed:.2f}s")
+    consistent = counts["ok"] == ledger == balance - final and final >= 0
+    print("consistency: OK" if consistent else "consistency: DOUBLE SPEND DETECTED")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--attempts", type=int, default=200, help="debit attempts per thread")
+    parser.add_argument("--balance", type=int, default=1000)
+    parser.add_argument("--url", default=None, help="SQLAlchemy URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url, args.threads, args.attempts, args.balance)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.threads, args.attempts, args.balance)
+
+
+if __name__ == "__main__":
+    main()
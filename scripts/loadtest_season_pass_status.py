@@ -0,0 +1,169 @@
+"""
+Load test for GET /api/season-pass/status.
+
+Usage:
+    python scripts/loadtest_season_pass_status.py [--users 200] [--requests 3000] [--threads 8] [--url sqlite:///bench.db]
+
+Seeds a season with 7 levels and `--users` users with progress, claimed rewards and a stamp,
+then fires `--requests` status requests spread over the users from `--threads` threads
+through the ASGI app (no network). Prints requests/s, latency percentiles and the average
+number of SQL statements per request.
+
+For a before/after comparison run the same script against the previous commit, e.g.
+`git worktree add /tmp/before HEAD~1 && cp scripts/loadtest_season_pass_status.py /tmp/before/scripts/`.
+
+Without --url a throw-away file-based SQLite database is used.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.api.deps import get_current_user_id, get_db
+from app.db.base import Base
+from app.main import app
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel, SeasonPassProgress, SeasonPassRewardLog, SeasonPassStampLog
+from app.models.user import User
+
+
+def seed(SessionLocal, users: int) -> None:  # noqa: ANN001
+    today = date.today()
+    with SessionLocal() as db:
+        season = SeasonPassConfig(
+            season_name="LOADTEST",
+            start_date=today - timedelta(days=1),
+            end_date=today + timedelta(days=30),
+            max_level=7,
+            base_xp_per_stamp=10,
+            is_active=True,
+        )
+        season.levels = [
+            SeasonPassLevel(level=i, required_xp=20 * i, reward_type="POINT", reward_amount=100, auto_claim=i % 2 == 1)
+            for i in range(1, 8)
+        ]
+        db.add(season)
+        db.flush()
+        db.execute(insert(User), [{"id": i, "external_id": f"load-{i}", "status": "ACTIVE"} for i in range(1, users + 1)])
+        db.execute(
+            insert(SeasonPassProgress),
+            [{"user_id": i, "season_id": season.id, "current_level": 3, "current_xp": 60, "total_stamps": 2} for i in range(1, users + 1)],
+        )
+        db.execute(
+            insert(SeasonPassRewardLog),
+            [
+                {"user_id": i, "season_id": season.id, "level": level, "reward_type": "POINT", "reward_amount": 100}
+                for i in range(1, users + 1)
+                for level in (1, 3)
+            ],
+        )
+        db.execute(
+            insert(SeasonPassStampLog),
+            [
+                {
+                    "user_id": i,
+                    "season_id": season.id,
+                    "date": today,
+                    "period_key": today.isoformat(),
+                    "stamp_count": 1,
+                    "source_feature_type": "ROULETTE",
+                    "xp_earned": 10,
+                }
+                for i in range(1, users + 1, 2)
+            ],
+        )
+        db.commit()
+
+
+def run(url: str, users: int, requests: int, threads: int) -> None:
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args, pool_size=threads, max_overflow=0)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    seed(SessionLocal, users)
+
+    statements = 0
+    lock = threading.Lock()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        nonlocal statements
+        with lock:
+            statements += 1
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def header_user_id(request: Request) -> int:
+        return int(request.headers["x-user-id"])
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user_id] = header_user_id
+    latencies: list[float] = []
+    per_thread = requests // threads
+
+    def worker(offset: int) -> None:
+        with TestClient(app) as client:
+            for n in range(per_thread):
+                user_id = (offset + n) % users + 1
+                started = time.perf_counter()
+                resp = client.get("/api/season-pass/status", headers={"x-user-id": str(user_id)})
+                elapsed = time.perf_counter() - started
+                assert resp.status_code == 200, resp.text
+                with lock:
+                    latencies.append(elapsed)
+
+    worker(0)  # warm-up (caches, connection pool)
+    latencies.clear()
+    statements = 0
+
+    pool = [threading.Thread(target=worker, args=(i * per_thread,)) for i in range(threads)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    app.dependency_overrides.clear()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"requests:        {total} from {threads} threads over {users} users")
+    print(f"throughput:      {total / elapsed:,.0f} req/s")
+    print(f"latency p50/p99: {latencies[total // 2] * 1000:.2f} / {latencies[int(total * 0.99)] * 1000:.2f} ms")
+    print(f"SQL statements:  {statements / total:.2f} per request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--url", default=None, help="SQLAlchemy URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url, args.users, args.requests, args.threads)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        run(f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.users, args.requests, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Reconcile user_internal_win_count with the roulette/dice/lottery logs.
+
+Usage:
+    python scripts/reconcile_internal_wins.py [--user 123 --user 456] [--dry-run]
+
+Prints every user whose stored win counter differs from the logs and, unless --dry-run
+is given, rewrites those counters (inserting missing rows). Without --user all users with
+a win or a counter are checked.
+
+Requires: DATABASE_URL environment variable
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.services.play_counter_service import PlayCounterService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user", type=int, action="append", dest="user_ids", help="limit to this user id (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="report drift without writing")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        drift = PlayCounterService.reconcile_win_counts(db, user_ids=args.user_ids, apply=not args.dry_run)
+        if not args.dry_run:
+            db.commit()
+
+    for user_id, stored, actual in drift:
+        print(f"user_id={user_id} stored={'missing' if stored is None else stored} actual={actual}")
+    action = "would fix" if args.dry_run else "fixed"
+    print(f"{action} {len(drift)} counter(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Deliver queued rewards from reward_outbox (REWARD_DELIVERY_MODE=outbox).
+
+Usage:
+    python scripts/reward_outbox_worker.py [--batch 100] [--interval 2] [--max-attempts 8] [--once]
+
+Drains due outbox rows in batches of `--batch`, one transaction per batch; each row is
+delivered and marked DONE together. Failed rows are retried with exponential backoff
+and parked as FAILED after `--max-attempts`. With --once it exits when nothing is due;
+otherwise it polls every `--interval` seconds. Several workers can run side by side on
+databases with SKIP LOCKED (MySQL 8, PostgreSQL).
+
+Requires: DATABASE_URL environment variable
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.services.reward_service import RewardService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=100, help="rows per transaction")
+    parser.add_argument("--interval", type=float, default=2.0, help="seconds to sleep when nothing is due")
+    parser.add_argument("--max-attempts", type=int, default=8)
+    parser.add_argument("--once", action="store_true", help="exit once nothing is due")
+    args = parser.parse_args()
+
+    service = RewardService()
+    while True:
+        with SessionLocal() as db:
+            result = service.drain_outbox(db, limit=args.batch, max_attempts=args.max_attempts)
+        processed = sum(result.values())
+        if processed:
+            print(" ".join(f"{key}={value}" for key, value in result.items()), flush=True)
+        if processed < args.batch:
+            if args.once:
+                return
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Monte Carlo payout simulation of a saved roulette, dice or lottery config.
+
+Usage:
+    python scripts/simulate_game_config.py --game roulette --config-id 3 [--plays 10000000] [--seed 42] [--json]
+
+Runs the same NumPy simulation as POST /admin/api/{game}-config/{id}/simulate. Prints RTP
+(expected reward_amount per token), variance, the per-outcome distribution, the net token
+burn per play and, for lotteries, the plays until all finite stock is gone.
+
+Requires: DATABASE_URL environment variable
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.services.admin_dice_service import AdminDiceService
+from app.services.admin_lottery_service import AdminLotteryService
+from app.services.admin_roulette_service import AdminRouletteService
+from app.services.game_simulator import DEFAULT_PLAYS, game_simulator
+
+LOADERS = {
+    "roulette": AdminRouletteService.get_config,
+    "dice": AdminDiceService.get_config,
+    "lottery": AdminLotteryService.get_config,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--game", choices=sorted(LOADERS), required=True)
+    parser.add_argument("--config-id", type=int, required=True)
+    parser.add_argument("--plays", type=int, default=DEFAULT_PLAYS)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        config = LOADERS[args.game](db, args.config_id)
+        result = getattr(game_simulator, args.game)(config, plays=args.plays, seed=args.seed)
+
+    if args.json:
+        print(result.model_dump_json(indent=2))
+        return
+    print(f"{result.game} config {result.config_id}: {result.plays:,} plays in {result.elapsed_ms:,.0f} ms")
+    print(f"RTP {result.rtp:,.4f}  variance {result.variance:,.2f}  std dev {result.std_dev:,.2f}")
+    print(f"net {result.token_type} burn per play {result.net_token_burn_per_play:.4f}")
+    if result.plays_to_sell_out is not None:
+        print(f"finite stock sold out after {result.plays_to_sell_out:,} plays")
+    print(f"{'outcome':<20}{'reward':>20}{'count':>14}{'probability':>13}")
+    for outcome in result.distribution:
+        reward = f"{outcome.reward_type} {outcome.reward_amount}"
+        print(f"{outcome.label:<20}{reward:>20}{outcome.count:>14,}{outcome.probability:>13.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -69,16 +69,24 @@ export async function revokeGameTokens(payload: RevokeGameTokensPayload) {
   return data;
 }
 
-export async function fetchRecentPlayLogs(limit: number = 50, externalId?: string, offset: number = 0) {
-  const params: Record<string, any> = { limit, offset };
+// Play logs and the ledger are keyset-paginated: pass `nextCursor` back as `cursor` for the next page.
+export interface CursorPage<T> {
+  items: T[];
+  nextCursor?: string;
+}
+
+export async function fetchRecentPlayLogs(limit: number = 50, externalId?: string, cursor?: string): Promise<CursorPage<PlayLogEntry>> {
+  const params: Record<string, any> = { limit };
   if (externalId) params.external_id = externalId;
-  const { data } = await adminApi.get<PlayLogEntry[]>("/game-tokens/play-logs", { params });
-  return data;
+  if (cursor) params.cursor = cursor;
+  const { data, headers } = await adminApi.get<PlayLogEntry[]>("/game-tokens/play-logs", { params });
+  return { items: data, nextCursor: headers["x-next-cursor"] || undefined };
 }
 
-export async function fetchLedger(limit: number = 100, externalId?: string, offset: number = 0) {
-  const params: Record<string, any> = { limit, offset };
+export async function fetchLedger(limit: number = 100, externalId?: string, cursor?: string): Promise<CursorPage<LedgerEntry>> {
+  const params: Record<string, any> = { limit };
   if (externalId) params.external_id = externalId;
-  const { data } = await adminApi.get<LedgerEntry[]>("/game-tokens/ledger", { params });
-  return data;
+  if (cursor) params.cursor = cursor;
+  const { data, headers } = await adminApi.get<LedgerEntry[]>("/game-tokens/ledger", { params });
+  return { items: data, nextCursor: headers["x-next-cursor"] || undefined };
 }
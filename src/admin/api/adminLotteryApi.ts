@@ -14,6 +14,7 @@ export interface AdminLotteryConfigPayload {
   name: string;
   is_active: boolean;
   max_daily_plays: number;
+  use_urn?: boolean;
   prizes: AdminLotteryPrizePayload[];
 }
 
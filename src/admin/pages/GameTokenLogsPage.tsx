@@ -1,6 +1,7 @@
 import React, { useMemo, useState } from "react";
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import {
+  CursorPage,
   fetchRecentPlayLogs,
   fetchWallets,
   fetchLedger,
@@ -23,6 +24,8 @@ const GameTokenLogsPage: React.FC = () => {
   const [playLogFilterId, setPlayLogFilterId] = useState<string | undefined>();
   const [playLogLimit, setPlayLogLimit] = useState<number>(50);
   const [playLogPage, setPlayLogPage] = useState<number>(0);
+  // cursor of each visited page (page 0 has none)
+  const [playLogCursors, setPlayLogCursors] = useState<(string | undefined)[]>([undefined]);
 
   const [revokeExternalId, setRevokeExternalId] = useState<string | undefined>();
   const [revokeTokenType, setRevokeTokenType] = useState<GameTokenType>("ROULETTE_COIN");
@@ -30,20 +33,21 @@ const GameTokenLogsPage: React.FC = () => {
   const [ledgerFilterId, setLedgerFilterId] = useState<string | undefined>();
   const [ledgerLimit, setLedgerLimit] = useState<number>(50);
   const [ledgerPage, setLedgerPage] = useState<number>(0);
+  const [ledgerCursors, setLedgerCursors] = useState<(string | undefined)[]>([undefined]);
 
   const walletsQuery = useQuery<TokenBalance[], unknown>({
     queryKey: ["admin-wallets", filterExternalId, walletLimit, walletPage],
     queryFn: () => fetchWallets(filterExternalId, walletLimit, walletPage * walletLimit),
   });
 
-  const playLogsQuery = useQuery<PlayLogEntry[], unknown>({
-    queryKey: ["admin-play-logs", playLogFilterId, playLogLimit, playLogPage],
-    queryFn: () => fetchRecentPlayLogs(playLogLimit, playLogFilterId, playLogPage * playLogLimit),
+  const playLogsQuery = useQuery<CursorPage<PlayLogEntry>, unknown>({
+    queryKey: ["admin-play-logs", playLogFilterId, playLogLimit, playLogPage, playLogCursors[playLogPage]],
+    queryFn: () => fetchRecentPlayLogs(playLogLimit, playLogFilterId, playLogCursors[playLogPage]),
   });
 
-  const ledgerQuery = useQuery<LedgerEntry[], unknown>({
-    queryKey: ["admin-ledger", ledgerFilterId, ledgerLimit, ledgerPage],
-    queryFn: () => fetchLedger(ledgerLimit, ledgerFilterId, ledgerPage * ledgerLimit),
+  const ledgerQuery = useQuery<CursorPage<LedgerEntry>, unknown>({
+    queryKey: ["admin-ledger", ledgerFilterId, ledgerLimit, ledgerPage, ledgerCursors[ledgerPage]],
+    queryFn: () => fetchLedger(ledgerLimit, ledgerFilterId, ledgerCursors[ledgerPage]),
   });
 
   const revokeMutation = useMutation({
@@ -202,7 +206,7 @@ const GameTokenLogsPage: React.FC = () => {
               </tr>
             </thead>
             <tbody>
-              {playLogsQuery.data?.map((row) => (
+              {playLogsQuery.data?.items.map((row) => (
                 <tr key={`${row.game}-${row.id}`} className="border-b border-slate-800/60">
                   <td className="px-2 py-2">{row.game}</td>
                   <td className="px-2 py-2">{row.external_id ?? row.user_id}</td>
@@ -216,7 +220,7 @@ const GameTokenLogsPage: React.FC = () => {
             </tbody>
           </table>
           {playLogsQuery.isLoading && <p className="p-2 text-sm text-slate-400">불러오는 중...</p>}
-          {!playLogsQuery.isLoading && playLogsQuery.data?.length === 0 && (
+          {!playLogsQuery.isLoading && playLogsQuery.data?.items.length === 0 && (
             <p className="p-2 text-sm text-slate-400">데이터가 없습니다.</p>
           )}
           <div className="mt-2 flex items-center gap-2 text-sm text-slate-300">
@@ -232,8 +236,11 @@ const GameTokenLogsPage: React.FC = () => {
             <button
               type="button"
               className="rounded border border-slate-700 px-2 py-1 disabled:opacity-50"
-              disabled={(playLogsQuery.data?.length ?? 0) < playLogLimit || playLogsQuery.isFetching}
-              onClick={() => setPlayLogPage((p) => p + 1)}
+              disabled={!playLogsQuery.data?.nextCursor || playLogsQuery.isFetching}
+              onClick={() => {
+                setPlayLogCursors((c) => [...c.slice(0, playLogPage + 1), playLogsQuery.data?.nextCursor]);
+                setPlayLogPage((p) => p + 1);
+              }}
             >
               다음
             </button>
@@ -294,7 +301,7 @@ const GameTokenLogsPage: React.FC = () => {
               </tr>
             </thead>
             <tbody>
-              {ledgerQuery.data?.map((row) => (
+              {ledgerQuery.data?.items.map((row) => (
                 <tr key={row.id} className="border-b border-slate-800/60">
                   <td className="px-2 py-2">{row.id}</td>
                   <td className="px-2 py-2">{row.external_id ?? row.user_id}</td>
@@ -309,7 +316,7 @@ const GameTokenLogsPage: React.FC = () => {
             </tbody>
           </table>
           {ledgerQuery.isLoading && <p className="p-2 text-sm text-slate-400">불러오는 중...</p>}
-          {!ledgerQuery.isLoading && ledgerQuery.data?.length === 0 && (
+          {!ledgerQuery.isLoading && ledgerQuery.data?.items.length === 0 && (
             <p className="p-2 text-sm text-slate-400">원장 데이터가 없습니다.</p>
           )}
           <div className="mt-2 flex items-center gap-2 text-sm text-slate-300">
@@ -325,8 +332,11 @@ const GameTokenLogsPage: React.FC = () => {
             <button
               type="button"
               className="rounded border border-slate-700 px-2 py-1 disabled:opacity-50"
-              disabled={(ledgerQuery.data?.length ?? 0) < ledgerLimit || ledgerQuery.isFetching}
-              onClick={() => setLedgerPage((p) => p + 1)}
+              disabled={!ledgerQuery.data?.nextCursor || ledgerQuery.isFetching}
+              onClick={() => {
+                setLedgerCursors((c) => [...c.slice(0, ledgerPage + 1), ledgerQuery.data?.nextCursor]);
+                setLedgerPage((p) => p + 1);
+              }}
             >
               다음
             </button>
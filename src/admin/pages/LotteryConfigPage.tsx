@@ -28,6 +28,7 @@ const lotterySchema = z
     name: z.string().min(1, "Name is required"),
     is_active: z.boolean().default(false),
     max_daily_plays: z.number().int().positive("At least 1 per day"),
+    use_urn: z.boolean().default(false),
     prizes: z.array(prizeSchema).min(1, "Add at least 1 prize"),
   })
   .refine((value) => value.prizes.some((p) => p.is_active && p.weight > 0), {
@@ -61,12 +62,14 @@ const LotteryConfigPage: React.FC = () => {
             name: editing.name,
             is_active: editing.is_active,
             max_daily_plays: editing.max_daily_plays,
+            use_urn: editing.use_urn ?? false,
             prizes: editing.prizes,
           }
         : {
             name: "Test Lottery",
             is_active: true,
             max_daily_plays: 1,
+            use_urn: false,
             prizes: [
               { label: "100P", weight: 50, stock: null, reward_type: "POINT", reward_value: 100, is_active: true },
               { label: "Coupon", weight: 10, stock: 100, reward_type: "COUPON", reward_value: 1, is_active: true },
@@ -160,6 +163,7 @@ const LotteryConfigPage: React.FC = () => {
                           name: config.name,
                           is_active: config.is_active,
                           max_daily_plays: config.max_daily_plays,
+                          use_urn: config.use_urn ?? false,
                           prizes: config.prizes,
                         });
                       }}
@@ -202,6 +206,10 @@ const LotteryConfigPage: React.FC = () => {
               <input type="checkbox" className="h-4 w-4" {...form.register("is_active")} />
               <span className="text-sm text-slate-200">Active</span>
             </div>
+            <div className="flex items-center space-x-3 pt-6">
+              <input type="checkbox" className="h-4 w-4" {...form.register("use_urn")} />
+              <span className="text-sm text-slate-200">Pre-drawn stock urn</span>
+            </div>
           </div>
 
           <div className="space-y-3 rounded-lg border border-emerald-800/60 bg-slate-900/70 p-3">
@@ -1,6 +1,7 @@
 // src/api/apiClient.ts
 import axios from 'axios';
 import { clearAuth, getAuthToken } from '../auth/authStore';
+import { attachReadPin } from './readPin';
 
 // Backend routes already include the /api prefix where needed (e.g., /api/team-battle, /admin/api/*)
 // so the base URL should stop at the host.
@@ -9,11 +10,14 @@ const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 const apiClient = axios.create({
   baseURL: API_URL,
   timeout: 10000,
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
 });
 
+attachReadPin(apiClient);
+
 // Request interceptor: use shared auth store and legacy fallback keys.
 apiClient.interceptors.request.use(
   (config) => {
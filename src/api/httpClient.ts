@@ -1,6 +1,7 @@
 // src/api/httpClient.ts
 import axios from "axios";
 import { clearAuth, getAuthToken } from "../auth/authStore";
+import { attachReadPin } from "./readPin";
 
 const normalizeApiBase = (url: string) => {
   const trimmed = url.replace(/\/+$/, "");
@@ -22,8 +23,11 @@ const resolvedBaseURL = normalizeApiBase(rawBase);
 
 export const userApi = axios.create({
   baseURL: resolvedBaseURL,
+  withCredentials: true,
 });
 
+attachReadPin(userApi);
+
 // Attach bearer token if present in storage; keeps compatibility with existing `token` key.
 userApi.interceptors.request.use((config) => {
   const token = getAuthToken() || (typeof localStorage !== "undefined" ? localStorage.getItem("token") : null);
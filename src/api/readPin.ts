@@ -0,0 +1,24 @@
+// src/api/readPin.ts
+import type { AxiosInstance } from "axios";
+
+// After a write the backend returns X-Read-Pin (unix time); echoing it back until then keeps this
+// client's reads on the primary DB so a play shows up in the next status call despite replica lag.
+const READ_PIN_HEADER = "X-Read-Pin";
+let readPinUntil = 0;
+
+export const attachReadPin = (client: AxiosInstance) => {
+  client.interceptors.request.use((config) => {
+    if (readPinUntil * 1000 > Date.now()) {
+      config.headers = config.headers ?? {};
+      config.headers[READ_PIN_HEADER] = readPinUntil.toFixed(3);
+    }
+    return config;
+  });
+  client.interceptors.response.use((response) => {
+    const pin = Number(response.headers?.[READ_PIN_HEADER.toLowerCase()]);
+    if (Number.isFinite(pin) && pin > readPinUntil) {
+      readPinUntil = pin;
+    }
+    return response;
+  });
+};
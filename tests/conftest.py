@@ -13,6 +13,8 @@ from app.api.deps import get_db, get_current_user_id
 from app.models.game_wallet import GameTokenType, UserGameWallet
 from app.db.base import Base
 from app.main import app
+from app.services.config_cache import config_cache
+from app.services.leaderboard import external_leaderboard
 
 
 @pytest.fixture()
@@ -29,6 +31,9 @@ def client() -> Generator[TestClient, None, None]:
     )
     TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
     Base.metadata.create_all(engine)
+    # Config snapshots are cached per process; every test starts from an empty cache.
+    config_cache.clear()
+    external_leaderboard.reset()
 
     def override_get_db() -> Generator[Session, None, None]:
         db = TestingSessionLocal()
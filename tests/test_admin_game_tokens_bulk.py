@@ -0,0 +1,121 @@
+"""Integration tests for the bulk game token grant/revoke endpoints."""
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+
+
+def seed_users(session: Session, count: int) -> None:
+    for user_id in range(1, count + 1):
+        session.add(User(id=user_id, external_id=f"ext-{user_id}", status="ACTIVE"))
+    session.commit()
+
+
+def wallet_balance(session: Session, user_id: int, token_type: GameTokenType) -> int:
+    return (
+        session.query(UserGameWallet.balance)
+        .filter(UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type)
+        .scalar()
+    )
+
+
+def test_bulk_grant_resolves_users_and_writes_ledger(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_users(session, 3)
+    session.close()
+
+    payload = {
+        "reason": "EVENT_DAY",
+        "items": [
+            {"user_id": 2, "token_type": "LOTTERY_TICKET", "amount": 3},
+            {"external_id": "ext-3", "token_type": "LOTTERY_TICKET", "amount": 1},
+            {"external_id": "missing", "token_type": "LOTTERY_TICKET", "amount": 1},
+            {"user_id": 2, "token_type": "LOTTERY_TICKET", "amount": 2},
+            {"user_id": 999, "token_type": "DICE_TOKEN", "amount": 1},
+            {"external_id": "ext-1", "token_type": "LOTTERY_TICKET", "amount": 5},
+        ],
+    }
+    resp = client.post("/admin/api/game-tokens/grant-bulk", json=payload)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["requested"] == 6
+    assert data["applied"] == 4
+    assert [(f["index"], f["error"]) for f in data["failed"]] == [(2, "USER_NOT_FOUND"), (4, "USER_NOT_FOUND")]
+    assert data["rows_per_second"] > 0
+    balances = {(b["user_id"], b["token_type"]): b["balance"] for b in data["balances"]}
+    # User 1 starts with the 10 tokens seeded by the test client.
+    assert balances == {(2, "LOTTERY_TICKET"): 5, (3, "LOTTERY_TICKET"): 1, (1, "LOTTERY_TICKET"): 15}
+
+    verify: Session = session_factory()
+    assert wallet_balance(verify, 2, GameTokenType.LOTTERY_TICKET) == 5
+    ledger = (
+        verify.query(UserGameWalletLedger)
+        .filter(UserGameWalletLedger.user_id == 2)
+        .order_by(UserGameWalletLedger.id)
+        .all()
+    )
+    assert [(row.delta, row.balance_after, row.reason) for row in ledger] == [(3, 3, "EVENT_DAY"), (2, 5, "EVENT_DAY")]
+    verify.close()
+
+
+def test_bulk_revoke_rejects_rows_exceeding_balance(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_users(session, 2)
+    session.add(UserGameWallet(user_id=2, token_type=GameTokenType.DICE_TOKEN, balance=4))
+    session.commit()
+    session.close()
+
+    payload = {
+        "items": [
+            {"user_id": 2, "token_type": "DICE_TOKEN", "amount": 3},
+            {"user_id": 2, "token_type": "DICE_TOKEN", "amount": 3},
+            {"user_id": 2, "token_type": "DICE_TOKEN", "amount": 1},
+        ]
+    }
+    resp = client.post("/admin/api/game-tokens/revoke-bulk", json=payload)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["applied"] == 2
+    assert data["failed"] == [{"index": 1, "user_id": 2, "external_id": "ext-2", "error": "NOT_ENOUGH_TOKENS"}]
+
+    verify: Session = session_factory()
+    assert wallet_balance(verify, 2, GameTokenType.DICE_TOKEN) == 0
+    assert verify.query(UserGameWalletLedger).filter(UserGameWalletLedger.reason == "REVOKE").count() == 2
+    verify.close()
+
+
+def test_bulk_grant_statement_count_is_independent_of_row_count(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_users(session, 300)
+    session.close()
+
+    engine = session_factory.kw["bind"]
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        # Skip the per-request wallet lookups done by the test client's session seeding.
+        if statement.startswith("SELECT user_game_wallet.id") and "user_game_wallet.user_id = ?" in statement:
+            return
+        if "user_game_wallet" in statement or "user.external_id" in statement:
+            statements.append(statement)
+
+    items = [{"user_id": user_id, "token_type": "ROULETTE_COIN", "amount": 2} for user_id in range(2, 301)]
+    client.get("/admin/api/game-tokens/wallets")  # lets the client seed user 1's wallets up front
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        resp = client.post("/admin/api/game-tokens/grant-bulk", json={"items": items})
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert resp.status_code == 200
+    assert resp.json()["applied"] == 299
+    # user lookup, wallet select, wallet insert, wallet update, ledger insert
+    assert len(statements) == 5, statements
+
+    verify: Session = session_factory()
+    assert verify.query(UserGameWalletLedger).count() == 299
+    assert wallet_balance(verify, 300, GameTokenType.ROULETTE_COIN) == 2
+    verify.close()
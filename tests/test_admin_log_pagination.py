@@ -0,0 +1,102 @@
+"""Keyset (cursor) pagination of the admin play-log and wallet-ledger listings."""
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.dice import DiceConfig, DiceLog
+from app.models.game_wallet import GameTokenType
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize
+from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
+from app.models.user import User
+
+BASE = datetime(2025, 12, 20, 12, 0, 0)
+
+
+def seed_logs(session: Session) -> list[tuple[str, int]]:
+    """Seven logs across the three games, with created_at ties inside and across games."""
+
+    session.add_all([User(id=1, external_id="alice", status="ACTIVE"), User(id=2, external_id="bob", status="ACTIVE")])
+    roulette = RouletteConfig(name="R", is_active=True)
+    roulette.segments = [RouletteSegment(slot_index=i, label=f"S{i}", reward_type="NONE", reward_amount=0, weight=1) for i in range(6)]
+    lottery = LotteryConfig(name="L", is_active=True)
+    lottery.prizes = [LotteryPrize(label="P", reward_type="NONE", reward_amount=0, weight=1)]
+    dice = DiceConfig(name="D", is_active=True)
+    session.add_all([roulette, lottery, dice])
+    session.flush()
+
+    def dice_log(user_id: int, minutes: int) -> DiceLog:
+        return DiceLog(
+            user_id=user_id, config_id=dice.id, user_dice_1=1, user_dice_2=1, user_sum=2, dealer_dice_1=1,
+            dealer_dice_2=1, dealer_sum=2, result="DRAW", created_at=BASE + timedelta(minutes=minutes),
+        )
+
+    segment_id, prize_id = roulette.segments[0].id, lottery.prizes[0].id
+    session.add_all(
+        [
+            RouletteLog(user_id=1, config_id=roulette.id, segment_id=segment_id, reward_type="NONE", created_at=BASE),
+            RouletteLog(user_id=2, config_id=roulette.id, segment_id=segment_id, reward_type="NONE", created_at=BASE),
+            RouletteLog(user_id=1, config_id=roulette.id, segment_id=segment_id, reward_type="NONE", created_at=BASE + timedelta(minutes=3)),
+            dice_log(1, 0),
+            dice_log(2, 2),
+            LotteryLog(user_id=1, config_id=lottery.id, prize_id=prize_id, reward_type="NONE", created_at=BASE),
+            LotteryLog(user_id=2, config_id=lottery.id, prize_id=prize_id, reward_type="NONE", created_at=BASE + timedelta(minutes=3)),
+        ]
+    )
+    session.commit()
+    # Newest first; ties broken by game (ROULETTE, LOTTERY, DICE) then id descending.
+    return [("ROULETTE", 3), ("LOTTERY", 2), ("DICE", 2), ("ROULETTE", 2), ("ROULETTE", 1), ("LOTTERY", 1), ("DICE", 1)]
+
+
+def collect(client: TestClient, path: str, key, **params) -> tuple[list, int]:  # noqa: ANN001
+    seen, pages, cursor = [], 0, None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        seen.extend(key(row) for row in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return seen, pages
+
+
+def test_play_logs_cursor_pages_cover_every_row_once_in_order(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    expected = seed_logs(session)
+    session.close()
+
+    rows, pages = collect(client, "/admin/api/game-tokens/play-logs", lambda r: (r["game"], r["id"]), limit=2)
+    assert rows == expected
+    assert pages == 4
+
+    bob, _ = collect(client, "/admin/api/game-tokens/play-logs", lambda r: (r["game"], r["id"]), limit=2, external_id="bob")
+    assert bob == [("LOTTERY", 2), ("DICE", 2), ("ROULETTE", 2)]
+
+    # Legacy page-number clients still get the same rows through offset.
+    page = client.get("/admin/api/game-tokens/play-logs", params={"limit": 2, "offset": 2}).json()
+    assert [(r["game"], r["id"]) for r in page] == expected[2:4]
+
+
+def test_ledger_cursor_pages_and_invalid_cursor(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    session.add(User(id=1, external_id="alice", status="ACTIVE"))
+    session.add_all(
+        [
+            UserGameWalletLedger(
+                user_id=1, token_type=GameTokenType.DICE_TOKEN, delta=1, balance_after=n,
+                created_at=BASE + timedelta(minutes=n // 2),  # pairs share a timestamp
+            )
+            for n in range(5)
+        ]
+    )
+    session.commit()
+    session.close()
+
+    ids, pages = collect(client, "/admin/api/game-tokens/ledger", lambda r: r["id"], limit=2)
+    assert ids == [5, 4, 3, 2, 1]
+    assert pages == 3
+
+    bad = client.get("/admin/api/game-tokens/ledger", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+    assert bad.json()["error"]["code"] == "INVALID_CURSOR"
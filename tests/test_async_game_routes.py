@@ -0,0 +1,108 @@
+"""DB_STACK=async game routes: AsyncSession + run_sync over the existing game services."""
+import queue
+import time
+from collections.abc import AsyncGenerator
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.deps import get_async_db, get_current_user_id
+from app.api.routes import async_games
+from app.core.config import get_settings
+from app.core.error_handlers import register_exception_handlers
+from app.db.async_session import async_url
+from app.db.base import Base
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
+from app.models.user import User
+from app.services.event_writer import event_writer
+
+
+@pytest.fixture()
+def async_client(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(sync_engine)
+    async_engine = create_async_engine(async_url(url))
+    factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with factory() as db:
+            yield db
+
+    app = FastAPI()
+    register_exception_handlers(app)
+    for router in async_games.routers:
+        app.include_router(router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+
+    with TestClient(app) as client:
+        yield client, sessionmaker(bind=sync_engine, expire_on_commit=False)
+    sync_engine.dispose()
+
+
+def test_async_url_swaps_in_the_async_driver() -> None:
+    assert async_url("mysql+pymysql://u:p@db:3306/xmas") == "mysql+aiomysql://u:p@db:3306/xmas"
+    assert async_url("sqlite:///bench.db") == "sqlite+aiosqlite:///bench.db"
+
+
+def seed_roulette(session: Session) -> None:
+    config = RouletteConfig(name="ASYNC", is_active=True, max_daily_spins=0)
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            UserGameWallet(user_id=1, token_type=GameTokenType.ROULETTE_COIN, balance=2),
+            FeatureSchedule(date=date.today(), feature_type=FeatureType.ROULETTE, is_active=True),
+            FeatureConfig(feature_type=FeatureType.ROULETTE, title="Roulette", page_path="/roulette", is_enabled=True),
+            config,
+        ]
+    )
+    session.flush()
+    session.add_all(
+        [RouletteSegment(config=config, slot_index=i, label=f"S{i}", reward_type="NONE", reward_amount=0, weight=1) for i in range(6)]
+    )
+    session.commit()
+
+
+def test_async_roulette_play_and_error_envelope(async_client) -> None:
+    client, session_factory = async_client
+    assert client.post("/api/dice/play").json()["error"]["code"] == "NO_FEATURE_TODAY"
+
+    session: Session = session_factory()
+    seed_roulette(session)
+
+    status = client.get("/api/roulette/status").json()
+    assert status["token_balance"] == 2
+
+    played = client.post("/api/roulette/play")
+    assert played.status_code == 200
+    assert client.get("/api/roulette/status").json()["token_balance"] == 1
+    assert session.query(RouletteLog).filter_by(user_id=1).count() == 1
+    session.close()
+
+
+def test_async_play_drops_buffered_event_instead_of_waiting(monkeypatch, async_client) -> None:
+    client, session_factory = async_client
+    session: Session = session_factory()
+    seed_roulette(session)
+    monkeypatch.setattr(get_settings(), "event_log_mode", "buffered")
+    full: queue.Queue = queue.Queue(maxsize=1)
+    full.put_nowait(({}, 0.0))
+    monkeypatch.setattr(event_writer, "_queue", full)  # nothing drains it
+    monkeypatch.setattr(event_writer, "_ensure_started", lambda: None)
+    monkeypatch.setattr(event_writer, "put_timeout", 5.0)
+    event_writer.reset_metrics()
+
+    started = time.perf_counter()
+    assert client.post("/api/roulette/play").status_code == 200
+    # The play ran on the event loop thread: a blocking put would have held it for 5 s.
+    assert time.perf_counter() - started < 2.0
+    assert (event_writer.metrics()["dropped"], event_writer.metrics()["submitted"]) == (1, 0)
+    session.close()
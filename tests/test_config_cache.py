@@ -0,0 +1,115 @@
+"""Tests for the per-worker config cache and its version-based invalidation."""
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.config_version import ConfigVersion
+from app.models.dice import DiceConfig
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.models.user import User
+from app.schemas.admin_dice import AdminDiceConfigUpdate
+from app.services.admin_dice_service import AdminDiceService
+from app.services.config_cache import ConfigCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def seed_dice(session: Session) -> DiceConfig:
+    session.add(User(id=1, external_id="tester", status="ACTIVE"))
+    session.add(FeatureConfig(feature_type=FeatureType.DICE, title="DICE", page_path="/dice"))
+    session.add(FeatureSchedule(date=date.today(), feature_type=FeatureType.DICE, is_active=True))
+    cfg = DiceConfig(
+        name="DICE",
+        is_active=True,
+        max_daily_plays=0,
+        win_reward_type="POINT",
+        win_reward_amount=5,
+        draw_reward_type="NONE",
+        draw_reward_amount=0,
+        lose_reward_type="NONE",
+        lose_reward_amount=0,
+    )
+    session.add(cfg)
+    session.commit()
+    return cfg
+
+
+def test_ttl_then_version_check(client: TestClient, session_factory) -> None:
+    clock = FakeClock()
+    cache = ConfigCache(ttl_seconds=10, clock=clock)
+    calls: list[int] = []
+
+    def loader(_db: Session) -> int:
+        calls.append(1)
+        return len(calls)
+
+    db: Session = session_factory()
+    assert cache.get(db, "DICE", "active", loader) == 1
+    assert cache.get(db, "DICE", "active", loader) == 1
+
+    # Past the TTL with an unchanged version: revalidated, not reloaded.
+    clock.now = 11
+    assert cache.get(db, "DICE", "active", loader) == 1
+
+    # Another worker bumped the version: picked up after the TTL expires.
+    db.add(ConfigVersion(namespace="DICE", version=5))
+    db.commit()
+    clock.now = 15
+    assert cache.get(db, "DICE", "active", loader) == 1
+    clock.now = 22
+    assert cache.get(db, "DICE", "active", loader) == 2
+    assert (cache.hits, cache.misses) == (3, 2)
+    db.close()
+
+
+def test_bump_invalidates_immediately(client: TestClient, session_factory) -> None:
+    cache = ConfigCache(ttl_seconds=60, clock=FakeClock())
+    db: Session = session_factory()
+    values = iter(["old", "new"])
+    assert cache.get(db, "ROULETTE", "active", lambda _db: next(values)) == "old"
+
+    cache.bump(db, "ROULETTE")
+    cache.bump(db, "ROULETTE")
+    db.commit()
+    assert cache.current_version(db, "ROULETTE") == 2
+    assert cache.get(db, "ROULETTE", "active", lambda _db: next(values)) == "new"
+    db.close()
+
+
+def test_status_reuses_cached_config_until_admin_update(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    cfg = seed_dice(session)
+    config_id = cfg.id
+    session.close()
+
+    engine = session_factory.kw["bind"]
+    config_selects: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT") and "dice_config" in statement:
+            config_selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        for _ in range(5):
+            assert client.get("/api/dice/status").json()["name"] == "DICE"
+        assert len(config_selects) == 1
+
+        admin: Session = session_factory()
+        AdminDiceService.update_config(admin, config_id, AdminDiceConfigUpdate(name="DICE_V2"))
+        admin.close()
+
+        config_selects.clear()
+        for _ in range(3):
+            assert client.get("/api/dice/status").json()["name"] == "DICE_V2"
+        assert len(config_selects) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
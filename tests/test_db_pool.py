@@ -0,0 +1,50 @@
+"""Settings-driven pool options and pool wait/overflow metrics."""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import get_settings
+from app.db.pool_metrics import PoolUsage, TimedQueuePool
+from app.db.session import engine_options
+
+
+def test_engine_options_come_from_settings(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "db_pool_size", 4)
+    monkeypatch.setattr(settings, "db_max_overflow", 2)
+
+    options = engine_options("mysql+pymysql://u:p@db/xmas", settings)
+    assert options["poolclass"] is TimedQueuePool
+    assert (options["pool_size"], options["max_overflow"], options["pool_pre_ping"]) == (4, 2, True)
+    assert options["pool_recycle"] == settings.db_pool_recycle
+    assert engine_options("sqlite://", settings) == {}
+
+
+def test_pool_usage_reports_overflow_waits_and_timeouts(tmp_path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05
+    )
+    usage = PoolUsage().attach(engine)
+
+    first, second = engine.connect(), engine.connect()
+    stats = usage.describe(engine)
+    assert (stats["checked_out"], stats["overflow"], stats["peak_in_use"]) == (2, 1, 2)
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    stats = usage.describe(engine)
+    assert (stats["timeouts"], stats["checkouts"]) == (1, 2)
+    assert stats["max_wait_ms"] >= 50
+
+    first.close()
+    second.close()
+    assert usage.describe(engine)["checked_out"] == 0
+    usage.detach(engine)
+    engine.dispose()
+
+
+def test_metrics_endpoint_includes_primary_pool(client: TestClient) -> None:
+    body = client.get("/admin/api/metrics").json()
+    assert set(body) == {"event_writer", "db_pool", "season_resolver"}
+    assert {"checkouts", "in_use", "timeouts", "avg_wait_ms"} <= set(body["db_pool"]["primary"])
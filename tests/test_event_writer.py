@@ -0,0 +1,81 @@
+"""Buffered user_event_log writer: batching, backpressure and flush after the play commits."""
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType, UserEventLog
+from app.models.roulette import RouletteConfig, RouletteSegment
+from app.models.user import User
+from app.services.event_writer import BufferedEventWriter, event_writer
+
+
+def test_events_are_written_in_multi_row_batches(session_factory) -> None:
+    session: Session = session_factory()
+    session.add(User(id=1, external_id="tester", status="ACTIVE"))
+    session.commit()
+
+    engine = session_factory.kw["bind"]
+    inserts: list[int] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.startswith("INSERT INTO user_event_log"):
+            inserts.append(len(parameters) if executemany else 1)
+
+    writer = BufferedEventWriter(session_factory=session_factory, batch_size=4, flush_interval_ms=1000)
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        for n in range(10):
+            assert writer.submit(1, "ROULETTE", "PLAY", {"n": n})
+        writer.stop()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert sorted(row.meta_json["n"] for row in session.query(UserEventLog).all()) == list(range(10))
+    assert sum(inserts) == 10 and max(inserts) == 4 and len(inserts) <= 4
+    metrics = writer.metrics()
+    assert (metrics["submitted"], metrics["written"], metrics["dropped"], metrics["queue_depth"]) == (10, 10, 0, 0)
+    assert metrics["batches"] == len(inserts)
+    session.close()
+
+
+def test_full_queue_applies_backpressure_then_drops(monkeypatch, session_factory) -> None:
+    writer = BufferedEventWriter(session_factory=session_factory, max_queue=2, put_timeout_ms=1)
+    monkeypatch.setattr(writer, "_ensure_started", lambda: None)  # nothing drains the queue
+
+    assert [writer.submit(1, "AUTH", "AUTH_LOGIN") for _ in range(3)] == [True, True, False]
+    metrics = writer.metrics()
+    assert (metrics["submitted"], metrics["dropped"], metrics["queue_depth"]) == (2, 1, 2)
+
+
+def test_buffered_play_event_is_written_after_the_play(monkeypatch, client: TestClient, session_factory) -> None:
+    monkeypatch.setattr(get_settings(), "event_log_mode", "buffered")
+    monkeypatch.setattr(event_writer, "_session_factory", session_factory)
+    session: Session = session_factory()
+    today = date.today()
+    config = RouletteConfig(name="BUFFERED", is_active=True, max_daily_spins=0)
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureSchedule(date=today, feature_type=FeatureType.ROULETTE, is_active=True),
+            FeatureConfig(feature_type=FeatureType.ROULETTE, title="Roulette", page_path="/roulette", is_enabled=True),
+            config,
+        ]
+    )
+    session.flush()
+    session.add_all(
+        [RouletteSegment(config=config, slot_index=i, label=f"S{i}", reward_type="POINT", reward_amount=1, weight=1) for i in range(6)]
+    )
+    session.commit()
+    event_writer.reset_metrics()
+
+    assert client.post("/api/roulette/play").status_code == 200
+    event_writer.stop()
+
+    rows = session.query(UserEventLog).filter_by(event_name="PLAY").all()
+    assert [(row.user_id, row.feature_type) for row in rows] == [(1, "ROULETTE")]
+    metrics = client.get("/admin/api/metrics").json()["event_writer"]
+    assert (metrics["mode"], metrics["submitted"], metrics["written"]) == ("buffered", 1, 1)
+    session.close()
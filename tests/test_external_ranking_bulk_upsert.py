@@ -0,0 +1,178 @@
+"""Batched external ranking uploads: per-row XP deltas, batched lookups and phase timings."""
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.external_ranking import ExternalRankingData
+from app.models.game_wallet import UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.level_xp import UserLevelProgress, UserLevelRewardLog, UserXpEventLog
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel, SeasonPassProgress, SeasonPassStampLog
+from app.models.user import User
+from app.services.level_xp_service import LevelXPService
+
+
+def seed(session: Session, user_count: int) -> None:
+    today = date.today()
+    season = SeasonPassConfig(
+        season_name="S1",
+        start_date=today - timedelta(days=1),
+        end_date=today + timedelta(days=6),
+        max_level=5,
+        base_xp_per_stamp=10,
+        is_active=True,
+    )
+    season.levels = [
+        SeasonPassLevel(level=i, required_xp=20 * i, reward_type="POINT", reward_amount=100 * i, auto_claim=True)
+        for i in range(1, 6)
+    ]
+    session.add(season)
+    for user_id in range(1, user_count + 1):
+        session.add(User(id=user_id, external_id=f"ext-{user_id}", status="ACTIVE"))
+    session.add(
+        ExternalRankingData(
+            user_id=2,
+            deposit_amount=200_000,
+            play_count=0,
+            daily_base_deposit=0,
+            daily_base_play=0,
+            last_daily_reset=today,
+            updated_at=datetime.utcnow() - timedelta(hours=1),
+        )
+    )
+    session.commit()
+
+
+def progress_xp(session: Session) -> dict[int, int]:
+    return {row.user_id: row.current_xp for row in session.query(SeasonPassProgress).all()}
+
+
+def test_upload_grants_xp_from_each_rows_own_previous_values(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session, 3)
+    session.close()
+
+    payload = [
+        # 200k -> 300k: one new step.
+        {"external_id": "ext-2", "deposit_amount": 300_000, "play_count": 0},
+        # New row: two steps (50k carried) plus two plays.
+        {"user_id": 3, "deposit_amount": 250_000, "play_count": 2},
+    ]
+    resp = client.post("/admin/api/external-ranking/", json=payload)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [item["user_id"] for item in data["items"]] == [2, 3]
+    assert set(data["timings_ms"]) == {"resolve", "load", "deltas", "write", "xp", "top10"}
+
+    verify: Session = session_factory()
+    # Step/play XP plus 10 XP for the weekly TOP10 stamp.
+    assert progress_xp(verify) == {2: 30, 3: 90}
+    remainders = {row.user_id: row.deposit_remainder for row in verify.query(ExternalRankingData).all()}
+    assert remainders == {2: 0, 3: 50_000}
+    assert verify.query(SeasonPassStampLog).filter_by(source_feature_type="EXTERNAL_RANKING_TOP10").count() == 2
+    verify.close()
+
+    # Re-uploading the same totals grants nothing new for deposits and no second TOP10 stamp.
+    resp = client.post("/admin/api/external-ranking/", json=payload)
+    assert resp.status_code == 200
+    verify = session_factory()
+    assert progress_xp(verify) == {2: 30, 3: 130}  # play XP is measured against the daily base
+    assert verify.query(SeasonPassStampLog).filter_by(source_feature_type="EXTERNAL_RANKING_TOP10").count() == 2
+    verify.close()
+
+
+def test_unknown_external_id_rejects_whole_upload(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session, 3)
+    session.close()
+
+    payload = [
+        {"user_id": 3, "deposit_amount": 100_000, "play_count": 0},
+        {"external_id": "missing", "deposit_amount": 100_000, "play_count": 0},
+    ]
+    resp = client.post("/admin/api/external-ranking/", json=payload)
+    assert resp.status_code == 404
+
+    verify: Session = session_factory()
+    assert verify.query(ExternalRankingData).count() == 1
+    assert progress_xp(verify) == {}
+    verify.close()
+
+
+def test_lookup_statement_count_is_independent_of_row_count(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session, 200)
+    session.close()
+
+    engine = session_factory.kw["bind"]
+    lookups: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        # TOP10 stamping still looks up its (at most ten) users one by one.
+        if not statement.startswith("SELECT") or " IN (" not in statement:
+            return
+        if "FROM external_ranking_data" in statement and "ORDER BY" not in statement:
+            lookups.append(statement)
+        elif "FROM season_pass_progress" in statement or "FROM season_pass_reward_log" in statement:
+            lookups.append(statement)
+        elif "user.external_id IN" in statement:
+            lookups.append(statement)
+
+    payload = [{"external_id": f"ext-{user_id}", "deposit_amount": 100_000, "play_count": 1} for user_id in range(3, 201)]
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        resp = client.post("/admin/api/external-ranking/", json=payload)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert resp.status_code == 200
+    # external_id IN, existing rows IN, progress IN, reward logs IN
+    assert len(lookups) == 4, lookups
+
+    verify: Session = session_factory()
+    xp = progress_xp(verify)
+    # User 2 (not uploaded, highest deposit) only gets the TOP10 stamp XP; uploaded users get
+    # 20 XP per step and per play, plus the stamp for the nine that made the TOP10.
+    assert xp.pop(2) == 10
+    assert sorted(xp.values()) == [40] * 189 + [50] * 9
+    verify.close()
+
+
+def level_snapshot(session: Session) -> tuple[dict, list, dict]:
+    progress = {row.user_id: (row.level, row.xp) for row in session.query(UserLevelProgress).all()}
+    rewards = sorted((row.user_id, row.level, row.auto_granted) for row in session.query(UserLevelRewardLog).all())
+    wallets = {(row.user_id, row.token_type): row.balance for row in session.query(UserGameWallet).filter(UserGameWallet.user_id > 1).all()}
+    return progress, rewards, wallets
+
+
+def test_core_level_bulk_mirror_matches_per_user_add_xp(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    for user_id in range(2, 6):
+        session.add(User(id=user_id, external_id=f"ext-{user_id}", status="ACTIVE"))
+    session.add(UserLevelProgress(user_id=5, level=2, xp=120))
+    session.add(UserLevelRewardLog(user_id=5, level=1, reward_type="TICKET_ROULETTE", auto_granted=True))
+    session.add(UserLevelRewardLog(user_id=5, level=2, reward_type="TICKET_DICE", auto_granted=True))
+    session.commit()
+    xp_by_user = {2: 30, 3: 110, 4: 320, 5: 400}
+
+    service = LevelXPService()
+    service.add_xp_bulk(session, xp_by_user, source="BULK")
+    session.commit()
+    bulk = level_snapshot(session)
+
+    session.rollback()
+    for model in (UserLevelProgress, UserLevelRewardLog, UserXpEventLog, UserGameWallet, UserGameWalletLedger):
+        session.query(model).filter(model.user_id > 1).delete()
+    session.add(UserLevelProgress(user_id=5, level=2, xp=120))
+    session.add(UserLevelRewardLog(user_id=5, level=1, reward_type="TICKET_ROULETTE", auto_granted=True))
+    session.add(UserLevelRewardLog(user_id=5, level=2, reward_type="TICKET_DICE", auto_granted=True))
+    session.commit()
+    for user_id, xp in xp_by_user.items():
+        service.add_xp(session, user_id=user_id, delta=xp, source="SINGLE")
+    session.commit()
+
+    assert bulk == level_snapshot(session)
+    assert bulk[0][5] == (5, 520)
+    session.close()
@@ -19,6 +19,8 @@ def test_external_ranking_deposit_steps_accumulate_xp(session_factory, monkeypat
             external_ranking_deposit_max_steps_per_day=0,
             external_ranking_deposit_cooldown_minutes=0,
             xp_from_game_reward=False,
+            season_xp_mirror_mode="session",
+            reward_delivery_mode="inline",
         ),
     )
 
@@ -0,0 +1,139 @@
+"""Streaming CSV/NDJSON import for external ranking data."""
+import csv
+import json
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.external_ranking import ExternalRankingData
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel, SeasonPassStampLog
+from app.models.user import User
+
+
+def seed(session: Session, user_count: int) -> None:
+    today = date.today()
+    season = SeasonPassConfig(
+        season_name="S1",
+        start_date=today - timedelta(days=1),
+        end_date=today + timedelta(days=6),
+        max_level=5,
+        base_xp_per_stamp=10,
+        is_active=True,
+    )
+    season.levels = [
+        SeasonPassLevel(level=i, required_xp=20 * i, reward_type="POINT", reward_amount=100 * i, auto_claim=True)
+        for i in range(1, 6)
+    ]
+    session.add(season)
+    for user_id in range(1, user_count + 1):
+        session.add(User(id=user_id, external_id=f"ext-{user_id}", status="ACTIVE"))
+    session.commit()
+
+
+def ranking_rows(session: Session) -> dict[int, tuple[int, int, str | None]]:
+    return {row.user_id: (row.deposit_amount, row.play_count, row.memo) for row in session.query(ExternalRankingData).all()}
+
+
+def test_csv_import_streams_chunks_and_reports_bad_lines(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session, 5)
+    session.close()
+
+    body = "\n".join(
+        [
+            "user_id,external_id,deposit_amount,play_count,memo",
+            "1,,1000,1,first",
+            ",ext-2,2000,2,",
+            ",missing,3000,3,",
+            "4,,not-a-number,4,",
+            ",,5000,5,",
+            ",ext-5,5000,5,last",
+        ]
+    )
+    resp = client.post(
+        "/admin/api/external-ranking/import",
+        params={"chunk_size": 2},
+        files={"file": ("ranking.csv", body.encode("utf-8-sig"), "text/csv")},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["format"] == "csv"
+    assert (data["chunks"], data["rows_read"], data["rows_upserted"], data["failed_count"]) == (3, 6, 3, 3)
+    assert data["failed"] == [
+        {"line": 4, "error": "USER_NOT_FOUND"},
+        {"line": 5, "error": "INVALID_ROW"},
+        {"line": 6, "error": "USER_REQUIRED"},
+    ]
+    assert {"resolve", "write", "top10"} <= set(data["timings_ms"])
+
+    verify: Session = session_factory()
+    assert ranking_rows(verify) == {1: (1000, 1, "first"), 2: (2000, 2, None), 5: (5000, 5, "last")}
+    verify.close()
+
+
+def test_ndjson_import_stamps_top10_once_after_last_chunk(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session, 15)
+    session.close()
+
+    lines = [json.dumps({"external_id": f"ext-{user_id}", "deposit_amount": user_id * 1000}) for user_id in range(1, 16)]
+    lines.insert(3, "{not json")
+    lines.insert(7, "")
+    resp = client.post(
+        "/admin/api/external-ranking/import",
+        params={"chunk_size": 4},
+        files={"file": ("ranking.ndjson", "\n".join(lines).encode(), "application/octet-stream")},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["format"], data["chunks"], data["rows_read"], data["rows_upserted"]) == ("ndjson", 4, 16, 15)
+    assert data["failed"] == [{"line": 4, "error": "INVALID_ROW"}]
+
+    verify: Session = session_factory()
+    assert len(ranking_rows(verify)) == 15
+    stamped = {
+        row.user_id
+        for row in verify.query(SeasonPassStampLog).filter_by(source_feature_type="EXTERNAL_RANKING_TOP10").all()
+    }
+    # Only the final TOP10 is stamped, not the leaders of earlier chunks.
+    assert stamped == set(range(6, 16))
+    verify.close()
+
+
+def test_import_rejects_unknown_format(client: TestClient, session_factory) -> None:
+    resp = client.post("/admin/api/external-ranking/import", files={"file": ("ranking.xlsx", b"", "application/octet-stream")})
+    assert resp.status_code == 400
+    assert resp.json()["error"]["code"] == "UNSUPPORTED_IMPORT_FORMAT"
+
+
+def test_unreadable_file_midway_reports_where_to_resume(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session, 6)
+    session.close()
+
+    header = "user_id,deposit_amount,play_count,memo"
+    rows = [f"{user_id},{user_id * 1000},0," for user_id in range(1, 5)]
+    too_long = f"5,5000,0,{'x' * (csv.field_size_limit() + 1)}"
+    body = "\n".join([header, *rows, too_long, "6,6000,0,"])
+    resp = client.post(
+        "/admin/api/external-ranking/import",
+        params={"chunk_size": 2},
+        files={"file": ("ranking.csv", body.encode(), "text/csv")},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["chunks"], data["rows_upserted"]) == (2, 4)
+    assert data["aborted"] == {"line": 6, "error": "INVALID_IMPORT_FILE"}
+
+    verify: Session = session_factory()
+    assert set(ranking_rows(verify)) == {1, 2, 3, 4}
+    assert verify.query(SeasonPassStampLog).filter_by(source_feature_type="EXTERNAL_RANKING_TOP10").count() == 0
+    verify.close()
+
+    resp = client.post(
+        "/admin/api/external-ranking/import",
+        files={"file": ("ranking.csv", header.encode() + b"\n1,\xff\xfe,0,\n", "text/csv")},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["error"]["code"] == "INVALID_IMPORT_FILE"
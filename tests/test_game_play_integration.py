@@ -1,14 +1,20 @@
 """Integration tests for roulette, dice, and lottery play endpoints."""
 from datetime import date
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.core.exceptions import NotEnoughTokensError
 from app.models.dice import DiceConfig, DiceLog
 from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType, UserEventLog
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
 from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize
 from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
 from app.models.user import User
+from app.services.roulette_service import RouletteService
 
 
 def seed_common(session: Session, feature_type: FeatureType) -> None:
@@ -112,3 +118,116 @@ def test_lottery_play_decrements_stock_and_logs(client: TestClient, session_fact
     assert verify.query(LotteryLog).count() == 1
     assert verify.query(UserEventLog).count() == 1
     verify.close()
+
+
+def test_roulette_play_commits_once_and_rolls_back_atomically(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_common(session, FeatureType.ROULETTE)
+    cfg = RouletteConfig(name="ROU", is_active=True)
+    session.add(cfg)
+    session.flush()
+    for idx in range(6):
+        session.add(
+            RouletteSegment(config_id=cfg.id, slot_index=idx, label=f"S{idx}", reward_type="TICKET_DICE", reward_amount=1, weight=1)
+        )
+    session.add(UserGameWallet(user_id=1, token_type=GameTokenType.ROULETTE_COIN, balance=1))
+    session.commit()
+
+    commits: list[int] = []
+    engine = session.get_bind()
+    listener = lambda conn: commits.append(1)  # noqa: E731
+    event.listen(engine, "commit", listener)
+    try:
+        RouletteService().play(session, user_id=1, now=date.today())
+        assert len(commits) == 1
+
+        # Second spin has no coin left: nothing from the failed play may be persisted.
+        with pytest.raises(NotEnoughTokensError):
+            RouletteService().play(session, user_id=1, now=date.today())
+    finally:
+        event.remove(engine, "commit", listener)
+    session.close()
+
+    verify: Session = session_factory()
+    assert verify.query(RouletteLog).count() == 1
+    assert verify.query(UserEventLog).count() == 1
+    assert verify.query(UserGameWalletLedger).count() == 2  # debit + TICKET_DICE reward
+    dice_wallet = verify.query(UserGameWallet).filter_by(user_id=1, token_type=GameTokenType.DICE_TOKEN).one()
+    assert dice_wallet.balance == 1
+    verify.close()
+
+
+def test_roulette_multi_play_is_one_batch_commit(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_common(session, FeatureType.ROULETTE)
+    cfg = RouletteConfig(name="ROU", is_active=True)
+    cfg.segments = [
+        RouletteSegment(slot_index=idx, label=f"S{idx}", reward_type="NONE" if idx else "POINT", reward_amount=0 if idx else 5, weight=1)
+        for idx in range(6)
+    ]
+    session.add(cfg)
+    session.add(UserGameWallet(user_id=1, token_type=GameTokenType.ROULETTE_COIN, balance=12))
+    session.commit()
+
+    commits: list[int] = []
+    engine = session.get_bind()
+    listener = lambda conn: commits.append(1)  # noqa: E731
+    event.listen(engine, "commit", listener)
+    try:
+        response = RouletteService().play(session, user_id=1, now=date.today(), count=10)
+        assert len(commits) == 1
+        assert len(response.segments) == 10
+        assert response.segment == response.segments[-1]
+
+        # 2 coins left: a x10 spin is refused as a whole.
+        with pytest.raises(NotEnoughTokensError):
+            RouletteService().play(session, user_id=1, now=date.today(), count=10)
+    finally:
+        event.remove(engine, "commit", listener)
+    session.close()
+
+    verify: Session = session_factory()
+    assert verify.query(RouletteLog).count() == 10
+    assert verify.query(UserEventLog).count() == 10
+    ledger = verify.query(UserGameWalletLedger).filter_by(reason="ROULETTE_PLAY").order_by(UserGameWalletLedger.id).all()
+    assert [entry.balance_after for entry in ledger] == list(range(11, 1, -1))
+    assert verify.query(UserGameWallet).filter_by(user_id=1, token_type=GameTokenType.ROULETTE_COIN).one().balance == 2
+    verify.close()
+
+
+def test_dice_play_endpoint_accepts_count(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_common(session, FeatureType.DICE)
+    session.add(DiceConfig(name="DICE", is_active=True, win_reward_type="NONE", draw_reward_type="NONE", lose_reward_type="NONE"))
+    session.commit()
+    session.close()
+
+    dice = client.post("/api/dice/play", params={"count": 3}).json()
+    assert len(dice["games"]) == 3 and dice["game"] == dice["games"][-1]
+    assert client.post("/api/dice/play", params={"count": 0}).status_code == 422
+    assert client.post("/api/dice/play", params={"count": 51}).status_code == 422
+
+    verify: Session = session_factory()
+    assert verify.query(DiceLog).count() == 3
+    assert verify.query(UserGameWallet).filter_by(user_id=1, token_type=GameTokenType.DICE_TOKEN).one().balance == 7
+    verify.close()
+
+
+def test_lottery_multi_play_settles_stock_within_the_batch(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_common(session, FeatureType.LOTTERY)
+    lottery = LotteryConfig(name="LOT", is_active=True, max_daily_tickets=0)
+    lottery.prizes = [LotteryPrize(label="P", reward_type="NONE", reward_amount=0, weight=1, stock=2)]
+    session.add(lottery)
+    session.commit()
+    session.close()
+
+    assert len(client.post("/api/lottery/play", params={"count": 2}).json()["prizes"]) == 2
+    # The batch emptied the stock; a third draw has nothing left and rolls back.
+    assert client.post("/api/lottery/play").status_code == 500
+
+    verify: Session = session_factory()
+    assert verify.query(LotteryLog).count() == 2
+    assert verify.query(LotteryPrize).one().stock == 0
+    assert verify.query(UserGameWallet).filter_by(user_id=1, token_type=GameTokenType.LOTTERY_TICKET).one().balance == 8
+    verify.close()
@@ -0,0 +1,58 @@
+"""NumPy payout simulator for roulette, dice and lottery configs."""
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.roulette import RouletteConfig, RouletteSegment
+from app.services.game_simulator import game_simulator
+
+
+def test_dice_matches_two_dice_odds_and_reward_mapping() -> None:
+    config = SimpleNamespace(
+        id=1, win_reward_type="POINT", win_reward_amount=10, draw_reward_type="TICKET_DICE", draw_reward_amount=1,
+        lose_reward_type="NONE", lose_reward_amount=5,
+    )
+    result = game_simulator.dice(config, plays=2_000_000, seed=7)
+    win, draw, lose = (outcome.probability for outcome in result.distribution)
+    # Exact odds: P(draw) = 146/1296, win and lose split the rest evenly.
+    assert abs(draw - 146 / 1296) < 0.002
+    assert abs(win - 575 / 1296) < 0.002 and abs(lose - 575 / 1296) < 0.002
+    assert abs(result.rtp - (10 * win + draw)) < 1e-9  # NONE pays nothing whatever its amount
+    assert abs(result.net_token_burn_per_play - (1 - draw)) < 1e-9
+
+
+def test_lottery_never_oversells_and_reports_sell_out() -> None:
+    prizes = [
+        SimpleNamespace(label="BIG", reward_type="POINT", reward_amount=1000, weight=1, stock=30, is_active=True),
+        SimpleNamespace(label="MID", reward_type="POINT", reward_amount=10, weight=50, stock=2000, is_active=True),
+        SimpleNamespace(label="MISS", reward_type="NONE", reward_amount=0, weight=100, stock=None, is_active=True),
+        SimpleNamespace(label="OFF", reward_type="POINT", reward_amount=99, weight=100, stock=None, is_active=False),
+    ]
+    result = game_simulator.lottery(SimpleNamespace(id=2, prizes=prizes), plays=3_000_000, seed=1)
+    counts = {outcome.label: outcome.count for outcome in result.distribution}
+    assert counts["BIG"] == 30 and counts["MID"] == 2000 and "OFF" not in counts
+    assert result.plays == 3_000_000
+    assert 2030 < result.plays_to_sell_out < 3_000_000
+
+    finite_only = game_simulator.lottery(SimpleNamespace(id=3, prizes=prizes[:2]), plays=5000, seed=1)
+    assert finite_only.plays == finite_only.plays_to_sell_out == 2030
+    assert finite_only.requested_plays == 5000
+
+
+def test_simulate_endpoint_for_saved_roulette_config(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    config = RouletteConfig(name="DRAFT", is_active=False)
+    config.segments = [
+        RouletteSegment(slot_index=i, label=f"S{i}", reward_type="POINT", reward_amount=100 * i, weight=1) for i in range(6)
+    ]
+    session.add(config)
+    session.commit()
+    session.close()
+
+    response = client.post(f"/admin/api/roulette-config/{config.id}/simulate", params={"plays": 600_000, "seed": 3})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["plays"] == 600_000 and len(body["distribution"]) == 6
+    assert abs(body["rtp"] - 250) < 3
+    assert client.post("/admin/api/roulette-config/999/simulate").status_code == 404
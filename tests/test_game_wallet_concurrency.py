@@ -0,0 +1,120 @@
+"""Concurrency checks for the conditional-UPDATE wallet debit."""
+import threading
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.exceptions import NotEnoughTokensError
+from app.db.base import Base
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.services.game_wallet_service import GameWalletService
+
+THREADS = 16
+ATTEMPTS_PER_THREAD = 10
+START_BALANCE = 50
+
+
+@pytest.fixture()
+def file_session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wallet.db'}", connect_args={"check_same_thread": False, "timeout": 30})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    with factory() as db:
+        db.add(User(id=1, external_id="tester", status="ACTIVE"))
+        db.add(UserGameWallet(user_id=1, token_type=GameTokenType.ROULETTE_COIN, balance=START_BALANCE))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+@pytest.mark.parametrize("use_returning", [True, False])
+def test_concurrent_debits_never_overdraw(file_session_factory, monkeypatch, use_returning: bool) -> None:
+    engine = file_session_factory.kw["bind"]
+    monkeypatch.setattr(engine.dialect, "update_returning", use_returning)
+    service = GameWalletService()
+    barrier = threading.Barrier(THREADS)
+    outcomes: list[str] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(ATTEMPTS_PER_THREAD):
+            with file_session_factory() as db:
+                try:
+                    service.require_and_consume_token(db, 1, GameTokenType.ROULETTE_COIN, reason="STRESS")
+                    outcome = "ok"
+                except NotEnoughTokensError:
+                    db.rollback()
+                    outcome = "empty"
+            with lock:
+                outcomes.append(outcome)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes.count("ok") == START_BALANCE
+    assert outcomes.count("empty") == THREADS * ATTEMPTS_PER_THREAD - START_BALANCE
+
+    with file_session_factory() as db:
+        assert db.execute(select(UserGameWallet.balance)).scalar_one() == 0
+        assert db.execute(select(func.count()).select_from(UserGameWalletLedger)).scalar_one() == START_BALANCE
+        balances_after = db.execute(select(UserGameWalletLedger.balance_after)).scalars().all()
+        assert sorted(balances_after) == list(range(START_BALANCE))
+
+
+def test_debit_updates_loaded_wallet(file_session_factory) -> None:
+    service = GameWalletService()
+    db: Session = file_session_factory()
+    assert service.get_balance(db, 1, GameTokenType.ROULETTE_COIN) == START_BALANCE
+    assert service.require_and_consume_token(db, 1, GameTokenType.ROULETTE_COIN, amount=3) == START_BALANCE - 3
+    assert service.get_balance(db, 1, GameTokenType.ROULETTE_COIN) == START_BALANCE - 3
+    with pytest.raises(NotEnoughTokensError):
+        service.require_and_consume_token(db, 1, GameTokenType.ROULETTE_COIN, amount=START_BALANCE)
+    db.close()
+
+
+def test_bulk_grant_survives_a_wallet_created_after_its_select(file_session_factory) -> None:
+    engine = file_session_factory.kw["bind"]
+    racer = create_engine(engine.url)
+    with file_session_factory() as db:
+        db.add_all([User(id=2, external_id="two", status="ACTIVE"), User(id=3, external_id="three", status="ACTIVE")])
+        db.commit()
+
+    def first_play(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        # A first play creates user 2's wallet between the bulk SELECT and its INSERT.
+        if statement.startswith("INSERT INTO user_game_wallet ") and not first_play.done:
+            first_play.done = True
+            with sessionmaker(bind=racer)() as other:
+                other.add(UserGameWallet(user_id=2, token_type=GameTokenType.LOTTERY_TICKET, balance=4))
+                other.commit()
+
+    first_play.done = False
+    event.listen(engine, "before_cursor_execute", first_play)
+    try:
+        with file_session_factory() as db:
+            items = [
+                SimpleNamespace(user_id=user_id, external_id=None, token_type=GameTokenType.LOTTERY_TICKET, amount=1)
+                for user_id in (1, 2, 3)
+            ]
+            result = GameWalletService().grant_tokens_bulk(db, items, reason="EVENT_DAY")
+    finally:
+        event.remove(engine, "before_cursor_execute", first_play)
+        racer.dispose()
+
+    assert first_play.done and result.applied == 3 and result.failures == []
+    with file_session_factory() as db:
+        balances = dict(
+            db.execute(
+                select(UserGameWallet.user_id, UserGameWallet.balance).where(UserGameWallet.token_type == GameTokenType.LOTTERY_TICKET)
+            ).all()
+        )
+        assert balances == {1: 1, 2: 5, 3: 1}
+        ledger = db.execute(select(UserGameWalletLedger.balance_after).where(UserGameWalletLedger.user_id == 2)).scalars().all()
+        assert ledger == [5]
@@ -0,0 +1,141 @@
+"""Tests for the external ranking leaderboard engine."""
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.feature import FeatureConfig, FeatureType
+from app.models.user import User
+from app.schemas.admin_user import AdminUserUpdate
+from app.schemas.external_ranking import ExternalRankingCreate, ExternalRankingUpdate
+from app.services.admin_external_ranking_service import AdminExternalRankingService
+from app.services.admin_user_service import AdminUserService
+from app.services.leaderboard import NO_NICKNAME, InMemoryLeaderboard, LeaderboardEntry, RedisLeaderboard, external_leaderboard
+
+
+def make_entries(count: int, seed: int) -> list[LeaderboardEntry]:
+    rng = random.Random(seed)
+    # Small value ranges force plenty of deposit/play ties.
+    return [
+        LeaderboardEntry(user_id=uid, deposit_amount=rng.randint(0, 5) * 1000, play_count=rng.randint(0, 3), user_name=f"u{uid}")
+        for uid in rng.sample(range(1, 10_000), count)
+    ]
+
+
+def expected_order(entries: list[LeaderboardEntry]) -> list[int]:
+    return [e.user_id for e in sorted(entries, key=lambda e: (-e.deposit_amount, -e.play_count, e.user_id))]
+
+
+def assert_board_matches(board, entries: list[LeaderboardEntry]) -> None:  # noqa: ANN001
+    order = expected_order(entries)
+    assert len(board) == len(order)
+    assert [entry.user_id for _, entry in board.page(0, len(order))] == order
+    for rank, user_id in enumerate(order, start=1):
+        assert board.get(user_id)[0] == rank
+    page = board.page(5, 7)
+    assert [(rank, entry.user_id) for rank, entry in page] == list(zip(range(6, 13), order[5:12]))
+
+
+def exercise_board(board) -> None:  # noqa: ANN001
+    entries = make_entries(200, seed=8)
+    board.replace_all(entries)
+    assert_board_matches(board, entries)
+
+    by_user = {e.user_id: e for e in entries}
+    updates = make_entries(60, seed=9)
+    for moved in updates[:30]:
+        by_user[moved.user_id] = moved
+    # Re-score 30 existing users too.
+    for entry in list(by_user.values())[:30]:
+        by_user[entry.user_id] = LeaderboardEntry(entry.user_id, entry.deposit_amount + 500, entry.play_count, entry.user_name)
+    board.upsert([by_user[uid] for uid in [u.user_id for u in updates[:30]] + list(by_user)[:30]])
+    removed = list(by_user)[40:50]
+    board.remove(removed)
+    for user_id in removed:
+        del by_user[user_id]
+    assert_board_matches(board, list(by_user.values()))
+    assert board.get(removed[0]) is None
+
+
+def test_in_memory_leaderboard_matches_sorted_reference() -> None:
+    exercise_board(InMemoryLeaderboard())
+
+
+def test_redis_leaderboard_matches_sorted_reference() -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    exercise_board(RedisLeaderboard(fakeredis.FakeRedis()))
+
+
+def seed_ranking(session: Session, count: int) -> None:
+    session.add(FeatureConfig(feature_type=FeatureType.RANKING, title="RANKING", page_path="/ranking"))
+    for user_id in range(1, count + 1):
+        session.add(User(id=user_id, external_id=f"ext-{user_id}", nickname=f"nick-{user_id}", status="ACTIVE"))
+    session.commit()
+
+
+def test_ranking_today_paginates_and_tracks_admin_updates(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_ranking(session, 5)
+    AdminExternalRankingService.upsert_many(
+        session,
+        [ExternalRankingCreate(user_id=uid, deposit_amount=uid * 1000, play_count=uid) for uid in range(2, 6)],
+    )
+    session.close()
+
+    data = client.get("/api/ranking/today", params={"top": 2, "offset": 1}).json()
+    assert [(e["rank"], e["user_id"]) for e in data["external_entries"]] == [(2, 4), (3, 3)]
+    assert data["external_total"] == 4
+    assert data["my_external_entry"] is None
+
+    engine = session_factory.kw["bind"]
+    full_loads: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "FROM external_ranking_data LEFT OUTER JOIN" in statement and " IN " not in statement:
+            full_loads.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        session = session_factory()
+        AdminExternalRankingService.upsert_many(session, [ExternalRankingCreate(user_id=1, deposit_amount=4500, play_count=0)])
+        AdminExternalRankingService.update(session, 5, ExternalRankingUpdate(deposit_amount=100))
+        session.close()
+
+        data = client.get("/api/ranking/today", params={"top": 3}).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert [(e["rank"], e["user_id"], e["user_name"]) for e in data["external_entries"]] == [
+        (1, 1, "nick-1"),
+        (2, 4, "nick-4"),
+        (3, 3, "nick-3"),
+    ]
+    assert data["my_external_entry"]["rank"] == 1
+    assert full_loads == []
+
+    session = session_factory()
+    AdminExternalRankingService.delete(session, 1)
+    session.close()
+    data = client.get("/api/ranking/today", params={"top": 10}).json()
+    assert [e["user_id"] for e in data["external_entries"]] == [4, 3, 2, 5]
+    assert data["my_external_entry"] is None
+
+
+def test_admin_user_edits_refresh_leaderboard_names(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_ranking(session, 2)
+    AdminExternalRankingService.upsert_many(
+        session, [ExternalRankingCreate(user_id=uid, deposit_amount=uid * 1000, play_count=0) for uid in (1, 2)]
+    )
+
+    def names() -> list[tuple[int, str]]:
+        return [(entry.user_id, entry.user_name) for _, entry in external_leaderboard.page(session, 0, 10)]
+
+    assert names() == [(2, "nick-2"), (1, "nick-1")]
+    AdminUserService.update_user(session, 1, AdminUserUpdate(nickname="renamed"))
+    assert names() == [(2, "nick-2"), (1, "renamed")]
+    AdminUserService.delete_user(session, 1)
+    assert names() == [(2, "nick-2"), (1, NO_NICKNAME)]
+    session.close()
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
 from app.models.lottery import LotteryConfig, LotteryPrize
 from app.models.user import User
+from app.services.config_cache import config_cache
 
 
 @pytest.fixture()
@@ -50,3 +51,40 @@ def test_lottery_play_returns_prize(client: TestClient) -> None:
     data = resp.json()
     assert data["result"] == "OK"
     assert data["prize"]["reward_type"] == "POINT"
+
+
+def test_lottery_stock_is_settled_per_draw_without_overselling(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    today = date.today()
+    config = LotteryConfig(name="STOCK", is_active=True, max_daily_tickets=0)
+    big = LotteryPrize(config=config, label="BIG", reward_type="POINT", reward_amount=100, weight=1_000_000, stock=1, is_active=True)
+    miss = LotteryPrize(config=config, label="MISS", reward_type="NONE", reward_amount=0, weight=1, stock=None, is_active=True)
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureSchedule(date=today, feature_type=FeatureType.LOTTERY, is_active=True),
+            FeatureConfig(feature_type=FeatureType.LOTTERY, title="Lottery Day", page_path="/lottery", is_enabled=True),
+            config,
+            big,
+            miss,
+        ]
+    )
+    session.commit()
+
+    assert client.get("/api/lottery/status").status_code == 200  # warm the snapshot with BIG in stock
+    assert client.post("/api/lottery/play").json()["prize"]["label"] == "BIG"
+    session.expire_all()
+    assert session.get(LotteryPrize, big.id).stock == 0
+    assert client.post("/api/lottery/play").json()["prize"]["label"] == "MISS"
+
+    # A snapshot that still lists the prize (another worker's view) falls through to the rest.
+    session.get(LotteryPrize, big.id).stock = 1
+    session.commit()
+    config_cache.invalidate("LOTTERY")
+    assert client.get("/api/lottery/status").status_code == 200
+    session.get(LotteryPrize, big.id).stock = 0  # sold out behind the cached snapshot
+    session.commit()
+    assert client.post("/api/lottery/play").json()["prize"]["label"] == "MISS"
+    session.expire_all()
+    assert session.get(LotteryPrize, big.id).stock == 0
+    session.close()
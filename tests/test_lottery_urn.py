@@ -0,0 +1,183 @@
+"""Pre-drawn urn for finite-stock lottery prizes (LotteryConfig.use_urn)."""
+import random
+import threading
+from collections import Counter
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.exceptions import InvalidConfigError
+from app.db.base import Base
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize, LotteryUrn, LotteryUrnSlot
+from app.models.user import User
+from app.services.config_cache import config_cache
+from app.services.lottery_service import LotteryService
+from app.services.lottery_urn import NO_SLOT, LotteryUrnService, UrnExhausted
+
+THREADS = 6
+STOCK = {"BIG": 4, "MID": 9}
+
+
+def prize_payload(label: str, weight: int, stock: int | None) -> dict:
+    return {"label": label, "weight": weight, "stock": stock, "reward_type": "NONE", "reward_amount": 0, "is_active": True}
+
+
+def test_draw_sequence_holds_each_prize_exactly_stock_times() -> None:
+    prizes = [
+        LotteryPrize(id=1, weight=5, stock=3, is_active=True),
+        LotteryPrize(id=2, weight=1, stock=7, is_active=True),
+        LotteryPrize(id=3, weight=90, stock=None, is_active=True),
+        LotteryPrize(id=4, weight=50, stock=5, is_active=False),
+    ]
+    slots = LotteryUrnService(rng=random.Random(1)).draw_sequence(prizes)
+    assert Counter(prize_id for _, prize_id in slots) == {1: 3, 2: 7}
+    seqs = [seq for seq, _ in slots]
+    assert seqs == sorted(set(seqs))
+
+    # Without unlimited prizes every ticket is a finite win.
+    slots = LotteryUrnService(rng=random.Random(1)).draw_sequence(prizes[:2])
+    assert [seq for seq, _ in slots] == list(range(10))
+
+
+def test_urn_is_built_on_save_and_settled_into_stock_on_deactivate(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureSchedule(date=date.today(), feature_type=FeatureType.LOTTERY, is_active=True),
+            FeatureConfig(feature_type=FeatureType.LOTTERY, title="Lottery Day", page_path="/lottery", is_enabled=True),
+        ]
+    )
+    session.commit()
+
+    created = client.post(
+        "/admin/api/lottery-config",
+        json={"name": "URN", "is_active": True, "max_daily_plays": 0, "use_urn": True, "prizes": [prize_payload("BIG", 1, 2)]},
+    )
+    assert created.status_code == 201
+    config_id = created.json()["id"]
+    assert session.execute(select(func.count()).select_from(LotteryUrnSlot)).scalar_one() == 2
+
+    assert [client.post("/api/lottery/play").json()["prize"]["label"] for _ in range(2)] == ["BIG", "BIG"]
+    sold_out = client.post("/api/lottery/play")
+    assert sold_out.json()["error"]["code"] == "INVALID_LOTTERY_CONFIG"
+    big = session.execute(select(LotteryPrize).where(LotteryPrize.config_id == config_id)).scalar_one()
+    assert big.stock == 2  # plays never write the prize row
+
+    assert client.post(f"/admin/api/lottery-config/{config_id}/deactivate").status_code == 200
+    session.expire_all()
+    assert session.get(LotteryPrize, big.id).stock == 0
+    assert session.execute(select(func.count()).select_from(LotteryUrnSlot)).scalar_one() == 0
+    urn = session.get(LotteryUrn, config_id)
+    assert (urn.last_seq, urn.generation) == (-1, 2)  # emptied; tickets of the old urn are void
+    session.close()
+
+
+@pytest.fixture()
+def file_session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'urn.db'}", connect_args={"check_same_thread": False, "timeout": 30})
+
+    # BEGIN IMMEDIATE: SQLite writers queue on the busy timeout instead of failing a lock upgrade.
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, _record):  # noqa: ANN001
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):  # noqa: ANN001
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.mark.parametrize("use_returning", [True, False])
+def test_concurrent_urn_plays_never_over_issue(file_session_factory, monkeypatch, use_returning: bool) -> None:
+    monkeypatch.setattr(file_session_factory.kw["bind"].dialect, "update_returning", use_returning)
+    with file_session_factory() as db:
+        db.add_all(
+            [FeatureSchedule(date=date.today(), feature_type=FeatureType.LOTTERY, is_active=True),
+             FeatureConfig(feature_type=FeatureType.LOTTERY, title="Lottery Day", page_path="/lottery", is_enabled=True)]
+            + [User(id=n, external_id=f"u{n}", status="ACTIVE") for n in range(1, THREADS + 1)]
+            + [UserGameWallet(user_id=n, token_type=GameTokenType.LOTTERY_TICKET, balance=1_000) for n in range(1, THREADS + 1)]
+        )
+        config = LotteryConfig(name="URN", is_active=True, max_daily_tickets=0, use_urn=True)
+        config.prizes = [
+            LotteryPrize(label=label, reward_type="NONE", reward_amount=0, weight=1, stock=stock) for label, stock in STOCK.items()
+        ] + [LotteryPrize(label="MISS", reward_type="NONE", reward_amount=0, weight=1, stock=None)]
+        db.add(config)
+        db.flush()
+        LotteryUrnService(rng=random.Random(7)).build(db, config)
+        db.commit()
+        # Enough plays to pass the last slot, so tickets left in other threads' batches get swept.
+        plays_per_thread = (db.get(LotteryUrn, config.id).last_seq + 1) // THREADS + 5
+    config_cache.clear()
+
+    barrier = threading.Barrier(THREADS)
+    errors: list[Exception] = []
+
+    def worker(user_id: int) -> None:
+        service = LotteryService()
+        service.urn_service = LotteryUrnService(batch_size=3)  # one "worker process" per thread
+        barrier.wait()
+        for _ in range(plays_per_thread):
+            try:
+                with file_session_factory() as db:
+                    service.play(db, user_id=user_id, now=date.today())
+            except InvalidConfigError as exc:  # pragma: no cover - fails the assertion below
+                errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(1, THREADS + 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with file_session_factory() as db:
+        won = Counter(
+            db.execute(select(LotteryPrize.label).join(LotteryLog, LotteryLog.prize_id == LotteryPrize.id)).scalars()
+        )
+        assert won["BIG"] == STOCK["BIG"] and won["MID"] == STOCK["MID"]
+        assert sum(won.values()) == THREADS * plays_per_thread
+        claimed = db.execute(select(LotteryUrnSlot.user_id).where(LotteryUrnSlot.claimed_at.is_not(None))).scalars().all()
+        assert len(claimed) == sum(STOCK.values())
+        assert db.execute(select(LotteryPrize.stock).where(LotteryPrize.label == "BIG")).scalar_one() == STOCK["BIG"]
+
+
+def test_rebuild_voids_batches_other_workers_still_hold(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    session.add(User(id=1, external_id="tester", status="ACTIVE"))
+    config = LotteryConfig(name="URN", is_active=True, max_daily_tickets=0, use_urn=True)
+    config.prizes = [LotteryPrize(label="BIG", reward_type="NONE", reward_amount=0, weight=1, stock=3)]
+    session.add(config)
+    session.flush()
+    admin, worker = LotteryUrnService(rng=random.Random(3)), LotteryUrnService(batch_size=3)
+    admin.build(session, config)
+    session.commit()
+    big_id = config.prizes[0].id
+
+    # The other worker reserves tickets 0-2 of generation 1 and claims ticket 0.
+    assert worker.claim(session, config.id, 1, generation=1) == big_id
+
+    # An admin save rebuilds the urn (stock 3 - 1 claimed = 2 slots, seqs 0-1) in another worker.
+    admin.build(session, config)
+    session.commit()
+    assert config.prizes[0].stock == 2
+    assert session.get(LotteryUrn, config.id).generation == 2
+
+    # Until its snapshot refreshes, the worker's old ticket 1 takes nothing from the new urn.
+    assert worker.claim(session, config.id, 1, generation=1) == NO_SLOT
+    assert session.execute(select(func.count()).select_from(LotteryUrnSlot).where(LotteryUrnSlot.claimed_at.is_not(None))).scalar_one() == 0
+
+    # With the new generation the stale batch is dropped and tickets come from the new counter.
+    assert [worker.claim(session, config.id, 1, generation=2) for _ in range(2)] == [big_id, big_id]
+    assert session.get(LotteryUrn, config.id).next_seq == 3
+    with pytest.raises(UrnExhausted):
+        worker.claim(session, config.id, 1, generation=2)
+    session.close()
@@ -0,0 +1,189 @@
+"""Tests for materialized daily play counters."""
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.dice import DiceConfig, DiceLog
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.models.play_counter import UserDailyPlayCount, UserInternalWinCount
+from app.models.user import User
+from app.services.play_counter_service import PlayCounterService
+
+
+def seed_dice(session: Session) -> DiceConfig:
+    session.add(User(id=1, external_id="tester", status="ACTIVE"))
+    session.add(FeatureConfig(feature_type=FeatureType.DICE, title="DICE", page_path="/dice"))
+    session.add(FeatureSchedule(date=date.today(), feature_type=FeatureType.DICE, is_active=True))
+    cfg = DiceConfig(
+        name="DICE",
+        is_active=True,
+        win_reward_type="NONE",
+        win_reward_amount=0,
+        draw_reward_type="NONE",
+        draw_reward_amount=0,
+        lose_reward_type="NONE",
+        lose_reward_amount=0,
+    )
+    session.add(cfg)
+    session.commit()
+    return cfg
+
+
+def test_play_increments_counter_and_status_skips_log_scan(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_dice(session)
+    session.close()
+
+    for _ in range(3):
+        assert client.post("/api/dice/play").status_code == 200
+
+    engine = session_factory.kw["bind"]
+    log_scans: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "FROM dice_log" in statement:
+            log_scans.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        data = client.get("/api/dice/status").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert data["today_plays"] == 3
+    assert log_scans == []
+
+    verify: Session = session_factory()
+    assert PlayCounterService.get_count(verify, 1, FeatureType.DICE, date.today()) == 3
+    assert PlayCounterService.get_count(verify, 1, FeatureType.ROULETTE, date.today()) == 0
+    verify.close()
+
+
+def test_rebuild_matches_logs(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    cfg = seed_dice(session)
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    for created_at in [yesterday, yesterday, datetime.utcnow()]:
+        session.add(
+            DiceLog(
+                user_id=1,
+                config_id=cfg.id,
+                user_dice_1=1,
+                user_dice_2=1,
+                user_sum=2,
+                dealer_dice_1=1,
+                dealer_dice_2=1,
+                dealer_sum=2,
+                result="DRAW",
+                reward_type="NONE",
+                reward_amount=0,
+                created_at=created_at,
+            )
+        )
+    # A stale counter that the rebuild must overwrite.
+    session.add(UserDailyPlayCount(user_id=1, feature_type=FeatureType.DICE, play_date=yesterday.date(), play_count=99))
+    session.commit()
+
+    assert PlayCounterService.rebuild(session) == 2
+    session.commit()
+    assert PlayCounterService.get_count(session, 1, FeatureType.DICE, yesterday.date()) == 2
+    assert PlayCounterService.get_count(session, 1, FeatureType.DICE, datetime.utcnow().date()) == 1
+
+    # Range-limited rebuild leaves other days alone.
+    PlayCounterService.increment(session, 1, FeatureType.DICE, yesterday.date(), amount=5)
+    PlayCounterService.rebuild(session, start=datetime.utcnow().date(), end=datetime.utcnow().date())
+    session.commit()
+    assert PlayCounterService.get_count(session, 1, FeatureType.DICE, yesterday.date()) == 7
+    assert PlayCounterService.get_count(session, 1, FeatureType.DICE, datetime.utcnow().date()) == 1
+    session.close()
+
+
+def add_dice_logs(session: Session, config_id: int, results: list[str]) -> None:
+    for result in results:
+        session.add(
+            DiceLog(
+                user_id=1,
+                config_id=config_id,
+                user_dice_1=1,
+                user_dice_2=1,
+                user_sum=2,
+                dealer_dice_1=1,
+                dealer_dice_2=1,
+                dealer_sum=2,
+                result=result,
+                reward_type="NONE",
+                reward_amount=0,
+            )
+        )
+
+
+def test_win_counter_seeds_from_logs_then_increments(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    cfg = seed_dice(session)
+    add_dice_logs(session, cfg.id, ["WIN", "LOSE", "WIN"])
+    session.commit()
+    session.close()
+
+    assert client.get("/api/season-pass/internal-wins").json()["total_wins"] == 2
+
+    session = session_factory()
+    add_dice_logs(session, cfg.id, ["WIN"])
+    session.flush()
+    assert PlayCounterService.record_win(session, 1) == 3
+    session.commit()
+    session.close()
+
+    engine = session_factory.kw["bind"]
+    log_scans: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "_log" in statement and "count(" in statement.lower():
+            log_scans.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        data = client.get("/api/season-pass/internal-wins").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    assert data["total_wins"] == 3
+    assert data["remaining"] == 47
+    assert log_scans == []
+
+
+def test_reconcile_win_counts_fixes_drift(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    cfg = seed_dice(session)
+    add_dice_logs(session, cfg.id, ["WIN", "WIN"])
+    session.add(UserInternalWinCount(user_id=1, win_count=7))
+    session.commit()
+
+    assert PlayCounterService.reconcile_win_counts(session, apply=False) == [(1, 7, 2)]
+    assert PlayCounterService.reconcile_win_counts(session) == [(1, 7, 2)]
+    session.commit()
+    assert PlayCounterService.reconcile_win_counts(session, apply=False) == []
+    assert PlayCounterService.ensure_win_count(session, 1) == (2, False)
+    session.close()
+
+
+def test_record_win_adds_own_wins_when_seed_insert_loses_the_race(client: TestClient, session_factory, monkeypatch) -> None:
+    session: Session = session_factory()
+    cfg = seed_dice(session)
+    add_dice_logs(session, cfg.id, ["WIN", "WIN"])
+    session.flush()
+    seeds: list[int] = []
+
+    def seeded_concurrently(db: Session, user_id: int) -> int:
+        # Another request commits its seed (which cannot see our uncommitted logs) first.
+        seeds.append(user_id)
+        db.add(UserInternalWinCount(user_id=user_id, win_count=5))
+        db.flush()
+        return 2
+
+    monkeypatch.setattr(PlayCounterService, "count_wins_from_logs", staticmethod(seeded_concurrently))
+    assert PlayCounterService.record_win(session, 1, wins=2) == 7
+    assert seeds == [1]
+    session.commit()
+    assert session.get(UserInternalWinCount, 1).win_count == 7
+    session.close()
@@ -0,0 +1,78 @@
+"""Read-only endpoints use the replica session, except right after the same client wrote."""
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.deps import READ_PIN_COOKIE, READ_PIN_HEADER
+from app.db import session as db_session
+from app.db.base import Base
+from app.models.dice import DiceConfig
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.models.user import User
+
+
+@pytest.fixture()
+def replica(monkeypatch) -> sessionmaker:
+    """An empty stand-in replica, so a read served from it is recognisable."""
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    monkeypatch.setattr(db_session, "read_engine", engine)
+    monkeypatch.setattr(db_session, "ReadSessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def seed_dice(session: Session) -> None:
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureConfig(feature_type=FeatureType.DICE, title="DICE", page_path="/dice"),
+            FeatureSchedule(date=date.today(), feature_type=FeatureType.DICE, is_active=True),
+            DiceConfig(
+                name="DICE", is_active=True, win_reward_type="NONE", win_reward_amount=0, draw_reward_type="NONE",
+                draw_reward_amount=0, lose_reward_type="NONE", lose_reward_amount=0,
+            ),
+        ]
+    )
+    session.commit()
+
+
+def test_listing_reads_replica_until_the_client_writes(replica, client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_dice(session)
+    session.close()
+
+    assert client.get("/admin/api/game-tokens/wallets").json() == []  # replica is empty
+
+    # Admin writes and failed plays do not pin.
+    granted = client.post("/admin/api/game-tokens/grant", json={"user_id": 1, "token_type": "DICE_TOKEN", "amount": 5})
+    assert granted.status_code == 200
+    assert READ_PIN_HEADER not in granted.headers
+    failed = client.post("/api/lottery/play")
+    assert failed.status_code >= 400 and READ_PIN_HEADER not in failed.headers
+
+    played = client.post("/api/dice/play")
+    assert played.status_code == 200
+    pin = played.headers[READ_PIN_HEADER]
+    client.cookies.clear()  # cross-origin SPA: only the echoed header comes back
+
+    wallets = client.get("/admin/api/game-tokens/wallets", params={"user_id": 1}, headers={READ_PIN_HEADER: pin}).json()
+    assert {(w["token_type"], w["balance"]) for w in wallets} >= {("DICE_TOKEN", 14)}
+    assert client.get("/admin/api/game-tokens/wallets").json() == []
+
+
+def test_without_replica_reads_use_the_primary_and_nothing_is_pinned(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    seed_dice(session)
+    session.close()
+
+    played = client.post("/api/dice/play")
+    assert played.status_code == 200
+    assert READ_PIN_HEADER not in played.headers and READ_PIN_COOKIE not in played.cookies
+    assert client.get("/admin/api/game-tokens/wallets", params={"user_id": 1}).json()
@@ -0,0 +1,178 @@
+"""Reward outbox: producers queue rewards in their transaction, the worker delivers them."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.reward_outbox import RewardOutbox
+from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel, SeasonPassProgress
+from app.models.user import User
+from app.services.reward_service import RewardService
+from app.services.season_pass_service import SeasonPassService
+
+
+@pytest.fixture()
+def outbox_mode(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "reward_delivery_mode", "outbox")
+
+
+def seed(session: Session) -> None:
+    today = date.today()
+    season = SeasonPassConfig(
+        season_name="S1",
+        start_date=today - timedelta(days=1),
+        end_date=today + timedelta(days=6),
+        max_level=3,
+        base_xp_per_stamp=10,
+        is_active=True,
+    )
+    season.levels = [
+        SeasonPassLevel(level=1, required_xp=0, reward_type="TICKET_DICE", reward_amount=1, auto_claim=True),
+        SeasonPassLevel(level=2, required_xp=20, reward_type="TICKET_DICE", reward_amount=2, auto_claim=True),
+        SeasonPassLevel(level=3, required_xp=50, reward_type="TICKET_LOTTERY", reward_amount=3, auto_claim=True),
+    ]
+    session.add_all([season, User(id=2, external_id="outbox", status="ACTIVE")])
+    session.commit()
+
+
+def balance(session: Session, token_type: GameTokenType) -> int:
+    wallet = session.query(UserGameWallet).filter_by(user_id=2, token_type=token_type).one_or_none()
+    return wallet.balance if wallet else 0
+
+
+def test_rewards_are_queued_with_the_producer_and_delivered_once(outbox_mode, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session)
+
+    result = SeasonPassService().add_bonus_xp(session, user_id=2, xp_amount=60)
+    assert [reward["level"] for reward in result["rewards"]] == [2, 3]
+    assert balance(session, GameTokenType.DICE_TOKEN) == 0  # nothing delivered inline
+
+    keys = {row.idempotency_key for row in session.query(RewardOutbox).all()}
+    season_id = session.query(SeasonPassConfig).one().id
+    # Season levels 2-3 plus core level 1 (40 XP) reached through the core XP mirror.
+    assert keys == {f"SEASON_PASS:{season_id}:2:2", f"SEASON_PASS:{season_id}:2:3", "LEVEL:2:1"}
+
+    # A producer re-running for the same event does not queue a second delivery.
+    service = RewardService()
+    assert service.enqueue(session, 2, "TICKET_DICE", 2, idempotency_key=f"SEASON_PASS:{season_id}:2:2") is None
+
+    assert service.drain_outbox(session) == {"delivered": 3, "retried": 0, "failed": 0}
+    assert service.drain_outbox(session) == {"delivered": 0, "retried": 0, "failed": 0}
+    assert balance(session, GameTokenType.DICE_TOKEN) == 2
+    assert balance(session, GameTokenType.LOTTERY_TICKET) == 3
+    assert balance(session, GameTokenType.ROULETTE_COIN) == 1
+    assert {row.status for row in session.query(RewardOutbox).all()} == {"DONE"}
+    session.close()
+
+
+def test_failed_delivery_is_retried_with_backoff_then_parked(outbox_mode, monkeypatch, session_factory) -> None:
+    session: Session = session_factory()
+    seed(session)
+    service = RewardService()
+    service.enqueue(session, 2, "TICKET_DICE", 5, idempotency_key="TEST:1")
+    session.commit()
+
+    calls = {"n": 0}
+    deliver_now = service.deliver_now
+
+    def flaky(*args, **kwargs):  # noqa: ANN002, ANN003
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("wallet down")
+        return deliver_now(*args, **kwargs)
+
+    monkeypatch.setattr(service, "deliver_now", flaky)
+    now = datetime.utcnow()
+    assert service.drain_outbox(session, now=now) == {"delivered": 0, "retried": 1, "failed": 0}
+    row = session.query(RewardOutbox).one()
+    assert (row.status, row.attempts, row.last_error) == ("PENDING", 1, "RuntimeError: wallet down")
+    assert row.next_attempt_at == now + timedelta(seconds=30)
+
+    assert service.drain_outbox(session, now=now + timedelta(seconds=10)) == {"delivered": 0, "retried": 0, "failed": 0}
+    assert service.drain_outbox(session, now=now + timedelta(seconds=31)) == {"delivered": 1, "retried": 0, "failed": 0}
+    assert balance(session, GameTokenType.DICE_TOKEN) == 5
+
+    service.enqueue(session, 2, "TICKET_DICE", 1, idempotency_key="TEST:2")
+    session.commit()
+
+    def broken(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise RuntimeError("gone")
+
+    monkeypatch.setattr(service, "deliver_now", broken)
+    assert service.drain_outbox(session, max_attempts=1) == {"delivered": 0, "retried": 0, "failed": 1}
+    assert session.query(RewardOutbox).filter_by(idempotency_key="TEST:2").one().status == "FAILED"
+    session.close()
+
+
+def test_game_play_queues_its_reward_keyed_by_the_play_log(outbox_mode, client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    today = date.today()
+    config = RouletteConfig(name="OUTBOX", is_active=True, max_daily_spins=0)
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureSchedule(date=today, feature_type=FeatureType.ROULETTE, is_active=True),
+            FeatureConfig(feature_type=FeatureType.ROULETTE, title="Roulette", page_path="/roulette", is_enabled=True),
+            config,
+        ]
+    )
+    session.flush()
+    session.add_all(
+        [
+            RouletteSegment(config=config, slot_index=i, label=f"S{i}", reward_type="TICKET_DICE", reward_amount=2, weight=1)
+            for i in range(6)
+        ]
+    )
+    session.commit()
+    session.close()
+
+    assert client.post("/api/roulette/play").status_code == 200
+
+    verify: Session = session_factory()
+    log = verify.query(RouletteLog).one()
+    row = verify.query(RewardOutbox).one()
+    assert (row.idempotency_key, row.user_id, row.reward_type, row.reward_amount) == (f"ROULETTE:{log.id}", 1, "TICKET_DICE", 2)
+    dice_before = verify.query(UserGameWallet).filter_by(user_id=1, token_type=GameTokenType.DICE_TOKEN).one().balance
+    assert RewardService().drain_outbox(verify)["delivered"] == 1
+    assert verify.query(UserGameWallet).filter_by(user_id=1, token_type=GameTokenType.DICE_TOKEN).one().balance == dice_before + 2
+    verify.close()
+
+
+def test_drain_runs_the_season_xp_hook_inside_its_transaction(outbox_mode, monkeypatch, session_factory) -> None:
+    monkeypatch.setattr(get_settings(), "xp_from_game_reward", True)
+    session: Session = session_factory()
+    seed(session)
+    service = RewardService()
+    service.enqueue(session, 2, "POINT", 60, idempotency_key="GAME:1")
+    service.enqueue(session, 2, "TICKET_DICE", 1, idempotency_key="GAME:2")
+    session.commit()
+
+    commits: list[str] = []
+
+    def crash() -> None:
+        commits.append("commit")
+        raise RuntimeError("worker crashed")
+
+    # The POINT row's bonus XP must not commit the batch early: the only commit is the drain's own.
+    session.commit = crash
+    with pytest.raises(RuntimeError):
+        service.drain_outbox(session)
+    del session.commit
+    assert commits == ["commit"]
+    session.rollback()
+    assert session.query(SeasonPassProgress).count() == 0
+    assert {(row.status, row.attempts) for row in session.query(RewardOutbox).all()} == {("PENDING", 0)}
+
+    assert service.drain_outbox(session) == {"delivered": 2, "retried": 0, "failed": 0}
+    assert session.query(SeasonPassProgress).filter_by(user_id=2).one().current_xp == 60
+    assert balance(session, GameTokenType.DICE_TOKEN) == 1
+    season_id = session.query(SeasonPassConfig).one().id
+    queued = {row.idempotency_key: row.status for row in session.query(RewardOutbox).all()}
+    assert queued[f"SEASON_PASS:{season_id}:2:3"] == "PENDING"  # level rewards queued in the same commit
+    session.close()
@@ -3,6 +3,7 @@ from datetime import date
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
@@ -50,3 +51,21 @@ def test_roulette_play_returns_segment(client: TestClient) -> None:
     data = resp.json()
     assert data["result"] == "OK"
     assert data["segment"]["reward_type"] == "POINT"
+
+
+@pytest.mark.usefixtures("seed_roulette")
+def test_roulette_spin_draws_from_snapshot_without_touching_segment_rows(client: TestClient, session_factory) -> None:
+    engine = session_factory.kw["bind"]
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        statements.append(statement)
+
+    assert client.get("/api/roulette/status").status_code == 200  # warm the config snapshot
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        assert client.post("/api/roulette/play").status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert not [s for s in statements if "roulette_segment" in s and not s.startswith("INSERT")]
@@ -4,6 +4,7 @@ from datetime import date, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models.season_pass import (
@@ -14,6 +15,8 @@ from app.models.season_pass import (
     SeasonPassStampLog,
 )
 from app.models.user import User
+from app.schemas.admin_season import AdminSeasonUpdate
+from app.services.admin_season_service import AdminSeasonService
 
 
 @pytest.fixture()
@@ -244,3 +247,164 @@ def test_season_conflict_raises_error(session_factory) -> None:
     assert "NO_ACTIVE_SEASON_CONFLICT" in exc_info.value.detail
     
     session.close()
+
+
+def test_status_is_one_query_once_the_level_table_is_cached(client: TestClient, seed_season, session_factory) -> None:
+    assert client.get("/api/season-pass/status").status_code == 200
+    session: Session = session_factory()
+    assert session.query(SeasonPassProgress).count() == 0  # reading status does not create progress
+    session.close()
+
+    stamp_resp = client.post("/api/season-pass/stamp", json={"source_feature_type": "ROULETTE", "xp_bonus": 5})
+    assert stamp_resp.status_code == 200
+
+    engine = session_factory.kw["bind"]
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "season_pass" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        data = client.get("/api/season-pass/status").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 1, statements
+    assert data["today"]["stamped"] is True
+    assert data["progress"]["current_xp"] == 15
+    assert [(lvl["level"], lvl["is_unlocked"], lvl["is_claimed"]) for lvl in data["levels"]] == [
+        (1, True, False),
+        (2, True, False),
+        (3, True, True),
+    ]
+
+
+def test_status_picks_up_admin_season_changes(client: TestClient, seed_season, session_factory) -> None:
+    data = client.get("/api/season-pass/status").json()
+    assert data["season"]["season_name"] == "TEST_SEASON"
+
+    session: Session = session_factory()
+    AdminSeasonService.update_season(session, data["season"]["id"], AdminSeasonUpdate(season_name="RENAMED"))
+    session.close()
+
+    assert client.get("/api/season-pass/status").json()["season"]["season_name"] == "RENAMED"
+
+
+def test_level_ladder_resolves_levels_by_bisect() -> None:
+    from types import SimpleNamespace
+
+    from app.services.config_cache import SeasonLevelLadder
+
+    rows = [
+        SimpleNamespace(level=level, required_xp=xp, reward_type="POINT", reward_amount=level, auto_claim=True)
+        for level, xp in [(3, 50), (1, 0), (2, 20), (2, 99), (4, 40), (5, 80)]
+    ]
+    ladder = SeasonLevelLadder.from_models(7, rows)
+
+    assert [lvl.level for lvl in ladder.levels] == [1, 2, 3, 4, 5]  # duplicate level 2 keeps the first row
+    # Level 4 is cheaper than level 3, so it is only reached together with level 3.
+    assert ladder.thresholds == (0, 20, 50, 50, 80)
+    assert [lvl.level for lvl in ladder.reached(49)] == [1, 2]
+    assert ladder.level_for_xp(50) == 4
+    assert [lvl.level for lvl in ladder.crossed(1, 60)] == [2, 3, 4]
+    assert ladder.crossed(4, 79) == ()
+    assert ladder.next_level_xp(20) == 50
+    assert ladder.next_level_xp(500) == 80
+    assert ladder.get(3).required_xp == 50 and ladder.get(9) is None
+    assert SeasonLevelLadder.from_models(8, []).level_for_xp(100) == 1
+
+
+def test_xp_gain_reads_levels_from_cached_ladder(client: TestClient, seed_season, session_factory) -> None:
+    from app.services.season_pass_service import SeasonPassService
+
+    engine = session_factory.kw["bind"]
+    level_queries: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "FROM season_pass_level" in statement:
+            level_queries.append(statement)
+
+    service = SeasonPassService()
+    session: Session = session_factory()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        first = service.add_bonus_xp(session, user_id=1, xp_amount=12)
+        second = service.add_bonus_xp(session, user_id=1, xp_amount=3)
+        stamp = client.post("/api/season-pass/stamp", json={"source_feature_type": "ROULETTE"})
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+        session.close()
+
+    assert len(level_queries) == 1, level_queries
+    assert [reward["level"] for reward in first["rewards"]] == []  # level 2 is manual-claim
+    assert [reward["level"] for reward in second["rewards"]] == [3]
+    assert stamp.status_code == 200
+
+    verify: Session = session_factory()
+    progress = verify.query(SeasonPassProgress).one()
+    assert (progress.current_level, progress.current_xp) == (3, 25)
+    verify.close()
+
+
+def test_reward_log_lookups_only_when_a_threshold_is_crossed(seed_season, session_factory) -> None:
+    from app.models.level_xp import UserLevelRewardLog
+    from app.services.season_pass_service import SeasonPassService
+
+    engine = session_factory.kw["bind"]
+    lookups: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.startswith("SELECT") and ("FROM season_pass_reward_log" in statement or "FROM user_level_reward_log" in statement):
+            lookups.append(statement)
+
+    service = SeasonPassService()
+    session: Session = session_factory()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        service.add_bonus_xp(session, user_id=1, xp_amount=5)  # no season or core threshold crossed
+        assert lookups == []
+        # Crosses season levels 2-3 and core levels 1-2 at once: one lookup per system.
+        result = service.add_bonus_xp(session, user_id=1, xp_amount=100)
+        assert len(lookups) == 2, lookups
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+        session.close()
+
+    assert [reward["level"] for reward in result["rewards"]] == [3]
+    verify: Session = session_factory()
+    assert sorted(row.level for row in verify.query(UserLevelRewardLog).filter_by(user_id=1)) == [1, 2]
+    verify.close()
+
+
+@pytest.mark.parametrize("mode", ["session", "inline", "queue"])
+def test_stamp_mirrors_core_xp_without_a_second_session(mode, monkeypatch, seed_season, session_factory) -> None:
+    from app.core.config import get_settings
+    from app.db.pool_metrics import PoolUsage
+    from app.models.level_xp import UserLevelProgress, UserXpMirrorQueue
+    from app.services.level_xp_service import LevelXPService
+    from app.services.season_pass_service import SeasonPassService
+
+    monkeypatch.setattr(get_settings(), "season_xp_mirror_mode", mode)
+    engine = session_factory.kw["bind"]
+    usage = PoolUsage().attach(engine)
+    session: Session = session_factory()
+    try:
+        SeasonPassService().add_stamp(session, user_id=1, source_feature_type="ROULETTE", xp_bonus=35, commit=False)
+        # Everything ran on the caller's one connection and is still uncommitted.
+        assert usage.snapshot()["checkouts"] == 1
+        session.commit()
+    finally:
+        usage.detach(engine)
+        session.close()
+
+    verify: Session = session_factory()
+    if mode == "queue":
+        assert verify.query(UserLevelProgress).count() == 0
+        assert verify.query(UserXpMirrorQueue).count() == 1
+        assert LevelXPService().apply_queued(verify) == {"applied": 1, "failed": 0}
+        assert verify.query(UserXpMirrorQueue).count() == 0
+    progress = verify.get(UserLevelProgress, 1)
+    assert (progress.level, progress.xp) == (1, 45)
+    verify.close()
@@ -0,0 +1,107 @@
+"""Window-cached active-season resolution (season pass, admin user and team battle)."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.season_pass import SeasonPassConfig
+from app.schemas.admin_season import AdminSeasonUpdate
+from app.services.admin_season_service import AdminSeasonService
+from app.services.admin_user_service import AdminUserService
+from app.services.season_pass_service import SeasonPassService
+from app.services.season_resolver import season_resolver
+from app.services.team_battle_service import TeamBattleService
+
+DAY = date(2025, 12, 20)
+
+
+def season(name: str, start: date, end: date, is_active: bool = True) -> SeasonPassConfig:
+    return SeasonPassConfig(season_name=name, start_date=start, end_date=end, max_level=5, base_xp_per_stamp=10, is_active=is_active)
+
+
+def count_selects(session: Session) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def _record(conn, cursor, statement, *args):  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_season_pass_resolves_once_per_window(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    session.add_all([season("S1", DAY, DAY + timedelta(days=6)), season("S2", DAY + timedelta(days=10), DAY + timedelta(days=20))])
+    session.commit()
+    season_resolver.reset_metrics()
+    service = SeasonPassService()
+
+    current = service.get_current_season(session, DAY)
+    assert current.season_name == "S1"
+    selects = count_selects(session)
+    for offset in range(7):
+        assert service.get_current_season(session, DAY + timedelta(days=offset)).season_name == "S1"
+    # Within the window and the config-cache TTL a hit is served by the identity map.
+    assert selects == []
+    assert (season_resolver.hits, season_resolver.misses) == (7, 1)
+
+    # Crossing the window edge re-resolves: the gap up to S2's start, then S2 itself.
+    assert service.get_current_season(session, DAY + timedelta(days=7)) is None
+    assert service.get_current_season(session, DAY + timedelta(days=9)) is None
+    assert service.get_current_season(session, DAY + timedelta(days=10)).season_name == "S2"
+    assert (season_resolver.hits, season_resolver.misses) == (8, 3)
+    session.close()
+
+
+def test_admin_season_edit_and_overlap(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    s1 = season("S1", DAY, DAY + timedelta(days=6))
+    session.add(s1)
+    session.commit()
+    service = SeasonPassService()
+    assert service.get_current_season(session, DAY + timedelta(days=3)).id == s1.id
+    assert AdminUserService._get_active_season(session, DAY + timedelta(days=3)).id == s1.id
+
+    AdminSeasonService.update_season(session, s1.id, AdminSeasonUpdate(end_date=DAY + timedelta(days=1)))
+    assert service.get_current_season(session, DAY + timedelta(days=3)) is None
+    AdminSeasonService.deactivate(session, s1.id)
+    assert AdminUserService._get_active_season(session, DAY) is None
+    assert service.get_current_season(session, DAY).id == s1.id  # is_active only filters the admin lookup
+
+    # Overlapping seasons are an error every time, never a cached answer.
+    session.add(season("S2", DAY, DAY + timedelta(days=2)))
+    session.commit()
+    AdminSeasonService.update_season(session, s1.id, AdminSeasonUpdate(season_name="S1b"))
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            service.get_current_season(session, DAY)
+        assert exc.value.detail == "NO_ACTIVE_SEASON_CONFLICT"
+    session.close()
+
+
+def test_team_season_window_and_admin_toggle(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    service = TeamBattleService()
+    now = datetime(2025, 12, 20, 3, 0, 0)
+    team_season = service.create_season(
+        session, {"name": "T1", "starts_at": now - timedelta(hours=1), "ends_at": now + timedelta(hours=1), "is_active": True}
+    )
+    season_resolver.reset_metrics()
+
+    assert service.get_active_season(session, now).id == team_season.id
+    assert service.get_active_season(session, now + timedelta(minutes=30)).id == team_season.id
+    assert service.get_active_season(session, now + timedelta(hours=2)) is None
+    assert (season_resolver.hits, season_resolver.misses) == (1, 2)
+
+    service.set_active(session, team_season.id, False)
+    assert service.get_active_season(session, now) is None
+    assert service.ensure_current_season(session, now).id == team_season.id
+
+    metrics = client.get("/admin/api/metrics").json()["season_resolver"]
+    assert metrics["hits"] == season_resolver.hits and metrics["misses"] == season_resolver.misses
+    assert metrics["hit_rate"] == round(season_resolver.hits / (season_resolver.hits + season_resolver.misses), 4)
+    session.close()
@@ -0,0 +1,71 @@
+"""Statistical checks for the alias-table weighted sampler."""
+import random
+from collections import Counter
+from fractions import Fraction
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.config_cache import LotteryConfigSnapshot, RouletteConfigSnapshot
+from app.services.weighted_sampler import WeightedSampler, build_sampler
+
+# Chi-square critical values at p = 0.001 by degrees of freedom.
+CHI2_CRITICAL_P001 = {3: 16.266, 5: 20.515}
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [
+        [30, 25, 20, 15, 8, 2],  # default roulette wheel
+        [10000, 1, 5000, 0, 250, 7],  # fine-grained admin odds with a disabled slot
+        [1, 1, 1, 1],
+    ],
+)
+def test_alias_table_is_exact(weights: list[int]) -> None:
+    sampler = WeightedSampler(weights)
+    total = sum(weights)
+    assert sampler.probabilities() == [Fraction(w, total) for w in weights]
+
+
+@pytest.mark.parametrize("weights", [[30, 25, 20, 15, 8, 2], [10000, 3, 5000, 40, 250, 7], [5, 1, 1, 3]])
+def test_sampled_distribution_matches_weights(weights: list[int]) -> None:
+    rng = random.Random(20251220)
+    sampler = WeightedSampler(weights)
+    draws = 200_000
+    counts = Counter(sampler.sample_index(rng) for _ in range(draws))
+
+    total = sum(weights)
+    chi2 = sum((counts[i] - draws * w / total) ** 2 / (draws * w / total) for i, w in enumerate(weights))
+    assert chi2 < CHI2_CRITICAL_P001[len(weights) - 1]
+
+
+def test_zero_weight_is_never_drawn() -> None:
+    rng = random.Random(7)
+    sampler = WeightedSampler([0, 3, 0, 1])
+    assert {sampler.sample_index(rng) for _ in range(10_000)} == {1, 3}
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0], [1, -1]])
+def test_invalid_weights_rejected(weights: list[int]) -> None:
+    with pytest.raises(ValueError):
+        WeightedSampler(weights)
+
+
+def test_snapshots_carry_their_alias_tables() -> None:
+    segments = [SimpleNamespace(id=i, slot_index=i, label=f"S{i}", reward_type="NONE", reward_amount=0, weight=w, is_jackpot=False)
+                for i, w in enumerate([0, 0, 9, 0, 0, 0])]
+    roulette = RouletteConfigSnapshot.from_model(SimpleNamespace(id=1, name="R", max_daily_spins=0), segments)
+    assert roulette.pick() is roulette.segments[2]
+    assert roulette.sampler.probabilities()[2] == 1
+
+    prizes = [SimpleNamespace(id=i, label=f"P{i}", reward_type="NONE", reward_amount=0, weight=w, stock=stock, is_active=True)
+              for i, (w, stock) in enumerate([(3, 5), (1, None), (0, None)])]
+    lottery = LotteryConfigSnapshot.from_model(SimpleNamespace(id=2, name="L", max_daily_tickets=0, use_urn=True), prizes)
+    assert lottery.sampler.probabilities() == [Fraction(3, 4), Fraction(1, 4), 0]
+    assert [prize.id for prize in lottery.unlimited] == [1]
+    assert lottery.unlimited_sampler.sample_index() == 0
+
+
+def test_build_sampler_without_weight_is_none() -> None:
+    assert build_sampler([SimpleNamespace(weight=0), SimpleNamespace(weight=-2)]) is None
+    assert build_sampler([SimpleNamespace(weight=0), SimpleNamespace(weight=4)]).probabilities() == [0, 1]